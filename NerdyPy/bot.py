@@ -4,14 +4,14 @@ Main Class of the NerpyBot
 """
 
 import time
-from asyncio import CancelledError, create_task, run, sleep
-from contextlib import contextmanager
+from asyncio import CancelledError, create_task, gather, run, sleep, to_thread
+from contextlib import asynccontextmanager, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from random import choices as random_choices
 from random import uniform as random_uniform
 from traceback import format_exc, print_exc, print_tb
-from typing import Annotated, Any, Generator, Optional
+from typing import Annotated, Any, AsyncGenerator, Generator, Optional
 from warnings import filterwarnings
 
 import typer
@@ -19,9 +19,11 @@ from importlib.metadata import version as pkg_version
 from discord import (
     ClientException,
     DMChannel,
+    Embed,
     Game,
     Intents,
     Interaction,
+    InteractionResponseType,
     LoginFailure,
     Message,
     RawReactionActionEvent,
@@ -29,7 +31,7 @@ from discord import (
 )
 from discord.ext import commands
 from discord.ext.commands import (
-    Bot,
+    AutoShardedBot,
     CommandError,
     CommandNotFound,
     Context,
@@ -37,21 +39,33 @@ from discord.ext.commands import (
 )
 from alembic.config import Config
 import alembic.command as alembic_command
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 from models.guild import BotGuild
 from utils import logging
 from utils.cache import GuildConfigCache
+from utils.command_sync import auto_sync
 from utils.config import parse_config
 from utils.conversation import AnswerType, ConversationManager
-from utils.database import BASE
+from utils.database import BASE, install_sync_call_guard
 from utils.error_throttle import ErrorCounter, ErrorThrottle
 from utils.errors import NerpyException, NerpyInfraException, SilentCheckFailure
+from utils.guild_metadata import GuildMetadataPublisher
 from utils.helpers import error_context, notify_error, parse_id, send_hidden_message
+from utils.loop_monitor import create_loop_monitor
+from utils.member_cache import CHUNK_SELECTIVE, create_member_cache, member_guild_ids
+from utils.metrics import METRICS
 from utils.permissions import build_permissions_embed, check_guild_permissions, required_permissions_for
+from utils.resource_versions import ResourceVersionPublisher, pop_changed_resources
+from utils.sharding import plan_from_config
 from utils.strings import get_string, load_strings
+from utils.twitch_index import TwitchNotificationIndex
 from utils.valkey import valkey_listener_loop
 
 SENTINEL_PATH = Path("/tmp/nerpybot_ready")
@@ -76,13 +90,66 @@ ACTIVITIES = [
 # "Use / for commands" entries get 3× higher chance than flavor entries
 ACTIVITY_WEIGHTS = [3 if "/" in a else 1 for a in ACTIVITIES]
 
+_DEFERRED_RESPONSES = (
+    InteractionResponseType.deferred_channel_message,
+    InteractionResponseType.deferred_message_update,
+)
+
+
+def _seconds_since(created_at: datetime) -> float:
+    """Seconds from a Discord snowflake timestamp to now (includes gateway delay and clock skew)."""
+    return (datetime.now(UTC) - created_at).total_seconds()
+
+
+@contextmanager
+def _startup_phase(log, name: str, quiet: bool = False) -> Generator[None, Any, None]:
+    """Log how long a startup step took and record it under ``startup``/*name* in ``METRICS``."""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        elapsed = time.monotonic() - start
+        METRICS.observe("startup", name, elapsed)
+        (log.debug if quiet else log.info)(f"Startup phase {name} took {elapsed:.2f}s")
+
+
+async def _threaded_phase(log, name: str, func, *args) -> None:
+    """Run a blocking startup step in a worker thread as a timed phase."""
+    with _startup_phase(log, name):
+        await to_thread(func, *args)
+
+
+async def _warm_twitch_index(bot) -> None:
+    """Warm the Twitch index as a timed phase; it reads in a worker thread but swaps on the loop."""
+    with _startup_phase(bot.log, "cache:twitch-notification"):
+        try:
+            await bot.twitch_index.warm_async(bot.SESSION)
+        except Exception as e:
+            bot.log.error(f"Failed to warm twitch-notification cache: {e}", exc_info=True)
 
-def run_migrations() -> None:
+
+def _database_at_head(alembic_cfg: Config, database_url: str) -> bool:
+    """Return True when the database's Alembic revision already matches the migration heads."""
+    heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            current = set(MigrationContext.configure(connection).get_current_heads())
+    finally:
+        engine.dispose()
+    return bool(heads) and current == heads
+
+
+def run_migrations(database_url: str | None = None) -> None:
     """Apply all pending Alembic migrations before the bot connects.
 
     Searches upward from this file's directory for alembic.ini, so it works
     both in the repo (alembic.ini at root) and in Docker. Raises on failure —
     callers must not catch it.
+
+    With *database_url* (the bot's own database), the upgrade is skipped when that database is
+    already at head, which saves running the migration environment on every restart. If the
+    revision cannot be read, the upgrade runs as usual.
     """
     log = logging.get_logger("nerpybot")
     for parent in Path(__file__).resolve().parents:
@@ -92,9 +159,16 @@ def run_migrations() -> None:
             break
     else:
         raise FileNotFoundError("alembic.ini not found in any parent directory of bot.py")
+    alembic_cfg = Config(str(alembic_ini))
+    if database_url is not None:
+        try:
+            if _database_at_head(alembic_cfg, database_url):
+                log.info("Database already at the latest revision, skipping migrations.")
+                return
+        except Exception as e:
+            log.debug(f"Could not read the database revision, running migrations: {e}")
     log.info("Running database migrations...")
     try:
-        alembic_cfg = Config(str(alembic_ini))
         alembic_command.upgrade(alembic_cfg, "head")
     except Exception as e:
         log.error(f"Database migration failed: {e}")
@@ -102,7 +176,7 @@ def run_migrations() -> None:
     log.info("Database migrations complete.")
 
 
-class NerpyBot(Bot):
+class NerpyBot(AutoShardedBot):
     """Discord Bot"""
 
     def __init__(self, config: dict, intents: Intents, debug: bool):
@@ -111,8 +185,10 @@ class NerpyBot(Bot):
 
         This sets up bot identity and operator lists from the provided config, initializes
         conversation and error-throttling subsystems, tracks uptime, prepares module state, and
-        creates a SQLAlchemy engine and session factory (with connection pre-ping enabled). If no
-        "database" section is present in config, a warning is logged and a local SQLite fallback is used.
+        creates sync and async SQLAlchemy engines and session factories (with connection pre-ping
+        enabled). If no "database" section is present in config, a warning is logged and a local
+        SQLite fallback is used. In debug mode, synchronous queries issued on the event loop thread
+        are logged.
 
         Parameters:
             config (dict): Parsed configuration containing at minimum:
@@ -120,20 +196,27 @@ class NerpyBot(Bot):
                 - bot.token: bot token string
                 - bot.ops: iterable of operator IDs (strings or int-like)
                 - bot.modules: module list/configuration
+                - bot.sharding (optional): shard count and cluster slot, see ``utils.sharding``
+                - bot.member_cache (optional): which guilds are chunked, see ``utils.member_cache``
                 - database (optional): database connection pieces; if absent, sqlite:///db.db is used.
             intents (Intents): Discord gateway intents for the bot.
-            debug (bool): Debug flag to enable debug behavior in subsystems.
+            debug (bool): Debug flag to enable debug behavior in subsystems and the sync-DB-on-loop guard.
 
         """
         self.bot_name = (config["bot"].get("name") or "").strip() or "NerpyBot"
         bot_description = (
             config["bot"].get("description") or ""
         ).strip() or f"{self.bot_name} - Always one step ahead!"
+        self.cluster = plan_from_config(config)
+        self.member_cache = create_member_cache(config)
         super().__init__(
             command_prefix="",
             description=bot_description,
             intents=intents,
             help_command=None,
+            shard_count=self.cluster.shard_count,
+            shard_ids=self.cluster.shard_ids,
+            chunk_guilds_at_startup=self.member_cache.chunk_at_startup,
         )
 
         self.config = config
@@ -151,6 +234,10 @@ class NerpyBot(Bot):
         self.error_counter = ErrorCounter()
         self.disabled_modules: set[str] = set()
         self.guild_cache = GuildConfigCache()
+        self.guild_metadata = GuildMetadataPublisher(self.get_guild)
+        self.twitch_index = TwitchNotificationIndex()
+        self.resource_versions = ResourceVersionPublisher()
+        self.loop_monitor = create_loop_monitor(config)
 
         # database variables
         db_connection_string = self.build_connection_string(config)
@@ -159,15 +246,34 @@ class NerpyBot(Bot):
 
         self.ENGINE = create_engine(db_connection_string, pool_pre_ping=True)
         self.SESSION = sessionmaker(bind=self.ENGINE, expire_on_commit=False)
+        # Event-loop code paths (loops, hot command handlers) use the async engine so a slow
+        # query does not stall the gateway heartbeat.
+        self.ASYNC_ENGINE = create_async_engine(
+            self.build_connection_string(config, async_driver=True), pool_pre_ping=True
+        )
+        self.ASYNC_SESSION = async_sessionmaker(bind=self.ASYNC_ENGINE, expire_on_commit=False)
+        if debug:
+            install_sync_call_guard(self.ENGINE, self.log)
+        if self.cluster.clustered:
+            self.log.info(
+                f"Cluster {self.cluster.cluster_id + 1}/{self.cluster.cluster_count}: "
+                f"shards {self.cluster.shard_ids} of {self.cluster.shard_count}"
+            )
+
+    def owns_guild(self, guild_id: int) -> bool:
+        """Return True if this process serves *guild_id* (always, unless running in cluster mode)."""
+        return self.cluster.owns(guild_id)
 
     @staticmethod
-    def build_connection_string(config: dict) -> str:
+    def build_connection_string(config: dict, async_driver: bool = False) -> str:
         """Build a SQLAlchemy connection string from the bot config.
 
-        Returns ``"sqlite:///db.db"`` when no database section is present.
+        Returns ``"sqlite:///db.db"`` when no database section is present. With *async_driver*,
+        SQLite URLs use ``aiosqlite``; psycopg serves both the sync and the async engine.
         """
+        sqlite_driver = "sqlite+aiosqlite" if async_driver else "sqlite"
         if "database" not in config:
-            return "sqlite:///db.db"
+            return f"{sqlite_driver}:///db.db"
 
         database_config = config["database"]
         db_type = database_config["db_type"]
@@ -175,6 +281,8 @@ class NerpyBot(Bot):
 
         if "postgresql" in db_type:
             db_type = f"{db_type}+psycopg"
+        elif async_driver and db_type == "sqlite":
+            db_type = sqlite_driver
 
         return URL.create(
             drivername=db_type,
@@ -213,6 +321,7 @@ class NerpyBot(Bot):
         try:
             yield session
             session.commit()
+            self.resource_versions.publish(pop_changed_resources(session))
         except SQLAlchemyError as exc:
             session.rollback()
             self.log.error(exc)
@@ -220,6 +329,31 @@ class NerpyBot(Bot):
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        """Async counterpart of ``session_scope`` for code running on the event loop.
+
+        Model helpers are synchronous classmethods; call them through ``session.run_sync``, which
+        runs them on the async connection without blocking the loop::
+
+            async with self.bot.async_session_scope() as session:
+                rows = await session.run_sync(lambda s: Model.get_by_guild(guild_id, s))
+
+        Only touch column attributes of returned objects outside ``run_sync`` — lazy-loading a
+        relationship there raises ``MissingGreenlet``.
+        """
+        session = self.ASYNC_SESSION()
+        try:
+            yield session
+            await session.commit()
+            self.resource_versions.publish(pop_changed_resources(session))
+        except SQLAlchemyError as exc:
+            await session.rollback()
+            self.log.error(exc)
+            raise NerpyInfraException("A database error occurred.") from exc
+        finally:
+            await session.close()
+
     async def setup_hook(self) -> None:
         """
         Discord Bot setup_hook
@@ -228,30 +362,46 @@ class NerpyBot(Bot):
         self.tree.on_error = self._on_app_command_error
         self.tree.interaction_check = self._global_interaction_check
 
-        # load modules
-        for module in self.modules:
-            try:
-                await self.load_extension(f"modules.{module}")
-            except (ImportError, ExtensionFailed, ClientException) as e:
-                self.log.error(f"failed to load extension {module}. {e}")
-                self.log.debug(print_exc())
+        if self.loop_monitor is not None:
+            self.loop_monitor.start()
 
         # noinspection GrazieInspection
         # auto-load essential extensions not explicitly listed in config
-        auto_load = ["server_admin", "operator"]
-
-        for module in auto_load:
-            if module not in self.modules:
-                try:
-                    await self.load_extension(f"modules.{module}")
-                except (ImportError, ExtensionFailed, ClientException) as e:
-                    self.log.error(f"failed to auto-load {module} extension. {e}")
-                    self.log.debug(print_exc())
+        auto_load = [module for module in ("server_admin", "operator") if module not in self.modules]
+
+        # Modules do not depend on each other while loading, so their setups (and the I/O some of
+        # them do in cog_load) overlap instead of running one after another.
+        with _startup_phase(self.log, "extensions"):
+            await gather(
+                *(self._load_module(module) for module in self.modules),
+                *(self._load_module(module, auto=True) for module in auto_load),
+            )
 
         # load localization strings before registering persistent views (views call get_string in __init__)
-        load_strings()
+        with _startup_phase(self.log, "strings"):
+            load_strings()
 
-        # Register persistent views so buttons on old messages keep working
+        with _startup_phase(self.log, "persistent_views"):
+            self._register_persistent_views()
+
+        # create database/tables and such stuff; after the extensions, which import the models
+        with _startup_phase(self.log, "create_all"):
+            await to_thread(self.create_all)
+
+    async def _load_module(self, module: str, auto: bool = False) -> None:
+        """Load ``modules.<module>``, logging (not raising) a failure."""
+        with _startup_phase(self.log, f"extension:{module}", quiet=True):
+            try:
+                await self.load_extension(f"modules.{module}")
+            except (ImportError, ExtensionFailed, ClientException) as e:
+                if auto:
+                    self.log.error(f"failed to auto-load {module} extension. {e}")
+                else:
+                    self.log.error(f"failed to load extension {module}. {e}")
+                self.log.debug(print_exc())
+
+    def _register_persistent_views(self) -> None:
+        """Register persistent views so buttons on old messages keep working."""
         if "application" in self.modules:
             try:
                 from modules.application.views import ApplicationApplyView, ApplicationReviewView
@@ -282,11 +432,9 @@ class NerpyBot(Bot):
                 self.log.error(f"failed to register crafting order persistent views. {e}")
                 self.log.debug(print_exc())
 
-        # create database/tables and such stuff
-        self.create_all()
-
     async def _global_interaction_check(self, interaction: Interaction) -> bool:
         """Block slash commands from disabled modules."""
+        METRICS.observe("interaction", "receive", _seconds_since(interaction.created_at))
         command = interaction.command
         if command is None:
             return True
@@ -326,10 +474,9 @@ class NerpyBot(Bot):
         """
         Handle post-login initialization and readiness tasks.
 
-        Starts the activity status loop and the Valkey listener (if configured), synchronizes guild membership state to the database, checks each guild for required permissions and notifies subscribed guild admins of any missing permissions, and writes the readiness sentinel file to signal that the bot is healthy and ready.
+        Starts the activity status loop and the Valkey listener (if configured), synchronizes guild membership state to the database and warms the in-memory caches (concurrently, in worker threads), checks each guild for required permissions, and writes the readiness sentinel file to signal that the bot is healthy and ready. Subscribed guild admins are notified of missing permissions in the background, after the sentinel is written.
         """
-        from models.permissions import PermissionSubscriber
-
+        ready_start = time.monotonic()
         self.log.info(f"Logged in as {self.user} (ID: {self.user.id})")
 
         if not hasattr(self, "_activity_task") or self._activity_task.done():
@@ -340,21 +487,24 @@ class NerpyBot(Bot):
         if valkey_url and (not hasattr(self, "_valkey_task") or self._valkey_task.done()):
             self._valkey_task = create_task(valkey_listener_loop(self, valkey_url))
 
-        # Sync guild membership table for web dashboard presence detection
-        try:
-            with self.session_scope() as session:
-                BotGuild.sync([g.id for g in self.guilds], session)
-        except Exception as e:
-            self.log.warning(f"Failed to sync BotGuild table: {e}")
-
-        for cache_name, warm in (
-            ("reaction-role", self.guild_cache.warm_reaction_roles),
-            ("leave-message", self.guild_cache.warm_leave_messages),
-        ):
-            try:
-                warm(self.SESSION)
-            except Exception as e:
-                self.log.error(f"Failed to warm {cache_name} cache: {e}", exc_info=True)
+        # Re-identify after a gateway outage: events missed meanwhile are not replayed.
+        self.guild_metadata.sync_guilds(self.guilds)
+
+        # The membership sync and the cache warm-ups read different tables and are blocking DB
+        # work; run them side by side in worker threads instead of one after another on the loop.
+        # Each warm-up swaps its cache in when done, so events handled meanwhile see the old state.
+        await gather(
+            _threaded_phase(self.log, "guild_sync", self._sync_bot_guilds, [g.id for g in self.guilds]),
+            _threaded_phase(self.log, "member_guilds", self._load_member_guilds),
+            *(
+                _threaded_phase(self.log, f"cache:{cache_name}", self._warm_cache, cache_name, warm)
+                for cache_name, warm in (
+                    ("reaction-role", self.guild_cache.warm_reaction_roles),
+                    ("leave-message", self.guild_cache.warm_leave_messages),
+                )
+            ),
+            _warm_twitch_index(self),
+        )
         self.log.debug("Guild config cache warm-up finished.")
         if not self.guild_cache.rr_warmed:
             self.log.error(
@@ -366,36 +516,101 @@ class NerpyBot(Bot):
             )
 
         required = required_permissions_for(self.modules)
-        for guild in self.guilds:
-            missing = check_guild_permissions(guild, required)
-            if missing:
-                self.log.warning(f"[{guild.name} ({guild.id})] missing permissions: {', '.join(missing)}")
-                emb = build_permissions_embed(guild, missing, self.client_id, required)
-                # noinspection PyArgumentList
-                with self.session_scope() as session:
-                    subscribers = PermissionSubscriber.get_by_guild(guild.id, session)
-                for sub in subscribers:
-                    try:
-                        user = await self.fetch_user(sub.UserId)
-                        await user.send(embed=emb)
-                    except Exception as ex:
-                        self.log.debug(f"Could not DM permission alert to {sub.UserId}: {ex}")
+        alerts = {}
+        with _startup_phase(self.log, "permission_scan"):
+            for guild in self.guilds:
+                missing = check_guild_permissions(guild, required)
+                if missing:
+                    self.log.warning(f"[{guild.name} ({guild.id})] missing permissions: {', '.join(missing)}")
+                    alerts[guild.id] = build_permissions_embed(guild, missing, self.client_id, required)
 
         SENTINEL_PATH.touch()
-        self.log.info("Readiness sentinel written — healthcheck will pass.")
+        elapsed = time.monotonic() - ready_start
+        METRICS.observe("startup", "on_ready", elapsed)
+        self.log.info(f"Readiness sentinel written — healthcheck will pass (on_ready took {elapsed:.2f}s).")
+
+        # DMs are rate limited and need a user lookup each; they must not hold up readiness.
+        if alerts:
+            self._permission_alert_task = create_task(self._send_permission_alerts(alerts))
+
+        # Full member lists only for the guilds whose features read them (see utils/member_cache.py);
+        # a new session after a reconnect starts with empty member caches, so this runs every time.
+        if self.member_cache.chunking == CHUNK_SELECTIVE and (
+            not hasattr(self, "_member_chunk_task") or self._member_chunk_task.done()
+        ):
+            self._member_chunk_task = create_task(self._chunk_member_guilds())
+
+        # Once per process: reconnects fire on_ready again but cannot change the tree.
+        if self.config.get("bot", {}).get("command_sync") == "auto" and not hasattr(self, "_command_sync_task"):
+            self._command_sync_task = create_task(auto_sync(self))
+
+    def _sync_bot_guilds(self, guild_ids: list[int]) -> None:
+        """Sync the guild membership table used for web dashboard presence detection."""
+        try:
+            with self.session_scope() as session:
+                added, removed = BotGuild.sync(guild_ids, session, self.cluster.guild_filter(BotGuild.GuildId))
+            self.log.debug(f"BotGuild table synced: {added} added, {removed} removed.")
+        except Exception as e:
+            self.log.warning(f"Failed to sync BotGuild table: {e}")
+
+    def _load_member_guilds(self) -> None:
+        """Load the guilds chunked after startup; without them every guild is left to lazy lookups."""
+        if self.member_cache.chunking != CHUNK_SELECTIVE:
+            return
+        try:
+            with self.session_scope() as session:
+                self.member_cache.set_wanted(member_guild_ids(session))
+        except Exception as e:
+            self.log.warning(f"Failed to load the guilds that need member lists: {e}")
+
+    async def _chunk_member_guilds(self) -> None:
+        with _startup_phase(self.log, "member_chunking"):
+            chunked = await self.member_cache.chunk_wanted(self.guilds)
+        self.log.debug(f"Chunked the members of {chunked} guild(s).")
+
+    def _warm_cache(self, cache_name: str, warm) -> None:
+        try:
+            warm(self.SESSION)
+        except Exception as e:
+            self.log.error(f"Failed to warm {cache_name} cache: {e}", exc_info=True)
+
+    async def _send_permission_alerts(self, alerts: dict[int, Embed]) -> None:
+        """DM each guild's permission subscribers the embed listing what the bot is missing there."""
+        from models.permissions import PermissionSubscriber
+
+        try:
+            async with self.async_session_scope() as session:
+                subscribers = await session.run_sync(lambda s: PermissionSubscriber.get_by_guilds(list(alerts), s))
+        except Exception as e:
+            self.log.warning(f"Failed to load permission subscribers: {e}")
+            return
+        for sub in subscribers:
+            try:
+                user = self.get_user(sub.UserId) or await self.fetch_user(sub.UserId)
+                await user.send(embed=alerts[sub.GuildId])
+            except Exception as ex:
+                self.log.debug(f"Could not DM permission alert to {sub.UserId}: {ex}")
 
     # noinspection PyUnusedLocal
     async def on_app_command_completion(self, interaction: Interaction, command: app_commands.Command) -> None:
-        """Log successful slash command invocations."""
+        """Log successful slash command invocations and record their latency."""
         self.log.debug(error_context(interaction))
+        elapsed = _seconds_since(interaction.created_at)
+        METRICS.observe("command", command.qualified_name, elapsed)
+        deferred = interaction.response.type in _DEFERRED_RESPONSES
+        METRICS.observe("interaction", "deferred" if deferred else "immediate", elapsed)
 
     async def on_command_completion(self, ctx: Context) -> None:
-        """Log successful prefix command invocations."""
+        """Log successful prefix command invocations and record their latency."""
         self.log.debug(error_context(ctx))
+        if ctx.interaction is None:  # hybrid commands run as slash commands are recorded above
+            METRICS.observe("command", ctx.command.qualified_name, _seconds_since(ctx.message.created_at))
 
     async def _on_app_command_error(self, interaction: Interaction, error: app_commands.AppCommandError) -> None:
         """Handle errors from slash commands."""
         err_ctx = error_context(interaction)
+        command = interaction.command
+        METRICS.incr("command_errors", command.qualified_name if command is not None else "unknown")
 
         if isinstance(error, app_commands.CheckFailure):
             if isinstance(error, SilentCheckFailure):
@@ -429,6 +644,8 @@ class NerpyBot(Bot):
         """Handle errors from prefix commands (sync, debug)."""
         if isinstance(error, CommandNotFound):
             return  # Silently ignore — DM prefix fallback only
+        if ctx.interaction is None:
+            METRICS.incr("command_errors", ctx.command.qualified_name if ctx.command is not None else "unknown")
         if isinstance(error, commands.CommandInvokeError) and isinstance(error.original, NerpyException):
             self.log.error(f"{error_context(ctx)}: {error.original.args[0]}")
             await ctx.send(str(error.original.args[0]))
@@ -441,7 +658,8 @@ class NerpyBot(Bot):
             await ctx.send("An error occurred.")
 
     async def on_guild_join(self, guild) -> None:
-        """Add the newly joined guild to the BotGuild table."""
+        """Add the newly joined guild to the BotGuild table and the dashboard snapshot."""
+        self.guild_metadata.sync_guild(guild)
         try:
             with self.session_scope() as session:
                 BotGuild.add(guild.id, session)
@@ -456,10 +674,36 @@ class NerpyBot(Bot):
         except Exception as e:
             self.log.warning(f"Failed to remove guild {guild.id} from BotGuild table: {e}")
         self.guild_cache.evict_guild(guild.id)
+        self.guild_metadata.forget_guild(guild.id)
+
+    async def on_guild_channel_create(self, channel) -> None:
+        """Add the channel to the dashboard snapshot."""
+        self.guild_metadata.put_channel(channel)
+
+    async def on_guild_channel_update(self, before, after) -> None:
+        """Refresh the channel in the dashboard snapshot."""
+        self.guild_metadata.put_channel(after)
+
+    async def on_guild_channel_delete(self, channel) -> None:
+        """Drop the channel from the dashboard snapshot."""
+        self.guild_metadata.remove_channel(channel)
+
+    async def on_guild_role_create(self, role) -> None:
+        """Add the role to the dashboard snapshot."""
+        self.guild_metadata.put_role(role)
+
+    async def on_guild_role_update(self, before, after) -> None:
+        """Refresh the role in the dashboard snapshot."""
+        self.guild_metadata.put_role(after)
+
+    async def on_guild_role_delete(self, role) -> None:
+        """Drop the role from the dashboard snapshot."""
+        self.guild_metadata.remove_role(role)
 
     async def on_guild_language_changed(self, guild_id: int, language: str) -> None:
-        """Update the language cache when a guild changes its language setting."""
+        """Update the language caches when a guild changes its language setting."""
         self.guild_cache.set_guild_language(guild_id, language)
+        self.twitch_index.set_language(guild_id, language)
 
     async def on_modrole_changed(self, guild_id: int, role_id: int | None) -> None:
         """Update the modrole cache when a guild's bot-moderator role is set or cleared."""
@@ -519,7 +763,10 @@ class NerpyBot(Bot):
         """
         self.log.info("shutting down server!")
         self.restart = False
+        if self.loop_monitor is not None:
+            self.loop_monitor.stop()
         await self.close()
+        await self.ASYNC_ENGINE.dispose()
 
 
 def get_intents() -> Intents:
@@ -560,7 +807,7 @@ def main(
     Behavior:
         - Loads and merges configuration from the provided file and environment variables.
         - Determines effective logging configuration from CLI flags and config, and initializes selected loggers.
-        - Runs database migrations before starting the bot.
+        - Runs database migrations before starting the bot, unless its database is already at head.
         - Instantiates NerpyBot and enters its main run loop; on unexpected exceptions the process will remove the readiness sentinel file, wait briefly, and then retry.
         - Handles LoginFailure and KeyboardInterrupt by logging and exiting cleanly.
 
@@ -594,7 +841,8 @@ def main(
         for logger_name in loggers:
             logging.create_logger(resolved_loglevel, logger_name)
         SENTINEL_PATH.unlink(missing_ok=True)
-        run_migrations()
+        with _startup_phase(logging.get_logger("nerpybot"), "migrations"):
+            run_migrations(NerpyBot.build_connection_string(resolved_config))
         bot = NerpyBot(resolved_config, intents, is_debug)
 
         while True:
@@ -5,11 +5,13 @@ import enum
 
 from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Index, Integer, Unicode, UnicodeText
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy import func, select
 from sqlalchemy.orm import relationship, selectinload
 from utils import database as db
 
 from models.application.forms import (
     ApplicationForm,
+    ApplicationQuestion,
     ApplicationTemplate,
     ApplicationTemplateQuestion,
     BUILT_IN_TEMPLATES,
@@ -36,7 +38,7 @@ class ApplicationSubmission(db.BASE):
 
     __tablename__ = "ApplicationSubmission"
     __table_args__ = (
-        Index("ApplicationSubmission_GuildId", "GuildId"),
+        Index("ApplicationSubmission_GuildId_Id", "GuildId", "Id"),
         Index("ApplicationSubmission_FormId", "FormId"),
         Index("ApplicationSubmission_ReviewMessageId", "ReviewMessageId"),
     )
@@ -86,6 +88,55 @@ class ApplicationSubmission(db.BASE):
             .all()
         )
 
+    @classmethod
+    def vote_count_columns(cls):
+        """Return ``(ApproveCount, DenyCount)`` columns to select alongside submission rows.
+
+        Each is a correlated count over ``ApplicationVote_SubmissionId``, so tallies come from the
+        database without loading any vote rows.
+        """
+        return tuple(
+            select(func.count(ApplicationVote.Id))
+            .where(ApplicationVote.SubmissionId == cls.Id, ApplicationVote.Vote == vote_type)
+            .correlate(cls)
+            .scalar_subquery()
+            .label(label)
+            for vote_type, label in ((VoteType.APPROVE, "ApproveCount"), (VoteType.DENY, "DenyCount"))
+        )
+
+    @classmethod
+    def get_pending_reviews(cls, guild_id, session):
+        """Returns the review-embed fields of a guild's pending submissions that have a review message.
+
+        One row per submission with the submission's own columns, the form's ``FormName``,
+        ``RequiredApprovals``, ``RequiredDenials`` and ``ReviewChannelId``, and the vote tallies.
+        Answers are not included; see ``ApplicationAnswer.get_texts_by_submission``.
+        """
+        return (
+            session.query(
+                cls.Id,
+                cls.UserId,
+                cls.UserName,
+                cls.Status,
+                cls.SubmittedAt,
+                cls.ReviewMessageId,
+                cls.ApplicantNotified,
+                ApplicationForm.Name.label("FormName"),
+                ApplicationForm.RequiredApprovals,
+                ApplicationForm.RequiredDenials,
+                ApplicationForm.ReviewChannelId,
+                *cls.vote_count_columns(),
+            )
+            .join(ApplicationForm, ApplicationForm.Id == cls.FormId)
+            .filter(
+                cls.GuildId == guild_id,
+                cls.Status == SubmissionStatus.PENDING,
+                cls.ReviewMessageId.isnot(None),
+                ApplicationForm.ReviewChannelId.isnot(None),
+            )
+            .all()
+        )
+
     @classmethod
     def get_by_user_and_form(cls, user_id: int, form_id: int, session):
         """Returns the most recent submission by a user for a given form, or None."""
@@ -109,6 +160,25 @@ class ApplicationAnswer(db.BASE):
     submission = relationship("ApplicationSubmission", back_populates="answers")
     question = relationship("ApplicationQuestion", lazy="joined")
 
+    @classmethod
+    def get_texts_by_submission(cls, submission_ids, session) -> dict[int, list[tuple[str, str | None]]]:
+        """Returns ``{submission_id: [(question_text, answer_text), ...]}`` for the given submissions.
+
+        Same shape as ``extract_answers``, without loading answer or question entities.
+        """
+        texts = {submission_id: [] for submission_id in submission_ids}
+        if not texts:
+            return texts
+        rows = (
+            session.query(cls.SubmissionId, cls.QuestionId, ApplicationQuestion.QuestionText, cls.AnswerText)
+            .outerjoin(ApplicationQuestion, ApplicationQuestion.Id == cls.QuestionId)
+            .filter(cls.SubmissionId.in_(texts))
+            .order_by(cls.SubmissionId, cls.Id)
+        )
+        for submission_id, question_id, question_text, answer_text in rows:
+            texts[submission_id].append((question_text or f"Question {question_id}", answer_text))
+        return texts
+
 
 class ApplicationVote(db.BASE):
     """Database entity model for a reviewer's vote on a submission."""
@@ -142,6 +212,17 @@ class ApplicationVote(db.BASE):
         """Returns the count of votes of a given type for a submission."""
         return session.query(cls).filter(cls.SubmissionId == submission_id, cls.Vote == vote_type).count()
 
+    @classmethod
+    def tally(cls, submission_id, session) -> tuple[int, int]:
+        """Returns ``(approve_count, deny_count)`` for a submission, counted in the database."""
+        rows = dict(
+            session.query(cls.Vote, func.count(cls.Id))
+            .filter(cls.SubmissionId == submission_id)
+            .group_by(cls.Vote)
+            .all()
+        )
+        return rows.get(VoteType.APPROVE, 0), rows.get(VoteType.DENY, 0)
+
 
 def seed_built_in_templates(session):
     """Seed built-in templates into DB if not already present, and remove stale ones."""
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-"""Guild-domain database models: guild registry and per-guild language preference."""
+"""Guild-domain database models: guild registry, command sync state and per-guild language preference."""
 
-from sqlalchemy import BigInteger, Column, String, insert
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, String, insert
 
 from utils import database as db
 
@@ -13,11 +15,25 @@ class BotGuild(db.BASE):
     GuildId = Column(BigInteger, primary_key=True)
 
     @classmethod
-    def sync(cls, guild_ids: list[int], session) -> None:
-        """Replace the full set of known guilds with the given list."""
-        session.query(cls).delete()
-        if guild_ids:
-            session.execute(insert(cls), [{"GuildId": gid} for gid in guild_ids])
+    def sync(cls, guild_ids: list[int], session, guild_filter=None) -> tuple[int, int]:
+        """Make the known guilds match the given list; returns ``(added, removed)``.
+
+        Only the difference is written, so a restart without membership changes touches no rows.
+        *guild_filter* (see ``ClusterPlan.guild_filter``) limits the comparison to the guilds of
+        this cluster, so one process never removes the guilds of another.
+        """
+        wanted = set(guild_ids)
+        query = session.query(cls.GuildId)
+        if guild_filter is not None:
+            query = query.filter(guild_filter)
+        known = {row[0] for row in query}
+        stale = known - wanted
+        new = wanted - known
+        if stale:
+            session.query(cls).filter(cls.GuildId.in_(stale)).delete(synchronize_session=False)
+        if new:
+            session.execute(insert(cls), [{"GuildId": gid} for gid in sorted(new)])
+        return len(new), len(stale)
 
     @classmethod
     def add(cls, guild_id: int, session) -> None:
@@ -42,6 +58,31 @@ class BotGuild(db.BASE):
         return {str(row[0]) for row in session.query(cls.GuildId).all()}
 
 
+class CommandTreeSync(db.BASE):
+    """Hash of the application command tree last synced to Discord, per scope (``global`` or a guild ID)."""
+
+    __tablename__ = "CommandTreeSync"
+    Scope = Column(String(20), primary_key=True)
+    Hash = Column(String(64), nullable=False)
+    SyncedAt = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    @classmethod
+    def get_hash(cls, scope: str, session) -> str | None:
+        """Return the hash last synced for *scope*, or None if it was never synced."""
+        entry = session.get(cls, scope)
+        return entry.Hash if entry is not None else None
+
+    @classmethod
+    def set_hash(cls, scope: str, digest: str, session) -> None:
+        """Record that *scope* was synced with the tree hashing to *digest*."""
+        entry = session.get(cls, scope)
+        if entry is None:
+            session.add(cls(Scope=scope, Hash=digest))
+        else:
+            entry.Hash = digest
+            entry.SyncedAt = datetime.now(UTC)
+
+
 class GuildLanguageConfig(db.BASE):
     """Per-guild language preference for localized bot responses."""
 
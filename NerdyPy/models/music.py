@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
-"""Playlist and PlaylistEntry models for the music module."""
+"""Playlist, PlaylistEntry and TrackMetadata models for the music module."""
 
-from datetime import UTC, datetime
+import hashlib
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint, Unicode, UnicodeText
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    Unicode,
+    UnicodeText,
+)
 
 from utils import database as db
 
@@ -48,3 +60,70 @@ class PlaylistEntry(db.BASE):
     def delete_by_url(cls, playlist_id: int, url: str, session) -> int:
         """Delete entries matching url. Returns the number of rows deleted."""
         return session.query(cls).filter(cls.PlaylistId == playlist_id, cls.Url == url).delete()
+
+
+class TrackMetadata(db.BASE):
+    """Durable cache of trimmed yt-dlp metadata, keyed by the requested URL.
+
+    Survives restarts so saved playlists and repeat requests skip re-extraction.
+    Only single tracks are stored — playlist contents change over time.
+    """
+
+    __tablename__ = "MusicTrackMetadata"
+    __table_args__ = (Index("MusicTrackMetadata_FetchedAt", "FetchedAt"),)
+
+    UrlHash = Column(String(64), primary_key=True)
+    Url = Column(UnicodeText, nullable=False)
+    VideoId = Column(Unicode(100))
+    Title = Column(UnicodeText)
+    Duration = Column(Integer)
+    Uploader = Column(Unicode(200))
+    Thumbnail = Column(UnicodeText)
+    WebpageUrl = Column(UnicodeText)
+    FetchedAt = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC).replace(tzinfo=None))
+
+    @staticmethod
+    def hash_url(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def to_info(self) -> dict:
+        """Return the record in the trimmed yt-dlp info dict shape used by the music cogs."""
+        return {
+            "title": self.Title,
+            "id": self.VideoId,
+            "duration": self.Duration,
+            "uploader": self.Uploader,
+            "thumbnail": self.Thumbnail,
+            "webpage_url": self.WebpageUrl,
+        }
+
+    @classmethod
+    def get_fresh(cls, url: str, max_age_seconds: float, session):
+        """Return the record for *url* if it was fetched within *max_age_seconds*, else None."""
+        row = session.get(cls, cls.hash_url(url))
+        if row is None:
+            return None
+        age = (datetime.now(UTC).replace(tzinfo=None) - row.FetchedAt).total_seconds()
+        return row if age <= max_age_seconds else None
+
+    @classmethod
+    def upsert(cls, url: str, info: dict, session):
+        """Insert or refresh the record for *url* from a trimmed info dict."""
+        row = session.get(cls, cls.hash_url(url))
+        if row is None:
+            row = cls(UrlHash=cls.hash_url(url), Url=url)
+            session.add(row)
+        row.VideoId = info.get("id")
+        row.Title = info.get("title")
+        row.Duration = int(info["duration"]) if info.get("duration") is not None else None
+        row.Uploader = (info.get("uploader") or "")[:200] or None
+        row.Thumbnail = info.get("thumbnail")
+        row.WebpageUrl = info.get("webpage_url")
+        row.FetchedAt = datetime.now(UTC).replace(tzinfo=None)
+        return row
+
+    @classmethod
+    def delete_older_than(cls, max_age_seconds: float, session) -> int:
+        """Delete records fetched more than *max_age_seconds* ago. Returns the number of rows deleted."""
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=max_age_seconds)
+        return session.query(cls).filter(cls.FetchedAt < cutoff).delete()
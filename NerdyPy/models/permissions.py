@@ -38,6 +38,13 @@ class PermissionSubscriber(db.BASE):
         """Returns all subscribers for a given guild."""
         return session.query(cls).filter(cls.GuildId == guild_id).all()
 
+    @classmethod
+    def get_by_guilds(cls, guild_ids: list[int], session) -> list["PermissionSubscriber"]:
+        """Returns all subscribers for the given guilds in one query."""
+        if not guild_ids:
+            return []
+        return session.query(cls).filter(cls.GuildId.in_(guild_ids)).all()
+
     @classmethod
     def get(cls, guild_id: int, user_id: int, session) -> "PermissionSubscriber | None":
         """Returns a specific subscription, or None."""
@@ -47,15 +47,24 @@ class ReminderMessage(db.BASE):
         return session.query(cls).filter(cls.GuildId == guild_id).all()
 
     @classmethod
-    def get_due(cls, session):
-        """Return all enabled reminders whose NextFire is in the past."""
+    def get_due(cls, session, guild_filter=None):
+        """Return all enabled reminders whose NextFire is in the past.
+
+        *guild_filter* (see ``ClusterPlan.guild_filter``) limits them to the guilds of this cluster.
+        """
         now = datetime.now(UTC)
-        return session.query(cls).filter(cls.Enabled.is_(True), cls.NextFire <= now).all()
+        query = session.query(cls).filter(cls.Enabled.is_(True), cls.NextFire <= now)
+        if guild_filter is not None:
+            query = query.filter(guild_filter)
+        return query.all()
 
     @classmethod
-    def get_next_fire_time(cls, session) -> datetime | None:
+    def get_next_fire_time(cls, session, guild_filter=None) -> datetime | None:
         """Return the earliest NextFire among enabled reminders, or None."""
-        result = session.query(func.min(cls.NextFire)).filter(cls.Enabled.is_(True)).scalar()
+        query = session.query(func.min(cls.NextFire)).filter(cls.Enabled.is_(True))
+        if guild_filter is not None:
+            query = query.filter(guild_filter)
+        result = query.scalar()
         if result is not None:
             return result.replace(tzinfo=UTC)
         return None
@@ -12,14 +12,13 @@ from discord.app_commands import checks
 from discord.ext.commands import Cog, GroupCog
 from models.application import (
     TEMPLATE_KEY_MAP,
+    ApplicationAnswer,
     ApplicationForm,
     ApplicationGuildRole,
     ApplicationQuestion,
     ApplicationSubmission,
     ApplicationTemplate,
     ApplicationTemplateQuestion,
-    SubmissionStatus,
-    VoteType,
     seed_built_in_templates,
 )
 from modules.application.conversations import (
@@ -34,6 +33,7 @@ from utils.cache import (
     invalidate_autocomplete,
     invalidate_autocomplete_app_templates,
 )
+from utils.bulk_edit import MessageEdit, bulk_edit_messages, progress_logger
 from utils.cog import NerpyBotCog
 from utils.helpers import DISCORD_MESSAGE_LIMIT, fetch_message_content, send_hidden_message
 from utils.strings import get_raw, get_string
@@ -66,8 +66,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
         self.bot.create_all()
 
         try:
-            with self.bot.session_scope() as session:
-                seed_built_in_templates(session)
+            async with self.bot.async_session_scope() as session:
+                await session.run_sync(seed_built_in_templates)
         except SQLAlchemyError:
             self.bot.log.error("application: failed to seed built-in templates", exc_info=True)
 
@@ -200,7 +200,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     ) -> tuple[str, "ApplicationForm"] | None:
         """Look up a form by autocomplete value or name; returns (lang, form) or sends an error."""
         lang = interaction.client.get_guild_language(interaction.guild_id)
-        form = ApplicationManagement._resolve_form(name, interaction.guild.id, session)
+        form = await session.run_sync(lambda s: ApplicationManagement._resolve_form(name, interaction.guild.id, s))
         if not form:
             await interaction.response.send_message(
                 get_string(lang, "application.form_not_found", name=name), ephemeral=True
@@ -275,8 +275,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
         msg = None
         changes = []
 
-        with self.bot.session_scope() as session:
-            form = self._resolve_form(name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            form = await session.run_sync(lambda s: self._resolve_form(name, interaction.guild.id, s))
             if not form:
                 msg = get_string(lang, "application.form_not_found", name=name)
             else:
@@ -361,8 +361,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             return
         lang, prefill_description = result
 
-        with self.bot.session_scope() as session:
-            existing = ApplicationForm.get(name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            existing = await session.run_sync(lambda s: ApplicationForm.get(name, interaction.guild.id, s))
             if existing:
                 await interaction.response.send_message(
                     get_string(lang, "application.form_already_exists", name=name), ephemeral=True
@@ -412,14 +412,14 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
+        async with self.bot.async_session_scope() as session:
             result = await self._get_form_or_respond(interaction, name, session)
             if result is None:
                 return
             lang, form = result
             apply_channel_id = form.ApplyChannelId
             apply_message_id = form.ApplyMessageId
-            session.delete(form)
+            await session.delete(form)
 
         invalidate_autocomplete(("app_forms", interaction.guild.id))
         await interaction.response.send_message(
@@ -444,8 +444,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            forms = ApplicationForm.get_all_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            forms = await session.run_sync(lambda s: ApplicationForm.get_all_by_guild(interaction.guild.id, s))
             if not forms:
                 await interaction.response.send_message(get_string(lang, "application.list.empty"), ephemeral=True)
                 return
@@ -477,7 +477,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
+        async with self.bot.async_session_scope() as session:
             result = await self._get_form_or_respond(interaction, name, session)
             if result is None:
                 return
@@ -542,8 +542,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
 
         # If edit-description flag is set and no description yet → show modal
         if edit_description and description is None:
-            with self.bot.session_scope() as session:
-                form = self._resolve_form(name, interaction.guild.id, session)
+            async with self.bot.async_session_scope() as session:
+                form = await session.run_sync(lambda s: self._resolve_form(name, interaction.guild.id, s))
                 if not form:
                     await interaction.response.send_message(
                         get_string(lang, "application.form_not_found", name=name), ephemeral=True
@@ -593,8 +593,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            templates = ApplicationTemplate.get_available(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            templates = await session.run_sync(lambda s: ApplicationTemplate.get_available(interaction.guild.id, s))
             if not templates:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.list.empty"), ephemeral=True
@@ -643,8 +643,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            tpl = self._resolve_template(name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            tpl = await session.run_sync(lambda s: self._resolve_template(name, interaction.guild.id, s))
             if not tpl:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.not_found", name=name), ephemeral=True
@@ -707,8 +707,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            existing = ApplicationTemplate.get_by_name(name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            existing = await session.run_sync(lambda s: ApplicationTemplate.get_by_name(name, interaction.guild.id, s))
             if existing and not existing.IsBuiltIn:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.already_exists", name=name), ephemeral=True
@@ -745,15 +745,15 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             return
         lang, prefill_description = result
 
-        with self.bot.session_scope() as session:
-            tpl = self._resolve_template(template, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            tpl = await session.run_sync(lambda s: self._resolve_template(template, interaction.guild.id, s))
             if not tpl:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.not_found", name=template), ephemeral=True
                 )
                 return
 
-            existing = ApplicationForm.get(name, interaction.guild.id, session)
+            existing = await session.run_sync(lambda s: ApplicationForm.get(name, interaction.guild.id, s))
             if existing:
                 await interaction.response.send_message(
                     get_string(lang, "application.form_already_exists", name=name), ephemeral=True
@@ -773,9 +773,11 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
         async def _on_submit(modal_interaction: Interaction, description, approval_message, denial_message):
             form_id = None
             tmpl_not_found = False
-            with bot.session_scope() as db_session:
+            async with bot.async_session_scope() as db_session:
                 # Re-query template (session closed after permission checks above)
-                tmpl = ApplicationManagement._resolve_template(template, guild_id, db_session)
+                tmpl = await db_session.run_sync(
+                    lambda s: ApplicationManagement._resolve_template(template, guild_id, s)
+                )
 
                 if template is not None and tmpl is None:
                     tmpl_not_found = True
@@ -813,7 +815,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
                         DenialMessage=final_denial,
                     )
                     db_session.add(form)
-                    db_session.flush()
+                    await db_session.flush()
 
                     if questions is not None:
                         for i, q_text in enumerate(questions, start=1):
@@ -872,15 +874,17 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            src_form = self._resolve_form(form, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            src_form = await session.run_sync(lambda s: self._resolve_form(form, interaction.guild.id, s))
             if not src_form:
                 await interaction.response.send_message(
                     get_string(lang, "application.form_not_found", name=form), ephemeral=True
                 )
                 return
 
-            existing_tpl = ApplicationTemplate.get_by_name(template_name, interaction.guild.id, session)
+            existing_tpl = await session.run_sync(
+                lambda s: ApplicationTemplate.get_by_name(template_name, interaction.guild.id, s)
+            )
             if existing_tpl:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.already_exists", name=template_name), ephemeral=True
@@ -895,7 +899,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
                 DenialMessage=src_form.DenialMessage,
             )
             session.add(tpl)
-            session.flush()
+            await session.flush()
 
             for q in src_form.questions:
                 session.add(
@@ -920,8 +924,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            tpl = self._resolve_template(template_name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            tpl = await session.run_sync(lambda s: self._resolve_template(template_name, interaction.guild.id, s))
             if not tpl:
                 await interaction.response.send_message(
                     get_string(lang, "application.template.not_found", name=template_name), ephemeral=True
@@ -932,7 +936,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
                     get_string(lang, "application.template.delete.builtin_forbidden"), ephemeral=True
                 )
                 return
-            session.delete(tpl)
+            await session.delete(tpl)
 
         invalidate_autocomplete_app_templates(interaction.guild.id)
         await interaction.response.send_message(
@@ -953,8 +957,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
         changes = []
         msg = None
 
-        with self.bot.session_scope() as session:
-            tpl = self._resolve_template(template_name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            tpl = await session.run_sync(lambda s: self._resolve_template(template_name, interaction.guild.id, s))
             if not tpl:
                 msg = get_string(lang, "application.template.not_found", name=template_name)
             elif tpl.IsBuiltIn:
@@ -1041,8 +1045,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
 
         # When no text provided at all → open modal pre-filled with current values
         if approval_message is None and denial_message is None:
-            with self.bot.session_scope() as session:
-                tpl = self._resolve_template(template_name, interaction.guild.id, session)
+            async with self.bot.async_session_scope() as session:
+                tpl = await session.run_sync(lambda s: self._resolve_template(template_name, interaction.guild.id, s))
                 if not tpl:
                     await interaction.response.send_message(
                         get_string(lang, "application.template.not_found", name=template_name), ephemeral=True
@@ -1074,8 +1078,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
             await interaction.response.send_message(get_string(lang, "application.no_permission"), ephemeral=True)
             return
 
-        with self.bot.session_scope() as session:
-            form = self._resolve_form(name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            form = await session.run_sync(lambda s: self._resolve_form(name, interaction.guild.id, s))
             if not form:
                 await interaction.response.send_message(
                     get_string(lang, "application.form_not_found", name=name), ephemeral=True
@@ -1168,8 +1172,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
 
         form_name = form_data["name"].strip()
 
-        with self.bot.session_scope() as session:
-            existing = ApplicationForm.get(form_name, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            existing = await session.run_sync(lambda s: ApplicationForm.get(form_name, interaction.guild.id, s))
             if existing:
                 await interaction.user.send(get_string(lang, "application.import.form_exists", name=form_name))
                 return
@@ -1183,7 +1187,7 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
                 DenialMessage=form_data.get("denial_message"),
             )
             session.add(form)
-            session.flush()
+            await session.flush()
 
             for i, q in enumerate(questions):
                 session.add(
@@ -1203,8 +1207,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _managerole_add(self, interaction: Interaction, role: Role):
         """Add a role to the application manager list."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            ApplicationGuildRole.add(interaction.guild_id, role.id, "manager", session)
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(lambda s: ApplicationGuildRole.add(interaction.guild_id, role.id, "manager", s))
         await interaction.response.send_message(
             get_string(lang, "application.managerole.add_success", role=role.name), ephemeral=True
         )
@@ -1217,8 +1221,10 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _managerole_remove(self, interaction: Interaction, role: Role):
         """Remove a role from the application manager list."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            found = ApplicationGuildRole.remove(interaction.guild_id, role.id, "manager", session)
+        async with self.bot.async_session_scope() as session:
+            found = await session.run_sync(
+                lambda s: ApplicationGuildRole.remove(interaction.guild_id, role.id, "manager", s)
+            )
         if not found:
             await interaction.response.send_message(
                 get_string(lang, "application.managerole.not_found", role=role.name), ephemeral=True
@@ -1235,8 +1241,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _managerole_clear(self, interaction: Interaction):
         """Remove all application manager roles."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            ApplicationGuildRole.clear(interaction.guild_id, "manager", session)
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(lambda s: ApplicationGuildRole.clear(interaction.guild_id, "manager", s))
         await interaction.response.send_message(
             get_string(lang, "application.managerole.clear_success"), ephemeral=True
         )
@@ -1248,8 +1254,10 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _managerole_list(self, interaction: Interaction):
         """List all configured application manager roles."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            role_ids = ApplicationGuildRole.get_role_ids(interaction.guild_id, "manager", session)
+        async with self.bot.async_session_scope() as session:
+            role_ids = await session.run_sync(
+                lambda s: ApplicationGuildRole.get_role_ids(interaction.guild_id, "manager", s)
+            )
         if not role_ids:
             await interaction.response.send_message(
                 get_string(lang, "application.managerole.list_empty"), ephemeral=True
@@ -1274,8 +1282,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _reviewerrole_add(self, interaction: Interaction, role: Role):
         """Add a role to the application reviewer list."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            ApplicationGuildRole.add(interaction.guild_id, role.id, "reviewer", session)
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(lambda s: ApplicationGuildRole.add(interaction.guild_id, role.id, "reviewer", s))
         await interaction.response.send_message(
             get_string(lang, "application.reviewerrole.add_success", role=role.name), ephemeral=True
         )
@@ -1288,8 +1296,10 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _reviewerrole_remove(self, interaction: Interaction, role: Role):
         """Remove a role from the application reviewer list."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            found = ApplicationGuildRole.remove(interaction.guild_id, role.id, "reviewer", session)
+        async with self.bot.async_session_scope() as session:
+            found = await session.run_sync(
+                lambda s: ApplicationGuildRole.remove(interaction.guild_id, role.id, "reviewer", s)
+            )
         if not found:
             await interaction.response.send_message(
                 get_string(lang, "application.reviewerrole.not_found", role=role.name), ephemeral=True
@@ -1306,8 +1316,8 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _reviewerrole_clear(self, interaction: Interaction):
         """Remove all application reviewer roles."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            ApplicationGuildRole.clear(interaction.guild_id, "reviewer", session)
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(lambda s: ApplicationGuildRole.clear(interaction.guild_id, "reviewer", s))
         await interaction.response.send_message(
             get_string(lang, "application.reviewerrole.clear_success"), ephemeral=True
         )
@@ -1319,8 +1329,10 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
     async def _reviewerrole_list(self, interaction: Interaction):
         """List all configured application reviewer roles."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            role_ids = ApplicationGuildRole.get_role_ids(interaction.guild_id, "reviewer", session)
+        async with self.bot.async_session_scope() as session:
+            role_ids = await session.run_sync(
+                lambda s: ApplicationGuildRole.get_role_ids(interaction.guild_id, "reviewer", s)
+            )
         if not role_ids:
             await interaction.response.send_message(
                 get_string(lang, "application.reviewerrole.list_empty"), ephemeral=True
@@ -1346,101 +1358,73 @@ class ApplicationManagement(NerpyBotCog, GroupCog, group_name="application"):
         await self._refresh_review_embeds(guild_id)
 
     async def _refresh_apply_embeds(self, guild_id: int) -> None:
-        """Re-post or edit the Apply button embed for each configured form in the guild."""
-        from modules.application.views import ApplyEmbedData, edit_apply_button_message
+        """Re-render the Apply button embed of each configured form in the guild."""
+        from modules.application.views import render_apply_message
 
         lang = self._lang(guild_id)
-        with self.bot.session_scope() as session:
-            forms = ApplicationForm.get_all_by_guild(guild_id, session)
-            preloaded = [
-                ApplyEmbedData(
+
+        def _renderer(form_name: str, description: str | None):
+            return lambda _message: render_apply_message(self.bot, form_name, description, lang)
+
+        async with self.bot.async_session_scope() as session:
+            forms = await session.run_sync(lambda s: ApplicationForm.get_all_by_guild(guild_id, s))
+            edits = [
+                MessageEdit(
                     channel_id=f.ApplyChannelId,
                     message_id=f.ApplyMessageId,
-                    form_name=f.Name,
-                    description=f.ApplyDescription,
-                    lang=lang,
+                    render=_renderer(f.Name, f.ApplyDescription),
                 )
                 for f in forms
                 if f.ApplyMessageId and f.ApplyChannelId
             ]
 
-        for data in preloaded:
-            try:
-                await edit_apply_button_message(self.bot, preloaded=data)
-                self.bot.log.info(
-                    "application: refreshed apply embed for message %d (guild %d)", data.message_id, guild_id
-                )
-            except discord.HTTPException as exc:
-                self.bot.log.warning(
-                    "application: failed to refresh apply embed for message %d (guild %d): %s",
-                    data.message_id,
-                    guild_id,
-                    exc,
-                )
+        await bulk_edit_messages(
+            self.bot, edits, on_progress=progress_logger(f"application: apply embeds (guild {guild_id})")
+        )
 
     async def _refresh_review_embeds(self, guild_id: int) -> None:
         """Re-render each pending review embed in the guild with the new language."""
-        from modules.application.views import (
-            ReviewEmbedData,
-            RoutedReviewEmbed,
-            extract_answers,
-            update_review_embed,
-        )
+        from modules.application.views import ReviewEmbedData, render_review_message
 
         lang = self._lang(guild_id)
-        with self.bot.session_scope() as session:
-            submissions = ApplicationSubmission.get_by_guild(guild_id, session)
-            pending = []
-            for s in submissions:
-                if not (
-                    s.Status == SubmissionStatus.PENDING and s.ReviewMessageId and s.form and s.form.ReviewChannelId
-                ):
-                    continue
-                pending.append(
-                    RoutedReviewEmbed(
-                        data=ReviewEmbedData(
-                            user_id=s.UserId,
-                            user_name=s.UserName,
-                            submitted_at=s.SubmittedAt,
-                            status=s.Status,
-                            applicant_notified=s.ApplicantNotified,
-                            form_name=s.form.Name,
-                            required_approvals=s.form.RequiredApprovals,
-                            required_denials=s.form.RequiredDenials,
-                            lang=lang,
-                            approve_count=sum(1 for v in s.votes if v.Vote == VoteType.APPROVE),
-                            deny_count=sum(1 for v in s.votes if v.Vote == VoteType.DENY),
-                            answers=extract_answers(s.answers),
+
+        # Column projection with SQL-side vote tallies: no submission, form or vote entities are loaded.
+        def _collect(session):
+            reviews = ApplicationSubmission.get_pending_reviews(guild_id, session)
+            answers = ApplicationAnswer.get_texts_by_submission([r.Id for r in reviews], session)
+            edits = []
+            for r in reviews:
+                data = ReviewEmbedData(
+                    user_id=r.UserId,
+                    user_name=r.UserName,
+                    submitted_at=r.SubmittedAt,
+                    status=r.Status,
+                    applicant_notified=r.ApplicantNotified,
+                    form_name=r.FormName,
+                    required_approvals=r.RequiredApprovals,
+                    required_denials=r.RequiredDenials,
+                    lang=lang,
+                    approve_count=r.ApproveCount,
+                    deny_count=r.DenyCount,
+                    answers=answers[r.Id],
+                )
+                edits.append(
+                    MessageEdit(
+                        channel_id=r.ReviewChannelId,
+                        message_id=r.ReviewMessageId,
+                        render=lambda message, msg_id=r.ReviewMessageId, data=data: render_review_message(
+                            self.bot, message, msg_id, preloaded=data
                         ),
-                        channel_id=s.form.ReviewChannelId,
-                        message_id=s.ReviewMessageId,
                     )
                 )
+            return edits
 
-        for i, routed in enumerate(pending):
-            try:
-                await update_review_embed(
-                    self.bot,
-                    review_channel_id=routed.channel_id,
-                    review_message_id=routed.message_id,
-                    preloaded=routed.data,
-                )
-                self.bot.log.info("application: refreshed review embed %d (guild %d)", routed.message_id, guild_id)
-            except (discord.NotFound, discord.Forbidden):
-                self.bot.log.warning(
-                    "application: review message %d not accessible (guild %d) — skipping",
-                    routed.message_id,
-                    guild_id,
-                )
-            except discord.HTTPException as exc:
-                self.bot.log.warning(
-                    "application: failed to refresh review embed %d (guild %d): %s",
-                    routed.message_id,
-                    guild_id,
-                    exc,
-                )
-            if i < len(pending) - 1:
-                await asyncio.sleep(1)
+        async with self.bot.async_session_scope() as session:
+            edits = await session.run_sync(_collect)
+
+        await bulk_edit_messages(
+            self.bot, edits, on_progress=progress_logger(f"application: review embeds (guild {guild_id})")
+        )
 
 
 class _TemplateMessagesModal(discord.ui.Modal):
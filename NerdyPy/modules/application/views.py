@@ -95,17 +95,6 @@ def _normalize_review_view(
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class ApplyEmbedData:
-    """Scalar data needed to edit an Apply button embed without a DB session."""
-
-    channel_id: int
-    message_id: int
-    form_name: str
-    description: str | None
-    lang: str
-
-
 @dataclass
 class ReviewEmbedData:
     """Scalar data needed to rebuild a review embed without a DB session."""
@@ -126,15 +115,6 @@ class ReviewEmbedData:
     total_pages: int = field(default=1)
 
 
-@dataclass
-class RoutedReviewEmbed:
-    """Pairs pre-extracted review embed data with its Discord message location."""
-
-    data: "ReviewEmbedData"
-    channel_id: int
-    message_id: int
-
-
 def extract_answers(answers) -> list[tuple[str, str | None]]:
     """Extract (question_text, answer_text) pairs from an answer collection."""
     return [(a.question.QuestionText if a.question else f"Question {a.QuestionId}", a.AnswerText) for a in answers]
@@ -191,6 +171,7 @@ def build_review_embed(
     when the caller already has the list (avoids a second traversal).
     """
     all_answers = answers if answers is not None else extract_answers(submission.answers)
+    approve_count, deny_count = ApplicationVote.tally(submission.Id, session)
     total_pages = max(1, math.ceil(len(all_answers) / _ANSWERS_PER_PAGE))
     page = max(1, min(page, total_pages))
     return _build_review_embed_from_data(
@@ -204,8 +185,8 @@ def build_review_embed(
             required_approvals=form.RequiredApprovals,
             required_denials=form.RequiredDenials,
             lang=lang,
-            approve_count=sum(1 for v in submission.votes if v.Vote == VoteType.APPROVE),
-            deny_count=sum(1 for v in submission.votes if v.Vote == VoteType.DENY),
+            approve_count=approve_count,
+            deny_count=deny_count,
             answers=all_answers,
             page=page,
             total_pages=total_pages,
@@ -268,7 +249,6 @@ async def update_review_embed(
     interaction: discord.Interaction | None = None,
     review_channel_id: int | None = None,
     review_message_id: int | None = None,
-    preloaded: "ReviewEmbedData | None" = None,
     page: int | None = None,
 ):
     """Rebuild and edit the review embed with current vote counts.
@@ -280,7 +260,6 @@ async def update_review_embed(
 
     If the submission is no longer pending, all buttons are disabled.
 
-    Pass ``preloaded`` to skip the database lookup entirely (used by bulk language-refresh).
     Pass ``page`` to show a specific page of answers; defaults to 1.
     """
     # Resolve the review message
@@ -296,6 +275,25 @@ async def update_review_embed(
     else:
         raise ValueError("Either interaction (with .message) or review_channel_id+review_message_id must be provided")
 
+    kwargs = render_review_message(bot, message, msg_id, page=page)
+    if kwargs is not None:
+        await message.edit(**kwargs)
+
+
+def render_review_message(
+    bot,
+    message: discord.Message,
+    msg_id: int,
+    *,
+    preloaded: "ReviewEmbedData | None" = None,
+    page: int | None = None,
+) -> dict | None:
+    """Return the ``Message.edit`` arguments (embed and view) for review message *msg_id*.
+
+    Keeps the page the message currently shows unless *page* is given. Pass ``preloaded`` to skip
+    the database lookup entirely (used by the bulk language refresh). Returns None when the
+    submission behind the message no longer exists.
+    """
     if page is not None:
         current_page = page
     elif msg_id in _review_page_cache:
@@ -318,7 +316,7 @@ async def update_review_embed(
             submission = ApplicationSubmission.get_by_review_message(msg_id, session)
             if submission is None:
                 bot.log.warning("application: no submission found for review message %d — was it deleted?", msg_id)
-                return
+                return None
             form = ApplicationForm.get_by_id(submission.FormId, session)
             lang = bot.get_guild_language(submission.GuildId)
             all_answers = extract_answers(submission.answers)
@@ -336,7 +334,7 @@ async def update_review_embed(
         status=status,
         applicant_notified=applicant_notified,
     )
-    await message.edit(embed=embed, view=view)
+    return {"embed": embed, "view": view}
 
 
 # ---------------------------------------------------------------------------
@@ -1293,10 +1291,7 @@ async def post_apply_button_message(bot, form_id: int) -> None:
         bot.log.warning("application: could not fetch apply channel %d for form %d", channel_id, form_id)
         return
 
-    embed = build_apply_embed(form_name, description, lang)
-    view = ApplicationApplyView(bot=bot)
-    view.apply_button.label = get_string(lang, "application.apply.button_label")
-    msg = await channel.send(embed=embed, view=view)
+    msg = await channel.send(**render_apply_message(bot, form_name, description, lang))
 
     with bot.session_scope() as session:
         form = ApplicationForm.get_by_id(form_id, session)
@@ -1304,39 +1299,32 @@ async def post_apply_button_message(bot, form_id: int) -> None:
             form.ApplyMessageId = msg.id
 
 
-async def edit_apply_button_message(
-    bot, form_id: int | None = None, *, preloaded: "ApplyEmbedData | None" = None
-) -> None:
+def render_apply_message(bot, form_name: str, description: str | None, lang: str) -> dict:
+    """Return the ``Message.edit`` arguments (embed and view) for an Apply button message."""
+    view = ApplicationApplyView(bot=bot)
+    view.apply_button.label = get_string(lang, "application.apply.button_label")
+    return {"embed": build_apply_embed(form_name, description, lang), "view": view}
+
+
+async def edit_apply_button_message(bot, form_id: int) -> None:
     """Edit the Apply button message in-place (e.g. after description change).
 
     Raises discord.HTTPException on failure — callers must catch.
-
-    Pass ``preloaded`` to skip the database lookup (used by bulk language-refresh).
     """
-    if preloaded is not None:
-        channel_id = preloaded.channel_id
-        message_id = preloaded.message_id
-        form_name = preloaded.form_name
-        description = preloaded.description
-        lang = preloaded.lang
-    else:
-        with bot.session_scope() as session:
-            form = ApplicationForm.get_by_id(form_id, session)
-            if form is None or not form.ApplyMessageId or not form.ApplyChannelId:
-                return
-            channel_id = form.ApplyChannelId
-            message_id = form.ApplyMessageId
-            form_name = form.Name
-            description = form.ApplyDescription
-            lang = bot.get_guild_language(form.GuildId)
+    with bot.session_scope() as session:
+        form = ApplicationForm.get_by_id(form_id, session)
+        if form is None or not form.ApplyMessageId or not form.ApplyChannelId:
+            return
+        channel_id = form.ApplyChannelId
+        message_id = form.ApplyMessageId
+        form_name = form.Name
+        description = form.ApplyDescription
+        lang = bot.get_guild_language(form.GuildId)
 
     try:
         channel = await bot_get_or_fetch_channel(bot, channel_id)
         msg = await channel.fetch_message(message_id)
-        embed = build_apply_embed(form_name, description, lang)
-        view = ApplicationApplyView(bot=bot)
-        view.apply_button.label = get_string(lang, "application.apply.button_label")
-        await msg.edit(embed=embed, view=view)
+        await msg.edit(**render_apply_message(bot, form_name, description, lang))
     except discord.HTTPException:
         bot.log.warning("application: could not edit apply message %d in channel %d", message_id, channel_id)
         raise
@@ -4,7 +4,18 @@ import asyncio
 from datetime import UTC, datetime, time, timedelta
 
 import discord
-from discord import Color, Embed, HTTPException, Interaction, Member, TextChannel, app_commands
+from discord import (
+    Color,
+    Embed,
+    Guild,
+    HTTPException,
+    Interaction,
+    Member,
+    RawMemberRemoveEvent,
+    TextChannel,
+    User,
+    app_commands,
+)
 from discord.app_commands import checks
 from sqlalchemy.exc import SQLAlchemyError
 from discord.ext import tasks
@@ -27,6 +38,7 @@ from utils.helpers import (
     send_hidden_message,
     send_paginated,
 )
+from utils.metrics import instrumented_loop
 from utils.permissions import validate_channel_permissions
 from utils.strings import get_string
 
@@ -70,24 +82,30 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         self._autodeleter_loop.cancel()
 
     @tasks.loop(time=LOOP_RUN_TIME)
+    @instrumented_loop("autokicker")
     async def _autokicker_loop(self):
         self.bot.log.debug("Start Autokicker Loop!")
+        checked = 0
         try:
-            with self.bot.session_scope() as session:
+            async with self.bot.async_session_scope() as session:
                 self.bot.log.debug("Fetching configurations")
-                configurations = AutoKicker.get_all(session)
+                configurations = await session.run_sync(AutoKicker.get_all)
                 self.bot.log.debug(f"Fetched {len(configurations)} configurations")
             now = datetime.now(UTC)
             for configuration in configurations:
+                if not self.bot.owns_guild(configuration.GuildId):
+                    continue
                 if configuration.Enabled and configuration.KickAfter > 0:
                     guild = self.bot.get_guild(configuration.GuildId)
                     if guild is None:
                         continue
+                    checked += 1
                     self.bot.log.info(f"[{guild.name} ({guild.id})]: checking for members without role")
                     lang = self._lang(configuration.GuildId)
                     kick_delta = timedelta(seconds=configuration.KickAfter)
                     kick_after = now - kick_delta
                     kick_reminder = now - kick_delta / 2
+                    await self.bot.member_cache.ensure_chunked(guild)
                     for member in guild.members:
                         if member.joined_at is None or len(member.roles) != 1:
                             continue
@@ -129,8 +147,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
             self.bot.log.error("Autokicker: unexpected error: %s", ex, exc_info=True)
             await notify_error(self.bot, "Autokicker background loop", ex)
         self.bot.log.debug("Finish Autokicker Loop!")
+        return checked
 
     @tasks.loop(minutes=5)
+    @instrumented_loop("autodeleter")
     async def _autodeleter_loop(self):
         """
         Iterate enabled AutoDelete configurations, resolve their guilds and channels, and run per-channel cleanup.
@@ -138,13 +158,14 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         Fetches all AutoDelete entries from the database, skips configurations that are disabled or whose guild/channel cannot be resolved, and invokes _cleanup_channel for each remaining configuration. If a Discord HTTP 429 (rate limit) is encountered while cleaning a channel, stops processing further channels for the current run. Per-channel exceptions are logged; an unexpected error during the overall loop is logged and reported via notify_error.
         """
         self.bot.log.debug("Start Autodeleter Loop!")
+        cleaned = 0
         try:
-            with self.bot.session_scope() as session:
-                configurations = AutoDelete.get_all(session)
+            async with self.bot.async_session_scope() as session:
+                configurations = await session.run_sync(AutoDelete.get_all)
             self.bot.log.debug(f"Fetched {len(configurations)} configurations")
 
             for configuration in configurations:
-                if not configuration.Enabled:
+                if not configuration.Enabled or not self.bot.owns_guild(configuration.GuildId):
                     continue
                 guild = self.bot.get_guild(configuration.GuildId)
                 if guild is None:
@@ -154,6 +175,7 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
                     continue
                 try:
                     await self._cleanup_channel(configuration, guild, channel)
+                    cleaned += 1
                 except HTTPException as ex:
                     if ex.status == 429:
                         self.bot.log.warning(
@@ -172,6 +194,7 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
             self.bot.log.error("Autodeleter: unexpected error", exc_info=True)
             await notify_error(self.bot, "Autodeleter background loop", ex)
         self.bot.log.debug("Finish Autodeleter Loop!")
+        return cleaned
 
     async def _cleanup_channel(self, configuration, guild, channel):
         """
@@ -299,8 +322,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
             await send_hidden_message(interaction, get_string(lang, "moderation.invalid_timespan"))
             return
 
-        with self.bot.session_scope() as session:
-            configuration = AutoKicker.get_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(lambda s: AutoKicker.get_by_guild(interaction.guild.id, s))
             if configuration is not None:
                 configuration.KickAfter = kick_time
                 configuration.Enabled = enable
@@ -362,8 +385,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
             "read_message_history",
         )
 
-        with self.bot.session_scope() as session:
-            configuration = AutoDelete.get_by_channel(interaction.guild.id, channel_id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(
+                lambda s: AutoDelete.get_by_channel(interaction.guild.id, channel_id, s)
+            )
             already_exists = configuration is not None
             if not already_exists:
                 deleter = AutoDelete(
@@ -399,10 +424,12 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         channel_name = channel.name
 
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            configuration = AutoDelete.get_by_channel(interaction.guild.id, channel_id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(
+                lambda s: AutoDelete.get_by_channel(interaction.guild.id, channel_id, s)
+            )
             if configuration is not None:
-                AutoDelete.delete(interaction.guild.id, channel_id, session)
+                await session.run_sync(lambda s: AutoDelete.delete(interaction.guild.id, channel_id, s))
                 msg = get_string(lang, "moderation.autodeleter.delete.success", channel=channel_name)
             else:
                 msg = get_string(lang, "moderation.autodeleter.delete.not_found", channel=channel_name)
@@ -422,8 +449,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
 
         lang = self._lang(interaction.guild_id)
         list_msg = None
-        with self.bot.session_scope() as session:
-            configurations = AutoDelete.get_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            configurations = await session.run_sync(lambda s: AutoDelete.get_by_guild(interaction.guild.id, s))
             if configurations:
                 list_msg = ""
                 for configuration in configurations:
@@ -465,8 +492,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         """
         lang = self._lang(interaction.guild_id)
         error_key = None
-        with self.bot.session_scope() as session:
-            configuration = AutoDelete.get_by_channel(interaction.guild.id, channel.id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(
+                lambda s: AutoDelete.get_by_channel(interaction.guild.id, channel.id, s)
+            )
             if configuration is None:
                 error_key = "moderation.autodeleter.no_config"
             elif not configuration.Enabled:
@@ -495,8 +524,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         """
         lang = self._lang(interaction.guild_id)
         error_key = None
-        with self.bot.session_scope() as session:
-            configuration = AutoDelete.get_by_channel(interaction.guild.id, channel.id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(
+                lambda s: AutoDelete.get_by_channel(interaction.guild.id, channel.id, s)
+            )
             if configuration is None:
                 error_key = "moderation.autodeleter.no_config"
             elif configuration.Enabled:
@@ -549,8 +580,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         else:
             delete_in_seconds = None
 
-        with self.bot.session_scope() as session:
-            configuration = AutoDelete.get_by_channel(interaction.guild.id, channel_id, session)
+        async with self.bot.async_session_scope() as session:
+            configuration = await session.run_sync(
+                lambda s: AutoDelete.get_by_channel(interaction.guild.id, channel_id, s)
+            )
             if configuration is not None:
                 configuration.DeleteOlderThan = delete_in_seconds
                 configuration.KeepMessages = keep_messages if keep_messages is not None else 0
@@ -600,6 +633,10 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
             If True shows only Users without a Role. (The role everyone is not considered a given role)
         """
         lang = self._lang(interaction.guild_id)
+        if not interaction.guild.chunked:
+            # Only guilds whose features need it keep their full member list; load it for this one.
+            await interaction.response.defer(ephemeral=True)
+            await self.bot.member_cache.ensure_chunked(interaction.guild)
         msg = ""
         if show_only_users_without_roles:
             for member in interaction.guild.members:
@@ -635,40 +672,52 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
     @GroupCog.listener()
     async def on_member_remove(self, member: Member) -> None:
         """Send a farewell message when a member leaves the server."""
+        await self._send_leave_message(member.guild, member)
+
+    @GroupCog.listener()
+    async def on_raw_member_remove(self, payload: RawMemberRemoveEvent) -> None:
+        """Farewell for members missing from the member cache, which ``on_member_remove`` never sees."""
+        if isinstance(payload.user, Member):
+            return  # the member was cached, so on_member_remove handles it
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is not None:
+            await self._send_leave_message(guild, payload.user)
+
+    async def _send_leave_message(self, guild: Guild, member: Member | User) -> None:
         if member.bot:
             return
 
         await self.bot.guild_cache.try_rewarm_leave_messages(self.bot.SESSION)
 
-        if not self.bot.guild_cache.is_leave_message_guild(member.guild.id):
+        if not self.bot.guild_cache.is_leave_message_guild(guild.id):
             return
 
         try:
-            leave_config = self.bot.guild_cache.get_leave_config(member.guild.id, self.bot.SESSION)
+            leave_config = self.bot.guild_cache.get_leave_config(guild.id, self.bot.SESSION)
             if leave_config is LEAVE_CONFIG_DB_ERROR:
                 self.bot.log.warning(
                     "[%s (%d)]: on_member_remove: DB error reading leave config — skipping",
-                    member.guild.name,
-                    member.guild.id,
+                    guild.name,
+                    guild.id,
                 )
                 return
             if leave_config is None:
                 self.bot.log.debug(
                     "[%s (%d)]: on_member_remove: no leave config — skipping",
-                    member.guild.name,
-                    member.guild.id,
+                    guild.name,
+                    guild.id,
                 )
                 return
 
             channel_id, message_text = leave_config
-            channel = await get_or_fetch_channel(member.guild, channel_id)
+            channel = await get_or_fetch_channel(guild, channel_id)
             if channel is None or not isinstance(channel, TextChannel):
                 self.bot.log.warning(
-                    f"[{member.guild.name} ({member.guild.id})]: leave channel {channel_id} not found or not a text channel"
+                    f"[{guild.name} ({guild.id})]: leave channel {channel_id} not found or not a text channel"
                 )
                 return
 
-            self.bot.log.debug(f"[{member.guild.name} ({member.guild.id})]: sending leave message for {member}")
+            self.bot.log.debug(f"[{guild.name} ({guild.id})]: sending leave message for {member}")
 
             message = message_text or DEFAULT_LEAVE_MESSAGE
             member_str = f"**{member.display_name}** ({member.name})"
@@ -678,13 +727,9 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
 
             await channel.send(formatted_message)
         except discord.HTTPException as ex:
-            self.bot.log.error(
-                f"[{member.guild.name} ({member.guild.id})]: failed to send leave message for {member}: {ex}"
-            )
+            self.bot.log.error(f"[{guild.name} ({guild.id})]: failed to send leave message for {member}: {ex}")
         except Exception:
-            self.bot.log.exception(
-                "[%s (%d)]: on_member_remove: unexpected error for %s", member.guild.name, member.guild.id, member
-            )
+            self.bot.log.exception("[%s (%d)]: on_member_remove: unexpected error for %s", guild.name, guild.id, member)
 
     # ── /moderation leavemsg commands ────────────────────────────────────────
 
@@ -702,8 +747,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         validate_channel_permissions(channel, interaction.guild, "view_channel", "send_messages")
 
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            leave_config = LeaveMessage.get(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            leave_config = await session.run_sync(lambda s: LeaveMessage.get(interaction.guild.id, s))
             if leave_config is None:
                 leave_config = LeaveMessage(
                     GuildId=interaction.guild.id,
@@ -727,8 +772,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
     async def _leavemsg_disable(self, interaction: Interaction) -> None:
         """Disable leave messages for this server. [administrator]"""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            leave_config = LeaveMessage.get(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            leave_config = await session.run_sync(lambda s: LeaveMessage.get(interaction.guild.id, s))
             if leave_config is None:
                 raise NerpyValidationError(get_string(lang, "leavemsg.disable.not_configured"))
             leave_config.Enabled = False
@@ -744,8 +789,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
         total_reserve = occurrences * _LEAVE_MSG_MEMBER_RESERVE
         if len(message) > DISCORD_MESSAGE_LIMIT - total_reserve:
             raise NerpyValidationError(get_string(lang, "leavemsg.message.too_long"))
-        with self.bot.session_scope() as session:
-            leave_config = LeaveMessage.get(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            leave_config = await session.run_sync(lambda s: LeaveMessage.get(interaction.guild.id, s))
             if leave_config is None:
                 raise NerpyValidationError(get_string(lang, "leavemsg.message.not_enabled"))
             leave_config.Message = message
@@ -797,8 +842,8 @@ class Moderation(NerpyBotCog, GroupCog, group_name="moderation"):
     async def _leavemsg_status(self, interaction: Interaction) -> None:
         """Show current leave message configuration. [administrator]"""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            leave_config = LeaveMessage.get(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            leave_config = await session.run_sync(lambda s: LeaveMessage.get(interaction.guild.id, s))
 
         if leave_config is None or not leave_config.Enabled:
             await send_hidden_message(interaction, get_string(lang, "leavemsg.status.not_enabled"))
@@ -7,13 +7,17 @@ import asyncio
 import enum
 import logging
 import queue
+import time
 from collections import defaultdict, deque
 from datetime import UTC, datetime
 
 import discord
 from discord import Interaction, VoiceChannel, VoiceClient
 from discord.ext import tasks
+from modules.music.prefetch import DEFAULT_MAX_CONCURRENT, DEFAULT_PER_GUILD, PrefetchScheduler
+from modules.music.telemetry import TELEMETRY
 from utils.helpers import error_context
+from utils.metrics import instrumented_loop
 
 
 class BufferKey(enum.Enum):
@@ -38,8 +42,10 @@ class QueueMixin:
         title = info.get("title", url)
         idn = info.get("id")
         duration = info.get("duration")
-        thumbnails = info.get("thumbnails") or []
-        thumbnail_url = thumbnails[0].get("url") if thumbnails else None
+        thumbnail_url = info.get("thumbnail")
+        if not thumbnail_url:
+            thumbnails = info.get("thumbnails") or []
+            thumbnail_url = thumbnails[0].get("url") if thumbnails else None
         artist = info.get("uploader") or info.get("channel")
 
         song = QueuedSong(
@@ -100,11 +106,13 @@ class QueuedSong:
         self.requester = requester
         self.thumbnail = thumbnail
         self.artist = artist
+        self.queued_at = time.monotonic()
         self.log = logging.getLogger("nerpybot")
 
     async def fetch_buffer(self):
         """Fetches the buffer for the song"""
-        await asyncio.to_thread(self._fetcher, self)
+        with TELEMETRY.fetch.time():
+            await asyncio.to_thread(self._fetcher, self)
 
 
 class Audio:
@@ -115,14 +123,20 @@ class Audio:
         self.buffer = {}
         self.lastPlayed = {}
         self.buffer_limit = self.bot.config["audio"]["buffer_limit"]
+        self.prefetch = PrefetchScheduler(
+            max_concurrent=self.bot.config["audio"].get("prefetch_concurrency", DEFAULT_MAX_CONCURRENT),
+            per_guild=self.bot.config["audio"].get("prefetch_per_guild", DEFAULT_PER_GUILD),
+        )
         self.current_song: dict = {}
         self.play_start: dict = {}
         self.paused_at: dict = {}
         self.now_playing_message: dict = {}
         self.history: dict = defaultdict(lambda: deque(maxlen=50))
+        self.timings: dict = defaultdict(dict)
         self._on_song_start_hook = None
 
     @tasks.loop(seconds=10)
+    @instrumented_loop("music_timeout")
     async def _timeout_manager(self):
         last = dict(self.lastPlayed)
         for guild_id in last:
@@ -136,8 +150,10 @@ class Audio:
                         self.lastPlayed[guild_id] = datetime.now()
 
     @tasks.loop(seconds=1)
+    @instrumented_loop("music_queue")
     async def _queue_manager(self):
         last = dict(self.lastPlayed)
+        started = 0
         for guild_id in last:
             if (
                 self._has_buffer(guild_id)
@@ -146,8 +162,46 @@ class Audio:
                 and not self.is_paused(guild_id)
             ):
                 queued_song = self.buffer[guild_id][BufferKey.QUEUE].get()
+                self._observe(guild_id, "queue_wait", queued_song)
                 await self._play(queued_song)
                 await self._update_buffer(guild_id)
+                started += 1
+        return started
+
+    def _observe(self, guild_id: int, histogram: str, song) -> None:
+        """Record the time since *song* was queued in the bot-wide histogram and the guild's last timings."""
+        queued_at = getattr(song, "queued_at", None)
+        if not isinstance(queued_at, float):
+            return
+        seconds = time.monotonic() - queued_at
+        getattr(TELEMETRY, histogram).observe(seconds)
+        self.timings[guild_id][f"{histogram}_ms"] = round(seconds * 1000, 1)
+
+    def guild_stats(self, guild_id: int) -> dict:
+        """Return queue depth and the last measured timings for one guild's playback."""
+        songs = self.list_queue(guild_id)
+        return {
+            "queue_length": len(songs),
+            "buffered": sum(1 for s in songs if s.stream is not None),
+            "queue_wait_ms": self.timings.get(guild_id, {}).get("queue_wait_ms"),
+            "time_to_first_audio_ms": self.timings.get(guild_id, {}).get("time_to_first_audio_ms"),
+        }
+
+    @staticmethod
+    def telemetry_stats() -> dict:
+        """Return the bot-wide music timing histograms and counters."""
+        return TELEMETRY.snapshot()
+
+    @staticmethod
+    def worker_stats() -> dict:
+        """Return utilization of the yt-dlp worker-process pool."""
+        from modules.music.download import WORKERS
+
+        return WORKERS.stats()
+
+    def prefetch_stats(self) -> dict:
+        """Return the state of the bot-wide prefetch scheduler."""
+        return self.prefetch.stats()
 
     async def setup_loops(self):
         self._queue_manager.start()
@@ -158,7 +212,7 @@ class Audio:
             self.bot.log.debug(
                 f"Fetching song buffer for {song.title} in channel {song.channel.name} ({song.channel.id})"
             )
-            await song.fetch_buffer()
+            await self.prefetch.fetch_now(song.channel.guild.id, song)
         await self._join_channel(song.channel)
 
         guild_id = song.channel.guild.id
@@ -182,6 +236,8 @@ class Audio:
         self.paused_at.pop(guild_id, None)
 
         self.bot.log.debug(f"Playing Song {song.title} in channel {song.channel.name} ({song.channel.id})")
+        self._observe(guild_id, "time_to_first_audio", song)
+        TELEMETRY.incr("songs_played")
         song.channel.guild.voice_client.play(
             song.stream,
             after=lambda e: (
@@ -232,15 +288,12 @@ class Audio:
         }
 
     async def _update_buffer(self, guild_id):
-        songs = [s for s in self.list_queue(guild_id) if s.stream is None][: self.buffer_limit]
-
-        if songs:
-            guild = self.bot.get_guild(guild_id)
-            guild_label = f"{guild.name} ({guild_id})" if guild else f"Unknown ({guild_id})"
-            results = await asyncio.gather(*[s.fetch_buffer() for s in songs], return_exceptions=True)
-            for song, result in zip(songs, results):
-                if isinstance(result, Exception):
-                    self.bot.log.error(f"[{guild_label}]: Buffer prefetch failed for '{song.title}': {result}")
+        """Hand the guild's next ``buffer_limit`` songs to the prefetch scheduler without waiting for them."""
+        songs = self.list_queue(guild_id)[: self.buffer_limit]
+        guild = self.bot.get_guild(guild_id)
+        guild_label = f"{guild.name} ({guild_id})" if guild else f"Unknown ({guild_id})"
+        playing = self._has_buffer(guild_id) and self._is_playing(guild_id)
+        self.prefetch.schedule(guild_id, songs, playing=playing, label=guild_label)
 
     def _add_to_buffer(self, guild_id, song):
         self.buffer[guild_id][BufferKey.QUEUE].put(song)
@@ -264,6 +317,7 @@ class Audio:
             await self._update_buffer(guild_id)
         else:
             self._setup_buffer(guild_id)
+            self._observe(guild_id, "queue_wait", song)
             await self._play(song)
 
     def clear_buffer(self, guild_id):
@@ -271,6 +325,7 @@ class Audio:
         if self._has_buffer(guild_id):
             self.buffer.get(guild_id).pop(BufferKey.QUEUE, None)
             self.lastPlayed.pop(guild_id, None)
+        self.prefetch.cancel_guild(guild_id)
 
     def list_queue(self, guild_id):
         """lists audio queue"""
@@ -296,6 +351,7 @@ class Audio:
         if self._has_buffer(guild_id):
             self.buffer[guild_id][BufferKey.QUEUE] = queue.Queue()
             self.lastPlayed[guild_id] = datetime.now()
+        self.prefetch.cancel_guild(guild_id)
         self.current_song.pop(guild_id, None)
         self.play_start.pop(guild_id, None)
         self.paused_at.pop(guild_id, None)
@@ -313,6 +369,7 @@ class Audio:
             except discord.NotFound:
                 pass  # Message already deleted; nothing to clean up
         self.clear_buffer(guild_id)
+        self.timings.pop(guild_id, None)
         self.current_song.pop(guild_id, None)
         self.play_start.pop(guild_id, None)
         self.paused_at.pop(guild_id, None)
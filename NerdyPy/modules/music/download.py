@@ -5,18 +5,31 @@ download and conversion method for Audio Content
 
 import logging
 import tempfile
+import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 
 import requests
 from cachetools import TTLCache
 from discord import FFmpegOpusAudio
+from sqlalchemy.exc import SQLAlchemyError
 
 from yt_dlp import YoutubeDL
 
+from modules.music.telemetry import TELEMETRY
+from modules.music.workers import WorkerPool
+
 LOG = logging.getLogger("nerpybot")
 FFMPEG_OPTIONS = {"options": "-vn"}
-CACHE = TTLCache(maxsize=100, ttl=600)
+# Hot in-process layer of trimmed info records; entries are a few hundred bytes, not full yt-dlp dicts.
+CACHE = TTLCache(maxsize=1000, ttl=600)
+# Durable layer (MusicTrackMetadata table) — titles and durations of a video rarely change.
+METADATA_TTL = 7 * 24 * 3600
+_metadata_session_factory = None
+# Single-flight: concurrent lookups of the same URL wait on the first caller's extraction.
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
 DL_DIR = Path(tempfile.gettempdir()) / "nerpybot-dl"
 DL_DIR.mkdir(exist_ok=True)
@@ -44,6 +57,122 @@ YTDL_ARGS = {
 # noinspection PyTypeChecker
 YTDL = YoutubeDL(YTDL_ARGS)
 
+# Extraction and yt-dlp downloads run in worker processes; YTDL above is the per-worker instance.
+WORKERS = WorkerPool()
+EXTRACT_TIMEOUT = 60.0
+DOWNLOAD_TIMEOUT = 300.0
+
+
+def configure_workers(audio_config: dict) -> None:
+    """Apply ``audio.worker_processes`` / ``extract_timeout`` / ``download_timeout`` from the bot config."""
+    global EXTRACT_TIMEOUT, DOWNLOAD_TIMEOUT
+    EXTRACT_TIMEOUT = float(audio_config.get("extract_timeout", EXTRACT_TIMEOUT))
+    DOWNLOAD_TIMEOUT = float(audio_config.get("download_timeout", DOWNLOAD_TIMEOUT))
+    WORKERS.configure(size=audio_config.get("worker_processes", WORKERS.size), timeout=EXTRACT_TIMEOUT)
+
+
+def configure_metadata_store(session_factory) -> None:
+    """Enable the durable metadata cache backed by the bot database."""
+    global _metadata_session_factory
+    _metadata_session_factory = session_factory
+
+
+def trim_info(info: dict) -> dict:
+    """Reduce a yt-dlp info dict to the fields the music cogs use.
+
+    Playlists keep their ``_type``, title and trimmed entries.
+    """
+    if info.get("_type") == "playlist":
+        return {
+            "_type": "playlist",
+            "title": info.get("title"),
+            "entries": [trim_info(e) for e in info.get("entries") or [] if e],
+        }
+    thumbnail = info.get("thumbnail")
+    if not thumbnail:
+        thumbnails = info.get("thumbnails") or []
+        thumbnail = thumbnails[-1].get("url") if thumbnails else None
+    return {
+        "title": info.get("title"),
+        "id": info.get("id"),
+        "duration": info.get("duration"),
+        "uploader": info.get("uploader") or info.get("channel"),
+        "thumbnail": thumbnail,
+        "webpage_url": info.get("webpage_url") or info.get("url"),
+    }
+
+
+def _extract_info(url: str) -> dict:
+    """Worker-side: run yt-dlp extraction and return the trimmed info record."""
+    return trim_info(YTDL.extract_info(url, download=False))
+
+
+def _load_metadata(url: str) -> dict | None:
+    """Return a fresh durable record for *url*, or None on miss / store disabled / DB error."""
+    if _metadata_session_factory is None:
+        return None
+    from models.music import TrackMetadata
+
+    try:
+        session = _metadata_session_factory()
+        try:
+            row = TrackMetadata.get_fresh(url, METADATA_TTL, session)
+            return row.to_info() if row is not None else None
+        finally:
+            session.close()
+    except SQLAlchemyError:
+        LOG.exception("fetch_yt_infos: metadata cache read failed for URL: %s", url)
+        return None
+
+
+def _store_metadata(records: dict[str, dict]) -> None:
+    """Persist single-track records keyed by URL. DB errors are logged and swallowed."""
+    if _metadata_session_factory is None or not records:
+        return
+    from models.music import TrackMetadata
+
+    try:
+        session = _metadata_session_factory()
+        try:
+            for url, info in records.items():
+                TrackMetadata.upsert(url, info, session)
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except SQLAlchemyError:
+        LOG.exception("fetch_yt_infos: metadata cache write failed for %d record(s)", len(records))
+
+
+def purge_stale_metadata() -> int:
+    """Delete durable metadata records older than METADATA_TTL. Returns the number of rows deleted."""
+    if _metadata_session_factory is None:
+        return 0
+    from models.music import TrackMetadata
+
+    session = _metadata_session_factory()
+    try:
+        deleted = TrackMetadata.delete_older_than(METADATA_TTL, session)
+        session.commit()
+        return deleted
+    except SQLAlchemyError:
+        session.rollback()
+        LOG.exception("purge_stale_metadata: failed to delete expired records")
+        return 0
+    finally:
+        session.close()
+
+
+def _download_file(url: str, video_id: str) -> str | None:
+    """Worker-side: download *url* into DL_DIR unless already present and return the file path."""
+    dl_file = lookup_file(video_id)
+    if dl_file is None:
+        YTDL.download([url])
+        dl_file = lookup_file(video_id)
+    return dl_file
+
 
 def convert(source, is_stream=True):
     """Convert downloaded file to playable ByteStream"""
@@ -58,16 +187,58 @@ def lookup_file(file_name):
     return None
 
 
-def fetch_yt_infos(url: str):
-    """Fetches information about a YouTube video"""
+def fetch_yt_infos(url: str) -> dict:
+    """Fetch the trimmed info record for a video or playlist URL.
+
+    Lookup order: in-process TTL cache → durable metadata table → yt-dlp extraction in the worker
+    pool. Concurrent calls for the same URL share one lookup. Playlist entries are cached under
+    their own URLs so enqueueing them afterwards does not extract each video a second time.
+    """
     if url in CACHE:
         LOG.info("Using cached information for URL: %s", url)
+        TELEMETRY.incr("metadata_hits")
         return CACHE[url]
 
-    LOG.info("Fetching Information about Video from Youtube...")
-    data = YTDL.extract_info(url, download=False)
-    CACHE[url] = data
-    return data
+    with _inflight_lock:
+        pending = _inflight.get(url)
+        leader = pending is None
+        if leader:
+            pending = _inflight[url] = Future()
+    if not leader:
+        LOG.debug("Waiting on in-flight lookup for URL: %s", url)
+        TELEMETRY.incr("metadata_shared")
+        return pending.result()
+
+    try:
+        data = _load_metadata(url)
+        if data is None:
+            LOG.info("Fetching Information about Video from Youtube...")
+            TELEMETRY.incr("metadata_misses")
+            try:
+                with TELEMETRY.extract.time():
+                    data = WORKERS.run(_extract_info, url, timeout=EXTRACT_TIMEOUT)
+            except Exception:
+                TELEMETRY.incr("extract_failures")
+                raise
+            if data.get("_type") == "playlist":
+                records = {e["webpage_url"]: e for e in data["entries"] if e.get("webpage_url")}
+            else:
+                records = {url: data}
+            CACHE.update(records)
+            _store_metadata(records)
+        else:
+            LOG.info("Using stored information for URL: %s", url)
+            TELEMETRY.incr("metadata_hits")
+            TELEMETRY.incr("metadata_store_hits")
+        CACHE[url] = data
+        pending.set_result(data)
+        return data
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(url, None)
 
 
 def download(url: str, video_id: str = None):
@@ -78,20 +249,32 @@ def download(url: str, video_id: str = None):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.7204.143 Safari/537.36",
         }
 
-        with requests.get(url, headers=req_headers, stream=True, timeout=(5, 30)) as response:
-            response.raise_for_status()
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".audio", dir=DL_DIR) as tmp:
-                for chunk in response.iter_content(chunk_size=65536):
-                    tmp.write(chunk)
-                audio_path = tmp.name
+        try:
+            with TELEMETRY.download.time():
+                with requests.get(url, headers=req_headers, stream=True, timeout=(5, 30)) as response:
+                    response.raise_for_status()
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=".audio", dir=DL_DIR) as tmp:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            tmp.write(chunk)
+                        audio_path = tmp.name
+        except Exception:
+            TELEMETRY.incr("download_failures")
+            raise
 
         return convert(audio_path, is_stream=False)
     else:
         dl_file = lookup_file(video_id)
 
         if dl_file is None:
-            YTDL.download([url])
-            dl_file = lookup_file(video_id)
+            TELEMETRY.incr("file_cache_misses")
+            try:
+                with TELEMETRY.download.time():
+                    dl_file = WORKERS.run(_download_file, url, video_id, timeout=DOWNLOAD_TIMEOUT)
+            except Exception:
+                TELEMETRY.incr("download_failures")
+                raise
+        else:
+            TELEMETRY.incr("file_cache_hits")
 
         return convert(dl_file, is_stream=False)
 
@@ -1,17 +1,27 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import time
 
 import discord
 from discord import Interaction, app_commands
 from discord.ext import tasks
 from discord.ext.commands import Cog
 from modules.music.audio import Audio, QueuedSong, QueueMixin
-from modules.music.download import cleanup_stale_files, fetch_yt_infos
-from modules.music.views import NowPlayingView, build_now_playing_embed
+from modules.music.download import (
+    WORKERS,
+    cleanup_stale_files,
+    configure_metadata_store,
+    configure_workers,
+    fetch_yt_infos,
+    purge_stale_metadata,
+)
+from modules.music.progress import PROGRESS_TICK, ProgressPacer
+from modules.music.views import NowPlayingView, build_now_playing_embed, progress_cells
 from utils.checks import can_leave_voice, can_stop_playback, is_connected_to_voice
 from utils.cog import NerpyBotCog
 from utils.helpers import register_before_loop
+from utils.metrics import instrumented_loop
 from utils.strings import get_string
 
 
@@ -38,10 +48,13 @@ class MusicPlayback(NerpyBotCog, QueueMixin, Cog):
         self.bot.audio = Audio(self.bot)
         self.audio = self.bot.audio
         self._background_tasks: set[asyncio.Task] = set()
+        self._progress_pacer = ProgressPacer()
         register_before_loop(bot, self._progress_updater, "Progress Updater")
         register_before_loop(bot, self._cleanup_dl_dir, "MusicCleanup")
 
     async def cog_load(self):
+        configure_workers(self.bot.config.get("audio", {}))
+        configure_metadata_store(self.bot.SESSION)
         await self.audio.setup_loops()
         self.audio._on_song_start_hook = self._handle_song_start
         self._progress_updater.start()
@@ -54,6 +67,8 @@ class MusicPlayback(NerpyBotCog, QueueMixin, Cog):
         self.audio._queue_manager.cancel()
         self.audio._timeout_manager.cancel()
         self.audio._on_song_start_hook = None
+        self.audio.prefetch.shutdown()
+        WORKERS.shutdown()
         super().cog_unload()
 
     async def _handle_song_start(self, guild_id: int, song: QueuedSong) -> None:
@@ -82,10 +97,14 @@ class MusicPlayback(NerpyBotCog, QueueMixin, Cog):
                     self.bot.log.error(f"[{guild_id}]: Failed to re-send now-playing embed: {e}")
             except discord.HTTPException as e:
                 self.bot.log.warning(f"[{guild_id}]: Transient error editing now-playing embed: {e}")
+        self._progress_pacer.start(guild_id, progress_cells(elapsed, song.duration or 0), song.duration)
 
-    @tasks.loop(seconds=10)
+    @tasks.loop(seconds=PROGRESS_TICK)
+    @instrumented_loop("music_progress")
     async def _progress_updater(self):
-        """Edit the now-playing embed for every active guild to update the progress bar."""
+        """Edit now-playing embeds whose progress bar has moved, paced by ``ProgressPacer``."""
+        pacer = self._progress_pacer
+        active = {}
         for guild_id, msg in list(self.audio.now_playing_message.items()):
             if msg is None:
                 continue
@@ -94,22 +113,48 @@ class MusicPlayback(NerpyBotCog, QueueMixin, Cog):
             song = self.audio.current_song.get(guild_id)
             if song is None:
                 continue
-            lang = self._lang(guild_id)
+            active[guild_id] = (msg, song)
+        pacer.retain(self.audio.now_playing_message)
+
+        due = pacer.due(active)
+        edited = 0
+        for guild_id in due:
+            msg, song = active[guild_id]
             elapsed = self.audio.get_elapsed(guild_id)
-            emb = build_now_playing_embed(song, elapsed, lang)
+            cells = progress_cells(elapsed, song.duration or 0)
+            if not pacer.changed(guild_id, cells):
+                pacer.skip(guild_id, song.duration)
+                continue
+            if edited:
+                # spread this tick's edits over the tick instead of sending them back to back
+                await asyncio.sleep(PROGRESS_TICK / len(due))
+            edited += 1
+            emb = build_now_playing_embed(song, elapsed, self._lang(guild_id))
+            started = time.monotonic()
             try:
                 await msg.edit(embed=emb)
             except (discord.NotFound, discord.Forbidden):
                 self.audio.now_playing_message.pop(guild_id, None)
+                pacer.forget(guild_id)
+                continue
             except discord.HTTPException as e:
                 self.bot.log.warning(f"[{guild_id}]: Transient error updating progress embed: {e}")
+                pacer.record(guild_id, None, song.duration, time.monotonic() - started, rate_limited=e.status == 429)
+                continue
+            pacer.record(guild_id, cells, song.duration, time.monotonic() - started)
+        return edited
 
     @tasks.loop(minutes=30)
+    @instrumented_loop("music_cleanup")
     async def _cleanup_dl_dir(self):
-        """Periodically remove stale audio files from the download cache."""
+        """Periodically remove stale audio files and expired metadata records."""
         deleted = await asyncio.to_thread(cleanup_stale_files)
         if deleted:
             self.bot.log.info(f"Music: cleaned up {deleted} stale file(s) from download cache")
+        purged = await asyncio.to_thread(purge_stale_metadata)
+        if purged:
+            self.bot.log.info(f"Music: purged {purged} expired metadata record(s)")
+        return deleted + purged
 
     @app_commands.command(name="play")
     @app_commands.guild_only()
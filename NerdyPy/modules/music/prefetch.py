@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Bot-wide prefetch scheduler for queued songs.
+
+Every guild used to start up to ``buffer_limit`` downloads whenever its queue changed, with no
+limit across guilds. The scheduler keeps one priority-ordered backlog for the whole bot instead:
+at most ``max_concurrent`` downloads run at once, and at most ``per_guild`` of them for any one
+guild so a long playlist cannot starve everyone else.
+
+Priority, best first: queue position, then whether the guild is currently playing, then the order
+in which jobs were scheduled. The next track of every playing guild therefore goes out before
+anyone's second track, and deep queue positions go last.
+"""
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+
+LOG = logging.getLogger("nerpybot")
+
+DEFAULT_MAX_CONCURRENT = 3
+DEFAULT_PER_GUILD = 2
+
+
+@dataclass
+class _Job:
+    guild_id: int
+    song: object
+    position: int
+    playing: bool
+    seq: int
+    label: str
+    task: asyncio.Task | None = None
+    cancelled: bool = False
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def priority(self) -> tuple:
+        return self.position, not self.playing, self.seq
+
+
+class PrefetchScheduler:
+    """Schedules ``QueuedSong.fetch_buffer`` calls under a global and a per-guild concurrency cap.
+
+    Callers hand over the guild's current prefetch window with ``schedule``; songs that dropped out
+    of the window are cancelled. Pending jobs are simply discarded. A download that has already
+    started in a worker cannot be interrupted, so a cancelled running job keeps its slot until it
+    finishes and its result is thrown away.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, per_guild: int = DEFAULT_PER_GUILD):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.per_guild = max(1, int(per_guild))
+        self._pending: dict[int, _Job] = {}
+        self._running: dict[int, _Job] = {}
+        self._seq = itertools.count()
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+
+    def configure(self, max_concurrent: int | None = None, per_guild: int | None = None) -> None:
+        """Update the concurrency caps. Takes effect for the next job that is started."""
+        if max_concurrent is not None:
+            self.max_concurrent = max(1, int(max_concurrent))
+        if per_guild is not None:
+            self.per_guild = max(1, int(per_guild))
+        self._pump()
+
+    def schedule(self, guild_id: int, songs: list, playing: bool, label: str = None) -> None:
+        """Replace *guild_id*'s prefetch window with *songs*, ordered by queue position.
+
+        Songs that already have a stream are skipped; scheduled songs no longer in *songs* are cancelled.
+        """
+        label = label or str(guild_id)
+        wanted = {id(song): (position, song) for position, song in enumerate(songs) if song.stream is None}
+
+        for key, job in list(self._pending.items()):
+            if job.guild_id == guild_id and key not in wanted:
+                self._discard(key)
+        for key, job in self._running.items():
+            if job.guild_id == guild_id and key not in wanted and not job.cancelled:
+                job.cancelled = True
+                self._cancelled += 1
+
+        for key, (position, song) in wanted.items():
+            job = self._pending.get(key) or self._running.get(key)
+            if job is not None:
+                job.position, job.playing, job.cancelled = position, playing, False
+                continue
+            self._pending[key] = _Job(guild_id, song, position, playing, next(self._seq), label)
+
+        self._pump()
+
+    def cancel_guild(self, guild_id: int) -> None:
+        """Cancel everything scheduled for *guild_id* (queue cleared or bot left)."""
+        self.schedule(guild_id, [], playing=False)
+
+    async def fetch_now(self, guild_id: int, song) -> None:
+        """Make sure *song* has a stream, bypassing the caps — it is about to be played.
+
+        Waits for a running prefetch of the same song instead of starting a second download.
+        """
+        key = id(song)
+        running = self._running.get(key)
+        if running is not None:
+            running.cancelled = False
+            await running.done.wait()
+            if song.stream is not None:
+                return
+        elif key in self._pending:
+            self._discard(key, count=False)
+        await song.fetch_buffer()
+
+    def _discard(self, key: int, count: bool = True) -> None:
+        job = self._pending.pop(key, None)
+        if job is not None:
+            job.cancelled = True
+            job.done.set()
+            if count:
+                self._cancelled += 1
+
+    def _next_job(self) -> _Job | None:
+        busy: dict[int, int] = {}
+        for job in self._running.values():
+            busy[job.guild_id] = busy.get(job.guild_id, 0) + 1
+        eligible = [job for job in self._pending.values() if busy.get(job.guild_id, 0) < self.per_guild]
+        return min(eligible, key=lambda job: job.priority, default=None)
+
+    def _pump(self) -> None:
+        while len(self._running) < self.max_concurrent:
+            job = self._next_job()
+            if job is None:
+                return
+            key = id(job.song)
+            del self._pending[key]
+            self._running[key] = job
+            job.task = asyncio.create_task(self._run(key, job))
+
+    async def _run(self, key: int, job: _Job) -> None:
+        try:
+            await job.song.fetch_buffer()
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._failed += 1
+            if not job.cancelled:
+                LOG.error(f"[{job.label}]: Buffer prefetch failed for '{job.song.title}': {ex}")
+        else:
+            self._completed += 1
+            if job.cancelled:
+                # Removed from the queue while downloading — stop the ffmpeg process it spawned.
+                stream, job.song.stream = job.song.stream, None
+                if stream is not None:
+                    stream.cleanup()
+        finally:
+            self._running.pop(key, None)
+            job.done.set()
+            self._pump()
+
+    def stats(self) -> dict:
+        """Return a JSON-serializable snapshot for the health command."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_guild": self.per_guild,
+            "running": len(self._running),
+            "pending": len(self._pending),
+            "guilds": len({job.guild_id for job in (*self._pending.values(), *self._running.values())}),
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+        }
+
+    def shutdown(self) -> None:
+        """Drop pending jobs and cancel the tasks awaiting running ones."""
+        for key in list(self._pending):
+            self._discard(key, count=False)
+        for job in list(self._running.values()):
+            if job.task is not None:
+                job.task.cancel()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Pacing for now-playing progress edits.
+
+Every progress update is a PATCH on the now-playing message. Editing every guild's embed on a fixed
+10-second beat produces a burst of requests per beat and re-sends embeds whose bar has not moved.
+``ProgressPacer`` decides which guilds are due for an edit:
+
+- a guild is only edited when the rendered bar has gained or lost a cell since the last edit,
+- each guild has its own due time, so edits are spread over the interval instead of bursting,
+- the interval grows with the track length (a 20-cell bar on a one-hour track moves every 3 minutes),
+- edits that come back slow or rate-limited stretch all intervals until edits are fast again.
+
+discord.py does not expose bucket state publicly; it sleeps inside the request when a bucket is
+exhausted, so a slow edit is the signal that the edit bucket is at its limit.
+"""
+
+import time
+
+from modules.music.views import PROGRESS_BAR_WIDTH
+
+PROGRESS_TICK = 2.0
+MIN_INTERVAL = 10.0
+MAX_INTERVAL = 60.0
+EDITS_PER_TICK = 5
+SLOW_EDIT_SECONDS = 1.0
+MAX_BACKOFF = 8.0
+
+
+class ProgressPacer:
+    """Per-guild schedule and shared back-off for progress-bar edits."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._cells: dict[int, int] = {}
+        self._due: dict[int, float] = {}
+        self.backoff = 1.0
+
+    @staticmethod
+    def base_interval(duration: float | None) -> float:
+        """Seconds between edit checks for a track of *duration* — one bar cell, clamped."""
+        if not duration:
+            return MIN_INTERVAL
+        return min(MAX_INTERVAL, max(MIN_INTERVAL, duration / PROGRESS_BAR_WIDTH))
+
+    def start(self, guild_id: int, cells: int, duration: float | None) -> None:
+        """Record the bar of a freshly sent now-playing embed (new song or resend)."""
+        self._cells[guild_id] = cells
+        self._due[guild_id] = self._clock() + self.base_interval(duration) * self.backoff
+
+    def forget(self, guild_id: int) -> None:
+        self._cells.pop(guild_id, None)
+        self._due.pop(guild_id, None)
+
+    def retain(self, guild_ids) -> None:
+        """Drop state for guilds that no longer have a now-playing message."""
+        for guild_id in set(self._due) - set(guild_ids):
+            self.forget(guild_id)
+
+    def due(self, guild_ids) -> list[int]:
+        """Return the guilds whose edit check is due, earliest first, capped by the per-tick budget."""
+        now = self._clock()
+        ready = sorted((g for g in guild_ids if self._due.get(g, now) <= now), key=lambda g: self._due.get(g, now))
+        return ready[: max(1, int(EDITS_PER_TICK / self.backoff))]
+
+    def changed(self, guild_id: int, cells: int) -> bool:
+        """True when the bar differs from the last edit."""
+        return self._cells.get(guild_id) != cells
+
+    def skip(self, guild_id: int, duration: float | None) -> None:
+        """Bar unchanged — check again after one interval."""
+        self._due[guild_id] = self._clock() + self.base_interval(duration) * self.backoff
+
+    def record(
+        self, guild_id: int, cells: int | None, duration: float | None, took: float, rate_limited: bool = False
+    ) -> None:
+        """Record a finished edit and adapt the back-off to how long it took.
+
+        Pass ``cells=None`` for a failed edit so the next check re-sends the bar.
+        """
+        if rate_limited or took >= SLOW_EDIT_SECONDS:
+            self.backoff = min(MAX_BACKOFF, self.backoff * 2)
+        else:
+            self.backoff = max(1.0, self.backoff * 0.8)
+        self._cells[guild_id] = cells
+        self._due[guild_id] = self._clock() + self.base_interval(duration) * self.backoff
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Timing histograms and counters for the music stack.
+
+Timings are recorded where the work happens (``download``, ``QueuedSong.fetch_buffer``,
+``Audio._play``) into the module-level ``TELEMETRY`` instance and reported by the ``health`` and
+``health_live`` Valkey commands. Downloads and extractions run on ``to_thread`` workers, so
+everything here is thread-safe.
+"""
+
+import threading
+
+import psutil
+
+from utils.metrics import Histogram
+
+
+class MusicTelemetry:
+    """Bot-wide music timings and counters.
+
+    Histograms:
+        - ``extract``: yt-dlp metadata extraction in the worker pool (cache misses only)
+        - ``download``: yt-dlp download in the worker pool (file cache misses only)
+        - ``fetch``: ``QueuedSong.fetch_buffer`` end to end, including cache hits and ffmpeg setup
+        - ``queue_wait``: song enqueued → taken off the queue to be played
+        - ``time_to_first_audio``: song enqueued → handed to the voice client
+    """
+
+    def __init__(self):
+        self.extract = Histogram()
+        self.download = Histogram()
+        self.fetch = Histogram()
+        self.queue_wait = Histogram()
+        self.time_to_first_audio = Histogram()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def hit_rate(self, hits: str, misses: str) -> float | None:
+        """Share of *hits* among *hits* + *misses*, or None before the first lookup."""
+        with self._lock:
+            hit, miss = self._counters.get(hits, 0), self._counters.get(misses, 0)
+        return round(hit / (hit + miss), 3) if hit + miss else None
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable view of every histogram and counter."""
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            "extract": self.extract.snapshot(),
+            "download": self.download.snapshot(),
+            "fetch": self.fetch.snapshot(),
+            "queue_wait": self.queue_wait.snapshot(),
+            "time_to_first_audio": self.time_to_first_audio.snapshot(),
+            "file_cache_hit_rate": self.hit_rate("file_cache_hits", "file_cache_misses"),
+            "metadata_cache_hit_rate": self.hit_rate("metadata_hits", "metadata_misses"),
+            "ffmpeg_processes": ffmpeg_process_count(),
+            "counters": counters,
+        }
+
+
+def ffmpeg_process_count() -> int:
+    """Count live ffmpeg child processes of the bot (one per prepared or playing stream)."""
+    try:
+        children = psutil.Process().children(recursive=True)
+    except psutil.Error:
+        return 0
+    count = 0
+    for child in children:
+        try:
+            if "ffmpeg" in child.name().lower():
+                count += 1
+        except psutil.Error:
+            continue  # exited between listing and inspection
+    return count
+
+
+TELEMETRY = MusicTelemetry()
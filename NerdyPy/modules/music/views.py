@@ -21,12 +21,22 @@ def _fmt_duration(seconds: float) -> str:
     return f"{h}:{m:02d}:{sec:02d}" if h else f"{m}:{sec:02d}"
 
 
-def build_progress_bar(elapsed: float, total: float, width: int = 20) -> str:
+PROGRESS_BAR_WIDTH = 20
+
+
+def progress_cells(elapsed: float, total: float, width: int = PROGRESS_BAR_WIDTH) -> int:
+    """Return how many cells of the progress bar are filled."""
+    if not total or total <= 0:
+        return 0
+    return round((min(elapsed, total) / total) * width)
+
+
+def build_progress_bar(elapsed: float, total: float, width: int = PROGRESS_BAR_WIDTH) -> str:
     """Return a two-line progress bar using Unicode block characters."""
     if total <= 0:
         return ""
     elapsed = min(elapsed, total)
-    filled = round((elapsed / total) * width)
+    filled = progress_cells(elapsed, total, width)
     bar = "█" * filled + "░" * (width - filled)
     return f"{bar}\n{_fmt_time(elapsed)} / {_fmt_time(total)}"
 
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Worker-process pool for yt-dlp extraction and downloads.
+
+yt-dlp extraction is CPU-heavy pure Python. Running it on ``to_thread`` workers makes it compete
+for the GIL with the gateway loop and the voice send thread, which shows up as audio stutter while
+a playlist is being resolved. Jobs submitted here run in separate processes instead; the calling
+thread only blocks on a pipe. A hung or crashed extractor takes its worker down with it, not the bot.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+LOG = logging.getLogger("nerpybot")
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_TIMEOUT = 60.0
+
+
+class WorkerTimeout(TimeoutError):
+    """A job ran longer than its timeout; the worker running it was terminated."""
+
+
+def _serve(conn) -> None:
+    """Worker process main loop: run each ``(fn, args)`` job received on *conn* and send back the outcome."""
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        fn, args = job
+        try:
+            outcome = (True, fn(*args))
+        except BaseException as exc:
+            outcome = (False, exc)
+        try:
+            conn.send(outcome)
+        except Exception as exc:  # result or exception could not be pickled
+            conn.send((False, RuntimeError(f"{fn.__name__}: {type(exc).__name__}: {exc}")))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, ctx, generation: int):
+        self.generation = generation
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_serve, args=(child,), name="nerpybot-worker", daemon=True)
+        self.process.start()
+        child.close()
+        try:
+            self.conn.recv()  # interpreter startup does not count against the first job's timeout
+        except BaseException:
+            self.terminate()
+            raise
+
+    def close(self) -> None:
+        """Let the process exit after its current job."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+    def terminate(self) -> None:
+        try:
+            self.process.terminate()
+            self.process.join(timeout=5)
+        except Exception as exc:
+            LOG.debug("WorkerPool: could not terminate worker %s: %s", self.process.pid, exc)
+        self.conn.close()
+
+
+class WorkerPool:
+    """Lazily started worker processes with per-job timeouts.
+
+    ``run`` is blocking and meant to be called from a ``to_thread`` worker. Jobs must be picklable
+    top-level functions and should return plain data (dicts, strings), never live objects.
+
+    A job waits, without a deadline, until one of ``size`` workers is idle; its timeout only counts
+    while that worker runs it. A job that overruns has its worker terminated and replaced, other
+    workers keep running. A job whose worker crashed underneath it is retried once on a new worker.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        self.size = max(1, int(size))
+        self.timeout = float(timeout)
+        self._cond = threading.Condition()
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._starting = 0
+        self._waiting = 0
+        self._generation = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._restarts = 0
+
+    def configure(self, size: int | None = None, timeout: float | None = None) -> None:
+        """Update pool size and default timeout. Workers of the old size are replaced as they go idle."""
+        with self._cond:
+            if timeout is not None:
+                self.timeout = float(timeout)
+            if size is None or max(1, int(size)) == self.size:
+                return
+            self.size = max(1, int(size))
+            retired = self._retire()
+        for worker in retired:
+            worker.close()
+
+    def _retire(self) -> list[_Worker]:
+        """Start a new generation; returns the idle workers to close. Caller must hold ``_cond``."""
+        self._generation += 1
+        retired, self._idle = self._idle, []
+        self._cond.notify_all()
+        return retired
+
+    def _acquire(self) -> _Worker:
+        """Wait for an idle worker, starting one while the pool is below its size."""
+        with self._cond:
+            self._waiting += 1
+            try:
+                while not self._idle and len(self._busy) + self._starting >= self.size:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            if self._idle:
+                worker = self._idle.pop()
+                self._busy.add(worker)
+                return worker
+            self._starting += 1
+            generation = self._generation
+        try:
+            # spawn, not fork: the parent runs an event loop plus voice threads, and forking a
+            # multithreaded process can deadlock the child on locks held at fork time.
+            worker = _Worker(multiprocessing.get_context("spawn"), generation)
+        except BaseException:  # includes EOFError from a worker that died while starting
+            with self._cond:
+                self._starting -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._starting -= 1
+            self._busy.add(worker)
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        with self._cond:
+            self._busy.discard(worker)
+            keep = worker.generation == self._generation
+            if keep:
+                self._idle.append(worker)
+            self._cond.notify()
+        if not keep:
+            worker.close()
+
+    def _replace(self, worker: _Worker) -> None:
+        """Terminate *worker*; the next job that needs one starts a new process."""
+        with self._cond:
+            self._busy.discard(worker)
+            self._restarts += 1
+            self._cond.notify()
+        worker.terminate()
+
+    def run(self, fn, *args, timeout: float | None = None):
+        """Run ``fn(*args)`` in a worker process and return its result.
+
+        Raises ``WorkerTimeout`` (a ``TimeoutError``) when the job runs longer than *timeout*
+        (default: the pool timeout), ``BrokenProcessPool`` when the worker crashes twice in a row,
+        and re-raises any exception raised by ``fn`` itself, ``TimeoutError`` included.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        for attempt in (1, 2):
+            worker = self._acquire()
+            try:
+                worker.conn.send((fn, args))
+                finished = worker.conn.poll(timeout)
+                if finished:
+                    ok, value = worker.conn.recv()
+            except (EOFError, OSError):
+                self._replace(worker)
+                if attempt == 1:
+                    LOG.warning("WorkerPool: worker died during %s — retrying on a new worker", fn.__name__)
+                    continue
+                with self._cond:
+                    self._failed += 1
+                raise BrokenProcessPool(f"worker died twice while running {fn.__name__}") from None
+            except BaseException:
+                # The job could not be sent or its outcome not read back; the pipe is in an unknown state.
+                self._replace(worker)
+                with self._cond:
+                    self._failed += 1
+                raise
+            if not finished:
+                with self._cond:
+                    self._timeouts += 1
+                    self._failed += 1
+                LOG.warning("WorkerPool: %s timed out after %.0fs — replacing its worker", fn.__name__, timeout)
+                self._replace(worker)
+                raise WorkerTimeout(f"{fn.__name__} timed out after {timeout:.0f}s")
+            self._release(worker)
+            with self._cond:
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+            if not ok:
+                raise value
+            return value
+
+    def stats(self) -> dict:
+        """Return a JSON-serializable utilization snapshot for the health command."""
+        with self._cond:
+            busy = min(len(self._busy) + self._starting, self.size)
+            return {
+                "size": self.size,
+                "running": bool(self._idle or self._busy),
+                "busy": busy,
+                "queued": self._waiting,
+                "utilization": round(busy / self.size, 2),
+                "completed": self._completed,
+                "failed": self._failed,
+                "timeouts": self._timeouts,
+                "restarts": self._restarts,
+            }
+
+    def shutdown(self) -> None:
+        """Stop idle workers; busy ones exit once their job is done. The next submission starts new ones."""
+        with self._cond:
+            retired = self._retire()
+        for worker in retired:
+            worker.close()
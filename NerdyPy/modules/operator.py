@@ -13,6 +13,7 @@ from discord.ext.commands import Cog, Context, Greedy, command, hybrid_command
 from models.permissions import PermissionSubscriber
 from utils.checks import is_admin_or_operator, require_operator
 from utils.cog import NerpyBotCog
+from utils.command_sync import auto_sync, sync_tree
 from utils.constants import PROTECTED_MODULES
 from utils.duration import parse_duration
 from utils.errors import NerpyInfraException, NerpyPermissionError
@@ -129,12 +130,16 @@ class Operator(NerpyBotCog, Cog):
         self,
         ctx: Context,
         guilds: Greedy[Object],
-        spec: Optional[Literal["local", "copy", "clear", "recipes"]] = None,
+        spec: Optional[Literal["local", "copy", "clear", "force", "auto", "recipes"]] = None,
     ) -> None:
         """Sync commands or data. [operator]
 
+        Command syncs are skipped for scopes whose commands did not change since their last sync.
+
         Usage:
           `!sync`                — Sync commands globally
+          `!sync force`          — Sync commands globally, even if unchanged
+          `!sync auto`           — Sync every scope whose commands changed
           `!sync <guild_id> ...` — Sync commands to specific guild(s)
           `!sync local`          — Sync current guild's commands
           `!sync copy`           — Copy global commands to current guild
@@ -171,24 +176,33 @@ class Operator(NerpyBotCog, Cog):
             if spec in ("local", "copy", "clear") and ctx.guild is None:
                 await ctx.send(f"The `{spec}` option requires a server context.")
                 return
+            if spec == "auto":
+                results = await auto_sync(self.bot)
+                changed = sum(1 for synced in results.values() if synced is not None)
+                await ctx.send(f"Synced {changed} of {len(results)} scopes; the others were unchanged or failed.")
+                return
             if spec == "local":
-                synced = await self.bot.tree.sync(guild=ctx.guild)
+                synced = await sync_tree(self.bot, ctx.guild)
             elif spec == "copy":
                 self.bot.tree.copy_global_to(guild=ctx.guild)
-                synced = await self.bot.tree.sync(guild=ctx.guild)
+                synced = await sync_tree(self.bot, ctx.guild)
             elif spec == "clear":
                 self.bot.tree.clear_commands(guild=ctx.guild)
-                await self.bot.tree.sync(guild=ctx.guild)
-                synced = []
+                synced = await sync_tree(self.bot, ctx.guild)
             else:
-                synced = await self.bot.tree.sync()
+                synced = await sync_tree(self.bot, force=spec == "force")
 
-            await ctx.send(f"Synced {len(synced)} commands {'globally' if spec is None else 'to the current guild.'}")
+            where = "globally" if spec in (None, "force") else "to the current guild"
+            if synced is None:
+                await ctx.send(f"Commands {where} are unchanged since the last sync. Use `!sync force` to push anyway.")
+            else:
+                await ctx.send(f"Synced {synced} commands {where}.")
             return
 
-        async def _sync_one(g: Object) -> bool:
+        async def _sync_one(g: Object) -> bool | None:
             try:
-                await self.bot.tree.sync(guild=g)
+                if await sync_tree(self.bot, g) is None:
+                    return None  # unchanged since the last sync
                 return True
             except (CommandSyncFailure, Forbidden, MissingApplicationID, TranslationError) as ex:
                 self.bot.log.debug(ex)
@@ -207,7 +221,8 @@ class Operator(NerpyBotCog, Cog):
             elif isinstance(r, BaseException):
                 raise r
 
-        await ctx.send(f"Synced the tree to {ret}/{len(guilds)}.")
+        unchanged = sum(1 for r in results if r is None)
+        await ctx.send(f"Synced the tree to {ret}/{len(guilds)}" + (f" ({unchanged} unchanged)." if unchanged else "."))
 
     @command(name="uptime")
     async def _uptime(self, ctx: Context) -> None:
@@ -15,6 +15,7 @@ from models.reminder import ReminderMessage
 from utils.cog import NerpyBotCog
 from utils.duration import parse_duration
 from utils.helpers import notify_error, register_before_loop, send_paginated
+from utils.metrics import instrumented_loop
 from utils.permissions import validate_channel_permissions
 from utils.schedule import compute_next_fire
 from utils.strings import get_string
@@ -75,16 +76,21 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     # -- Smart loop ----------------------------------------------------
 
     @tasks.loop(seconds=LOOP_MAX_SECONDS)
+    @instrumented_loop("reminder")
     async def _reminder_loop(self):
         self.bot.log.debug("Reminder loop tick")
+        fired = 0
+        # In cluster mode the other processes fire the reminders of their own guilds.
+        owned = self.bot.cluster.guild_filter(ReminderMessage.GuildId)
         try:
-            with self.bot.session_scope() as session:
-                due = ReminderMessage.get_due(session)
+            async with self.bot.async_session_scope() as session:
+                due = await session.run_sync(ReminderMessage.get_due, owned)
                 self.bot.log.debug(f"Found {len(due)} due reminder(s)")
 
                 for msg in due:
                     try:
                         await self._fire_reminder(msg, session)
+                        fired += 1
                     except (discord.HTTPException, SQLAlchemyError) as ex:
                         self.bot.log.error(f"Reminder #{msg.Id} fire failed: {ex}")
                         await notify_error(self.bot, f"Reminder #{msg.Id} fire", ex)
@@ -93,7 +99,7 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
                         await notify_error(self.bot, f"Reminder #{msg.Id} fire", ex)
 
                 # Adjust interval to next due reminder
-                next_fire = ReminderMessage.get_next_fire_time(session)
+                next_fire = await session.run_sync(ReminderMessage.get_next_fire_time, owned)
 
             self._adjust_interval(next_fire)
 
@@ -103,17 +109,18 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
         except Exception as ex:
             self.bot.log.error("Reminder loop: unexpected error", exc_info=True)
             await notify_error(self.bot, "Reminder background loop", ex)
+        return fired
 
     async def _fire_reminder(self, msg: ReminderMessage, session):
         """Send a reminder message and handle rescheduling or deletion."""
         guild = self.bot.get_guild(msg.GuildId)
         if guild is None:
-            session.delete(msg)
+            await session.delete(msg)
             return
 
         chan = guild.get_channel(msg.ChannelId)
         if chan is None:
-            session.delete(msg)
+            await session.delete(msg)
             return
 
         await chan.send(msg.Message)
@@ -136,7 +143,7 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
         )
 
         if next_fire is None:
-            session.delete(msg)
+            await session.delete(msg)
         else:
             msg.NextFire = next_fire
 
@@ -186,7 +193,7 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
         next_fire = datetime.now(UTC) + td
 
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
+        async with self.bot.async_session_scope() as session:
             reminder = ReminderMessage(
                 GuildId=interaction.guild.id,
                 ChannelId=target.id,
@@ -297,7 +304,7 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
             timezone=tz,
         )
 
-        with self.bot.session_scope() as session:
+        async with self.bot.async_session_scope() as session:
             reminder = ReminderMessage(
                 GuildId=interaction.guild.id,
                 ChannelId=target.id,
@@ -336,8 +343,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     async def _reminder_list(self, interaction: Interaction):
         """List all current reminder messages."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            msgs = ReminderMessage.get_all_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            msgs = await session.run_sync(lambda s: ReminderMessage.get_all_by_guild(interaction.guild.id, s))
             if not msgs:
                 await interaction.response.send_message(get_string(lang, "reminder.no_reminders"), ephemeral=True)
                 return
@@ -448,8 +455,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     ):
         """Edit an existing reminder's message, channel, or timing."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            msg = ReminderMessage.get_by_id(reminder_id, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            msg = await session.run_sync(lambda s: ReminderMessage.get_by_id(reminder_id, interaction.guild.id, s))
             if msg is None:
                 await interaction.response.send_message(get_string(lang, "reminder.not_found"), ephemeral=True)
                 return
@@ -582,8 +589,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     # -- Autocomplete helper -------------------------------------------
 
     async def _reminder_id_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[int]]:
-        with self.bot.session_scope() as session:
-            reminders = ReminderMessage.get_all_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            reminders = await session.run_sync(lambda s: ReminderMessage.get_all_by_guild(interaction.guild.id, s))
             choices = []
             for msg in reminders:
                 status = "\u2705" if msg.Enabled else "\u23f8\ufe0f"
@@ -604,8 +611,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     async def _reminder_delete(self, interaction: Interaction, reminder_id: int):
         """Delete a reminder message."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            ReminderMessage.delete(reminder_id, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(lambda s: ReminderMessage.delete(reminder_id, interaction.guild.id, s))
         self._reschedule()
         await interaction.response.send_message(get_string(lang, "reminder.delete.success"), ephemeral=True)
 
@@ -616,8 +623,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     async def _reminder_pause(self, interaction: Interaction, reminder_id: int):
         """Pause a reminder without deleting it."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            msg = ReminderMessage.get_by_id(reminder_id, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            msg = await session.run_sync(lambda s: ReminderMessage.get_by_id(reminder_id, interaction.guild.id, s))
             if msg is None:
                 await interaction.response.send_message(get_string(lang, "reminder.not_found"), ephemeral=True)
                 return
@@ -639,8 +646,8 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
     async def _reminder_resume(self, interaction: Interaction, reminder_id: int):
         """Resume a paused reminder."""
         lang = self._lang(interaction.guild_id)
-        with self.bot.session_scope() as session:
-            msg = ReminderMessage.get_by_id(reminder_id, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            msg = await session.run_sync(lambda s: ReminderMessage.get_by_id(reminder_id, interaction.guild.id, s))
             if msg is None:
                 await interaction.response.send_message(get_string(lang, "reminder.not_found"), ephemeral=True)
                 return
@@ -665,7 +672,7 @@ class Reminder(NerpyBotCog, GroupCog, group_name="reminder"):
                     msg.NextFire = next_fire
                 else:
                     # One-shot whose time has passed — just delete it
-                    session.delete(msg)
+                    await session.delete(msg)
                     await interaction.response.send_message(
                         get_string(lang, "reminder.resume.expired", reminder_id=reminder_id), ephemeral=True
                     )
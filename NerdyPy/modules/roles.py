@@ -207,7 +207,7 @@ class Roles(NerpyBotCog, Cog):
         if guild is None:
             return
 
-        member = guild.get_member(payload.user_id)
+        member = await self.bot.member_cache.get_member(guild, payload.user_id)
         if member is None or member.bot:
             return
 
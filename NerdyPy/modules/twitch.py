@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError
 from models.twitch import TwitchNotifications
 from utils.cog import NerpyBotCog
 from utils.helpers import send_hidden_message
+from utils.twitch_index import targets_from_rows
 
 
 @app_commands.guild_only()
@@ -40,6 +41,7 @@ class TwitchNotificationsCog(NerpyBotCog, GroupCog, group_name="twitch"):
             )
             return
         reply = None
+        target = None
         with self.bot.session_scope() as session:
             existing = TwitchNotifications.get_by_channel_and_streamer(
                 interaction.guild_id, channel.id, streamer_lower, session
@@ -71,6 +73,10 @@ class TwitchNotificationsCog(NerpyBotCog, GroupCog, group_name="twitch"):
                         streamer=streamer_lower,
                         channel=channel.mention,
                     )
+                else:
+                    target = targets_from_rows([row], session)[0]
+        if target is not None:
+            self.bot.twitch_index.put(streamer_lower, target)
         if reply:
             await send_hidden_message(interaction, reply)
             return
@@ -89,6 +95,8 @@ class TwitchNotificationsCog(NerpyBotCog, GroupCog, group_name="twitch"):
                 reply = self.bot.get_localized_string(interaction.guild_id, "twitch.remove_not_found")
             else:
                 session.delete(row)
+        if reply is None:
+            self.bot.twitch_index.remove(config_id)
         if reply:
             await send_hidden_message(interaction, reply)
             return
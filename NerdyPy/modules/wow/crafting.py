@@ -21,8 +21,10 @@ from models.wow import (
     CraftingRoleMapping,
 )
 from modules.wow.api import CRAFTING_PROFESSIONS
+from utils.bulk_edit import MessageEdit, bulk_edit_messages, progress_logger
 from utils.errors import NerpyInfraException
 from utils.helpers import get_or_fetch_channel, notify_error, register_before_loop
+from utils.metrics import instrumented_loop
 from utils.permissions import validate_channel_permissions
 from utils.strings import get_string
 
@@ -162,16 +164,21 @@ class WowCraftingMixin:
     # ── Crafting cleanup loop ────────────────────────────────────────────
 
     @tasks.loop(hours=1)
+    @instrumented_loop("crafting_cleanup")
     async def _crafting_cleanup_loop(self):
         """Delete anchored order messages whose MessageDeleteAt deadline has passed."""
         self.bot.log.debug("Start Crafting Cleanup Loop!")
+        cleared_ids = []
         try:
             with self.bot.session_scope() as session:
                 pending = CraftingOrder.get_pending_cleanup(session)
                 # Snapshot the fields we need before closing the session
-                to_process = [(o.Id, o.GuildId, o.ChannelId, o.OrderMessageId, o.ThreadId) for o in pending]
+                to_process = [
+                    (o.Id, o.GuildId, o.ChannelId, o.OrderMessageId, o.ThreadId)
+                    for o in pending
+                    if self.bot.owns_guild(o.GuildId)
+                ]
 
-            cleared_ids = []
             for order_id, guild_id, channel_id, message_id, thread_id in to_process:
                 channel = self.bot.get_channel(channel_id)
                 if channel is None:
@@ -217,6 +224,7 @@ class WowCraftingMixin:
             self.bot.log.error("Crafting cleanup loop error: %s", ex)
             await notify_error(self.bot, "Crafting cleanup background loop", ex)
         self.bot.log.debug("Stop Crafting Cleanup Loop!")
+        return len(cleared_ids)
 
     # ── Crafting Order commands ──────────────────────────────────────────
 
@@ -538,7 +546,7 @@ class WowCraftingMixin:
         await self._refresh_active_orders(guild_id, new_lang)
 
     async def _refresh_crafting_board(self, guild_id: int, new_lang: str) -> None:
-        """Edit the crafting board embed and view in-place with the new language."""
+        """Re-render the crafting board embed and view with the new language."""
         from modules.wow.views.board import CraftingBoardView
 
         with self.bot.session_scope() as session:
@@ -549,12 +557,7 @@ class WowCraftingMixin:
             message_id = config.BoardMessageId
             description = config.Description
 
-        try:
-            guild = self.bot.get_guild(guild_id)
-            channel = guild.get_channel(channel_id) if guild else None
-            if channel is None:
-                channel = await self.bot.fetch_channel(channel_id)
-            msg = await channel.fetch_message(message_id)
+        def _render(_message: discord.Message) -> dict:
             embed = discord.Embed(
                 title=get_string(new_lang, "wow.craftingorder.board_title"),
                 description=description,
@@ -566,15 +569,16 @@ class WowCraftingMixin:
                 label=get_string(new_lang, "wow.craftingorder.create_button"),
                 housing_label=get_string(new_lang, "wow.craftingorder.housing_button"),
             )
-            await msg.edit(embed=embed, view=view)
-            self.bot.log.info("wow: refreshed crafting board embed for guild %d (lang=%s)", guild_id, new_lang)
-        except (discord.NotFound, discord.Forbidden):
-            self.bot.log.warning("wow: crafting board message not accessible for guild %d - skipping refresh", guild_id)
-        except discord.HTTPException as exc:
-            self.bot.log.warning("wow: failed to refresh crafting board for guild %d: %s", guild_id, exc)
+            return {"embed": embed, "view": view}
+
+        await bulk_edit_messages(
+            self.bot,
+            [MessageEdit(channel_id=channel_id, message_id=message_id, render=_render)],
+            on_progress=progress_logger(f"wow: crafting board (guild {guild_id}, lang={new_lang})"),
+        )
 
     async def _refresh_active_orders(self, guild_id: int, new_lang: str) -> None:
-        """Edit each active crafting order card embed and view with the new language."""
+        """Re-render each active crafting order card embed and view with the new language."""
         from modules.wow.views.board import build_order_embed, build_order_view
 
         with self.bot.session_scope() as session:
@@ -583,27 +587,23 @@ class WowCraftingMixin:
             for o in active_orders:
                 session.expunge(o)
 
-        guild = self.bot.get_guild(guild_id)
-        for i, order in enumerate(active_orders):
-            try:
-                channel = guild.get_channel(order.ChannelId) if guild else None
-                if channel is None:
-                    channel = await self.bot.fetch_channel(order.ChannelId)
-                    if channel is not None and guild is None:
-                        guild = channel.guild
-                msg = await channel.fetch_message(order.OrderMessageId)
-                embed = build_order_embed(order, guild, new_lang)
-                view = build_order_view(order.Id, order.Status, new_lang)
-                await msg.edit(embed=embed, view=view)
-                self.bot.log.info("wow: refreshed order #%d embed for guild %d (lang=%s)", order.Id, guild_id, new_lang)
-            except (discord.NotFound, discord.Forbidden):
-                self.bot.log.warning(
-                    "wow: order #%d message not accessible for guild %d - skipping refresh", order.Id, guild_id
-                )
-            except discord.HTTPException as exc:
-                self.bot.log.warning("wow: failed to refresh order #%d for guild %d: %s", order.Id, guild_id, exc)
-            if i < len(active_orders) - 1:
-                await asyncio.sleep(1)
+        def _renderer(order: CraftingOrder):
+            def _render(message: discord.Message) -> dict:
+                return {
+                    "embed": build_order_embed(order, message.guild, new_lang),
+                    "view": build_order_view(order.Id, order.Status, new_lang),
+                }
+
+            return _render
+
+        await bulk_edit_messages(
+            self.bot,
+            [
+                MessageEdit(channel_id=o.ChannelId, message_id=o.OrderMessageId, render=_renderer(o))
+                for o in active_orders
+            ],
+            on_progress=progress_logger(f"wow: crafting orders (guild {guild_id}, lang={new_lang})"),
+        )
 
     async def _send_manual_mapping_view(self, interaction: Interaction, unmapped: list[int], lang: str):
         """Send an ephemeral followup with Select dropdowns for manual profession mapping."""
@@ -35,6 +35,7 @@ from utils.errors import (
     NerpyValidationError,
 )
 from utils.helpers import get_or_fetch_channel, notify_error, register_before_loop, send_hidden_message, send_paginated
+from utils.metrics import instrumented_loop
 from utils.permissions import validate_channel_permissions
 from utils.strings import get_string
 
@@ -127,8 +128,10 @@ class WowNewsMixin:
 
             validate_channel_permissions(channel, interaction.guild, "view_channel", "send_messages", "embed_links")
 
-            with self.bot.session_scope() as session:
-                existing = WowGuildNewsConfig.get_existing(interaction.guild.id, name_slug, realm_slug, region, session)
+            async with self.bot.async_session_scope() as session:
+                existing = await session.run_sync(
+                    lambda s: WowGuildNewsConfig.get_existing(interaction.guild.id, name_slug, realm_slug, region, s)
+                )
                 if existing:
                     raise NerpyValidationError(
                         get_string(
@@ -175,8 +178,8 @@ class WowNewsMixin:
         return await self._realm_autocomplete(interaction, current)
 
     async def _config_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[int]]:
-        with self.bot.session_scope() as session:
-            configs = WowGuildNewsConfig.get_all_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            configs = await session.run_sync(lambda s: WowGuildNewsConfig.get_all_by_guild(interaction.guild.id, s))
             choices = []
             for cfg in configs:
                 status = "\u2705" if cfg.Enabled else "\u23f8\ufe0f"
@@ -193,12 +196,12 @@ class WowNewsMixin:
         await interaction.response.defer(ephemeral=True)
         lang = self._lang(interaction.guild_id)
         not_found = False
-        with self.bot.session_scope() as session:
-            cfg = WowGuildNewsConfig.get_by_id(config, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config, interaction.guild.id, s))
             if not cfg:
                 not_found = True
             else:
-                WowGuildNewsConfig.delete(config, interaction.guild.id, session)
+                await session.run_sync(lambda s: WowGuildNewsConfig.delete(config, interaction.guild.id, s))
         if not_found:
             await send_hidden_message(interaction, get_string(lang, "wow.guildnews.config_not_found", config=config))
             return
@@ -212,8 +215,8 @@ class WowNewsMixin:
         list_empty = False
         output = ""
         configs = []
-        with self.bot.session_scope() as session:
-            raw_configs = WowGuildNewsConfig.get_all_by_guild(interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            raw_configs = await session.run_sync(lambda s: WowGuildNewsConfig.get_all_by_guild(interaction.guild.id, s))
             if not raw_configs:
                 list_empty = True
             else:
@@ -261,8 +264,8 @@ class WowNewsMixin:
         await interaction.response.defer(ephemeral=True)
         lang = self._lang(interaction.guild_id)
         not_found = False
-        with self.bot.session_scope() as session:
-            cfg = WowGuildNewsConfig.get_by_id(config, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config, interaction.guild.id, s))
             if not cfg:
                 not_found = True
             else:
@@ -279,8 +282,8 @@ class WowNewsMixin:
         await interaction.response.defer(ephemeral=True)
         lang = self._lang(interaction.guild_id)
         not_found = False
-        with self.bot.session_scope() as session:
-            cfg = WowGuildNewsConfig.get_by_id(config, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config, interaction.guild.id, s))
             if not cfg:
                 not_found = True
             else:
@@ -321,8 +324,8 @@ class WowNewsMixin:
         not_found = False
         guild_label = None
         changes = []
-        with self.bot.session_scope() as session:
-            cfg = WowGuildNewsConfig.get_by_id(config, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config, interaction.guild.id, s))
             if not cfg:
                 not_found = True
             else:
@@ -350,8 +353,8 @@ class WowNewsMixin:
         require_operator(interaction)
         await interaction.response.defer(ephemeral=True)
         check_msg = None
-        with self.bot.session_scope() as session:
-            cfg = WowGuildNewsConfig.get_by_id(config, interaction.guild.id, session)
+        async with self.bot.async_session_scope() as session:
+            cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config, interaction.guild.id, s))
             if not cfg:
                 check_msg = f"Config #{config} not found."
             elif not cfg.Enabled:
@@ -399,15 +402,20 @@ class WowNewsMixin:
     # ── Background task ─────────────────────────────────────────────────
 
     @tasks.loop(minutes=15)
+    @instrumented_loop("guild_news")
     async def _guild_news_loop(self):
         self.bot.log.debug("Start Guild News Loop!")
+        polled = 0
         try:
-            with self.bot.session_scope() as session:
-                configs = WowGuildNewsConfig.get_all_enabled(session)
+            async with self.bot.async_session_scope() as session:
+                configs = await session.run_sync(WowGuildNewsConfig.get_all_enabled)
 
             for config in configs:
+                if not self.bot.owns_guild(config.GuildId):
+                    continue  # polled by the cluster serving that guild
                 try:
                     await self._poll_single_config(config.Id)
+                    polled += 1
                 except Exception as ex:
                     self.bot.log.error(f"Guild news poll failed for config #{config.Id}: {ex}")
 
@@ -415,14 +423,15 @@ class WowNewsMixin:
             self.bot.log.error(f"Guild news loop error: {ex}")
             await notify_error(self.bot, "Guild news background loop", ex)
         self.bot.log.debug("Stop Guild News Loop!")
+        return polled
 
     async def _poll_single_config(self, config_id: int, *, ignore_baseline: bool = False):
         """Poll a single guild news config for activity and mounts."""
         self.bot.log.debug(f"Guild news #{config_id}: starting poll")
 
         # Re-fetch from DB inside its own session for each phase
-        with self.bot.session_scope() as session:
-            config = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+        async with self.bot.async_session_scope() as session:
+            config = await session.get(WowGuildNewsConfig, config_id)
             if not config or not config.Enabled:
                 self.bot.log.debug(f"Guild news #{config_id}: config not found or disabled, skipping")
                 return
@@ -625,8 +634,8 @@ class WowNewsMixin:
         # Update last activity timestamp
         if new_timestamp and new_timestamp != last_activity_ts and not send_failed:
             self.bot.log.debug(f"Guild news #{config_id}: advancing activity timestamp to {new_timestamp}")
-            with self.bot.session_scope() as session:
-                config = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+            async with self.bot.async_session_scope() as session:
+                config = await session.get(WowGuildNewsConfig, config_id)
                 if config:
                     config.LastActivityTimestamp = new_timestamp
 
@@ -726,13 +735,17 @@ class WowNewsMixin:
         last_count: int = 0
         new_ids: set = set()
         stored_id: int | None = None
-        with self.bot.session_scope() as session:
-            stored = WowCharacterMounts.get_by_character(config_id, char_name, char_realm, session)
+        async with self.bot.async_session_scope() as session:
+            stored = await session.run_sync(
+                lambda s: WowCharacterMounts.get_by_character(config_id, char_name, char_realm, s)
+            )
 
             # Check for a renamed character: no entry under current name, but the
             # API returns a different canonical name that does have stored data.
             if stored is None and api_name and api_name != char_name:
-                old_entry = WowCharacterMounts.get_by_character(config_id, api_name, char_realm, session)
+                old_entry = await session.run_sync(
+                    lambda s: WowCharacterMounts.get_by_character(config_id, api_name, char_realm, s)
+                )
                 if old_entry:
                     self.bot.log.info(f"Guild news #{config_id}: detected rename {api_name} -> {char_name}, migrating")
                     old_entry.CharacterName = char_name
@@ -858,8 +871,8 @@ class WowNewsMixin:
         # --- Phase 3: Write phase (short DB session) ---
         # Persist updated mount set only if all embeds were sent successfully.
         if not mount_send_failed and stored_id is not None:
-            with self.bot.session_scope() as session:
-                stored = session.get(WowCharacterMounts, stored_id)
+            async with self.bot.async_session_scope() as session:
+                stored = await session.get(WowCharacterMounts, stored_id)
                 if stored is not None:
                     mount_json = {
                         "ids": sorted(known_ids | current_ids),
@@ -928,8 +941,10 @@ class WowNewsMixin:
 
         # Prune mount data for characters who left the guild over STALE_DAYS ago
         stale_cutoff = datetime.now(UTC) - timedelta(days=STALE_DAYS)
-        with self.bot.session_scope() as session:
-            deleted = WowCharacterMounts.delete_stale(config_id, candidate_keys, stale_cutoff, session)
+        async with self.bot.async_session_scope() as session:
+            deleted = await session.run_sync(
+                lambda s: WowCharacterMounts.delete_stale(config_id, candidate_keys, stale_cutoff, s)
+            )
             if deleted:
                 self.bot.log.info(f"Guild news #{config_id}: pruned {deleted} stale character(s) from mount tracking")
 
@@ -937,12 +952,12 @@ class WowNewsMixin:
             return
 
         # Load existing data, build account groups, determine initial sync
-        with self.bot.session_scope() as session:
-            existing = WowCharacterMounts.get_all_by_config(config_id, session)
+        async with self.bot.async_session_scope() as session:
+            existing = await session.run_sync(lambda s: WowCharacterMounts.get_all_by_config(config_id, s))
             baselined_keys = {(e.CharacterName, e.RealmSlug) for e in existing}
             stored_mounts = {(e.CharacterName, e.RealmSlug): e.KnownMountIds for e in existing}
 
-            config_record = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+            config_record = await session.get(WowGuildNewsConfig, config_id)
             temporal_data = json.loads(config_record.AccountGroupData or "{}") if config_record else {}
             character_failures = temporal_data.pop("_failures", {})
             had_stored_failures = bool(character_failures)
@@ -1003,8 +1018,8 @@ class WowNewsMixin:
         )
 
         # Process batches - loop through all during initial sync, single batch otherwise
-        with self.bot.session_scope() as session:
-            config = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+        async with self.bot.async_session_scope() as session:
+            config = await session.get(WowGuildNewsConfig, config_id)
             if not config:
                 return
             offset = config.RosterOffset or 0
@@ -1031,8 +1046,8 @@ class WowNewsMixin:
             await asyncio.gather(*[self._check_character(c, ctx) for c in batch])
 
             if not batch_rate_limited.is_set():
-                with self.bot.session_scope() as session:
-                    config = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+                async with self.bot.async_session_scope() as session:
+                    config = await session.get(WowGuildNewsConfig, config_id)
                     if config:
                         config.RosterOffset = new_offset
 
@@ -1071,8 +1086,8 @@ class WowNewsMixin:
 
         # Update AccountGroupData (temporal correlation + failure tracking)
         if cycle_new_mounts or character_failures or had_stored_failures:
-            with self.bot.session_scope() as session:
-                config_record = session.query(WowGuildNewsConfig).filter(WowGuildNewsConfig.Id == config_id).first()
+            async with self.bot.async_session_scope() as session:
+                config_record = await session.get(WowGuildNewsConfig, config_id)
                 if config_record:
                     temporal_data = json.loads(config_record.AccountGroupData or "{}")
                     temporal_data.pop("_failures", None)
@@ -316,14 +316,16 @@ async def _navigate_prof_gear(
     if class_id is None:
         await interaction.response.edit_message(content=_ls(interaction, _LS_CATEGORY_EMPTY), embed=None, view=None)
         return
-    with ctx.bot.session_scope() as session:
-        subclasses = CraftingRecipeCache.get_item_subclasses(
-            RECIPE_TYPE_CRAFTED,
-            class_id,
-            session,
-            profession_ids=ctx.mapped_prof_ids,
-            orderable_only=True,
-            exclude_pvp=False,
+    async with ctx.bot.async_session_scope() as session:
+        subclasses = await session.run_sync(
+            lambda s: CraftingRecipeCache.get_item_subclasses(
+                RECIPE_TYPE_CRAFTED,
+                class_id,
+                s,
+                profession_ids=ctx.mapped_prof_ids,
+                orderable_only=True,
+                exclude_pvp=False,
+            )
         )
     view = ItemSubTypeSelectView(
         ctx.bot,
@@ -349,9 +351,11 @@ async def _navigate_prof_knowledge(
     back_factory=None,
 ):
     """Shared navigation helper: fetch profession knowledge items and show ItemSelectView."""
-    with ctx.bot.session_scope() as session:
-        recipes = CraftingRecipeCache.get_prof_knowledge_items(
-            RECIPE_TYPE_CRAFTED, session, profession_ids=ctx.mapped_prof_ids
+    async with ctx.bot.async_session_scope() as session:
+        recipes = await session.run_sync(
+            lambda s: CraftingRecipeCache.get_prof_knowledge_items(
+                RECIPE_TYPE_CRAFTED, s, profession_ids=ctx.mapped_prof_ids
+            )
         )
     view = ItemSelectView(
         ctx.bot, recipes, ctx.roles, ctx.guild_id, ctx.lang, breadcrumbs=breadcrumbs, back_factory=back_factory
@@ -372,13 +376,17 @@ async def _navigate_pvp_weapons(
     If there are more than 24 weapons, routes to a weapon-subtype picker first so no
     items are silently truncated by the Discord select menu limit.
     """
-    with ctx.bot.session_scope() as session:
-        recipes = CraftingRecipeCache.get_pvp_items(
-            RECIPE_TYPE_CRAFTED, weapon_class_id, None, session, profession_ids=ctx.mapped_prof_ids
+    async with ctx.bot.async_session_scope() as session:
+        recipes = await session.run_sync(
+            lambda s: CraftingRecipeCache.get_pvp_items(
+                RECIPE_TYPE_CRAFTED, weapon_class_id, None, s, profession_ids=ctx.mapped_prof_ids
+            )
         )
         if len(recipes) > _DISCORD_SELECT_LIMIT:
-            subclasses = CraftingRecipeCache.get_pvp_item_subclasses(
-                RECIPE_TYPE_CRAFTED, weapon_class_id, session, profession_ids=ctx.mapped_prof_ids
+            subclasses = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_pvp_item_subclasses(
+                    RECIPE_TYPE_CRAFTED, weapon_class_id, s, profession_ids=ctx.mapped_prof_ids
+                )
             )
         else:
             subclasses = []
@@ -415,9 +423,11 @@ async def _navigate_pvp_armor(
     back_factory=None,
 ):
     """Shared navigation helper: fetch PvP armor subclasses and show PvPArmorTypeSelectView."""
-    with ctx.bot.session_scope() as session:
-        subclasses = CraftingRecipeCache.get_pvp_item_subclasses(
-            RECIPE_TYPE_CRAFTED, armor_class_id, session, profession_ids=ctx.mapped_prof_ids
+    async with ctx.bot.async_session_scope() as session:
+        subclasses = await session.run_sync(
+            lambda s: CraftingRecipeCache.get_pvp_item_subclasses(
+                RECIPE_TYPE_CRAFTED, armor_class_id, s, profession_ids=ctx.mapped_prof_ids
+            )
         )
     view = PvPArmorTypeSelectView(
         ctx.bot,
@@ -658,12 +668,12 @@ class CraftingBoardView(ui.View):
 
     async def _on_create_order(self, interaction: Interaction):
         lang = mapped_prof_ids = mapping_role_ids = available_vcats = item_class_ids = pvp_item_class_ids = None
-        with self.bot.session_scope() as session:
-            board_ctx = self._load_board_context(interaction.guild_id, session)
+        async with self.bot.async_session_scope() as session:
+            board_ctx = await session.run_sync(lambda s: self._load_board_context(interaction.guild_id, s))
             if board_ctx is not None:
                 lang, mapped_prof_ids, mapping_role_ids = board_ctx
-                available_vcats, item_class_ids, pvp_item_class_ids = _build_vcat_info(
-                    RECIPE_TYPE_CRAFTED, session, mapped_prof_ids
+                available_vcats, item_class_ids, pvp_item_class_ids = await session.run_sync(
+                    lambda s: _build_vcat_info(RECIPE_TYPE_CRAFTED, s, mapped_prof_ids)
                 )
 
         if board_ctx is None:
@@ -695,13 +705,15 @@ class CraftingBoardView(ui.View):
 
     async def _on_create_housing(self, interaction: Interaction):
         lang = mapped_prof_ids = mapping_role_ids = housing_professions = None
-        with self.bot.session_scope() as session:
-            board_ctx = self._load_board_context(interaction.guild_id, session)
+        async with self.bot.async_session_scope() as session:
+            board_ctx = await session.run_sync(lambda s: self._load_board_context(interaction.guild_id, s))
             if board_ctx is not None:
                 lang, mapped_prof_ids, mapping_role_ids = board_ctx
                 if mapped_prof_ids:
-                    housing_professions = CraftingRecipeCache.get_professions_with_recipes(
-                        RECIPE_TYPE_HOUSING, session, profession_ids=mapped_prof_ids
+                    housing_professions = await session.run_sync(
+                        lambda s: CraftingRecipeCache.get_professions_with_recipes(
+                            RECIPE_TYPE_HOUSING, s, profession_ids=mapped_prof_ids
+                        )
                     )
                 else:
                     housing_professions = []
@@ -805,26 +817,30 @@ class ItemTypeSelectView(ui.View):
 
     async def _on_select(self, interaction: Interaction):
         item_class_id = int(interaction.data["values"][0])
-        with self.bot.session_scope() as session:
-            subclasses = CraftingRecipeCache.get_item_subclasses(
-                RECIPE_TYPE_CRAFTED,
-                item_class_id,
-                session,
-                profession_ids=self.mapped_prof_ids,
-                orderable_only=self.orderable_only,
-            )
-
-        if not subclasses:
-            # No subclasses — go straight to item select
-            with self.bot.session_scope() as session:
-                recipes = CraftingRecipeCache.get_by_type_and_subclass(
+        async with self.bot.async_session_scope() as session:
+            subclasses = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_item_subclasses(
                     RECIPE_TYPE_CRAFTED,
                     item_class_id,
-                    None,
-                    session,
+                    s,
                     profession_ids=self.mapped_prof_ids,
                     orderable_only=self.orderable_only,
                 )
+            )
+
+        if not subclasses:
+            # No subclasses — go straight to item select
+            async with self.bot.async_session_scope() as session:
+                recipes = await session.run_sync(
+                    lambda s: CraftingRecipeCache.get_by_type_and_subclass(
+                        RECIPE_TYPE_CRAFTED,
+                        item_class_id,
+                        None,
+                        s,
+                        profession_ids=self.mapped_prof_ids,
+                        orderable_only=self.orderable_only,
+                    )
+                )
             view = ItemSelectView(self.bot, recipes, self.roles, self.guild_id, self.lang)
             embed = view._make_embed()
             await interaction.response.edit_message(embed=embed, view=view, content=None)
@@ -913,15 +929,17 @@ class ItemSubTypeSelectView(ui.View):
 
         selected_label = _resolve_subtype_label(self._subclasses, item_subclass_id, self.lang)
 
-        with self.bot.session_scope() as session:
-            recipes = CraftingRecipeCache.get_by_type_and_subclass(
-                RECIPE_TYPE_CRAFTED,
-                self.item_class_id,
-                item_subclass_id,
-                session,
-                profession_ids=self.mapped_prof_ids,
-                orderable_only=self.orderable_only,
-                exclude_pvp=self.exclude_pvp,
+        async with self.bot.async_session_scope() as session:
+            recipes = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_by_type_and_subclass(
+                    RECIPE_TYPE_CRAFTED,
+                    self.item_class_id,
+                    item_subclass_id,
+                    s,
+                    profession_ids=self.mapped_prof_ids,
+                    orderable_only=self.orderable_only,
+                    exclude_pvp=self.exclude_pvp,
+                )
             )
 
         view = ItemSelectView(
@@ -1048,9 +1066,11 @@ class VirtualCategorySelectView(ui.View):
                 await interaction.response.edit_message(embed=embed, view=view, content=None)
 
         elif vcat == _VCAT_RAID_PREP:
-            with self.bot.session_scope() as session:
-                categories = CraftingRecipeCache.get_raid_prep_categories(
-                    RECIPE_TYPE_CRAFTED, session, profession_ids=self.mapped_prof_ids
+            async with self.bot.async_session_scope() as session:
+                categories = await session.run_sync(
+                    lambda s: CraftingRecipeCache.get_raid_prep_categories(
+                        RECIPE_TYPE_CRAFTED, s, profession_ids=self.mapped_prof_ids
+                    )
                 )
             if not categories:
                 await interaction.response.edit_message(
@@ -1083,14 +1103,16 @@ class VirtualCategorySelectView(ui.View):
                 )
                 return
 
-            with self.bot.session_scope() as session:
-                subclasses = CraftingRecipeCache.get_item_subclasses(
-                    RECIPE_TYPE_CRAFTED,
-                    class_id,
-                    session,
-                    profession_ids=self.mapped_prof_ids,
-                    orderable_only=True,
-                    exclude_pvp=True,
+            async with self.bot.async_session_scope() as session:
+                subclasses = await session.run_sync(
+                    lambda s: CraftingRecipeCache.get_item_subclasses(
+                        RECIPE_TYPE_CRAFTED,
+                        class_id,
+                        s,
+                        profession_ids=self.mapped_prof_ids,
+                        orderable_only=True,
+                        exclude_pvp=True,
+                    )
                 )
             view = ItemSubTypeSelectView(
                 self.bot,
@@ -1142,9 +1164,11 @@ class VirtualCategorySelectView(ui.View):
                 )
 
         elif vcat == _VCAT_OTHER:
-            with self.bot.session_scope() as session:
-                categories = CraftingRecipeCache.get_other_categories(
-                    RECIPE_TYPE_CRAFTED, session, profession_ids=self.mapped_prof_ids
+            async with self.bot.async_session_scope() as session:
+                categories = await session.run_sync(
+                    lambda s: CraftingRecipeCache.get_other_categories(
+                        RECIPE_TYPE_CRAFTED, s, profession_ids=self.mapped_prof_ids
+                    )
                 )
             if not categories:
                 await interaction.response.edit_message(
@@ -1417,9 +1441,11 @@ class PvPSubTypeSelectView(ui.View):
 
         selected_label = _resolve_subtype_label(self._subclasses, item_subclass_id, self.lang)
 
-        with self.bot.session_scope() as session:
-            recipes = CraftingRecipeCache.get_pvp_items(
-                RECIPE_TYPE_CRAFTED, self.item_class_id, item_subclass_id, session, profession_ids=self.mapped_prof_ids
+        async with self.bot.async_session_scope() as session:
+            recipes = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_pvp_items(
+                    RECIPE_TYPE_CRAFTED, self.item_class_id, item_subclass_id, s, profession_ids=self.mapped_prof_ids
+                )
             )
         if len(recipes) > ItemSelectView._PAGE_SIZE:
             log.warning(
@@ -1522,8 +1548,10 @@ class CategoryPickerView(ui.View):
 
         selected_label = _resolve_category_label(self._categories, category_name, self.lang)
 
-        with self.bot.session_scope() as session:
-            recipes = self._fetch_fn(category_name, session, profession_ids=self.mapped_prof_ids)
+        async with self.bot.async_session_scope() as session:
+            recipes = await session.run_sync(
+                lambda s: self._fetch_fn(category_name, s, profession_ids=self.mapped_prof_ids)
+            )
         if not recipes:
             await interaction.response.edit_message(
                 content=_ls(interaction, _LS_CATEGORY_EMPTY),
@@ -1716,8 +1744,8 @@ class ItemSelectView(ui.View):
         await self._navigate_to_page(interaction, self._page + 1)
 
     async def _on_other(self, interaction: Interaction):
-        with self.bot.session_scope() as session:
-            mappings = CraftingRoleMapping.get_by_guild(interaction.guild_id, session)
+        async with self.bot.async_session_scope() as session:
+            mappings = await session.run_sync(lambda s: CraftingRoleMapping.get_by_guild(interaction.guild_id, s))
         roles_found = []
         for m in mappings:
             role = interaction.guild.get_role(m.RoleId)
@@ -1745,8 +1773,8 @@ class ItemSelectView(ui.View):
             return
 
         role_id = None
-        with self.bot.session_scope() as session:
-            mappings = CraftingRoleMapping.get_by_guild(interaction.guild_id, session)
+        async with self.bot.async_session_scope() as session:
+            mappings = await session.run_sync(lambda s: CraftingRoleMapping.get_by_guild(interaction.guild_id, s))
             for m in mappings:
                 if m.ProfessionId == recipe.ProfessionId:
                     role_id = m.RoleId
@@ -1841,10 +1869,14 @@ class HousingProfessionSelectView(ui.View):
         prof_name = next((name for pid, name in self._housing_professions if pid == prof_id), str(prof_id))
         child_crumbs = self._breadcrumbs + [prof_name]
 
-        with self.bot.session_scope() as session:
-            expansions = CraftingRecipeCache.get_expansions_for_profession(prof_id, RECIPE_TYPE_HOUSING, session)
+        async with self.bot.async_session_scope() as session:
+            expansions = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_expansions_for_profession(prof_id, RECIPE_TYPE_HOUSING, s)
+            )
             recipes = (
-                CraftingRecipeCache.get_by_profession(prof_id, RECIPE_TYPE_HOUSING, session) if not expansions else None
+                await session.run_sync(lambda s: CraftingRecipeCache.get_by_profession(prof_id, RECIPE_TYPE_HOUSING, s))
+                if not expansions
+                else None
             )
 
         go_back = self._make_back_closure()
@@ -1918,9 +1950,11 @@ class ExpansionSelectView(ui.View):
 
     async def _on_select(self, interaction: Interaction):
         expansion = interaction.data["values"][0]
-        with self.bot.session_scope() as session:
-            recipes = CraftingRecipeCache.get_by_profession_and_expansion(
-                self.prof_id, RECIPE_TYPE_HOUSING, expansion, session
+        async with self.bot.async_session_scope() as session:
+            recipes = await session.run_sync(
+                lambda s: CraftingRecipeCache.get_by_profession_and_expansion(
+                    self.prof_id, RECIPE_TYPE_HOUSING, expansion, s
+                )
             )
 
         view = ItemSelectView(
@@ -2010,7 +2044,7 @@ class ManualProfessionMappingView(ui.View):
             )
             return
 
-        with self.bot.session_scope() as session:
+        def _save(session):
             for role_id, prof_id in self.selections.items():
                 existing = (
                     session.query(CraftingRoleMapping)
@@ -2022,6 +2056,9 @@ class ManualProfessionMappingView(ui.View):
                 else:
                     session.add(CraftingRoleMapping(GuildId=self.guild_id, RoleId=role_id, ProfessionId=prof_id))
 
+        async with self.bot.async_session_scope() as session:
+            await session.run_sync(_save)
+
         self.stop()
 
         if not is_last_batch:
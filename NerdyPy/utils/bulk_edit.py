@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Bulk re-rendering of bot-owned messages (language changes and similar guild-wide refreshes).
+
+Refreshers describe each message as a ``MessageEdit``: where it lives and how to render it. The
+pipeline then:
+
+- groups the edits by channel and works through each channel in order, because Discord rate-limits
+  message edits per channel; several channels are edited in parallel
+- leaves pacing within a channel to discord.py, which waits on the rate-limit bucket headers
+- fetches each message once, hands it to the renderer, and skips the edit when the rendered
+  embeds and components match what is already posted
+- reports progress through an optional callback and returns the final counts
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import discord
+
+from utils.helpers import bot_get_or_fetch_channel
+
+_log = logging.getLogger("nerpybot")
+
+# Channels edited at the same time. Each channel has its own bucket; this only bounds how much of
+# the global request budget a single refresh may take.
+CHANNEL_CONCURRENCY = 5
+
+
+@dataclass(slots=True)
+class MessageEdit:
+    """One message to re-render.
+
+    ``render`` receives the fetched message and returns the ``Message.edit`` keyword arguments,
+    or None when there is nothing to edit any more.
+    """
+
+    channel_id: int
+    message_id: int
+    render: Callable[[discord.Message], dict | None]
+
+
+@dataclass(slots=True)
+class BulkEditStats:
+    total: int
+    edited: int = 0
+    unchanged: int = 0
+    missing: int = 0  # channel or message gone, or no access
+    failed: int = 0
+
+    @property
+    def done(self) -> int:
+        return self.edited + self.unchanged + self.missing + self.failed
+
+
+def progress_logger(label: str, every: int = 25) -> Callable[[BulkEditStats], None]:
+    """Return an ``on_progress`` callback that logs every *every* messages and once at the end."""
+
+    def _log_progress(stats: BulkEditStats) -> None:
+        if stats.done == stats.total:
+            _log.info(
+                "%s: %d edited, %d unchanged, %d missing, %d failed",
+                label,
+                stats.edited,
+                stats.unchanged,
+                stats.missing,
+                stats.failed,
+            )
+        elif stats.done % every == 0:
+            _log.info("%s: %d/%d messages", label, stats.done, stats.total)
+
+    return _log_progress
+
+
+def _embed_signature(embed: discord.Embed) -> tuple:
+    return (
+        embed.title,
+        embed.description,
+        embed.url,
+        embed.colour.value if embed.colour else None,
+        tuple((f.name, f.value, f.inline) for f in embed.fields),
+        embed.footer.text,
+        embed.author.name,
+        embed.image.url,
+        embed.thumbnail.url,
+        embed.timestamp,
+    )
+
+
+def _item_signature(item) -> tuple:
+    return (
+        type(item).__name__,
+        getattr(item, "custom_id", None),
+        getattr(item, "label", None),
+        getattr(item, "disabled", None),
+    )
+
+
+def is_unchanged(message: discord.Message, kwargs: dict) -> bool:
+    """Return True if editing *message* with *kwargs* would not change its embeds or components."""
+    if set(kwargs) - {"embed", "embeds", "view"}:
+        return False  # content, attachments, ...: not compared, always edit
+    embeds = kwargs.get("embeds", [kwargs["embed"]] if "embed" in kwargs else None)
+    if embeds is not None and [_embed_signature(e) for e in embeds] != [_embed_signature(e) for e in message.embeds]:
+        return False
+    view = kwargs.get("view")
+    if view is not None:
+        posted = sorted(_item_signature(c) for row in message.components for c in getattr(row, "children", [row]))
+        if sorted(_item_signature(item) for item in view.children) != posted:
+            return False
+    return True
+
+
+async def bulk_edit_messages(
+    bot,
+    edits: list[MessageEdit],
+    *,
+    on_progress: Callable[[BulkEditStats], None] | None = None,
+) -> BulkEditStats:
+    """Apply *edits* channel by channel, with up to ``CHANNEL_CONCURRENCY`` channels in parallel."""
+    stats = BulkEditStats(total=len(edits))
+    by_channel: dict[int, list[MessageEdit]] = {}
+    for edit in edits:
+        by_channel.setdefault(edit.channel_id, []).append(edit)
+    slots = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+
+    def _report():
+        if on_progress is not None:
+            on_progress(stats)
+
+    async def _edit_one(channel, edit: MessageEdit) -> None:
+        try:
+            message = await channel.fetch_message(edit.message_id)
+            kwargs = edit.render(message)
+            if kwargs is None:
+                stats.missing += 1
+            elif is_unchanged(message, kwargs):
+                stats.unchanged += 1
+            else:
+                await message.edit(**kwargs)
+                stats.edited += 1
+        except (discord.NotFound, discord.Forbidden):
+            stats.missing += 1
+        except discord.HTTPException as exc:
+            _log.warning("bulk edit: failed to edit message %d in channel %d: %s", edit.message_id, channel.id, exc)
+            stats.failed += 1
+        except Exception:
+            _log.exception("bulk edit: failed to render message %d in channel %d", edit.message_id, channel.id)
+            stats.failed += 1
+
+    async def _run_channel(channel_id: int, channel_edits: list[MessageEdit]) -> None:
+        async with slots:
+            try:
+                channel = await bot_get_or_fetch_channel(bot, channel_id)
+            except discord.HTTPException as exc:
+                _log.warning("bulk edit: failed to fetch channel %d: %s", channel_id, exc)
+                stats.failed += len(channel_edits)
+                _report()
+                return
+            if channel is None:
+                stats.missing += len(channel_edits)
+                _report()
+                return
+            for edit in channel_edits:
+                await _edit_one(channel, edit)
+                _report()
+
+    await asyncio.gather(*(_run_channel(cid, channel_edits) for cid, channel_edits in by_channel.items()))
+    return stats
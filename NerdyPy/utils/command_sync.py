@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Hash-guarded application command sync.
+
+Discord rate-limits command syncs tightly, yet most syncs after a deploy push a tree that did not
+change. The payload each scope (global, or one guild) would send is hashed, and the hash of its
+last successful sync is kept in ``CommandTreeSync``; a sync whose hash matches is skipped unless
+forced. ``bot.command_sync: auto`` syncs every scope that differs once the bot is ready.
+
+A change made on Discord's side (another client syncing, a manual delete) is not visible here;
+``force`` pushes the tree regardless.
+"""
+
+import hashlib
+import json
+
+from discord import Object
+
+from models.guild import CommandTreeSync
+
+GLOBAL_SCOPE = "global"
+
+
+def scope_key(guild) -> str:
+    """Return the ``CommandTreeSync`` key for *guild* (None: the global scope)."""
+    return GLOBAL_SCOPE if guild is None else str(guild.id)
+
+
+async def tree_payload(tree, guild=None) -> list[dict]:
+    """Return what ``tree.sync(guild=guild)`` would send, ordered by command type and name."""
+    commands = tree.get_commands(guild=guild)
+    translator = tree.translator
+    if translator:
+        payload = [await command.get_translated_payload(tree, translator) for command in commands]
+    else:
+        payload = [command.to_dict(tree) for command in commands]
+    return sorted(payload, key=lambda entry: (entry.get("type", 1), entry["name"]))
+
+
+async def tree_hash(tree, guild=None) -> str:
+    """Return a SHA-256 hex digest of the scope's payload; equal trees hash equal across restarts."""
+    payload = await tree_payload(tree, guild)
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+async def sync_tree(bot, guild=None, *, force: bool = False) -> int | None:
+    """Sync one scope unless its tree is unchanged since the last sync.
+
+    Returns the number of commands synced, or None when the sync was skipped. Errors from
+    ``tree.sync`` propagate, and the stored hash is only updated after a successful sync.
+    """
+    key = scope_key(guild)
+    digest = await tree_hash(bot.tree, guild)
+    if not force:
+        async with bot.async_session_scope() as session:
+            stored = await session.run_sync(lambda s: CommandTreeSync.get_hash(key, s))
+        if stored == digest:
+            bot.log.debug(f"Command tree for {key} unchanged, skipping sync.")
+            return None
+
+    synced = await bot.tree.sync(guild=guild)
+    async with bot.async_session_scope() as session:
+        await session.run_sync(lambda s: CommandTreeSync.set_hash(key, digest, s))
+    bot.log.info(f"Synced {len(synced)} commands to {key}.")
+    return len(synced)
+
+
+async def auto_sync(bot) -> dict[str, int | None]:
+    """Sync the global scope and every guild with guild-specific commands whose tree changed.
+
+    Returns ``{scope: synced count or None if skipped}``. A failing scope is logged and left out,
+    so one guild missing the ``applications.commands`` scope does not stop the others. In cluster
+    mode each process syncs the guilds it serves and only the primary syncs the global scope.
+    """
+    guilds = [Object(id=guild.id) for guild in bot.guilds if bot.tree.get_commands(guild=guild)]
+    scopes = [None, *guilds] if bot.cluster.primary else guilds
+    results = {}
+    for guild in scopes:
+        try:
+            results[scope_key(guild)] = await sync_tree(bot, guild)
+        except Exception as e:
+            bot.log.error(f"Command sync for {scope_key(guild)} failed: {e}")
+    return results
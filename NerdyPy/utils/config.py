@@ -44,6 +44,11 @@ def parse_env_config() -> dict:
         ("NERPYBOT_DB_HOST", ["database", "db_host"], str),
         ("NERPYBOT_DB_PORT", ["database", "db_port"], str),
         ("NERPYBOT_AUDIO_BUFFER_LIMIT", ["audio", "buffer_limit"], int),
+        ("NERPYBOT_AUDIO_WORKER_PROCESSES", ["audio", "worker_processes"], int),
+        ("NERPYBOT_AUDIO_PREFETCH_CONCURRENCY", ["audio", "prefetch_concurrency"], int),
+        ("NERPYBOT_AUDIO_PREFETCH_PER_GUILD", ["audio", "prefetch_per_guild"], int),
+        ("NERPYBOT_AUDIO_EXTRACT_TIMEOUT", ["audio", "extract_timeout"], float),
+        ("NERPYBOT_AUDIO_DOWNLOAD_TIMEOUT", ["audio", "download_timeout"], float),
         ("NERPYBOT_YOUTUBE_KEY", ["music", "ytkey"], str),
         ("NERPYBOT_RIOT_KEY", ["league", "riot"], str),
         ("NERPYBOT_WOW_CLIENT_ID", ["wow", "wow_id"], str),
@@ -57,6 +62,14 @@ def parse_env_config() -> dict:
         ("NERPYBOT_VALKEY_URL", ["web", "valkey_url"], str),
         ("NERPYBOT_WEB_VALKEY_URL", ["web", "valkey_url"], str),  # overrides NERPYBOT_VALKEY_URL if both are set
         ("NERPYBOT_LOG_LEVEL", ["bot", "log_level"], str),
+        ("NERPYBOT_LOOP_MONITOR", ["bot", "loop_monitor", "enabled"], _to_bool),
+        ("NERPYBOT_LOOP_LAG_THRESHOLD_MS", ["bot", "loop_monitor", "threshold_ms"], int),
+        ("NERPYBOT_COMMAND_SYNC", ["bot", "command_sync"], str),
+        ("NERPYBOT_SHARD_COUNT", ["bot", "sharding", "shard_count"], int),
+        ("NERPYBOT_CLUSTER_ID", ["bot", "sharding", "cluster_id"], int),
+        ("NERPYBOT_CLUSTER_COUNT", ["bot", "sharding", "cluster_count"], int),
+        ("NERPYBOT_MEMBER_CHUNKING", ["bot", "member_cache", "chunking"], str),
+        ("NERPYBOT_MEMBER_LOOKUP_CACHE_SIZE", ["bot", "member_cache", "lookup_cache_size"], int),
         ("NERPYBOT_NAME", ["bot", "name"], str),
         ("NERPYBOT_DESCRIPTION", ["bot", "description"], str),
     ]
@@ -1,6 +1,46 @@
 # -*- coding: utf-8 -*-
 """providing access to the sqlite db"""
 
+import asyncio
+import traceback
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base
 
 BASE = declarative_base()
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _first_project_frame() -> str:
+    """Return ``file:line`` of the innermost caller inside NerdyPy, skipping this module."""
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename).resolve()
+        if path == Path(__file__).resolve() or not path.is_relative_to(_PROJECT_ROOT):
+            continue
+        return f"{path.relative_to(_PROJECT_ROOT)}:{frame.lineno}"
+    return "<unknown>"
+
+
+def install_sync_call_guard(engine: Engine, log) -> None:
+    """Warn when *engine* executes a query on a thread that is running an asyncio event loop.
+
+    A synchronous query there blocks the Discord gateway until the database answers. Each call
+    site is reported once. Queries from ``to_thread`` workers are fine and stay silent. Meant for
+    debug mode only — walking the stack on every query is not free.
+    """
+    reported: set[str] = set()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _check(conn, cursor, statement, parameters, context, executemany):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        site = _first_project_frame()
+        if site in reported:
+            return
+        reported.add(site)
+        log.warning(f"Synchronous database call on the event loop at {site}: {statement.splitlines()[0][:120]}")
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Durable event delivery from the web dashboard over a Valkey Stream.
+
+The web appends events with XADD (capped with ``MAXLEN ~``); the bot reads them through a consumer
+group with XREADGROUP and acknowledges an entry only after its handler succeeded. Entries that are
+never acknowledged — the bot crashed mid-dispatch, or the handler asked for a retry — stay in the
+group's pending list and are taken over with XAUTOCLAIM once they have been idle long enough. An
+entry that keeps failing is dropped after ``max_deliveries`` attempts so it cannot wedge the stream.
+
+Unlike pub/sub, nothing is lost while the bot restarts or the listener reconnects: the entries wait
+in the stream until the group reads them.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from valkey.exceptions import ResponseError
+
+_log = logging.getLogger(__name__)
+
+TWITCH_EVENT_STREAM = "nerpybot:events:twitch"
+CONSUMER_GROUP = "nerpybot"
+CONSUMER_NAME = "bot"
+
+
+class EventStreamConsumer:
+    """Reads one stream through a consumer group and hands each entry's JSON payload to *handler*.
+
+    *handler* returns True when the entry is done (it is then acknowledged) and False to leave it
+    pending for redelivery. An exception counts as False. Entries of a batch are dispatched
+    concurrently, so a burst of events is not serialized behind the slowest one.
+    """
+
+    def __init__(
+        self,
+        client,
+        stream: str,
+        handler: Callable[[dict], Awaitable[bool]],
+        *,
+        group: str = CONSUMER_GROUP,
+        consumer: str | None = None,
+        batch_size: int = 50,
+        block_ms: int = 5000,
+        claim_idle_ms: int = 60_000,
+        max_deliveries: int = 5,
+        max_age_seconds: float | None = None,
+    ):
+        self._client = client
+        self.stream = stream
+        self._handler = handler
+        self.group = group
+        # Not tied to the host: a restarted or recreated container is the same consumer and finds the
+        # entries its predecessor read but never acknowledged. Each cluster has a group of its own.
+        self.consumer = consumer or CONSUMER_NAME
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._claim_idle_ms = claim_idle_ms
+        self._max_deliveries = max_deliveries
+        self._max_age_ms = None if max_age_seconds is None else int(max_age_seconds * 1000)
+        self._last_claim = 0.0
+        self.stats = {"acked": 0, "retried": 0, "expired": 0, "dead_lettered": 0, "claimed": 0}
+
+    async def run(self) -> None:
+        """Consume until cancelled, reconnecting with backoff on Valkey errors."""
+        delay = 1.0
+        while True:
+            try:
+                await self._ensure_group()
+                # Entries this consumer read before a restart but never acknowledged.
+                await self._read("0")
+                while True:
+                    if time.monotonic() - self._last_claim >= self._claim_idle_ms / 1000:
+                        await self.claim_stale()
+                    await self._read(">")
+                    delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _log.error("Event stream %s consumer error: %s (retrying in %.0fs)", self.stream, e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+    async def _ensure_group(self) -> None:
+        try:
+            start = await self._group_start()
+            await self._client.xgroup_create(self.stream, self.group, id=start, mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _group_start(self) -> str:
+        """Where a new group starts reading: after the newest entry another group already delivered.
+
+        A group is new when the stream's readers change (entering or leaving cluster mode); its
+        entries were handled by the groups that read the stream before. With no other group, nothing
+        has been delivered yet and the new group starts at the beginning.
+        """
+        try:
+            groups = await self._client.xinfo_groups(self.stream)
+        except ResponseError:  # no such stream yet
+            return "0"
+        delivered = [g["last-delivered-id"] for g in groups if g["name"] != self.group]
+        return max(delivered, key=_entry_key, default="0")
+
+    async def _read(self, start: str) -> None:
+        response = await self._client.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: start},
+            count=self._batch_size,
+            block=None if start == "0" else self._block_ms,
+        )
+        for _stream, entries in response or []:
+            await self.process(entries)
+
+    async def claim_stale(self) -> None:
+        """Take over entries left pending by any consumer for longer than ``claim_idle_ms``.
+
+        Consumers that are gone (idle that long with nothing pending) are removed from the group.
+        """
+        self._last_claim = time.monotonic()
+        await self._claim()
+        await self._remove_idle_consumers()
+
+    async def _claim(self) -> None:
+        _next, entries, *_ = await self._client.xautoclaim(
+            self.stream, self.group, self.consumer, min_idle_time=self._claim_idle_ms, count=self._batch_size
+        )
+        entries = [entry for entry in entries if entry[0] is not None]
+        if not entries:
+            return
+        self.stats["claimed"] += len(entries)
+        ids = [entry_id for entry_id, _ in entries]
+        pending = await self._client.xpending_range(self.stream, self.group, ids[0], ids[-1], self._batch_size * 4)
+        deliveries = {p["message_id"]: p["times_delivered"] for p in pending}
+        dead = [entry_id for entry_id in ids if deliveries.get(entry_id, 0) > self._max_deliveries]
+        if dead:
+            _log.error("Event stream %s: dropping %d entries after repeated failures: %s", self.stream, len(dead), dead)
+            self.stats["dead_lettered"] += len(dead)
+            await self._client.xack(self.stream, self.group, *dead)
+        await self.process([entry for entry in entries if entry[0] not in dead])
+
+    async def _remove_idle_consumers(self) -> None:
+        consumers = await self._client.xinfo_consumers(self.stream, self.group)
+        for info in consumers:
+            if info["name"] != self.consumer and not info["pending"] and info["idle"] >= self._claim_idle_ms:
+                await self._client.xgroup_delconsumer(self.stream, self.group, info["name"])
+
+    async def process(self, entries: list[tuple[str, dict | None]]) -> None:
+        """Dispatch *entries* concurrently and acknowledge the ones that are done."""
+        if not entries:
+            return
+        results = await asyncio.gather(*(self._dispatch(entry_id, fields) for entry_id, fields in entries))
+        done = [entry_id for (entry_id, _), ok in zip(entries, results) if ok]
+        self.stats["retried"] += len(entries) - len(done)
+        if done:
+            await self._client.xack(self.stream, self.group, *done)
+            self.stats["acked"] += len(done)
+
+    async def _dispatch(self, entry_id: str, fields: dict | None) -> bool:
+        if not fields or "data" not in fields:
+            _log.warning("Event stream %s: discarding malformed entry %s", self.stream, entry_id)
+            return True
+        if self._max_age_ms is not None:
+            age_ms = time.time() * 1000 - int(entry_id.split("-", 1)[0])
+            if age_ms > self._max_age_ms:
+                _log.info("Event stream %s: skipping entry %s, %.0fs old", self.stream, entry_id, age_ms / 1000)
+                self.stats["expired"] += 1
+                return True
+        try:
+            payload = json.loads(fields["data"])
+        except ValueError:
+            _log.warning("Event stream %s: discarding entry %s with invalid JSON", self.stream, entry_id)
+            return True
+        try:
+            return bool(await self._handler(payload))
+        except Exception:
+            _log.exception("Event stream %s: handler failed for entry %s", self.stream, entry_id)
+            return False
+
+
+def _entry_key(entry_id: str) -> tuple[int, int]:
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Bot-pushed snapshot of guild channels and roles for the web dashboard.
+
+Per guild, three Valkey hashes are kept:
+
+- ``nerpybot:guild:<id>:channels`` — channel id → ``{"name", "type"}``
+- ``nerpybot:guild:<id>:roles`` — role id → ``{"name", "position"}`` (``@everyone`` excluded)
+- ``nerpybot:guild:<id>:meta`` — ``version`` (bumped on every change) and ``updated`` (epoch seconds)
+
+The listener loop attaches the publisher once its Valkey connection is up and a full snapshot of
+every guild is written; afterwards the gateway events in ``NerpyBot`` apply single-field updates.
+Updates go through one queue and one writer so they reach Valkey in event order, and each batch is
+written as a single MULTI/EXEC. The web reads these hashes directly (``web.cache.ValkeyClient``)
+and only asks the bot over RPC when a guild is missing, which in turn republishes that guild.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+_log = logging.getLogger(__name__)
+
+KEY_PREFIX = "nerpybot:guild"
+# Refreshed on every write; a guild that sees no change for this long is dropped and republished
+# on the next dashboard miss, which bounds how long a lost update can linger.
+SNAPSHOT_TTL = 24 * 3600
+_RETRY_DELAY = 5.0  # seconds between attempts to rewrite guilds whose last batch failed
+
+
+def snapshot_keys(guild_id: int) -> tuple[str, str, str]:
+    """Return the ``(channels, roles, meta)`` keys of a guild."""
+    base = f"{KEY_PREFIX}:{guild_id}"
+    return f"{base}:channels", f"{base}:roles", f"{base}:meta"
+
+
+def _channel_entry(channel) -> str:
+    return json.dumps({"name": channel.name, "type": channel.type.value})
+
+
+def _role_entry(role) -> str:
+    return json.dumps({"name": role.name, "position": role.position})
+
+
+class GuildMetadataPublisher:
+    """Queues guild channel/role changes and writes them to Valkey in order.
+
+    Every method is synchronous and cheap: it captures the current state of the Discord object and
+    enqueues it. While no Valkey client is attached, changes are discarded — the full snapshot
+    written on ``attach`` covers them.
+    """
+
+    def __init__(self, get_guild):
+        """*get_guild* resolves a guild id to the current guild (``bot.get_guild``) for retries."""
+        self._get_guild = get_guild
+        self._client = None
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._stale: set[int] = set()
+
+    @property
+    def attached(self) -> bool:
+        return self._client is not None
+
+    def attach(self, client, guilds) -> None:
+        """Start writing through *client* (an async Valkey client) and publish *guilds* in full."""
+        self.detach()
+        self._client = client
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop(), name="guild-metadata-writer")
+        self.sync_guilds(guilds)
+
+    def detach(self) -> None:
+        """Stop writing; queued changes are dropped."""
+        self._client = None
+        self._queue = None
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+    def _enqueue(self, guild_id: int, op: tuple) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait((guild_id, op))
+
+    def sync_guilds(self, guilds) -> None:
+        for guild in guilds:
+            self.sync_guild(guild)
+
+    def sync_guild(self, guild) -> None:
+        """Replace the whole snapshot of *guild*."""
+        self._enqueue(guild.id, _full_snapshot(guild))
+
+    def put_channel(self, channel) -> None:
+        self._enqueue(channel.guild.id, ("hset", 0, str(channel.id), _channel_entry(channel)))
+
+    def remove_channel(self, channel) -> None:
+        self._enqueue(channel.guild.id, ("hdel", 0, str(channel.id)))
+
+    def put_role(self, role) -> None:
+        if not role.is_default():
+            self._enqueue(role.guild.id, ("hset", 1, str(role.id), _role_entry(role)))
+
+    def remove_role(self, role) -> None:
+        self._enqueue(role.guild.id, ("hdel", 1, str(role.id)))
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._enqueue(guild_id, ("forget",))
+
+    async def _write_loop(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [] if self._stale else [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            batch = self._take_stale() + batch
+            try:
+                async with self._client.pipeline(transaction=True) as pipe:
+                    for guild_id, op in batch:
+                        _apply(pipe, guild_id, op)
+                    await pipe.execute()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Incremental changes in the batch are lost, so those guilds are rewritten in full.
+                _log.warning("Guild metadata write failed for %d changes, retrying: %s", len(batch), e)
+                self._stale.update(guild_id for guild_id, _ in batch)
+                await asyncio.sleep(_RETRY_DELAY)
+
+    def _take_stale(self) -> list[tuple]:
+        """Full-snapshot (or forget) changes for every guild whose last write failed."""
+        ops = []
+        for guild_id in self._stale:
+            guild = self._get_guild(guild_id)
+            ops.append((guild_id, _full_snapshot(guild) if guild is not None else ("forget",)))
+        self._stale.clear()
+        return ops
+
+
+def _full_snapshot(guild) -> tuple:
+    channels = {str(c.id): _channel_entry(c) for c in guild.channels}
+    roles = {str(r.id): _role_entry(r) for r in guild.roles if not r.is_default()}
+    return "guild", channels, roles
+
+
+def _apply(pipe, guild_id: int, op: tuple) -> None:
+    """Queue the Valkey commands for one change on *pipe*."""
+    keys = snapshot_keys(guild_id)
+    kind = op[0]
+    if kind == "forget":
+        pipe.delete(*keys)
+        return
+    if kind == "guild":
+        _, channels, roles = op
+        pipe.delete(keys[0], keys[1])
+        if channels:
+            pipe.hset(keys[0], mapping=channels)
+        if roles:
+            pipe.hset(keys[1], mapping=roles)
+    elif kind == "hset":
+        _, which, field, value = op
+        pipe.hset(keys[which], field, value)
+    elif kind == "hdel":
+        _, which, field = op
+        pipe.hdel(keys[which], field)
+    pipe.hincrby(keys[2], "version", 1)
+    pipe.hset(keys[2], "updated", int(time.time()))
+    for key in keys:
+        pipe.expire(key, SNAPSHOT_TTL)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Event-loop lag monitor.
+
+Everything the bot does shares one asyncio loop, so a synchronous DB session, a YAML load or a
+large embed build on it delays every gateway event and interaction behind it. Two parts measure
+that:
+
+- a probe task sleeps ``interval`` seconds at a time and records how late it wakes up into a
+  histogram (the loop's scheduling delay)
+- a watchdog thread checks that the probe keeps waking up; once it is ``threshold`` seconds
+  overdue, the thread grabs the loop thread's current stack, which shows the code blocking it
+
+Stalls are logged with their stack when the loop recovers and kept for the ``health`` command.
+Opt-in via ``bot.loop_monitor.enabled``: the watchdog wakes up a few times per interval.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import UTC, datetime
+
+from utils.metrics import Histogram
+
+_log = logging.getLogger("nerpybot")
+
+# Lag is usually well under a millisecond; the upper buckets catch real stalls.
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_STACK_DEPTH = 30
+
+
+class LoopMonitor:
+    """Probe task plus watchdog thread for one event loop; see the module docstring."""
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25, max_stalls: int = 20):
+        self.interval = interval
+        self.threshold = threshold
+        self.lag = Histogram(LAG_BUCKETS)
+        self.stall_count = 0
+        self._stalls: deque[dict] = deque(maxlen=max_stalls)
+        self._pending_stack: list[str] | None = None  # captured by the watchdog, reported by the probe
+        self._last_beat = 0.0
+        self._loop_thread_id: int | None = None
+        self._probe: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._probe is not None and not self._probe.done()
+
+    def start(self) -> None:
+        """Start monitoring the running loop. Must be called from the loop thread."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._probe = asyncio.get_running_loop().create_task(self._probe_loop(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        self._watchdog = None
+
+    async def _probe_loop(self) -> None:
+        try:
+            while True:
+                before = time.monotonic()
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                with self._lock:
+                    self._last_beat = now
+                    stack, self._pending_stack = self._pending_stack, None
+                lag = max(0.0, now - before - self.interval)
+                self.lag.observe(lag)
+                if lag >= self.threshold:
+                    self._record_stall(lag, stack)
+        except asyncio.CancelledError:
+            pass
+
+    def _record_stall(self, lag: float, stack: list[str] | None) -> None:
+        self.stall_count += 1
+        self._stalls.append(
+            {
+                "at": datetime.now(UTC).isoformat(timespec="seconds"),
+                "blocked_ms": round(lag * 1000, 1),
+                "stack": stack or [],
+            }
+        )
+        if stack:
+            _log.warning("Event loop blocked for %.0f ms at:\n%s", lag * 1000, "".join(stack))
+        else:
+            _log.warning("Event loop blocked for %.0f ms", lag * 1000)
+
+    def _watch(self) -> None:
+        # Check a few times per interval so a stall is caught while it is still going on.
+        step = min(self.interval, self.threshold) / 2
+        while not self._stop.wait(step):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.interval
+                if overdue < self.threshold or self._pending_stack is not None:
+                    continue
+            stack = self._capture_loop_stack()
+            with self._lock:
+                # The probe may have woken up meanwhile; then the stack belongs to nothing.
+                if time.monotonic() - self._last_beat - self.interval >= self.threshold:
+                    self._pending_stack = stack
+
+    def _capture_loop_stack(self) -> list[str]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return []
+        return traceback.format_list(traceback.extract_stack(frame, limit=_STACK_DEPTH))
+
+    def snapshot(self, *, stalls: bool = True) -> dict:
+        """Return a JSON-serializable summary; *stalls* includes the recent stalls and their stacks."""
+        return {
+            "interval_ms": round(self.interval * 1000),
+            "threshold_ms": round(self.threshold * 1000),
+            "lag": self.lag.snapshot(),
+            "stall_count": self.stall_count,
+            "recent_stalls": list(self._stalls) if stalls else [],
+        }
+
+
+def create_loop_monitor(config: dict) -> LoopMonitor | None:
+    """Build a monitor from ``bot.loop_monitor``, or return None when it is not enabled."""
+    settings = config.get("bot", {}).get("loop_monitor") or {}
+    if not settings.get("enabled"):
+        return None
+    return LoopMonitor(
+        interval=int(settings.get("interval_ms", 500)) / 1000,
+        threshold=int(settings.get("threshold_ms", 250)) / 1000,
+    )
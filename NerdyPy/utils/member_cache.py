@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Selective member chunking and lazy member lookups.
+
+Chunking downloads a guild's full member list over the gateway and keeps every ``Member`` in
+memory; for large guilds that dominates the bot's RSS. Only a few features read full lists:
+
+- the autokicker walks ``guild.members`` (guilds with an enabled ``AutoKicker``)
+- reaction roles resolve the member removing a reaction (guilds with ``ReactionRoleMessage`` rows)
+
+``bot.member_cache.chunking`` picks the strategy:
+
+- ``all``: discord.py chunks every guild at startup (its default behaviour)
+- ``selective`` (default): after ``on_ready`` only guilds with one of the features above are
+  chunked, one after another in the background
+- ``lazy``: nothing up front; a guild is chunked the first time a feature needs its full list
+
+Everywhere else members are looked up one at a time (``get_member`` / ``get_members``): from the
+client cache if present, otherwise from Discord, and kept in a bounded LRU instead of the client
+cache. The client still caches members that join or sit in voice while the bot runs.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+
+import discord
+import psutil
+
+from models.moderation import AutoKicker
+from models.reactionrole import ReactionRoleMessage
+from utils.metrics import Histogram
+
+_log = logging.getLogger("nerpybot")
+
+CHUNK_ALL = "all"
+CHUNK_SELECTIVE = "selective"
+CHUNK_LAZY = "lazy"
+CHUNK_MODES = (CHUNK_ALL, CHUNK_SELECTIVE, CHUNK_LAZY)
+QUERY_BATCH = 100  # user IDs per gateway member request (Discord's limit)
+
+
+def member_guild_ids(session) -> set[int]:
+    """Return the guilds with a feature that reads full member lists."""
+    kickers = session.query(AutoKicker.GuildId).filter(AutoKicker.Enabled.is_(True), AutoKicker.KickAfter > 0)
+    reaction_roles = session.query(ReactionRoleMessage.GuildId).distinct()
+    return {row[0] for row in kickers} | {row[0] for row in reaction_roles}
+
+
+class MemberCache:
+    """Chunks the guilds that need full member lists and looks up members of the others lazily."""
+
+    def __init__(self, chunking: str = CHUNK_SELECTIVE, lookup_size: int = 1000, lookup_ttl: float = 600.0):
+        if chunking not in CHUNK_MODES:
+            raise ValueError(f"bot.member_cache.chunking must be one of {', '.join(CHUNK_MODES)}")
+        self.chunking = chunking
+        self.lookup_size = lookup_size
+        self.lookup_ttl = lookup_ttl
+        self.chunk_time = Histogram()
+        self.last_startup: dict | None = None
+        self._wanted: set[int] = set()
+        self._lookups: OrderedDict[tuple[int, int], tuple[float, discord.Member]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def chunk_at_startup(self) -> bool:
+        """Whether discord.py itself should chunk every guild before ``on_ready``."""
+        return self.chunking == CHUNK_ALL
+
+    def set_wanted(self, guild_ids: set[int]) -> None:
+        """Replace the guilds chunked after ``on_ready`` (see ``member_guild_ids``)."""
+        self._wanted = set(guild_ids)
+
+    def wants(self, guild_id: int) -> bool:
+        return self.chunking == CHUNK_SELECTIVE and guild_id in self._wanted
+
+    async def ensure_chunked(self, guild: discord.Guild) -> None:
+        """Load *guild*'s full member list into the client cache unless it is already there."""
+        if guild.chunked:
+            return
+        with self.chunk_time.time():
+            await guild.chunk()
+
+    async def chunk_wanted(self, guilds) -> int:
+        """Chunk every wanted guild in *guilds*, one at a time; returns how many were chunked.
+
+        Duration and RSS growth of the run are kept for the ``health`` command.
+        """
+        rss = psutil.Process().memory_info().rss
+        start = time.monotonic()
+        chunked = 0
+        for guild in guilds:
+            if not self.wants(guild.id) or guild.chunked:
+                continue
+            try:
+                await self.ensure_chunked(guild)
+                chunked += 1
+            except (discord.DiscordException, TimeoutError) as e:
+                # The feature chunks it again on first use.
+                _log.warning(f"[{guild.name} ({guild.id})]: member chunking failed: {e}")
+        self.last_startup = {
+            "guilds": chunked,
+            "seconds": round(time.monotonic() - start, 2),
+            "rss_delta_mb": round((psutil.Process().memory_info().rss - rss) / (1024 * 1024), 2),
+        }
+        return chunked
+
+    def _cached(self, guild_id: int, user_id: int) -> discord.Member | None:
+        entry = self._lookups.get((guild_id, user_id))
+        if entry is None or time.monotonic() - entry[0] > self.lookup_ttl:
+            return None
+        self._lookups.move_to_end((guild_id, user_id))
+        return entry[1]
+
+    def _remember(self, member: discord.Member) -> None:
+        self._lookups[(member.guild.id, member.id)] = (time.monotonic(), member)
+        self._lookups.move_to_end((member.guild.id, member.id))
+        while len(self._lookups) > self.lookup_size:
+            self._lookups.popitem(last=False)
+
+    async def get_member(self, guild: discord.Guild, user_id: int) -> discord.Member | None:
+        """Return the member from the client cache, the lookup cache or the API; None if not a member."""
+        member = guild.get_member(user_id)
+        if member is not None or guild.chunked:
+            return member
+        member = self._cached(guild.id, user_id)
+        if member is not None:
+            self._hits += 1
+            return member
+        self._misses += 1
+        try:
+            member = await guild.fetch_member(user_id)
+        except (discord.NotFound, discord.Forbidden):
+            return None
+        self._remember(member)
+        return member
+
+    async def get_members(self, guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+        """Look up many members at once; the uncached ones are requested over the gateway in batches."""
+        found: dict[int, discord.Member] = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            member = guild.get_member(user_id)
+            if member is None and not guild.chunked:
+                member = self._cached(guild.id, user_id)
+                if member is None:
+                    missing.append(user_id)
+                    continue
+                self._hits += 1
+            if member is not None:
+                found[user_id] = member
+        self._misses += len(missing)
+        for i in range(0, len(missing), QUERY_BATCH):
+            batch = missing[i : i + QUERY_BATCH]
+            try:
+                members = await guild.query_members(user_ids=batch, limit=QUERY_BATCH, cache=False)
+            except TimeoutError:
+                _log.warning(f"[{guild.name} ({guild.id})]: member lookup of {len(batch)} user(s) timed out")
+                break
+            for member in members:
+                self._remember(member)
+                found[member.id] = member
+        return found
+
+    def snapshot(self, guilds) -> dict:
+        """Return a JSON-serializable summary for the ``health`` command."""
+        guilds = list(guilds)
+        return {
+            "chunking": self.chunking,
+            "guilds": len(guilds),
+            "chunked_guilds": sum(1 for guild in guilds if guild.chunked),
+            "wanted_guilds": len(self._wanted),
+            "cached_members": sum(len(guild.members) for guild in guilds),
+            "lookup_cache": {
+                "size": len(self._lookups),
+                "max_size": self.lookup_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            },
+            "chunk": self.chunk_time.snapshot(),
+            "startup": self.last_startup,
+        }
+
+
+def create_member_cache(config: dict) -> MemberCache:
+    """Build the member cache from ``bot.member_cache`` (``chunking``, ``lookup_cache_size``)."""
+    settings = config.get("bot", {}).get("member_cache") or {}
+    return MemberCache(
+        chunking=settings.get("chunking") or CHUNK_SELECTIVE,
+        lookup_size=int(settings.get("lookup_cache_size", 1000)),
+    )
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+In-process latency histograms and counters.
+
+Subsystems with their own telemetry object (music, the event-loop monitor) keep their histograms
+there. Everything else records into the bot-wide ``METRICS`` registry, which the ``metrics``
+Valkey command hands to the dashboard:
+
+- ``command``: slash and prefix command latency per qualified name (interaction created → done)
+- ``interaction``: ``receive`` (created → handled by the bot), ``immediate`` and ``deferred``
+  (created → command done, split by how the interaction was answered)
+- ``loop``: duration of each ``tasks.loop`` iteration, see ``instrumented_loop``
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds; wide enough for anything from a cache hit to a five-minute download.
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+# Commands and loop iterations are mostly a few milliseconds; keep resolution at the low end.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram of durations in seconds.
+
+    Quantiles are estimated from the bucket bounds (the upper bound of the bucket the quantile
+    falls into), which is precise enough to tell a 200 ms lookup from a 20 s one without keeping
+    samples around.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot: above the largest bound
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._last: float | None = None
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._count += 1
+            self._sum += seconds
+            self._max = max(self._max, seconds)
+            self._last = seconds
+
+    @contextmanager
+    def time(self):
+        """Observe the wall time of the ``with`` block, including when it raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - start)
+
+    def _quantile(self, q: float) -> float | None:
+        """Estimate the *q* quantile. Caller must hold ``_lock``."""
+        if not self._count:
+            return None
+        rank = q * self._count
+        seen = 0
+        for bound, count in zip(self.buckets, self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def cumulative(self) -> tuple[list[tuple[float, int]], int, float]:
+        """Return ``([(upper bound, observations <= bound), ...], count, sum)`` in seconds.
+
+        The shape of a Prometheus histogram; the ``+Inf`` bucket is the count.
+        """
+        with self._lock:
+            counts, count, total = list(self._counts), self._count, self._sum
+        pairs, seen = [], 0
+        for bound, n in zip(self.buckets, counts):
+            seen += n
+            pairs.append((bound, seen))
+        return pairs, count, total
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable summary in milliseconds."""
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 1)
+
+        with self._lock:
+            return {
+                "count": self._count,
+                "avg_ms": ms(self._sum / self._count) if self._count else None,
+                "p50_ms": ms(self._quantile(0.5)),
+                "p95_ms": ms(self._quantile(0.95)),
+                "p99_ms": ms(self._quantile(0.99)),
+                "max_ms": ms(self._max) if self._count else None,
+                "last_ms": ms(self._last),
+            }
+
+
+class MetricsRegistry:
+    """Thread-safe named histograms and counters, grouped into families.
+
+    Histograms and counters are created on first use, so callers never register anything up
+    front; a family is e.g. ``command`` and the name within it the command's qualified name.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._histograms: dict[str, dict[str, Histogram]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, family: str, name: str) -> Histogram:
+        with self._lock:
+            histograms = self._histograms.setdefault(family, {})
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = Histogram(self.buckets)
+            return histogram
+
+    def observe(self, family: str, name: str, seconds: float) -> None:
+        self.histogram(family, name).observe(seconds)
+
+    def incr(self, family: str, name: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(family, {})
+            counters[name] = counters.get(name, 0) + amount
+
+    def counter(self, family: str, name: str) -> int:
+        with self._lock:
+            return self._counters.get(family, {}).get(name, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> dict:
+        """Return ``{"histograms": {family: {name: summary}}, "counters": {family: {name: n}}}``."""
+        with self._lock:
+            histograms = {family: dict(entries) for family, entries in self._histograms.items()}
+            counters = {family: dict(entries) for family, entries in self._counters.items()}
+        return {
+            "histograms": {
+                family: {name: histogram.snapshot() for name, histogram in sorted(entries.items())}
+                for family, entries in histograms.items()
+            },
+            "counters": counters,
+        }
+
+
+METRICS = MetricsRegistry()
+
+
+def instrumented_loop(name: str):
+    """Record each iteration of a ``tasks.loop`` coroutine under ``loop``/*name*.
+
+    Goes between ``@tasks.loop`` and the coroutine. The iteration's duration lands in the ``loop``
+    histogram and ``loop_iterations`` counter; an iteration that returns an int reports it as the
+    amount of work done (``loop_items``), and one that raises counts in ``loop_errors``.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.monotonic()
+            try:
+                work = await func(*args, **kwargs)
+            except Exception:
+                METRICS.incr("loop_errors", name)
+                raise
+            finally:
+                METRICS.observe("loop", name, time.monotonic() - start)
+                METRICS.incr("loop_iterations", name)
+            if isinstance(work, int):
+                METRICS.incr("loop_items", name, work)
+            return work
+
+        return wrapper
+
+    return decorator
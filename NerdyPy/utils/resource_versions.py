@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Per-resource version counters for the dashboard's conditional GETs.
+
+Read-mostly dashboard views (reaction roles, application forms, reminders, the recipe browser) are
+served with an ETag derived from Valkey counters:
+
+- ``nerpybot:version:epoch`` — random token; changes when bumps may have been lost
+- ``nerpybot:version:<resource>`` — bumped by changes that cannot be tied to one guild
+- ``nerpybot:version:<resource>:<guild_id>`` — bumped by changes to one guild's rows
+
+Nobody bumps by hand. A session listener records which tracked tables a flush touched
+(``session.info``), and whoever owns the session publishes them after the commit: the bot from
+``session_scope``/``async_session_scope`` through ``ResourceVersionPublisher``, the web from its
+DB session dependency through ``ValkeyClient.bump_resource_versions``. Bulk statements
+(``query.delete()``, ``insert(...)`` with a row list) bump the resource-wide counter.
+"""
+
+import asyncio
+import logging
+import secrets
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+_log = logging.getLogger(__name__)
+
+KEY_PREFIX = "nerpybot:version"
+EPOCH_KEY = f"{KEY_PREFIX}:epoch"
+_INFO_KEY = "changed_resources"
+_RETRY_DELAY = 5.0  # seconds before retrying a failed bump (with a new epoch)
+
+# table -> (resource, guild id column, parent relationship for child rows without a guild column)
+TRACKED_TABLES = {
+    "ReactionRoleMessage": ("reaction_roles", "GuildId", None),
+    "ReactionRoleEntry": ("reaction_roles", None, "message"),
+    "ApplicationForm": ("application_forms", "GuildId", None),
+    "ApplicationQuestion": ("application_forms", None, "form"),
+    "ReminderMessage": ("reminders", "GuildId", None),
+    "CraftingRecipeCache": ("recipe_cache", None, None),
+}
+
+
+def version_key(resource: str, guild_id: int | None = None) -> str:
+    return f"{KEY_PREFIX}:{resource}" if guild_id is None else f"{KEY_PREFIX}:{resource}:{guild_id}"
+
+
+def new_epoch() -> str:
+    return secrets.token_hex(8)
+
+
+def _guild_of(session, obj, guild_column, parent_rel):
+    if guild_column is not None:
+        return getattr(obj, guild_column, None)
+    if parent_rel is None:
+        return None
+    # Never lazy-load here (async sessions cannot): use the parent only if it is already in memory.
+    parent = obj.__dict__.get(parent_rel)
+    if parent is None:
+        rel = inspect(type(obj)).relationships[parent_rel]
+        (fk_column,) = rel.local_columns
+        fk = getattr(obj, fk_column.key, None)
+        if fk is not None:
+            parent = session.identity_map.get(identity_key(rel.mapper.class_, fk))
+    if parent is None:
+        return None
+    return _guild_of(session, parent, *TRACKED_TABLES[parent.__tablename__][1:])
+
+
+def _record(session, resource: str, guild_id: int | None) -> None:
+    session.info.setdefault(_INFO_KEY, set()).add((resource, guild_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session, _flush_context) -> None:
+    dirty = session.dirty
+    for obj in (*session.new, *dirty, *session.deleted):
+        tracked = TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+        if tracked is None or (obj in dirty and not session.is_modified(obj)):
+            continue
+        resource, guild_column, parent_rel = tracked
+        _record(session, resource, _guild_of(session, obj, guild_column, parent_rel))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    tracked = TRACKED_TABLES.get(mapper.class_.__tablename__) if mapper is not None else None
+    if tracked is not None:
+        _record(orm_execute_state.session, tracked[0], None)
+
+
+def pop_changed_resources(session) -> set[tuple[str, int | None]]:
+    """Return and forget the ``(resource, guild_id)`` pairs this session's flushes touched.
+
+    Accepts a ``Session`` or an ``AsyncSession``. Call it after a successful commit.
+    """
+    info = getattr(session, "sync_session", session).info
+    return info.pop(_INFO_KEY, set())
+
+
+class ResourceVersionPublisher:
+    """Bot-side writer of the version counters.
+
+    ``publish`` may be called from any thread (``session_scope`` often runs inside ``to_thread``).
+    While no Valkey client is attached, changes are not recorded; ``attach`` therefore starts a new
+    epoch, which retires every ETag handed out before.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._epoch_stale = False
+
+    @property
+    def attached(self) -> bool:
+        return self._client is not None
+
+    def attach(self, client) -> None:
+        self.detach()
+        self._client = client
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._epoch_stale = True
+        self._writer = asyncio.create_task(self._write_loop(), name="resource-version-writer")
+
+    def detach(self) -> None:
+        self._client = None
+        self._queue = None
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+    def publish(self, changes) -> None:
+        """Bump the counters of *changes* (``(resource, guild_id)`` pairs)."""
+        queue, loop = self._queue, self._loop
+        if not changes or queue is None:
+            return
+        try:
+            same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            same_loop = False
+        if same_loop:
+            queue.put_nowait(set(changes))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, set(changes))
+
+    async def _write_loop(self) -> None:
+        queue = self._queue
+        while True:
+            changes = set() if self._epoch_stale else await queue.get()
+            while not queue.empty():
+                changes |= queue.get_nowait()
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    if self._epoch_stale:
+                        pipe.set(EPOCH_KEY, new_epoch())
+                    for resource, guild_id in changes:
+                        pipe.incr(version_key(resource, guild_id))
+                    await pipe.execute()
+                self._epoch_stale = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The lost bumps are covered by retiring every outstanding ETag.
+                _log.warning("Resource version bump failed, starting a new epoch: %s", e)
+                self._epoch_stale = True
+                await asyncio.sleep(_RETRY_DELAY)
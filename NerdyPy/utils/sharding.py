@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Shard and cluster layout of one bot process.
+
+Discord routes a guild's events to shard ``(guild_id >> 22) % shard_count``. A single process runs
+every shard through ``AutoShardedBot`` (Discord recommends the shard count unless ``shard_count``
+is set). In cluster mode, ``cluster_count`` processes share a fixed ``shard_count`` and each one
+connects a contiguous range of shards, so every guild is served by exactly one process:
+
+- dashboard commands for a guild are answered only by the process that owns it (``utils.valkey``)
+- background loops only pick up rows of owned guilds (``ClusterPlan.owns`` / ``guild_filter``)
+- everything not tied to a guild is answered by the primary process, cluster 0
+
+Configured under ``bot.sharding``; see ``plan_from_config``.
+"""
+
+from dataclasses import dataclass, field
+
+SHARD_SHIFT = 22  # a snowflake's creation timestamp starts at bit 22
+
+
+def shard_id_for(guild_id: int, shard_count: int) -> int:
+    """Return the shard Discord routes *guild_id*'s events to."""
+    return (guild_id >> SHARD_SHIFT) % shard_count
+
+
+def cluster_shard_ids(shard_count: int, cluster_id: int, cluster_count: int) -> list[int]:
+    """Return the contiguous shard range of *cluster_id*; ranges differ in size by at most one."""
+    return list(range(shard_count * cluster_id // cluster_count, shard_count * (cluster_id + 1) // cluster_count))
+
+
+@dataclass(frozen=True)
+class ClusterPlan:
+    """Which shards this process connects and which guilds it therefore owns."""
+
+    shard_count: int | None = None  # None: Discord's recommendation, single process only
+    cluster_id: int = 0
+    cluster_count: int = 1
+    _owned: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.cluster_count < 1:
+            raise ValueError("bot.sharding.cluster_count must be at least 1")
+        if not 0 <= self.cluster_id < self.cluster_count:
+            raise ValueError(f"bot.sharding.cluster_id must be between 0 and {self.cluster_count - 1}")
+        if self.shard_count is not None and self.shard_count < self.cluster_count:
+            raise ValueError("bot.sharding.shard_count must be at least cluster_count")
+        if self.clustered and self.shard_count is None:
+            raise ValueError("bot.sharding.shard_count is required when cluster_count is greater than 1")
+        owned = self.shard_ids or []
+        object.__setattr__(self, "_owned", frozenset(owned))
+
+    @property
+    def clustered(self) -> bool:
+        return self.cluster_count > 1
+
+    @property
+    def primary(self) -> bool:
+        """True for the process that answers commands not tied to a guild."""
+        return self.cluster_id == 0
+
+    @property
+    def shard_ids(self) -> list[int] | None:
+        """Shards this process connects, or None to run all of them."""
+        if not self.clustered:
+            return None
+        return cluster_shard_ids(self.shard_count, self.cluster_id, self.cluster_count)
+
+    def owns(self, guild_id: int) -> bool:
+        """Return True if *guild_id*'s shard is connected by this process."""
+        if not self.clustered:
+            return True
+        return shard_id_for(int(guild_id), self.shard_count) in self._owned
+
+    def guild_filter(self, column):
+        """Return a SQL clause keeping rows whose guild *column* this process owns, or None for all.
+
+        Integer floor division and modulo run natively on SQLite, PostgreSQL and MySQL, so the
+        shard is computed in the query and no foreign row is ever loaded.
+        """
+        if not self.clustered:
+            return None
+        return ((column // (1 << SHARD_SHIFT)) % self.shard_count).in_(sorted(self._owned))
+
+    def describe(self) -> dict:
+        """Return a JSON-serializable summary for the ``health`` command."""
+        return {
+            "id": self.cluster_id,
+            "count": self.cluster_count,
+            "shard_count": self.shard_count,
+            "shard_ids": self.shard_ids,
+        }
+
+
+def plan_from_config(config: dict) -> ClusterPlan:
+    """Build the plan from ``bot.sharding`` (``shard_count``, ``cluster_id``, ``cluster_count``)."""
+    settings = config.get("bot", {}).get("sharding") or {}
+    shard_count = settings.get("shard_count")
+    return ClusterPlan(
+        shard_count=int(shard_count) if shard_count not in (None, "") else None,
+        cluster_id=int(settings.get("cluster_id") or 0),
+        cluster_count=int(settings.get("cluster_count") or 1),
+    )
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""In-memory index of Twitch notification configs for the stream-event fan-out.
+
+Every stream event used to query ``TwitchNotifications`` by streamer and resolve each guild's
+language on the way. The index keeps those rows in memory, keyed by streamer login, with the
+guild language already resolved, so an event costs one dict lookup:
+
+- bulk-loaded in ``on_ready`` alongside the guild config caches; the rows are read in a worker
+  thread and swapped in on the event loop, replaying the changes made while they were read
+- updated by ``/twitch add`` and ``/twitch remove``
+- reloaded per config by the ``invalidate_twitch_notification`` command the dashboard sends
+  after each create/update/delete
+- re-keyed when a guild changes its language (``guild_language_changed``)
+
+Until it is warmed (or after a reload failed) ``get`` returns None and callers fall back to the DB.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+
+_log = logging.getLogger(__name__)
+
+# Minimum seconds between lazy re-warm attempts after a failed warm-up (matches utils.cache).
+_REWARM_COOLDOWN = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class TwitchTarget:
+    """One notification config, reduced to what the fan-out needs."""
+
+    config_id: int
+    guild_id: int
+    channel_id: int
+    message: str | None
+    notify_offline: bool
+    language: str
+
+
+def _languages(session, guild_ids) -> dict[int, str]:
+    from models.guild import GuildLanguageConfig
+
+    if not guild_ids:
+        return {}
+    rows = session.query(GuildLanguageConfig).filter(GuildLanguageConfig.GuildId.in_(guild_ids)).all()
+    return {row.GuildId: row.Language for row in rows}
+
+
+def targets_from_rows(rows, session) -> list[TwitchTarget]:
+    """Build targets for *rows*, resolving each guild's language in one query."""
+    languages = _languages(session, {row.GuildId for row in rows})
+    return [
+        TwitchTarget(
+            config_id=row.Id,
+            guild_id=row.GuildId,
+            channel_id=row.ChannelId,
+            message=row.Message,
+            notify_offline=row.NotifyOffline,
+            language=languages.get(row.GuildId, "en"),
+        )
+        for row in rows
+    ]
+
+
+class TwitchNotificationIndex:
+    """Streamer login → notification targets. All mutations happen on the event-loop thread.
+
+    Only ``load`` runs in a worker thread, and it does not touch the index.
+    """
+
+    def __init__(self):
+        self._by_streamer: dict[str, dict[int, TwitchTarget]] = {}
+        self._streamer_of: dict[int, str] = {}  # config id -> streamer, for removal by id
+        self._warmed = False
+        self._last_rewarm_attempt = 0.0
+        # One list per load in progress; each mutation is recorded in all of them and replayed
+        # once that load's rows are swapped in, so it is not overwritten by the older snapshot.
+        self._journals: list[list[tuple]] = []
+
+    @property
+    def warmed(self) -> bool:
+        return self._warmed
+
+    def __len__(self) -> int:
+        return len(self._streamer_of)
+
+    def get(self, streamer: str) -> list[TwitchTarget] | None:
+        """Return the targets of *streamer*, or None when the index cannot answer (not warmed)."""
+        if not self._warmed:
+            return None
+        return list(self._by_streamer.get(streamer, {}).values())
+
+    def _record(self, *change) -> None:
+        for journal in self._journals:
+            journal.append(change)
+
+    def put(self, streamer: str, target: TwitchTarget) -> None:
+        """Insert or replace a config (also moves it when its streamer changed)."""
+        self._record(self.put, streamer, target)
+        self._remove(target.config_id)
+        self._by_streamer.setdefault(streamer, {})[target.config_id] = target
+        self._streamer_of[target.config_id] = streamer
+
+    def remove(self, config_id: int) -> None:
+        self._record(self.remove, config_id)
+        self._remove(config_id)
+
+    def _remove(self, config_id: int) -> None:
+        streamer = self._streamer_of.pop(config_id, None)
+        if streamer is None:
+            return
+        targets = self._by_streamer.get(streamer)
+        if targets is not None:
+            targets.pop(config_id, None)
+            if not targets:
+                del self._by_streamer[streamer]
+
+    def set_language(self, guild_id: int, language: str) -> None:
+        """Re-resolve the targets of a guild after its language changed."""
+        self._record(self.set_language, guild_id, language)
+        for targets in self._by_streamer.values():
+            for config_id, target in targets.items():
+                if target.guild_id == guild_id:
+                    targets[config_id] = replace(target, language=language)
+
+    def invalidate(self) -> None:
+        """Stop answering from memory until the next successful warm-up (a reload failed)."""
+        self._warmed = False
+
+    @staticmethod
+    def load(session_factory) -> list[tuple[str, TwitchTarget]]:
+        """Read every notification config as ``(streamer, target)`` pairs. Safe in a worker thread."""
+        from models.twitch import TwitchNotifications
+
+        session = session_factory()
+        try:
+            rows = session.query(TwitchNotifications).all()
+            targets = targets_from_rows(rows, session)
+            return [(row.Streamer, target) for row, target in zip(rows, targets)]
+        finally:
+            session.close()
+
+    def _swap(self, entries: list[tuple[str, TwitchTarget]], journal: list[tuple]) -> None:
+        by_streamer: dict[str, dict[int, TwitchTarget]] = {}
+        for streamer, target in entries:
+            by_streamer.setdefault(streamer, {})[target.config_id] = target
+        self._by_streamer = by_streamer
+        self._streamer_of = {target.config_id: streamer for streamer, target in entries}
+        for change, *args in journal:
+            change(*args)
+        self._warmed = True
+
+    def warm(self, session_factory) -> None:
+        """Bulk-load every notification config on the calling (event-loop) thread."""
+        self._swap(self.load(session_factory), [])
+
+    async def warm_async(self, session_factory) -> None:
+        """Bulk-load every notification config in a worker thread. Safe to call again on reconnect.
+
+        Changes made on the loop while the rows are read are replayed on top of them.
+        """
+        journal: list[tuple] = []
+        self._journals.append(journal)
+        try:
+            entries = await asyncio.to_thread(self.load, session_factory)
+        finally:
+            self._journals.remove(journal)
+        self._swap(entries, journal)
+
+    async def try_rewarm(self, session_factory) -> None:
+        """Re-warm off the event loop, at most once per ``_REWARM_COOLDOWN`` seconds."""
+        if self._warmed:
+            return
+        now = time.monotonic()
+        if now - self._last_rewarm_attempt < _REWARM_COOLDOWN:
+            return
+        self._last_rewarm_attempt = now
+        try:
+            await self.warm_async(session_factory)
+            _log.info("TwitchNotificationIndex: lazily re-warmed (%d configs)", len(self))
+        except Exception:
+            _log.exception("TwitchNotificationIndex: lazy re-warm failed")
+
+
+class SendBudget:
+    """Caps concurrent notification sends overall and serializes sends to the same channel.
+
+    Discord rate-limits messages per channel; firing several embeds at one channel at once only
+    buys 429s, while different channels can be written in parallel.
+    """
+
+    def __init__(self, concurrency: int):
+        self._slots = asyncio.Semaphore(concurrency)
+        self._channels: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    @asynccontextmanager
+    async def slot(self, channel_id: int):
+        lock = self._channels.get(channel_id)
+        if lock is None:
+            lock = self._channels[channel_id] = asyncio.Lock()
+        async with lock, self._slots:
+            yield
@@ -2,14 +2,26 @@
 Valkey pub/sub integration for web dashboard ↔ bot communication.
 
 The listener loop runs as an asyncio background task. It subscribes to the
-``nerpybot:cmd`` channel, dispatches each incoming command to
-``handle_valkey_command``, and writes the result back under
-``nerpybot:reply:<request_id>`` with a 10-second TTL.
+``nerpybot:cmd`` channel and hands each incoming command to ``CommandRunner``,
+which runs ``handle_valkey_command`` in its own task and publishes
+``{"request_id", "result"}`` on the ``reply_to`` channel named in the command
+(one per web process, see ``web/rpc.py``). Commands without ``reply_to`` get
+the result pushed to ``nerpybot:reply:<request_id>`` with a 10-second TTL
+instead. In cluster mode every process receives every command and
+``route_command`` picks the one that handles and answers it.
+
+Twitch stream events do not use pub/sub: the web appends them to the
+``nerpybot:events:twitch`` stream and an ``EventStreamConsumer`` started next
+to the listener delivers them to ``handle_twitch_event`` (see
+``utils/event_stream.py``).
 """
 
 import json
+import math
 import time
-from asyncio import CancelledError, ensure_future, gather, sleep, to_thread
+from asyncio import CancelledError, Queue, Semaphore, ensure_future, gather, sleep, timeout, to_thread
+from collections import Counter
+from contextlib import nullcontext
 
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import UTC, datetime
@@ -18,14 +30,21 @@ from pathlib import Path
 
 import psutil
 
+from utils.command_sync import auto_sync, sync_tree
 from utils.constants import PROTECTED_MODULES
+from utils.event_stream import CONSUMER_GROUP, TWITCH_EVENT_STREAM, EventStreamConsumer
 from utils.helpers import get_or_fetch_channel
+from utils.metrics import METRICS
+from utils.strings import get_string
+from utils.twitch_index import SendBudget, targets_from_rows
 
 _proc = psutil.Process()
 _recipe_sync_running = False
 _proc.cpu_percent(interval=None)  # prime the baseline; first call always returns 0.0
 _cpu_percent_cached: float = 0.0  # updated by _cpu_sampler_loop; read by health commands
 _required_permissions = None  # cached across requests; invalidated on module load/unload
+# Stream announcements in flight at once across all channels; one at a time per channel.
+_twitch_send_budget = SendBudget(16)
 
 
 def _is_valid_module_name(module: str) -> bool:
@@ -73,20 +92,90 @@ def _get_guild(bot, payload: dict):
 
 
 def _build_voice_details(bot) -> tuple[list, list]:
-    """Return (active_vcs, voice_details) from the bot's current voice clients."""
+    """Return (active_vcs, voice_details) from the bot's current voice clients.
+
+    When the music module is loaded, each entry also carries the guild's queue depth and last
+    queue-wait / time-to-first-audio timings under ``music``.
+    """
     active_vcs = [vc for vc in bot.voice_clients if vc.guild and vc.channel]
+    audio = getattr(bot, "audio", None)
     voice_details = [
         {
             "guild_id": str(vc.guild.id),
             "guild_name": vc.guild.name,
             "channel_id": str(vc.channel.id),
             "channel_name": vc.channel.name,
+            "music": audio.guild_stats(vc.guild.id) if audio is not None else None,
         }
         for vc in active_vcs
     ]
     return active_vcs, voice_details
 
 
+def _build_music_stats(bot) -> dict | None:
+    """Return music subsystem stats, or None when the music module has never been loaded."""
+    audio = getattr(bot, "audio", None)
+    if audio is None:
+        return None
+    return {
+        "worker_pool": audio.worker_stats(),
+        "prefetch": audio.prefetch_stats(),
+        "telemetry": audio.telemetry_stats(),
+    }
+
+
+def _build_loop_stats(bot, *, stalls: bool = True) -> dict | None:
+    """Return event-loop lag stats, or None when the loop monitor is not enabled."""
+    monitor = getattr(bot, "loop_monitor", None)
+    if monitor is None:
+        return None
+    return monitor.snapshot(stalls=stalls)
+
+
+def _build_shard_stats(bot) -> list[dict]:
+    """Return latency, state and guild count of each shard this process runs."""
+    guild_counts = Counter(guild.shard_id for guild in bot.guilds)
+    return [
+        {
+            "id": shard_id,
+            # A shard that has not heartbeated yet reports an infinite latency, which is not JSON.
+            "latency_ms": round(shard.latency * 1000, 2) if math.isfinite(shard.latency) else None,
+            "closed": shard.is_closed(),
+            "guild_count": guild_counts.get(shard_id, 0),
+        }
+        for shard_id, shard in sorted(bot.shards.items())
+    ]
+
+
+def _routing_guild_id(command: str, payload: dict) -> int:
+    """Return the guild *command* acts on, or 0 when it is not tied to one."""
+    guild_id = _parse_guild_id(payload)
+    if not guild_id and command == "sync_commands" and payload.get("mode") not in ("global", "auto"):
+        guild_ids = payload.get("guild_ids") or [0]
+        guild_id = _parse_guild_id({"guild_id": guild_ids[0]})
+    return guild_id
+
+
+def route_command(bot, command: str, payload: dict) -> tuple[bool, bool]:
+    """Return ``(run, reply)``: whether this process handles *command* and whether it answers it.
+
+    Every process receives every command. One about a guild is handled by the process owning the
+    guild's shard; ``BROADCAST_COMMANDS`` run everywhere; the rest run on the primary. Only one
+    process replies, so the dashboard sees a single answer. Outside cluster mode that is always us.
+    """
+    guild_id = _routing_guild_id(command, payload)
+    if guild_id:
+        owned = bot.owns_guild(guild_id)
+        return owned, owned
+    primary = bot.cluster.primary
+    return command in BROADCAST_COMMANDS or primary, primary
+
+
+def _sync_result(synced: int | None) -> dict:
+    """``sync_commands`` reply for one scope; ``synced`` is None when the tree was unchanged."""
+    return {"success": True, "synced_count": synced or 0, "skipped": synced is None}
+
+
 async def _cpu_sampler_loop() -> None:
     """Background task that samples CPU usage every 5 s into a module-level cache.
 
@@ -114,7 +203,8 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
 
     Returns:
         dict: A command-specific response. Examples include:
-            - health: {"guild_count", "voice_connections", "latency_ms", "uptime_seconds", "python_version", "discord_py_version", "bot_version", "memory_mb", "cpu_percent", "error_count_24h", "active_reminders", "voice_details"}
+            - health: {"guild_count", "voice_connections", "latency_ms", "uptime_seconds", "python_version", "discord_py_version", "bot_version", "memory_mb", "cpu_percent", "error_count_24h", "active_reminders", "voice_details", "music", "event_loop", "shards", "cluster", "member_cache"}
+            - metrics: {"histograms": {family: {name: timing summary}}, "counters": {family: {name: n}}}
             - list_modules: {"modules": [{"name", "loaded"}, ...]}
             - list_guilds: {"guilds": [{"id", "name", "icon", "member_count"}, ...]}
             - module_load/module_unload: {"success": True} or {"success": False, "error": "..."}
@@ -158,6 +248,11 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
             "error_count_24h": bot.error_counter.count(),
             "active_reminders": active_reminders,
             "voice_details": voice_details,
+            "music": _build_music_stats(bot),
+            "event_loop": _build_loop_stats(bot),
+            "shards": _build_shard_stats(bot),
+            "cluster": bot.cluster.describe(),
+            "member_cache": bot.member_cache.snapshot(bot.guilds),
         }
     elif command == "health_live":
         uptime_seconds = (datetime.now(UTC) - bot.uptime).total_seconds()
@@ -169,8 +264,12 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
             "memory_mb": round(_proc.memory_info().rss / (1024 * 1024), 2),
             "cpu_percent": round(_cpu_percent_cached, 2),
             "voice_details": voice_details,
+            "music": _build_music_stats(bot),
+            "event_loop": _build_loop_stats(bot, stalls=False),  # stacks only in the full health payload
             "ts": time.time(),  # duplicate-frame guard: frontend skips updates when ts is unchanged
         }
+    elif command == "metrics":
+        return METRICS.snapshot()
     elif command == "list_modules":
         loaded_names: set[str] = set()
         modules = []
@@ -205,6 +304,7 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
         guild = _get_guild(bot, payload)
         if guild is None:
             return {"channels": []}
+        bot.guild_metadata.sync_guild(guild)  # the dashboard only asks when its snapshot is missing
         return {
             "channels": [
                 {"id": str(c.id), "name": c.name, "type": c.type.value}
@@ -215,6 +315,7 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
         guild = _get_guild(bot, payload)
         if guild is None:
             return {"roles": []}
+        bot.guild_metadata.sync_guild(guild)  # the dashboard only asks when its snapshot is missing
         return {
             "roles": [
                 {"id": str(r.id), "name": r.name}
@@ -227,7 +328,8 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
         guild = _get_guild(bot, payload)
         if guild is None:
             return {}
-        return {str(uid): m.display_name for uid in user_ids if (m := guild.get_member(uid))}
+        members = await bot.member_cache.get_members(guild, user_ids)
+        return {str(uid): member.display_name for uid, member in members.items()}
     elif command == "post_apply_button":
         form_id = int(payload.get("form_id", 0))
         if not form_id:
@@ -313,6 +415,34 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
         # value under concurrent updates and stays consistent with the leave-config pattern.
         bot.guild_cache.delete_modrole(guild_id)
         return {"ok": True}
+    elif command == "invalidate_twitch_notification":
+        guild_id = _parse_guild_id(payload)
+        config_id = payload.get("config_id")
+        if not guild_id or not isinstance(config_id, int) or isinstance(config_id, bool):
+            bot.log.warning("invalidate_twitch_notification: received invalid payload=%r", payload)
+            return {"ok": False, "error": "invalid guild_id or config_id"}
+
+        def _load_target():
+            from models.twitch import TwitchNotifications
+
+            with bot.session_scope() as session:
+                row = TwitchNotifications.get_by_id(config_id, guild_id, session)
+                if row is None:
+                    return None, None
+                return row.Streamer, targets_from_rows([row], session)[0]
+
+        try:
+            streamer, target = await to_thread(_load_target)
+        except Exception:
+            # A stale entry would keep announcing to the wrong channel; answer from the DB until re-warmed.
+            bot.twitch_index.invalidate()
+            bot.log.exception("invalidate_twitch_notification: reload failed for config_id=%d", config_id)
+            return {"ok": False, "error": "cache reload failed — see bot logs"}
+        if target is None:
+            bot.twitch_index.remove(config_id)
+        else:
+            bot.twitch_index.put(streamer, target)
+        return {"ok": True}
     elif command == "set_guild_language":
         guild_id = _parse_guild_id(payload)
         language = payload.get("language", "")
@@ -463,10 +593,14 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
     elif command == "sync_commands":
         mode = payload.get("mode", "global")
         guild_ids: list[str] = payload.get("guild_ids", [])
+        force = bool(payload.get("force", False))
         try:
+            if mode == "auto":
+                results = await auto_sync(bot)
+                synced = [count for count in results.values() if count is not None]
+                return {"success": True, "synced_count": sum(synced), "skipped": not synced}
             if mode == "global":
-                synced = await bot.tree.sync()
-                return {"success": True, "synced_count": len(synced)}
+                return _sync_result(await sync_tree(bot, force=force))
             if not guild_ids:
                 return {"success": False, "error": "guild_ids required for this mode"}
             guild_id = int(guild_ids[0])
@@ -474,160 +608,316 @@ async def handle_valkey_command(bot, command: str, payload: dict) -> dict:
             if guild is None:
                 return {"success": False, "error": f"Guild {guild_id} not found in cache"}
             if mode == "local":
-                synced = await bot.tree.sync(guild=guild)
-                return {"success": True, "synced_count": len(synced)}
+                return _sync_result(await sync_tree(bot, guild, force=force))
             elif mode == "copy":
                 bot.tree.copy_global_to(guild=guild)
-                synced = await bot.tree.sync(guild=guild)
-                return {"success": True, "synced_count": len(synced)}
+                return _sync_result(await sync_tree(bot, guild, force=force))
             elif mode == "clear":
                 bot.tree.clear_commands(guild=guild)
-                await bot.tree.sync(guild=guild)
-                return {"success": True, "synced_count": 0}
+                return _sync_result(await sync_tree(bot, guild, force=force))
             else:
                 return {"success": False, "error": f"Unknown mode: {mode}"}
         except Exception as exc:
             bot.log.error("sync_commands failed: %s", exc)
             return {"success": False, "error": str(exc)}
     elif command == "twitch_event":
-        import discord
-        from models.twitch import STREAM_OFFLINE, STREAM_ONLINE
-
-        event_type = payload.get("event_type", "")
-        broadcaster_login = payload.get("broadcaster_login", "").lower()
-        broadcaster_name = payload.get("broadcaster_name", broadcaster_login)
+        return await handle_twitch_event(bot, payload)
+    else:
+        return {"error": f"Unknown command: {command}"}
 
-        if not broadcaster_login:
-            bot.log.warning("twitch_event: received empty broadcaster_login — ignoring")
-            return {"success": False, "error": "broadcaster_login required"}
 
-        if event_type not in (STREAM_ONLINE, STREAM_OFFLINE):
-            bot.log.warning("twitch_event: unsupported event_type=%r — ignoring", event_type)
-            return {"success": False, "error": f"unsupported event_type: {event_type}"}
+async def handle_twitch_event(bot, payload: dict) -> dict:
+    """Post the stream online/offline embed to every channel subscribed to the broadcaster.
 
+    Called for each entry of the Twitch event stream (see ``utils.event_stream``) and for the legacy
+    ``twitch_event`` pub/sub command. Targets come from ``bot.twitch_index``; the DB is only queried
+    while the index is not warmed. A result with ``"retry": True`` leaves the stream entry pending
+    so it is delivered again; every other result acknowledges it.
+    """
+    import discord
+    from models.twitch import STREAM_OFFLINE, STREAM_ONLINE
+
+    event_type = payload.get("event_type", "")
+    broadcaster_login = payload.get("broadcaster_login", "").lower()
+    broadcaster_name = payload.get("broadcaster_name", broadcaster_login)
+
+    if not broadcaster_login:
+        bot.log.warning("twitch_event: received empty broadcaster_login — ignoring")
+        return {"success": False, "error": "broadcaster_login required"}
+
+    if event_type not in (STREAM_ONLINE, STREAM_OFFLINE):
+        bot.log.warning("twitch_event: unsupported event_type=%r — ignoring", event_type)
+        return {"success": False, "error": f"unsupported event_type: {event_type}"}
+
+    targets = bot.twitch_index.get(broadcaster_login)
+    if targets is None:
+        await bot.twitch_index.try_rewarm(bot.SESSION)
+        targets = bot.twitch_index.get(broadcaster_login)
+    if targets is None:
         try:
             from models.twitch import TwitchNotifications
 
-            def _get_configs():
+            def _get_targets():
                 with bot.session_scope() as session:
-                    return TwitchNotifications.get_all_by_streamer(broadcaster_login, session)
+                    rows = TwitchNotifications.get_all_by_streamer(broadcaster_login, session)
+                    return targets_from_rows(rows, session)
 
-            configs = await to_thread(_get_configs)
+            targets = await to_thread(_get_targets)
         except Exception:
             bot.log.exception("twitch_event: failed to query notification configs for '%s'", broadcaster_login)
-            return {"success": False, "error": "DB error"}
-
-        async def _notify_one(cfg) -> bool:
-            if event_type == STREAM_OFFLINE and not cfg.NotifyOffline:
-                return False
-
-            guild = bot.get_guild(cfg.GuildId)
-            if guild is None:
-                bot.log.warning("twitch_event: guild %s not in cache — skipping", cfg.GuildId)
-                return False
-
-            channel = await get_or_fetch_channel(guild, cfg.ChannelId)
-            if channel is None:
-                bot.log.debug("twitch_event: channel %s not found/accessible in guild %s", cfg.ChannelId, cfg.GuildId)
-                return False
-
-            stream_url = f"https://twitch.tv/{broadcaster_login}"
+            return {"success": False, "error": "DB error", "retry": True}
+
+    # In cluster mode every process receives the event and posts to the guilds it serves.
+    targets = [t for t in targets if bot.owns_guild(t.guild_id)]
+    if event_type == STREAM_OFFLINE:
+        targets = [t for t in targets if t.notify_offline]
+
+    # Targets sharing a language and custom message get the same embed, built once per event.
+    embeds: dict[tuple[str, str | None], discord.Embed] = {}
+    stream_url = f"https://twitch.tv/{broadcaster_login}"
+
+    def _embed_for(target) -> discord.Embed:
+        key = (target.language, target.message if event_type == STREAM_ONLINE else None)
+        embed = embeds.get(key)
+        if embed is None:
+            lang = target.language
             if event_type == STREAM_ONLINE:
-                description = cfg.Message or bot.get_localized_string(
-                    cfg.GuildId, "twitch.live_message", streamer=broadcaster_name
-                )
-                title = bot.get_localized_string(cfg.GuildId, "twitch.live_title", streamer=broadcaster_name)
+                description = target.message or get_string(lang, "twitch.live_message", streamer=broadcaster_name)
+                title = get_string(lang, "twitch.live_title", streamer=broadcaster_name)
                 color = discord.Color.from_rgb(145, 70, 255)
             else:
-                description = bot.get_localized_string(cfg.GuildId, "twitch.offline_message", streamer=broadcaster_name)
-                title = bot.get_localized_string(cfg.GuildId, "twitch.offline_title", streamer=broadcaster_name)
+                description = get_string(lang, "twitch.offline_message", streamer=broadcaster_name)
+                title = get_string(lang, "twitch.offline_title", streamer=broadcaster_name)
                 color = discord.Color.greyple()
-
-            embed = discord.Embed(title=title, description=description, url=stream_url, color=color)
+            embed = embeds[key] = discord.Embed(title=title, description=description, url=stream_url, color=color)
             embed.set_footer(text=f"twitch.tv/{broadcaster_login}")
+        return embed
+
+    async def _notify_one(target) -> bool:
+        guild = bot.get_guild(target.guild_id)
+        if guild is None:
+            bot.log.warning("twitch_event: guild %s not in cache — skipping", target.guild_id)
+            return False
 
+        channel = await get_or_fetch_channel(guild, target.channel_id)
+        if channel is None:
+            bot.log.debug(
+                "twitch_event: channel %s not found/accessible in guild %s", target.channel_id, target.guild_id
+            )
+            return False
+
+        try:
+            async with _twitch_send_budget.slot(target.channel_id):
+                await channel.send(embed=_embed_for(target))
+            return True
+        except discord.HTTPException as e:
+            bot.log.debug("twitch_event: could not send to channel %s: %s", target.channel_id, e)
+            return False
+
+    results = await gather(*(_notify_one(target) for target in targets), return_exceptions=True)
+    notified = 0
+    for r in results:
+        if isinstance(r, Exception):
+            bot.log.error(
+                "twitch_event: unexpected error notifying channel",
+                exc_info=(type(r), r, r.__traceback__),
+            )
+        elif r is True:
+            notified += 1
+    return {"success": True, "notified": notified}
+
+
+# Commands that call external APIs or fan out to Discord get their own, smaller lanes so a burst of
+# them can never crowd out ``health_live`` and the channel/role lookups the dashboard forms wait on.
+COMMAND_LIMITS = {
+    "search_realms": 2,
+    "validate_wow_guild": 2,
+    "support_message": 1,
+    "sync_commands": 1,
+    "twitch_event": 8,
+}
+COMMAND_TIMEOUTS = {
+    "validate_wow_guild": 20.0,
+    "support_message": 60.0,
+    "sync_commands": 60.0,
+    "twitch_event": 60.0,
+}
+DEFAULT_COMMAND_TIMEOUT = 15.0
+# Commands changing state each process keeps its own copy of; in cluster mode all processes run
+# them and the primary replies (see ``route_command``).
+BROADCAST_COMMANDS = frozenset(
+    {"module_load", "module_unload", "debug_toggle", "error_suppress", "error_resume", "twitch_event"}
+)
+MAX_IN_FLIGHT = 64  # the reader stops pulling commands off the channel beyond this
+# Stream entries older than this are acknowledged without posting: after a long outage a
+# "went live" message for a stream that may already be over does more harm than good.
+TWITCH_EVENT_MAX_AGE = 30 * 60
+
+
+class CommandRunner:
+    """Runs dashboard commands as independent tasks and sends their replies in pipelined batches.
+
+    ``submit`` returns as soon as the command is scheduled, so the listener goes straight back to
+    the channel; a slow ``search_realms`` only ever waits behind other ``search_realms`` calls.
+    Replies are queued and a single writer flushes everything queued so far in one round trip.
+    """
+
+    def __init__(self, bot, client):
+        self._bot = bot
+        self._client = client
+        self._slots = Semaphore(MAX_IN_FLIGHT)
+        self._lanes = {command: Semaphore(limit) for command, limit in COMMAND_LIMITS.items()}
+        self._tasks: set = set()
+        self._replies: Queue = Queue()
+        self._writer = ensure_future(self._write_replies())
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def submit(self, raw: str) -> None:
+        """Schedule one raw ``nerpybot:cmd`` message; waits only while ``MAX_IN_FLIGHT`` are running."""
+        await self._slots.acquire()
+        task = ensure_future(self._run(raw))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, raw: str) -> None:
+        request_id = reply_to = None
+        command = ""
+        reply = True
+        try:
             try:
-                await channel.send(embed=embed)
-                return True
-            except discord.HTTPException as e:
-                bot.log.debug("twitch_event: could not send to channel %s: %s", cfg.ChannelId, e)
-                return False
+                data = json.loads(raw)
+                request_id = data.pop("request_id", None)
+                reply_to = data.pop("reply_to", None)
+                command = data.pop("command", "")
+                run, reply = route_command(self._bot, command, data)
+                if not run:
+                    return
+                async with self._lanes.get(command) or nullcontext():
+                    async with timeout(COMMAND_TIMEOUTS.get(command, DEFAULT_COMMAND_TIMEOUT)):
+                        result = await handle_valkey_command(self._bot, command, data)
+            except TimeoutError:
+                self._bot.log.warning("Valkey command %r timed out", command)
+                result = {"error": f"{command} timed out"}
+            except Exception as e:
+                self._bot.log.error("Valkey command handler error: %s", e)
+                result = {"error": str(e)}
+            if request_id and reply:
+                self._replies.put_nowait((request_id, reply_to, result))
+        finally:
+            self._slots.release()
+
+    async def _write_replies(self) -> None:
+        while True:
+            batch = [await self._replies.get()]
+            while not self._replies.empty():
+                batch.append(self._replies.get_nowait())
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for request_id, reply_to, result in batch:
+                        if reply_to:
+                            pipe.publish(reply_to, json.dumps({"request_id": request_id, "result": result}))
+                        else:
+                            # Dashboards from before the multiplexed RPC channel wait on a list key.
+                            reply_key = f"nerpybot:reply:{request_id}"
+                            pipe.lpush(reply_key, json.dumps(result))
+                            pipe.expire(reply_key, 10)
+                    await pipe.execute()
+            except CancelledError:
+                raise
+            except Exception as e:
+                self._bot.log.error("Valkey reply error (%d replies dropped): %s", len(batch), e)
 
-        results = await gather(*(_notify_one(cfg) for cfg in configs), return_exceptions=True)
-        notified = 0
-        for r in results:
-            if isinstance(r, Exception):
-                bot.log.error(
-                    "twitch_event: unexpected error notifying channel",
-                    exc_info=(type(r), r, r.__traceback__),
-                )
-            elif r is True:
-                notified += 1
-        return {"success": True, "notified": notified}
-    else:
-        return {"error": f"Unknown command: {command}"}
+    async def aclose(self) -> None:
+        """Cancel running commands and the reply writer."""
+        for task in (*self._tasks, self._writer):
+            task.cancel()
+        await gather(*self._tasks, self._writer, return_exceptions=True)
+
+
+def _event_group(bot) -> str:
+    """Consumer group for the event streams; each cluster reads every entry through its own group.
+
+    A newly created group starts after the entries the existing groups already delivered (see
+    ``EventStreamConsumer._group_start``), so switching to or from cluster mode re-announces nothing.
+    """
+    if not bot.cluster.clustered:
+        return CONSUMER_GROUP
+    return f"{CONSUMER_GROUP}:cluster-{bot.cluster.cluster_id}"
 
 
 async def valkey_listener_loop(bot, valkey_url: str) -> None:
     """Background task that subscribes to Valkey pub/sub for web dashboard commands."""
-    import valkey as valkey_lib
+    import valkey.asyncio as valkey_async
 
     retry_delay = 1.0
     max_delay = 60.0
 
     sampler = ensure_future(_cpu_sampler_loop())
+    client = None
+    runner = None
+    events = None
     try:
+        # The command client and runner outlive pub/sub reconnects, so in-flight commands still reply.
+        client = valkey_async.from_url(valkey_url, decode_responses=True)
+        runner = CommandRunner(bot, client)
+
+        async def _consume_twitch_event(payload: dict) -> bool:
+            return not (await handle_twitch_event(bot, payload)).get("retry")
+
+        events = ensure_future(
+            EventStreamConsumer(
+                client,
+                TWITCH_EVENT_STREAM,
+                _consume_twitch_event,
+                group=_event_group(bot),
+                max_age_seconds=TWITCH_EVENT_MAX_AGE,
+            ).run()
+        )
         while not bot.is_closed():
-            client = None
             pubsub = None
             try:
-                client = valkey_lib.from_url(valkey_url, decode_responses=True)
                 pubsub = client.pubsub()
-                pubsub.subscribe("nerpybot:cmd")
+                await pubsub.subscribe("nerpybot:cmd")
                 bot.log.info("Valkey pub/sub listener started")
                 retry_delay = 1.0  # reset backoff on successful connection
+                # Valkey may have restarted while we were away, so every reconnect republishes all guilds.
+                bot.guild_metadata.attach(client, bot.guilds)
+                bot.resource_versions.attach(client)
 
                 while not bot.is_closed():
-                    try:
-                        msg = await to_thread(pubsub.get_message, ignore_subscribe_messages=True, timeout=1.0)
-                        if msg and msg["type"] == "message":
-                            request_id = None
-                            try:
-                                data = json.loads(msg["data"])
-                                request_id = data.pop("request_id", None)
-                                command = data.pop("command", "")
-                                result = await handle_valkey_command(bot, command, data)
-                            except Exception as e:
-                                bot.log.error("Valkey command handler error: %s", e)
-                                result = {"error": str(e)}
-                            if request_id:
-                                reply_key = f"nerpybot:reply:{request_id}"
-
-                                def _push_reply():
-                                    pipe = client.pipeline()
-                                    pipe.lpush(reply_key, json.dumps(result))
-                                    pipe.expire(reply_key, 10)
-                                    pipe.execute()
-
-                                await to_thread(_push_reply)
-                    except Exception as e:
-                        bot.log.error("Valkey read/reply error: %s", e)
-                        await sleep(retry_delay)
-                        retry_delay = min(retry_delay * 2, max_delay)
-                        break  # reconnect outer loop
+                    msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if msg and msg["type"] == "message":
+                        await runner.submit(msg["data"])
+            except CancelledError:
+                raise
             except Exception as e:
                 bot.log.error("Valkey listener error: %s", e)
                 await sleep(retry_delay)
                 retry_delay = min(retry_delay * 2, max_delay)
             finally:
-                try:
-                    if pubsub is not None:
-                        pubsub.unsubscribe()
-                    if client is not None:
-                        client.close()
-                except Exception as e:
-                    bot.log.debug("Valkey cleanup error: %s", e)
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception as e:
+                        bot.log.debug("Valkey cleanup error: %s", e)
     except CancelledError:
         return
+    except Exception as e:
+        bot.log.error("Valkey listener error: %s", e)
     finally:
         sampler.cancel()
+        bot.guild_metadata.detach()
+        bot.resource_versions.detach()
+        if events is not None:
+            events.cancel()
+            await gather(events, return_exceptions=True)
+        if runner is not None:
+            await runner.aclose()
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                bot.log.debug("Valkey cleanup error: %s", e)
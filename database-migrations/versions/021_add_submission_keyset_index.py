@@ -0,0 +1,42 @@
+"""application: replace ApplicationSubmission(GuildId) index with (GuildId, Id)
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-18
+
+The dashboard lists a guild's submissions newest first, one page at a time, keyed on Id
+(``WHERE GuildId = ? AND Id < ? ORDER BY Id DESC``). A composite index serves that without a
+sort, and still covers every lookup the GuildId-only index served.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+
+    if "ApplicationSubmission" in insp.get_table_names():
+        existing_indexes = {i["name"] for i in insp.get_indexes("ApplicationSubmission")}
+        if "ApplicationSubmission_GuildId_Id" not in existing_indexes:
+            op.create_index("ApplicationSubmission_GuildId_Id", "ApplicationSubmission", ["GuildId", "Id"])
+        if "ApplicationSubmission_GuildId" in existing_indexes:
+            op.drop_index("ApplicationSubmission_GuildId", table_name="ApplicationSubmission")
+
+
+def downgrade():
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+
+    if "ApplicationSubmission" in insp.get_table_names():
+        existing_indexes = {i["name"] for i in insp.get_indexes("ApplicationSubmission")}
+        if "ApplicationSubmission_GuildId" not in existing_indexes:
+            op.create_index("ApplicationSubmission_GuildId", "ApplicationSubmission", ["GuildId"])
+        if "ApplicationSubmission_GuildId_Id" in existing_indexes:
+            op.drop_index("ApplicationSubmission_GuildId_Id", table_name="ApplicationSubmission")
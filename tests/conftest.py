@@ -2,7 +2,7 @@
 """Shared pytest fixtures for NerpyBot test suite"""
 
 import sys
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -13,7 +13,7 @@ from sqlalchemy.orm import sessionmaker
 sys.path.insert(0, str(Path(__file__).parent.parent / "NerdyPy"))
 sys.path.insert(0, str(Path(__file__).parent))
 
-from db_helpers import create_test_engine
+from db_helpers import SyncBackedAsyncSession, create_test_engine
 
 
 @pytest.fixture(autouse=True)
@@ -69,16 +69,27 @@ def mock_log():
 def mock_bot(db_session, mock_log):
     """Create a mock bot with session_scope context manager."""
     from utils.cache import GuildConfigCache
+    from utils.member_cache import MemberCache
+    from utils.sharding import ClusterPlan
     from utils.strings import get_string
+    from utils.twitch_index import TwitchNotificationIndex
 
     bot = MagicMock()
     bot.log = mock_log
+    bot.cluster = ClusterPlan()
+    bot.owns_guild = bot.cluster.owns
+    bot.member_cache = MemberCache()
 
     @contextmanager
     def session_scope():
         yield db_session
 
+    @asynccontextmanager
+    async def async_session_scope():
+        yield SyncBackedAsyncSession(db_session)
+
     bot.session_scope = session_scope
+    bot.async_session_scope = async_session_scope
     bot.config = MagicMock()
 
     # Wire up a real GuildConfigCache backed by the test DB session so that
@@ -94,6 +105,7 @@ def mock_bot(db_session, mock_log):
     bot.get_localized_string = lambda guild_id, key, **kwargs: get_string(
         bot.get_guild_language(guild_id), key, **kwargs
     )
+    bot.twitch_index = TwitchNotificationIndex()
 
     return bot
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""Shared DB engine factory for NerpyBot test suites."""
+"""Shared DB engine factory and async-session stand-in for NerpyBot test suites."""
 
 import sys
 from pathlib import Path
@@ -26,7 +26,7 @@ from models.application import (  # noqa: F401
 from models.guild import GuildLanguageConfig  # noqa: F401
 from models.leavemsg import LeaveMessage  # noqa: F401
 from models.moderation import AutoDelete, AutoKicker  # noqa: F401
-from models.music import Playlist, PlaylistEntry  # noqa: F401
+from models.music import Playlist, PlaylistEntry, TrackMetadata  # noqa: F401
 from models.permissions import BotModeratorRole, PermissionSubscriber  # noqa: F401
 from models.premium import PremiumUser  # noqa: F401
 from models.reactionrole import ReactionRoleEntry, ReactionRoleMessage  # noqa: F401
@@ -61,3 +61,57 @@ def create_test_engine():
 
     BASE.metadata.create_all(engine)
     return engine
+
+
+class SyncBackedAsyncSession:
+    """Stand-in for ``AsyncSession`` that runs everything on a synchronous test session.
+
+    Covers the subset of the ``AsyncSession`` API used by ``NerpyBot.async_session_scope`` callers
+    and the web app's async routes, so code on the async path sees the same rows tests insert
+    through the sync session (in-memory SQLite cannot be shared between a sync and an async engine).
+    """
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def get(self, entity, ident):
+        return self.sync_session.get(entity, ident)
+
+    async def execute(self, statement, *args, **kwargs):
+        return self.sync_session.execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        return self.sync_session.scalar(statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        return self.sync_session.scalars(statement, *args, **kwargs)
+
+    async def refresh(self, instance, attribute_names=None):
+        self.sync_session.refresh(instance, attribute_names)
+
+    async def delete(self, instance):
+        self.sync_session.delete(instance)
+
+    async def flush(self):
+        self.sync_session.flush()
+
+    def expunge_all(self):
+        self.sync_session.expunge_all()
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+    async def close(self):
+        self.sync_session.close()
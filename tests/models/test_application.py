@@ -266,6 +266,80 @@ class TestApplicationSubmissionVotesEagerLoading:
         assert len(by_user[2].votes) == 2
 
 
+# ---------------------------------------------------------------------------
+# Review projection — SQL-side tallies, no vote rows loaded
+# ---------------------------------------------------------------------------
+class TestReviewProjection:
+    """Tests for ApplicationVote.tally(), get_pending_reviews() and get_texts_by_submission()."""
+
+    def _make(self, db_session, *, guild_id=111, status="pending", review_message_id=900, approvals=0, denials=0):
+        form = db_session.query(ApplicationForm).filter_by(GuildId=guild_id).first()
+        if form is None:
+            form = ApplicationForm(GuildId=guild_id, Name="Raid", ReviewChannelId=55, RequiredApprovals=3)
+            db_session.add(form)
+            db_session.flush()
+        sub = ApplicationSubmission(
+            FormId=form.Id,
+            GuildId=guild_id,
+            UserId=1,
+            UserName="Tester",
+            Status=status,
+            SubmittedAt=datetime.now(UTC),
+            ReviewMessageId=review_message_id,
+        )
+        db_session.add(sub)
+        db_session.flush()
+        votes = [VoteType.APPROVE] * approvals + [VoteType.DENY] * denials
+        for uid, vote in enumerate(votes):
+            db_session.add(ApplicationVote(SubmissionId=sub.Id, UserId=uid, Vote=vote))
+        db_session.commit()
+        return sub
+
+    def test_tally_counts_in_sql(self, db_session):
+        sub = self._make(db_session, approvals=2, denials=1)
+        assert ApplicationVote.tally(sub.Id, db_session) == (2, 1)
+
+    def test_tally_without_votes(self, db_session):
+        sub = self._make(db_session)
+        assert ApplicationVote.tally(sub.Id, db_session) == (0, 0)
+
+    def test_pending_reviews_carry_form_fields_and_tallies(self, db_session):
+        self._make(db_session, review_message_id=901, approvals=2, denials=1)
+        self._make(db_session, review_message_id=902)
+        db_session.expunge_all()
+
+        rows = {r.ReviewMessageId: r for r in ApplicationSubmission.get_pending_reviews(111, db_session)}
+
+        assert (rows[901].ApproveCount, rows[901].DenyCount) == (2, 1)
+        assert (rows[902].ApproveCount, rows[902].DenyCount) == (0, 0)
+        assert (rows[901].FormName, rows[901].ReviewChannelId, rows[901].RequiredApprovals) == ("Raid", 55, 3)
+        assert not any(isinstance(obj, ApplicationVote) for obj in db_session.identity_map.values())
+
+    def test_pending_reviews_skip_decided_unposted_and_other_guilds(self, db_session):
+        self._make(db_session, review_message_id=901)
+        self._make(db_session, review_message_id=902, status="approved")
+        self._make(db_session, review_message_id=None)
+        self._make(db_session, guild_id=222, review_message_id=903)
+
+        rows = ApplicationSubmission.get_pending_reviews(111, db_session)
+
+        assert [r.ReviewMessageId for r in rows] == [901]
+
+    def test_answer_texts_match_extract_answers_shape(self, db_session):
+        sub = self._make(db_session)
+        q1 = ApplicationQuestion(FormId=sub.FormId, QuestionText="Why?", SortOrder=1)
+        q2 = ApplicationQuestion(FormId=sub.FormId, QuestionText="When?", SortOrder=2)
+        db_session.add_all([q1, q2])
+        db_session.flush()
+        db_session.add(ApplicationAnswer(SubmissionId=sub.Id, QuestionId=q1.Id, AnswerText="Because"))
+        db_session.add(ApplicationAnswer(SubmissionId=sub.Id, QuestionId=q2.Id, AnswerText="Now"))
+        db_session.commit()
+
+        texts = ApplicationAnswer.get_texts_by_submission([sub.Id, 12345], db_session)
+
+        assert texts == {sub.Id: [("Why?", "Because"), ("When?", "Now")], 12345: []}
+
+
 # ---------------------------------------------------------------------------
 # ApplicationSubmission
 # ---------------------------------------------------------------------------
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for models/guild.py - BotGuild membership sync."""
+
+from models.guild import BotGuild
+
+
+class TestBotGuildSync:
+    """Tests for BotGuild.sync()."""
+
+    def test_populates_empty_table(self, db_session):
+        assert BotGuild.sync([1, 2, 3], db_session) == (3, 0)
+        assert BotGuild.get_ids(db_session) == {"1", "2", "3"}
+
+    def test_writes_only_the_difference(self, db_session):
+        BotGuild.sync([1, 2, 3], db_session)
+
+        assert BotGuild.sync([2, 3, 4], db_session) == (1, 1)
+        assert BotGuild.get_ids(db_session) == {"2", "3", "4"}
+
+    def test_unchanged_membership_touches_nothing(self, db_session):
+        BotGuild.sync([1, 2], db_session)
+
+        assert BotGuild.sync([2, 1], db_session) == (0, 0)
+        assert BotGuild.get_ids(db_session) == {"1", "2"}
+
+    def test_empty_list_clears_table(self, db_session):
+        BotGuild.sync([1, 2], db_session)
+
+        assert BotGuild.sync([], db_session) == (0, 2)
+        assert BotGuild.get_ids(db_session) == set()
+
+    def test_guild_filter_leaves_other_clusters_alone(self, db_session):
+        from utils.sharding import ClusterPlan
+
+        shard0, shard1 = 2 << 22, 1 << 22
+        BotGuild.sync([shard0, shard1], db_session)
+        plan = ClusterPlan(shard_count=2, cluster_id=1, cluster_count=2)
+
+        assert BotGuild.sync([], db_session, plan.guild_filter(BotGuild.GuildId)) == (0, 1)
+        assert BotGuild.get_ids(db_session) == {str(shard0)}
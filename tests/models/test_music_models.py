@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-"""Tests for Playlist and PlaylistEntry models."""
+"""Tests for Playlist, PlaylistEntry and TrackMetadata models."""
 
-from models.music import Playlist, PlaylistEntry
+from datetime import timedelta
+
+from models.music import Playlist, PlaylistEntry, TrackMetadata
 
 
 class TestPlaylist:
@@ -25,3 +27,37 @@ class TestPlaylistEntry:
         db_session.commit()
         entries = PlaylistEntry.get_by_playlist(p.Id, db_session)
         assert [e.Title for e in entries] == ["A", "B"]
+
+
+class TestTrackMetadata:
+    def test_upsert_and_get_fresh(self, db_session):
+        info = {"title": "Song", "id": "abc", "duration": 210, "uploader": "Artist", "webpage_url": "https://yt/abc"}
+        TrackMetadata.upsert("https://yt/abc", info, db_session)
+        db_session.commit()
+        row = TrackMetadata.get_fresh("https://yt/abc", 3600, db_session)
+        assert row is not None
+        assert row.to_info() == {**info, "thumbnail": None}
+
+    def test_get_fresh_ignores_expired(self, db_session):
+        TrackMetadata.upsert("https://yt/old", {"title": "Old", "id": "old"}, db_session)
+        db_session.commit()
+        row = TrackMetadata.get_fresh("https://yt/old", 3600, db_session)
+        row.FetchedAt = row.FetchedAt - timedelta(hours=2)
+        db_session.commit()
+        assert TrackMetadata.get_fresh("https://yt/old", 3600, db_session) is None
+
+    def test_upsert_refreshes_existing_row(self, db_session):
+        TrackMetadata.upsert("https://yt/x", {"title": "Before", "id": "x"}, db_session)
+        db_session.commit()
+        TrackMetadata.upsert("https://yt/x", {"title": "After", "id": "x"}, db_session)
+        db_session.commit()
+        assert db_session.query(TrackMetadata).count() == 1
+        assert TrackMetadata.get_fresh("https://yt/x", 3600, db_session).Title == "After"
+
+    def test_delete_older_than(self, db_session):
+        TrackMetadata.upsert("https://yt/keep", {"id": "keep"}, db_session)
+        stale = TrackMetadata.upsert("https://yt/drop", {"id": "drop"}, db_session)
+        stale.FetchedAt = stale.FetchedAt - timedelta(days=30)
+        db_session.commit()
+        assert TrackMetadata.delete_older_than(24 * 3600, db_session) == 1
+        assert TrackMetadata.get_fresh("https://yt/keep", 3600, db_session) is not None
@@ -115,6 +115,38 @@ class TestReminderMessageGetNextFireTime:
         assert ReminderMessage.get_next_fire_time(db_session) is None
 
 
+class TestReminderMessageClusterFilter:
+    """get_due() and get_next_fire_time() with a cluster's guild filter."""
+
+    def test_only_owned_guilds_are_returned(self, db_session):
+        from utils.sharding import ClusterPlan
+
+        now = datetime.now(UTC)
+        plan = ClusterPlan(shard_count=2, cluster_id=1, cluster_count=2)
+        owned, foreign = 1 << 22, 2 << 22  # shard 1 and shard 0
+        for guild_id, next_fire in ((owned, now - timedelta(seconds=10)), (foreign, now - timedelta(hours=1))):
+            db_session.add(
+                ReminderMessage(
+                    GuildId=guild_id,
+                    ChannelId=111,
+                    ChannelName="ch",
+                    CreateDate=now,
+                    Author="A",
+                    ScheduleType="once",
+                    NextFire=next_fire,
+                    Message=str(guild_id),
+                    Count=0,
+                    Enabled=True,
+                )
+            )
+        db_session.commit()
+        guild_filter = plan.guild_filter(ReminderMessage.GuildId)
+
+        assert [r.GuildId for r in ReminderMessage.get_due(db_session, guild_filter)] == [owned]
+        next_fire = ReminderMessage.get_next_fire_time(db_session, guild_filter)
+        assert abs((next_fire - (now - timedelta(seconds=10))).total_seconds()) < 2
+
+
 class TestReminderMessageGetAllByGuild:
     """Tests for ReminderMessage.get_all_by_guild()."""
 
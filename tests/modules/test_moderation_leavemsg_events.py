@@ -4,7 +4,7 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from discord import NotFound, TextChannel
+from discord import Member, NotFound, TextChannel, User
 
 from models.leavemsg import LeaveMessage
 from modules.moderation import Moderation
@@ -200,3 +200,45 @@ class TestOnMemberRemove:
 
         # Should not raise
         await cog.on_member_remove(member)
+
+
+class TestOnRawMemberRemove:
+    """Members the client never cached only arrive through on_raw_member_remove."""
+
+    @pytest.mark.asyncio
+    async def test_uncached_member_gets_a_leave_message(self, cog, db_session):
+        guild_id = 444000444
+        channel_id = 555000555
+        db_session.add(LeaveMessage(GuildId=guild_id, ChannelId=channel_id, Message="Bye {member}!", Enabled=True))
+        db_session.commit()
+        cog.bot.guild_cache.warm_leave_messages(cog.bot.SESSION)
+
+        mock_channel = MagicMock(spec=TextChannel)
+        mock_channel.id = channel_id
+        mock_channel.send = AsyncMock()
+        mock_guild = MagicMock()
+        mock_guild.id = guild_id
+        mock_guild.name = "Unchunked Guild"
+        mock_guild.get_channel = MagicMock(return_value=mock_channel)
+        cog.bot.get_guild = MagicMock(return_value=mock_guild)
+
+        user = MagicMock(spec=User)
+        user.bot = False
+        user.display_name = "Dave"
+        user.name = "dave000"
+        payload = MagicMock(guild_id=guild_id, user=user)
+
+        await cog.on_raw_member_remove(payload)
+
+        cog.bot.get_guild.assert_called_once_with(guild_id)
+        mock_channel.send.assert_awaited_once()
+        assert "Dave" in mock_channel.send.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_cached_member_is_left_to_on_member_remove(self, cog):
+        cog.bot.get_guild = MagicMock()
+        payload = MagicMock(guild_id=1, user=MagicMock(spec=Member))
+
+        await cog.on_raw_member_remove(payload)
+
+        cog.bot.get_guild.assert_not_called()
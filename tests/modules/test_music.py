@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from models.music import Playlist, PlaylistEntry
 from modules.music.playback import MusicPlayback
+from modules.music.progress import ProgressPacer
 from modules.music.playlist import MusicPlaylist
 from utils.cache import _autocomplete_cache
 from utils.strings import load_strings
@@ -38,6 +39,7 @@ def music_cog_new(mock_bot):
         cog.config = mock_bot.config["music"]
         cog.audio = mock_bot.audio
         cog._background_tasks = set()
+        cog._progress_pacer = ProgressPacer()
         cog._progress_updater = MagicMock()
         cog._progress_updater.start = MagicMock()
         cog._progress_updater.cancel = MagicMock()
@@ -135,6 +137,59 @@ class TestMusicHookAndProgressLoop:
         song.channel.send.assert_called_once()
         assert music_cog_new.audio.now_playing_message[guild_id] is new_msg
 
+    @staticmethod
+    def _playing(cog, guild_id, duration=200):
+        song = MagicMock()
+        song.title = "Song"
+        song.fetch_data = "https://youtube.com/watch?v=song"
+        song.duration = duration
+        song.requester = None
+        song.thumbnail = None
+        song.artist = None
+        msg = MagicMock()
+        msg.edit = AsyncMock()
+        cog.audio.current_song[guild_id] = song
+        cog.audio.now_playing_message[guild_id] = msg
+        return msg
+
+    @pytest.mark.asyncio
+    async def test_progress_updater_edits_when_bar_moved(self, music_cog_new, db_session):
+        msg = self._playing(music_cog_new, 1)
+
+        await MusicPlayback._progress_updater.coro(music_cog_new)
+
+        msg.edit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_progress_updater_skips_unchanged_bar(self, music_cog_new, db_session):
+        msg = self._playing(music_cog_new, 1)
+        await MusicPlayback._progress_updater.coro(music_cog_new)
+        music_cog_new._progress_pacer._due[1] = 0  # make the guild due again, elapsed unchanged
+
+        await MusicPlayback._progress_updater.coro(music_cog_new)
+
+        msg.edit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_progress_updater_waits_for_guild_interval(self, music_cog_new, db_session):
+        msg = self._playing(music_cog_new, 1)
+        music_cog_new._progress_pacer.start(1, cells=0, duration=200)
+
+        await MusicPlayback._progress_updater.coro(music_cog_new)
+
+        msg.edit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_progress_updater_drops_deleted_message(self, music_cog_new, db_session):
+        import discord as _discord
+
+        msg = self._playing(music_cog_new, 1)
+        msg.edit.side_effect = _discord.NotFound(MagicMock(status=404, reason="Not Found"), "not found")
+
+        await MusicPlayback._progress_updater.coro(music_cog_new)
+
+        assert 1 not in music_cog_new.audio.now_playing_message
+
 
 class TestPlayCommand:
     @pytest.mark.asyncio
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Tests for modules.music.download — trimmed metadata records and the fetch_yt_infos cache layers."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from models.music import TrackMetadata
+from modules.music import download
+
+
+@pytest.fixture(autouse=True)
+def _reset_download_state(monkeypatch):
+    download.CACHE.clear()
+    monkeypatch.setattr(download, "_metadata_session_factory", None)
+    yield
+    download.CACHE.clear()
+
+
+@pytest.fixture
+def store(db_engine, monkeypatch):
+    factory = sessionmaker(bind=db_engine, expire_on_commit=False)
+    download.configure_metadata_store(factory)
+    return factory
+
+
+def _full_info(video_id: str) -> dict:
+    return {
+        "title": f"Song {video_id}",
+        "id": video_id,
+        "duration": 200,
+        "uploader": "Artist",
+        "thumbnail": f"https://img/{video_id}.jpg",
+        "thumbnails": [{"url": "small"}, {"url": "large"}],
+        "webpage_url": f"https://yt/{video_id}",
+        "formats": [{"format_id": str(i)} for i in range(50)],
+        "subtitles": {"en": []},
+    }
+
+
+class TestTrimInfo:
+    def test_keeps_only_used_fields(self):
+        trimmed = download.trim_info(_full_info("abc"))
+        assert trimmed == {
+            "title": "Song abc",
+            "id": "abc",
+            "duration": 200,
+            "uploader": "Artist",
+            "thumbnail": "https://img/abc.jpg",
+            "webpage_url": "https://yt/abc",
+        }
+
+    def test_falls_back_to_channel_and_last_thumbnail(self):
+        info = {"id": "x", "channel": "Chan", "thumbnails": [{"url": "small"}, {"url": "large"}], "url": "https://u"}
+        trimmed = download.trim_info(info)
+        assert trimmed["uploader"] == "Chan"
+        assert trimmed["thumbnail"] == "large"
+        assert trimmed["webpage_url"] == "https://u"
+
+    def test_playlist_entries_are_trimmed(self):
+        info = {"_type": "playlist", "title": "PL", "entries": [_full_info("1"), None, _full_info("2")]}
+        trimmed = download.trim_info(info)
+        assert trimmed["_type"] == "playlist"
+        assert [e["id"] for e in trimmed["entries"]] == ["1", "2"]
+        assert "formats" not in trimmed["entries"][0]
+
+
+class TestFetchYtInfos:
+    def test_extracts_once_then_serves_from_memory(self, monkeypatch):
+        run = MagicMock(return_value=download.trim_info(_full_info("a")))
+        monkeypatch.setattr(download.WORKERS, "run", run)
+        assert download.fetch_yt_infos("https://yt/a")["id"] == "a"
+        assert download.fetch_yt_infos("https://yt/a")["id"] == "a"
+        run.assert_called_once()
+
+    def test_durable_store_survives_memory_cache_loss(self, store, monkeypatch):
+        run = MagicMock(return_value=download.trim_info(_full_info("a")))
+        monkeypatch.setattr(download.WORKERS, "run", run)
+        download.fetch_yt_infos("https://yt/a")
+        download.CACHE.clear()  # simulate a restart
+
+        info = download.fetch_yt_infos("https://yt/a")
+
+        run.assert_called_once()
+        assert info["title"] == "Song a"
+
+    def test_playlist_entries_cached_under_their_urls(self, store, monkeypatch):
+        playlist = download.trim_info(
+            {"_type": "playlist", "title": "PL", "entries": [_full_info("1"), _full_info("2")]}
+        )
+        run = MagicMock(return_value=playlist)
+        monkeypatch.setattr(download.WORKERS, "run", run)
+        download.fetch_yt_infos("https://yt/playlist?list=PL")
+        download.CACHE.clear()
+
+        assert download.fetch_yt_infos("https://yt/2")["id"] == "2"
+        run.assert_called_once()
+        with store() as session:
+            assert TrackMetadata.get_fresh("https://yt/playlist?list=PL", 3600, session) is None
+
+    def test_concurrent_lookups_share_one_extraction(self, monkeypatch):
+        calls = []
+
+        def slow_run(fn, url, timeout=None):
+            calls.append(url)
+            time.sleep(0.2)
+            return download.trim_info(_full_info("a"))
+
+        monkeypatch.setattr(download.WORKERS, "run", slow_run)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(download.fetch_yt_infos("https://yt/a"))) for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(r["id"] == "a" for r in results)
+
+    def test_failed_lookup_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(download.WORKERS, "run", MagicMock(side_effect=TimeoutError("slow")))
+        with pytest.raises(TimeoutError):
+            download.fetch_yt_infos("https://yt/a")
+        assert "https://yt/a" not in download.CACHE
+        assert "https://yt/a" not in download._inflight
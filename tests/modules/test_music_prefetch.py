@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Tests for modules.music.prefetch — bot-wide prefetch scheduler."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.music.prefetch import PrefetchScheduler
+
+
+class _Song:
+    """Minimal QueuedSong stand-in whose download blocks until released by the test."""
+
+    def __init__(self, title: str, started: list, fail: bool = False):
+        self.title = title
+        self.stream = None
+        self.fetch_calls = 0
+        self._started = started
+        self._fail = fail
+        self.release = asyncio.Event()
+
+    async def fetch_buffer(self):
+        self.fetch_calls += 1
+        self._started.append(self.title)
+        await self.release.wait()
+        if self._fail:
+            raise RuntimeError("boom")
+        self.stream = MagicMock()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def started():
+    return []
+
+
+class TestPrefetchScheduler:
+    @pytest.mark.asyncio
+    async def test_global_cap_limits_running_downloads(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=2, per_guild=5)
+        songs = [_Song(f"s{i}", started) for i in range(5)]
+        scheduler.schedule(1, songs, playing=True)
+        await _settle()
+
+        assert started == ["s0", "s1"]
+        assert scheduler.stats()["pending"] == 3
+
+        songs[0].release.set()
+        await _settle()
+        assert started == ["s0", "s1", "s2"]
+        for song in songs:
+            song.release.set()
+        await _settle()
+        assert scheduler.stats()["completed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_next_track_of_playing_guilds_goes_first(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1, per_guild=5)
+        blocker = _Song("blocker", started)
+        scheduler.schedule(99, [blocker], playing=True)
+        scheduler.schedule(1, [_Song("idle-0", started), _Song("idle-1", started)], playing=False)
+        scheduler.schedule(2, [_Song("play-0", started), _Song("play-1", started)], playing=True)
+        await _settle()
+
+        order = ["blocker"]
+        for title in ("play-0", "idle-0", "play-1", "idle-1"):
+            current = next(job for job in scheduler._running.values())
+            current.song.release.set()
+            await _settle()
+            order.append(title)
+        assert started == order
+
+    @pytest.mark.asyncio
+    async def test_per_guild_cap_leaves_room_for_other_guilds(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=3, per_guild=1)
+        scheduler.schedule(1, [_Song(f"a{i}", started) for i in range(3)], playing=True)
+        scheduler.schedule(2, [_Song("b0", started)], playing=False)
+        await _settle()
+
+        assert started == ["a0", "b0"]
+
+    @pytest.mark.asyncio
+    async def test_removed_songs_are_cancelled(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1, per_guild=1)
+        first, second = _Song("first", started), _Song("second", started)
+        scheduler.schedule(1, [first, second], playing=True)
+        await _settle()
+
+        scheduler.cancel_guild(1)
+        first.release.set()
+        await _settle()
+
+        assert started == ["first"]
+        assert second.fetch_calls == 0
+        assert first.stream is None  # finished after cancellation, result discarded
+        assert scheduler.stats()["cancelled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rescheduling_keeps_running_job(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1)
+        song = _Song("s", started)
+        scheduler.schedule(1, [song], playing=False)
+        await _settle()
+        scheduler.schedule(1, [song], playing=True)
+        song.release.set()
+        await _settle()
+
+        assert song.fetch_calls == 1
+        assert song.stream is not None
+
+    @pytest.mark.asyncio
+    async def test_fetch_now_waits_for_running_prefetch(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1)
+        song = _Song("s", started)
+        scheduler.schedule(1, [song], playing=True)
+        await _settle()
+
+        waiter = asyncio.create_task(scheduler.fetch_now(1, song))
+        await _settle()
+        assert not waiter.done()
+        song.release.set()
+        await waiter
+
+        assert song.fetch_calls == 1
+        assert song.stream is not None
+
+    @pytest.mark.asyncio
+    async def test_fetch_now_takes_pending_song_out_of_the_backlog(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1)
+        blocker, song = _Song("blocker", started), _Song("s", started)
+        scheduler.schedule(1, [blocker, song], playing=True)
+        await _settle()
+
+        song.release.set()
+        await scheduler.fetch_now(1, song)
+
+        assert song.stream is not None
+        assert scheduler.stats()["pending"] == 0
+        blocker.release.set()
+        await _settle()
+        assert song.fetch_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_is_counted_and_frees_the_slot(self, started):
+        scheduler = PrefetchScheduler(max_concurrent=1)
+        bad, good = _Song("bad", started, fail=True), _Song("good", started)
+        scheduler.schedule(1, [bad, good], playing=True)
+        bad.release.set()
+        good.release.set()
+        await _settle()
+
+        stats = scheduler.stats()
+        assert stats["failed"] == 1
+        assert stats["completed"] == 1
+        assert stats["running"] == 0
+
+    def test_songs_with_stream_are_skipped(self, started):
+        scheduler = PrefetchScheduler()
+        song = _Song("ready", started)
+        song.stream = MagicMock()
+        scheduler.schedule(1, [song], playing=True)
+        assert scheduler.stats()["pending"] == 0
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Tests for modules.music.progress — pacing of now-playing progress edits."""
+
+from modules.music.progress import EDITS_PER_TICK, MAX_BACKOFF, MAX_INTERVAL, MIN_INTERVAL, ProgressPacer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pacer():
+    clock = _Clock()
+    return ProgressPacer(clock=clock), clock
+
+
+class TestBaseInterval:
+    def test_short_track_uses_minimum(self):
+        assert ProgressPacer.base_interval(60) == MIN_INTERVAL
+
+    def test_long_track_slows_down(self):
+        assert ProgressPacer.base_interval(600) == 30.0
+
+    def test_very_long_track_is_capped(self):
+        assert ProgressPacer.base_interval(4 * 3600) == MAX_INTERVAL
+
+    def test_unknown_duration_uses_minimum(self):
+        assert ProgressPacer.base_interval(None) == MIN_INTERVAL
+
+
+class TestProgressPacer:
+    def test_unknown_guild_is_due_immediately(self):
+        pacer, _ = _pacer()
+        assert pacer.due([1]) == [1]
+
+    def test_started_guild_is_due_after_interval(self):
+        pacer, clock = _pacer()
+        pacer.start(1, cells=0, duration=200)
+        assert pacer.due([1]) == []
+        clock.now += MIN_INTERVAL
+        assert pacer.due([1]) == [1]
+
+    def test_changed_compares_with_last_edit(self):
+        pacer, _ = _pacer()
+        pacer.start(1, cells=3, duration=200)
+        assert not pacer.changed(1, 3)
+        assert pacer.changed(1, 4)
+
+    def test_failed_edit_forces_resend(self):
+        pacer, _ = _pacer()
+        pacer.record(1, None, 200, took=0.1)
+        assert pacer.changed(1, 0)
+
+    def test_due_is_capped_per_tick_earliest_first(self):
+        pacer, clock = _pacer()
+        guilds = list(range(EDITS_PER_TICK + 3))
+        for offset, guild_id in enumerate(guilds):
+            pacer.start(guild_id, cells=0, duration=200)
+            pacer._due[guild_id] -= offset
+        clock.now += MIN_INTERVAL + 10
+        due = pacer.due(guilds)
+        assert len(due) == EDITS_PER_TICK
+        assert due[0] == guilds[-1]
+
+    def test_slow_edit_backs_off_and_fast_edits_recover(self):
+        pacer, _ = _pacer()
+        pacer.record(1, 1, 200, took=2.0)
+        assert pacer.backoff == 2.0
+        for _ in range(10):
+            pacer.record(1, 1, 200, took=0.05)
+        assert pacer.backoff == 1.0
+
+    def test_backoff_stretches_interval_and_shrinks_budget(self):
+        pacer, clock = _pacer()
+        for _ in range(10):
+            pacer.record(1, 1, 200, took=0.1, rate_limited=True)
+        assert pacer.backoff == MAX_BACKOFF
+        clock.now += MIN_INTERVAL
+        assert pacer.due([1]) == []
+        clock.now += MIN_INTERVAL * MAX_BACKOFF
+        assert pacer.due([1]) == [1]
+        assert len(pacer.due(range(20))) == 1
+
+    def test_retain_drops_finished_guilds(self):
+        pacer, _ = _pacer()
+        pacer.start(1, cells=0, duration=200)
+        pacer.start(2, cells=0, duration=200)
+        pacer.retain([2])
+        assert pacer.changed(1, 0)
+        assert not pacer.changed(2, 0)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for modules.music.telemetry and the instrumentation in modules.music.download."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.music import download
+from modules.music.telemetry import MusicTelemetry, ffmpeg_process_count
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    fresh = MusicTelemetry()
+    monkeypatch.setattr(download, "TELEMETRY", fresh)
+    download.CACHE.clear()
+    yield fresh
+    download.CACHE.clear()
+
+
+class TestMusicTelemetry:
+    def test_hit_rate_is_none_before_lookups(self):
+        assert MusicTelemetry().hit_rate("file_cache_hits", "file_cache_misses") is None
+
+    def test_hit_rate(self):
+        t = MusicTelemetry()
+        t.incr("file_cache_hits", 3)
+        t.incr("file_cache_misses")
+        assert t.hit_rate("file_cache_hits", "file_cache_misses") == 0.75
+
+    def test_snapshot_shape(self):
+        snap = MusicTelemetry().snapshot()
+        for key in ("extract", "download", "fetch", "queue_wait", "time_to_first_audio"):
+            assert snap[key]["count"] == 0
+        assert snap["counters"] == {}
+        assert isinstance(snap["ffmpeg_processes"], int)
+
+    def test_ffmpeg_count_without_children(self):
+        assert ffmpeg_process_count() >= 0
+
+
+class TestDownloadInstrumentation:
+    def test_file_cache_hit_skips_download_histogram(self, telemetry, monkeypatch):
+        monkeypatch.setattr(download, "lookup_file", lambda video_id: "/tmp/cached")
+        monkeypatch.setattr(download, "convert", lambda source, is_stream: source)
+
+        download.download("https://yt/a", video_id="a")
+
+        assert telemetry.counter("file_cache_hits") == 1
+        assert telemetry.download.snapshot()["count"] == 0
+
+    def test_file_cache_miss_times_download(self, telemetry, monkeypatch):
+        monkeypatch.setattr(download, "lookup_file", lambda video_id: None)
+        monkeypatch.setattr(download, "convert", lambda source, is_stream: source)
+        monkeypatch.setattr(download.WORKERS, "run", MagicMock(return_value="/tmp/new"))
+
+        download.download("https://yt/a", video_id="a")
+
+        assert telemetry.counter("file_cache_misses") == 1
+        assert telemetry.download.snapshot()["count"] == 1
+
+    def test_failed_download_is_counted(self, telemetry, monkeypatch):
+        monkeypatch.setattr(download, "lookup_file", lambda video_id: None)
+        monkeypatch.setattr(download.WORKERS, "run", MagicMock(side_effect=TimeoutError("slow")))
+
+        with pytest.raises(TimeoutError):
+            download.download("https://yt/a", video_id="a")
+
+        assert telemetry.counter("download_failures") == 1
+
+    def test_metadata_lookups_are_counted(self, telemetry, monkeypatch):
+        monkeypatch.setattr(download, "_metadata_session_factory", None)
+        monkeypatch.setattr(download.WORKERS, "run", MagicMock(return_value={"id": "a", "title": "A"}))
+
+        download.fetch_yt_infos("https://yt/a")
+        download.fetch_yt_infos("https://yt/a")
+
+        assert telemetry.counter("metadata_misses") == 1
+        assert telemetry.counter("metadata_hits") == 1
+        assert telemetry.extract.snapshot()["count"] == 1
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Tests for modules.music.workers — yt-dlp worker-process pool."""
+
+import math
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from modules.music.workers import WorkerPool, WorkerTimeout
+
+NERDYPY = Path(__file__).parent.parent.parent / "NerdyPy"
+
+
+@pytest.fixture(autouse=True)
+def _nerdypy_first_on_path(monkeypatch):
+    """Spawned workers import ``modules.music.workers`` from the sys.path they inherit.
+
+    The web tests put ``tests/`` in front, where ``modules`` is the test package.
+    """
+    monkeypatch.syspath_prepend(str(NERDYPY))
+
+
+def _raise_timeout():
+    raise TimeoutError("socket read timed out")
+
+
+def _run_in_thread(pool, fn, *args, **kwargs) -> tuple[threading.Thread, dict]:
+    outcome = {}
+
+    def _target():
+        start = time.monotonic()
+        try:
+            outcome["result"] = pool.run(fn, *args, **kwargs)
+        except Exception as exc:
+            outcome["error"] = exc
+        outcome["seconds"] = time.monotonic() - start
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    return thread, outcome
+
+
+@pytest.fixture
+def pool():
+    p = WorkerPool(size=1, timeout=30)
+    yield p
+    p.shutdown()
+
+
+class TestWorkerPool:
+    def test_run_returns_result(self, pool):
+        assert pool.run(math.factorial, 5) == 120
+
+    def test_stats_counts_completed_jobs(self, pool):
+        pool.run(math.factorial, 3)
+        stats = pool.stats()
+        assert stats["completed"] == 1
+        assert stats["busy"] == 0
+        assert stats["running"] is True
+
+    def test_job_exception_propagates(self, pool):
+        with pytest.raises(ValueError):
+            pool.run(math.factorial, -1)
+        assert pool.stats()["failed"] == 1
+
+    def test_timeout_replaces_the_worker(self, pool):
+        with pytest.raises(WorkerTimeout):
+            pool.run(time.sleep, 10, timeout=0.5)
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["restarts"] == 1
+        assert stats["running"] is False
+        # the next job starts a new worker
+        assert pool.run(math.factorial, 4) == 24
+
+    def test_crashing_worker_is_isolated(self, pool):
+        with pytest.raises(BrokenProcessPool):
+            pool.run(os._exit, 1)
+        stats = pool.stats()
+        assert stats["restarts"] == 2  # crashed once, retried once, crashed again
+        assert stats["failed"] == 1
+        assert pool.run(math.factorial, 3) == 6
+
+    def test_configure_resizes_pool(self, pool):
+        pool.run(math.factorial, 1)
+        pool.configure(size=3, timeout=5)
+        stats = pool.stats()
+        assert stats["size"] == 3
+        assert stats["running"] is False
+        assert pool.timeout == 5.0
+
+    def test_stats_when_idle(self):
+        stats = WorkerPool(size=2).stats()
+        assert stats == {
+            "size": 2,
+            "running": False,
+            "busy": 0,
+            "queued": 0,
+            "utilization": 0.0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "restarts": 0,
+        }
+
+    def test_queued_job_timeout_counts_from_its_start(self, pool):
+        """A job waiting for the only worker must neither time out nor kill the job ahead of it."""
+        pool.run(math.factorial, 1)  # start the worker up front so spawn time is not measured
+        thread, slow = _run_in_thread(pool, time.sleep, 2, timeout=30)
+        time.sleep(0.2)
+
+        assert pool.run(math.factorial, 5, timeout=1) == 120
+
+        thread.join()
+        assert "error" not in slow and slow["seconds"] < 3
+        assert pool.stats()["timeouts"] == 0
+        assert pool.stats()["restarts"] == 0
+
+    def test_timeout_leaves_other_workers_running(self):
+        pool = WorkerPool(size=2, timeout=30)
+        try:
+            thread, slow = _run_in_thread(pool, time.sleep, 3)
+            with pytest.raises(WorkerTimeout):
+                pool.run(time.sleep, 10, timeout=1)
+            thread.join()
+            assert "error" not in slow
+            assert pool.stats()["restarts"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_timeout_raised_by_the_job_is_not_a_pool_timeout(self, pool):
+        pid = pool.run(os.getpid)
+        with pytest.raises(TimeoutError) as excinfo:
+            pool.run(_raise_timeout)
+        assert not isinstance(excinfo.value, WorkerTimeout)
+        stats = pool.stats()
+        assert (stats["timeouts"], stats["restarts"], stats["failed"]) == (0, 0, 1)
+        assert pool.run(os.getpid) == pid  # same worker
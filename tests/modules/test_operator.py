@@ -487,6 +487,45 @@ class TestSyncGuilds:
         msg = operator_ctx.send.call_args[0][0]
         assert "1/1" in msg
 
+    @pytest.mark.asyncio
+    async def test_unchanged_guilds_are_skipped(self, cog, operator_ctx):
+        cog.bot.tree.sync = AsyncMock(return_value=[])
+        guilds = self._make_guilds(1, 2)
+        await cog.sync.callback(cog, operator_ctx, guilds=guilds, spec=None)
+
+        await cog.sync.callback(cog, operator_ctx, guilds=guilds, spec=None)
+
+        assert cog.bot.tree.sync.await_count == 2
+        msg = operator_ctx.send.call_args[0][0]
+        assert "0/2" in msg and "2 unchanged" in msg
+
+
+# ---------------------------------------------------------------------------
+# !sync (global)
+# ---------------------------------------------------------------------------
+
+
+class TestSyncGlobal:
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_is_not_pushed_again(self, cog, operator_ctx):
+        cog.bot.tree.sync = AsyncMock(return_value=[MagicMock(), MagicMock()])
+
+        await cog.sync.callback(cog, operator_ctx, guilds=[], spec=None)
+        assert operator_ctx.send.call_args[0][0] == "Synced 2 commands globally."
+
+        await cog.sync.callback(cog, operator_ctx, guilds=[], spec=None)
+        assert "unchanged" in operator_ctx.send.call_args[0][0]
+        cog.bot.tree.sync.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_force_pushes_unchanged_tree(self, cog, operator_ctx):
+        cog.bot.tree.sync = AsyncMock(return_value=[])
+
+        await cog.sync.callback(cog, operator_ctx, guilds=[], spec=None)
+        await cog.sync.callback(cog, operator_ctx, guilds=[], spec="force")
+
+        assert cog.bot.tree.sync.await_count == 2
+
 
 # ---------------------------------------------------------------------------
 # _format_remaining helper
@@ -72,7 +72,7 @@ class TestReminderLoop:
 
         reminder_cog.bot.get_guild = MagicMock(return_value=mock_guild)
 
-        with reminder_cog.bot.session_scope() as session:
+        async with reminder_cog.bot.async_session_scope() as session:
             await reminder_cog._fire_reminder(r, session)
 
         mock_channel.send.assert_awaited_once_with("Test reminder")
@@ -96,7 +96,7 @@ class TestReminderLoop:
 
         reminder_cog.bot.get_guild = MagicMock(return_value=mock_guild)
 
-        with reminder_cog.bot.session_scope() as session:
+        async with reminder_cog.bot.async_session_scope() as session:
             await reminder_cog._fire_reminder(r, session)
 
         mock_channel.send.assert_awaited_once_with("Test reminder")
@@ -116,7 +116,7 @@ class TestReminderLoop:
 
         reminder_cog.bot.get_guild = MagicMock(return_value=mock_guild)
 
-        with reminder_cog.bot.session_scope() as session:
+        async with reminder_cog.bot.async_session_scope() as session:
             await reminder_cog._fire_reminder(r, session)
 
         # No message was sent (channel was None); the row should be deleted
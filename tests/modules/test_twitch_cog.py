@@ -44,6 +44,7 @@ class TestTwitchCog:
 
         cog = TwitchNotificationsCog.__new__(TwitchNotificationsCog)
         cog.bot = mock_bot
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
 
         inter = _make_interaction()
         mock_channel = MagicMock(spec=discord.TextChannel)
@@ -59,6 +60,7 @@ class TestTwitchCog:
             rows = TwitchNotifications.get_all_by_guild(111, session)
         assert len(rows) == 1
         assert rows[0].Streamer == "shroud"
+        assert [t.config_id for t in mock_bot.twitch_index.get("shroud")] == [rows[0].Id]
 
     @pytest.mark.asyncio
     async def test_list_empty(self, mock_bot, db_session):
@@ -139,12 +141,15 @@ class TestTwitchCog:
         cog = TwitchNotificationsCog.__new__(TwitchNotificationsCog)
         cog.bot = mock_bot
 
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
+
         inter = _make_interaction()
         await TwitchNotificationsCog.remove.callback(cog, inter, config_id=row_id)
 
         with mock_bot.session_scope() as session:
             rows = TwitchNotifications.get_all_by_guild(111, session)
         assert len(rows) == 0
+        assert mock_bot.twitch_index.get("shroud") == []
         inter.response.send_message.assert_called_once()
 
     @pytest.mark.asyncio
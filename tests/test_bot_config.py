@@ -135,6 +135,22 @@ class TestParseEnvConfig:
             monkeypatch.setenv("NERPYBOT_WOW_TRACK_MOUNTS", value)
             assert parse_env_config()["wow"]["guild_news"]["track_mounts"] is expected, f"failed for {value!r}"
 
+    def test_loop_monitor_nested(self, monkeypatch):
+        monkeypatch.setenv("NERPYBOT_LOOP_MONITOR", "true")
+        monkeypatch.setenv("NERPYBOT_LOOP_LAG_THRESHOLD_MS", "100")
+        assert parse_env_config()["bot"]["loop_monitor"] == {"enabled": True, "threshold_ms": 100}
+
+    def test_sharding_nested(self, monkeypatch):
+        monkeypatch.setenv("NERPYBOT_SHARD_COUNT", "4")
+        monkeypatch.setenv("NERPYBOT_CLUSTER_ID", "1")
+        monkeypatch.setenv("NERPYBOT_CLUSTER_COUNT", "2")
+        assert parse_env_config()["bot"]["sharding"] == {"shard_count": 4, "cluster_id": 1, "cluster_count": 2}
+
+    def test_member_cache_nested(self, monkeypatch):
+        monkeypatch.setenv("NERPYBOT_MEMBER_CHUNKING", "lazy")
+        monkeypatch.setenv("NERPYBOT_MEMBER_LOOKUP_CACHE_SIZE", "50")
+        assert parse_env_config()["bot"]["member_cache"] == {"chunking": "lazy", "lookup_cache_size": 50}
+
     def test_error_recipients_comma_separated(self, monkeypatch):
         monkeypatch.setenv("NERPYBOT_ERROR_RECIPIENTS", "111,222")
         result = parse_env_config()
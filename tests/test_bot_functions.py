@@ -263,9 +263,11 @@ class TestNerpyBotInit:
         with (
             patch("NerdyPy.bot.create_engine"),
             patch("NerdyPy.bot.sessionmaker"),
+            patch("NerdyPy.bot.install_sync_call_guard") as mock_guard,
         ):
             bot = NerpyBot(config, Intents.all(), debug=True)
             assert bot.debug is True
+            mock_guard.assert_called_once_with(bot.ENGINE, bot.log)
 
 
 class TestNerpyBotSessionScope:
@@ -314,6 +316,61 @@ class TestNerpyBotSessionScope:
                 raise SQLAlchemyError("forced error")
 
 
+class TestNerpyBotAsyncSessionScope:
+    """Test NerpyBot.async_session_scope() against a real aiosqlite engine."""
+
+    @staticmethod
+    async def _make_bot(tmp_path):
+        from discord import Intents
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from NerdyPy.bot import NerpyBot
+        from utils.database import BASE
+
+        config = {"bot": {"token": "test_token", "client_id": "12345", "ops": ["111"], "modules": []}}
+        bot = NerpyBot(config, Intents.all(), debug=False)
+        bot.ASYNC_ENGINE = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        bot.ASYNC_SESSION = async_sessionmaker(bind=bot.ASYNC_ENGINE, expire_on_commit=False)
+        async with bot.ASYNC_ENGINE.begin() as conn:
+            await conn.run_sync(BASE.metadata.create_all)
+        return bot
+
+    @pytest.mark.asyncio
+    async def test_commits_on_success(self, tmp_path):
+        from models.guild import BotGuild
+
+        bot = await self._make_bot(tmp_path)
+        try:
+            async with bot.async_session_scope() as session:
+                await session.run_sync(lambda s: BotGuild.add(12345, s))
+
+            async with bot.async_session_scope() as session:
+                guild = await session.run_sync(lambda s: s.query(BotGuild).filter_by(GuildId=12345).first())
+            assert guild is not None
+        finally:
+            await bot.ASYNC_ENGINE.dispose()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self, tmp_path):
+        from models.guild import BotGuild
+        from sqlalchemy.exc import SQLAlchemyError
+        from utils.errors import NerpyInfraException
+
+        bot = await self._make_bot(tmp_path)
+        try:
+            with pytest.raises(NerpyInfraException):
+                async with bot.async_session_scope() as session:
+                    session.add(BotGuild(GuildId=12345))
+                    await session.flush()
+                    raise SQLAlchemyError("forced error")
+
+            async with bot.async_session_scope() as session:
+                guild = await session.run_sync(lambda s: s.query(BotGuild).filter_by(GuildId=12345).first())
+            assert guild is None
+        finally:
+            await bot.ASYNC_ENGINE.dispose()
+
+
 class TestOnReady:
     """Test NerpyBot.on_ready() method."""
 
@@ -411,10 +468,155 @@ class TestOnReady:
             # Should only create activity loop task, not Valkey listener
             assert mock_create_task.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_on_ready_sends_permission_alerts_in_background(self, tmp_path):
+        """Permission DMs go to a background task; the sentinel does not wait for them."""
+        from NerdyPy.bot import NerpyBot
+
+        sentinel = tmp_path / "nerpybot_ready"
+        mock_guild = MagicMock()
+        mock_guild.id = 12345
+
+        mock_self = MagicMock()
+        mock_self.guilds = [mock_guild]
+        mock_self.modules = ["music"]
+        mock_self.config = {}
+        mock_self.log = MagicMock()
+        mock_self._activity_task.done.return_value = False
+        delattr(mock_self, "_valkey_task")
+
+        with (
+            patch("NerdyPy.bot.SENTINEL_PATH", sentinel),
+            patch("NerdyPy.bot.create_task") as mock_create_task,
+            patch("NerdyPy.bot.check_guild_permissions", return_value=["connect"]),
+            patch("NerdyPy.bot.build_permissions_embed", return_value="embed"),
+        ):
+            await NerpyBot.on_ready(mock_self)
+
+        assert sentinel.exists()
+        mock_self._send_permission_alerts.assert_called_once_with({12345: "embed"})
+        mock_create_task.assert_called_once_with(mock_self._send_permission_alerts.return_value)
+
+
+class TestSetupHook:
+    """Test NerpyBot.setup_hook() extension loading."""
+
+    @staticmethod
+    def _make_bot(modules):
+        from discord import Intents
+
+        from NerdyPy.bot import NerpyBot
+
+        config = {"bot": {"token": "test_token", "client_id": "12345", "ops": ["111"], "modules": modules}}
+        bot = NerpyBot(config, Intents.all(), debug=False)
+        bot.create_all = MagicMock()
+        return bot
+
+    @pytest.mark.asyncio
+    async def test_extensions_load_concurrently(self):
+        import asyncio
+
+        bot = self._make_bot(["alpha", "beta"])
+        running, peak, loaded = 0, 0, []
+
+        async def _load(name):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            loaded.append(name)
+
+        try:
+            with (
+                patch.object(bot, "load_extension", side_effect=_load),
+                patch("NerdyPy.bot.load_strings"),
+            ):
+                await bot.setup_hook()
+        finally:
+            await bot.ASYNC_ENGINE.dispose()
+
+        assert sorted(loaded) == ["modules.alpha", "modules.beta", "modules.operator", "modules.server_admin"]
+        assert peak == 4
+        bot.create_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_extension_does_not_stop_the_others(self):
+        from discord.ext.commands import ExtensionFailed
+
+        bot = self._make_bot(["alpha", "beta"])
+
+        async def _load(name):
+            if name == "modules.alpha":
+                raise ExtensionFailed(name, RuntimeError("boom"))
+
+        try:
+            with (
+                patch.object(bot, "load_extension", side_effect=_load) as mock_load,
+                patch("NerdyPy.bot.load_strings"),
+                patch.object(bot, "log") as mock_log,
+            ):
+                await bot.setup_hook()
+        finally:
+            await bot.ASYNC_ENGINE.dispose()
+
+        assert mock_load.await_count == 4
+        errors = [str(call[0][0]) for call in mock_log.error.call_args_list]
+        assert any("failed to load extension alpha" in msg for msg in errors)
+        bot.create_all.assert_called_once()
+
+
+class TestSendPermissionAlerts:
+    """Test NerpyBot._send_permission_alerts() against a real aiosqlite engine."""
+
+    @pytest.mark.asyncio
+    async def test_dms_subscribers_of_alerted_guilds_only(self, tmp_path):
+        from models.permissions import PermissionSubscriber
+
+        bot = await TestNerpyBotAsyncSessionScope._make_bot(tmp_path)
+        try:
+            async with bot.async_session_scope() as session:
+                session.add_all(
+                    [
+                        PermissionSubscriber(GuildId=1, UserId=10),
+                        PermissionSubscriber(GuildId=1, UserId=11),
+                        PermissionSubscriber(GuildId=2, UserId=20),
+                    ]
+                )
+
+            user = MagicMock()
+            user.send = AsyncMock()
+            with (
+                patch.object(bot, "get_user", return_value=None),
+                patch.object(bot, "fetch_user", AsyncMock(return_value=user)) as mock_fetch,
+            ):
+                await bot._send_permission_alerts({1: "embed-1"})
+        finally:
+            await bot.ASYNC_ENGINE.dispose()
+
+        assert sorted(call.args[0] for call in mock_fetch.await_args_list) == [10, 11]
+        assert user.send.await_count == 2
+        user.send.assert_awaited_with(embed="embed-1")
+
 
 class TestValkeyListenerLoop:
     """Test _valkey_listener_loop() function."""
 
+    @staticmethod
+    def _mock_client(pubsub):
+        client = MagicMock()
+        client.pubsub = MagicMock(return_value=pubsub)
+        client.aclose = AsyncMock()
+        return client
+
+    @staticmethod
+    def _mock_pubsub():
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.get_message = AsyncMock(return_value=None)
+        pubsub.aclose = AsyncMock()
+        return pubsub
+
     @pytest.mark.asyncio
     async def test_valkey_listener_subscribes_to_channel(self):
         """_valkey_listener_loop() should subscribe to nerpybot:cmd channel."""
@@ -422,24 +624,40 @@ class TestValkeyListenerLoop:
         # False: enter outer loop; True: exit inner loop; True: exit outer loop
         mock_bot.is_closed = MagicMock(side_effect=[False, True, True])
         mock_bot.log = MagicMock()
+        mock_pubsub = self._mock_pubsub()
+        mock_client = self._mock_client(mock_pubsub)
+
+        import valkey.asyncio as valkey_async
+
+        with patch.object(valkey_async, "from_url", return_value=mock_client):
+            await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
+
+        mock_pubsub.subscribe.assert_awaited_once_with("nerpybot:cmd")
+        mock_pubsub.aclose.assert_awaited_once()
+        mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_valkey_listener_submits_messages_without_waiting(self):
+        """Each message is handed to the CommandRunner; the loop never awaits the handler itself."""
+        mock_bot = MagicMock()
+        # False: enter outer loop; False x2: two reads; True: exit inner; True: exit outer
+        mock_bot.is_closed = MagicMock(side_effect=[False, False, False, True, True])
+        mock_bot.log = MagicMock()
+        mock_pubsub = self._mock_pubsub()
+        mock_pubsub.get_message = AsyncMock(side_effect=[{"type": "message", "data": '{"command": "health"}'}, None])
 
-        mock_client = MagicMock()
-        mock_pubsub = MagicMock()
-        mock_pubsub.subscribe = MagicMock()
-        mock_pubsub.unsubscribe = MagicMock()
-        mock_client.pubsub = MagicMock(return_value=mock_pubsub)
-        mock_client.close = MagicMock()
+        import valkey.asyncio as valkey_async
 
         with (
-            patch("NerdyPy.utils.valkey.to_thread", new_callable=AsyncMock),
+            patch.object(valkey_async, "from_url", return_value=self._mock_client(mock_pubsub)),
+            patch("NerdyPy.utils.valkey.CommandRunner") as mock_runner_cls,
         ):
-            import valkey as valkey_lib
-
-            with patch.object(valkey_lib, "from_url", return_value=mock_client):
-                await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
+            mock_runner_cls.return_value.submit = AsyncMock()
+            mock_runner_cls.return_value.aclose = AsyncMock()
+            await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
 
-                # Should have subscribed to channel
-                mock_pubsub.subscribe.assert_called_once_with("nerpybot:cmd")
+        mock_runner_cls.return_value.submit.assert_awaited_once_with('{"command": "health"}')
+        mock_runner_cls.return_value.aclose.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_valkey_listener_handles_cancelled_error(self):
@@ -450,31 +668,32 @@ class TestValkeyListenerLoop:
         mock_bot.is_closed = MagicMock(side_effect=CancelledError)
         mock_bot.log = MagicMock()
 
-        with patch("NerdyPy.utils.valkey.to_thread", new_callable=AsyncMock):
-            import valkey as valkey_lib
+        import valkey.asyncio as valkey_async
 
-            with patch.object(valkey_lib, "from_url", return_value=MagicMock()):
-                await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
-                # Should exit without raising
+        with patch.object(valkey_async, "from_url", return_value=self._mock_client(self._mock_pubsub())):
+            await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
+            # Should exit without raising
 
     @pytest.mark.asyncio
     async def test_valkey_listener_logs_errors(self):
-        """_valkey_listener_loop() should log errors."""
+        """_valkey_listener_loop() should log errors and back off before reconnecting."""
         mock_bot = MagicMock()
         mock_bot.log = MagicMock()
         # False: enter outer loop; True: exit after error + sleep
         mock_bot.is_closed = MagicMock(side_effect=[False, True])
+        mock_pubsub = self._mock_pubsub()
+        mock_pubsub.subscribe = AsyncMock(side_effect=Exception("Connection failed"))
+
+        import valkey.asyncio as valkey_async
 
         with (
-            patch("NerdyPy.utils.valkey.sleep", new_callable=AsyncMock),
+            patch("NerdyPy.utils.valkey.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch.object(valkey_async, "from_url", return_value=self._mock_client(mock_pubsub)),
         ):
-            import valkey as valkey_lib
-
-            with patch.object(valkey_lib, "from_url", side_effect=Exception("Connection failed")):
-                await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
+            await _valkey_listener_loop(mock_bot, "valkey://localhost:6379")
 
-                # Should log the error
-                mock_bot.log.error.assert_called()
+        mock_bot.log.error.assert_called()
+        mock_sleep.assert_awaited_once_with(1.0)
 
 
 class TestVersionCallback:
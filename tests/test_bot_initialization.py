@@ -45,6 +45,33 @@ class TestNerpyBotInitialization:
         assert bot.debug is False
         assert bot.restart is True
 
+    def test_init_sharding(self):
+        """Without sharding config Discord picks the shards; a cluster connects only its own range."""
+        config = {"bot": {"client_id": "1", "token": "t", "ops": [], "modules": []}}
+
+        bot = NerpyBot(config, Intents.default(), debug=False)
+        assert bot.shard_count is None and bot.shard_ids is None
+        assert bot.owns_guild(123 << 22)
+
+        config["bot"]["sharding"] = {"shard_count": 4, "cluster_id": 1, "cluster_count": 2}
+        bot = NerpyBot(config, Intents.default(), debug=False)
+        assert bot.shard_count == 4
+        assert bot.shard_ids == [2, 3]
+        assert bot.owns_guild(3 << 22)
+        assert not bot.owns_guild(1 << 22)
+
+    def test_init_member_chunking(self):
+        """Only the "all" mode lets discord.py chunk every guild before on_ready."""
+        config = {"bot": {"client_id": "1", "token": "t", "ops": [], "modules": []}}
+
+        bot = NerpyBot(config, Intents.default(), debug=False)
+        assert bot.member_cache.chunking == "selective"
+        assert bot._connection._chunk_guilds is False
+
+        config["bot"]["member_cache"] = {"chunking": "all"}
+        bot = NerpyBot(config, Intents(guilds=True, members=True), debug=False)
+        assert bot._connection._chunk_guilds is True
+
     def test_init_defaults(self):
         """bot_name and description should fall back to NerpyBot defaults when not configured."""
         config = {
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests for the command latency hooks on NerpyBot (completion events → METRICS)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from discord import InteractionResponseType
+
+from NerdyPy.bot import NerpyBot
+from utils.metrics import METRICS
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+def _interaction(response_type, age=0.5):
+    interaction = MagicMock()
+    interaction.created_at = datetime.now(UTC) - timedelta(seconds=age)
+    interaction.response.type = response_type
+    return interaction
+
+
+def _command(name):
+    command = MagicMock()
+    command.qualified_name = name
+    return command
+
+
+class TestAppCommandCompletion:
+    async def test_records_latency_per_command_and_response_kind(self):
+        bot = MagicMock()
+        await NerpyBot.on_app_command_completion(
+            bot, _interaction(InteractionResponseType.deferred_channel_message), _command("music play")
+        )
+        await NerpyBot.on_app_command_completion(
+            bot, _interaction(InteractionResponseType.channel_message), _command("reminder list")
+        )
+
+        histograms = METRICS.snapshot()["histograms"]
+        assert set(histograms["command"]) == {"music play", "reminder list"}
+        assert histograms["command"]["music play"]["last_ms"] >= 500
+        assert histograms["interaction"]["deferred"]["count"] == 1
+        assert histograms["interaction"]["immediate"]["count"] == 1
+
+
+class TestPrefixCommandCompletion:
+    async def test_records_prefix_commands(self):
+        ctx = MagicMock()
+        ctx.interaction = None
+        ctx.command = _command("sync")
+        ctx.message.created_at = datetime.now(UTC)
+
+        await NerpyBot.on_command_completion(MagicMock(), ctx)
+
+        assert METRICS.snapshot()["histograms"]["command"]["sync"]["count"] == 1
+
+    async def test_hybrid_commands_run_as_slash_commands_are_not_counted_twice(self):
+        ctx = MagicMock()
+        ctx.command = _command("sync")
+
+        await NerpyBot.on_command_completion(MagicMock(), ctx)
+
+        assert METRICS.snapshot()["histograms"] == {}
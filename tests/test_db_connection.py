@@ -156,3 +156,15 @@ class TestBuildConnectionString:
         assert parsed.username == "user"
         assert parsed.host == "localhost"
         assert parsed.database == "nerpybot"
+
+    def test_async_sqlite_fallback_uses_aiosqlite(self):
+        assert NerpyBot.build_connection_string({}, async_driver=True) == "sqlite+aiosqlite:///db.db"
+
+    def test_async_sqlite_configured(self):
+        config = {"database": {"db_type": "sqlite", "db_name": "bot.db"}}
+        assert NerpyBot.build_connection_string(config, async_driver=True) == "sqlite+aiosqlite:///bot.db"
+
+    def test_async_postgresql_keeps_psycopg(self):
+        """psycopg 3 provides the async dialect as well, so the URL is the same for both engines."""
+        config = {"database": {"db_type": "postgresql", "db_name": "nerpybot", "db_host": "localhost"}}
+        assert NerpyBot.build_connection_string(config, async_driver=True) == NerpyBot.build_connection_string(config)
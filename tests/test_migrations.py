@@ -105,3 +105,62 @@ def test_run_migrations_with_different_db_errors():
 
         with pytest.raises(OperationalError, match="Connection failed"):
             run_migrations()
+
+
+def test_run_migrations_skips_upgrade_when_database_at_head():
+    """With a database URL, an up-to-date database skips the Alembic upgrade."""
+    with (
+        patch("NerdyPy.bot.Config"),
+        patch("NerdyPy.bot._database_at_head", return_value=True),
+        patch("NerdyPy.bot.alembic_command") as mock_cmd,
+    ):
+        run_migrations("sqlite:///db.db")
+
+    mock_cmd.upgrade.assert_not_called()
+
+
+def test_run_migrations_upgrades_when_database_behind():
+    with (
+        patch("NerdyPy.bot.Config"),
+        patch("NerdyPy.bot._database_at_head", return_value=False),
+        patch("NerdyPy.bot.alembic_command") as mock_cmd,
+    ):
+        run_migrations("sqlite:///db.db")
+
+    mock_cmd.upgrade.assert_called_once()
+
+
+def test_run_migrations_upgrades_when_revision_unreadable():
+    """A failing head check must not prevent the upgrade (which then reports the real error)."""
+    with (
+        patch("NerdyPy.bot.Config"),
+        patch("NerdyPy.bot._database_at_head", side_effect=RuntimeError("DB unreachable")),
+        patch("NerdyPy.bot.alembic_command") as mock_cmd,
+    ):
+        run_migrations("sqlite:///db.db")
+
+    mock_cmd.upgrade.assert_called_once()
+
+
+def test_database_at_head_compares_stored_revision_with_scripts(tmp_path):
+    """_database_at_head() reads alembic_version and compares it with the script heads."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    from sqlalchemy import create_engine, text
+
+    from NerdyPy.bot import _database_at_head
+
+    cfg = Config(str(Path(__file__).resolve().parents[1] / "alembic.ini"))
+    cfg.set_main_option("script_location", str(Path(__file__).resolve().parents[1] / "database-migrations"))
+    url = f"sqlite:///{tmp_path / 'rev.db'}"
+
+    assert _database_at_head(cfg, url) is False  # no alembic_version table yet
+
+    (head,) = ScriptDirectory.from_config(cfg).get_heads()
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": head})
+    engine.dispose()
+
+    assert _database_at_head(cfg, url) is True
@@ -1,10 +1,12 @@
+import asyncio
+import json
 from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from utils.valkey import handle_valkey_command
+from utils.valkey import COMMAND_LIMITS, CommandRunner, handle_valkey_command
 
 
 class TestBotCommandHandler:
@@ -130,6 +132,92 @@ class TestBotCommandHandler:
         assert "bot_version" not in result
         assert "active_reminders" not in result
 
+    def test_loop_stats_none_without_monitor(self):
+        """Bots without the loop monitor enabled report no event loop stats."""
+        from utils.valkey import _build_loop_stats
+
+        bot = MagicMock(spec=["guilds"])
+        bot.loop_monitor = None
+        assert _build_loop_stats(bot) is None
+
+    def test_music_stats_none_without_audio(self):
+        """Bots that never loaded the music module report no music stats."""
+        from utils.valkey import _build_music_stats
+
+        bot = MagicMock(spec=["guilds"])
+        assert _build_music_stats(bot) is None
+
+    def test_music_stats_include_worker_pool(self, mock_bot):
+        """Music stats expose the worker pool, prefetch scheduler and telemetry snapshots."""
+        from utils.valkey import _build_music_stats
+
+        mock_bot.audio.worker_stats.return_value = {"size": 2, "busy": 1}
+        mock_bot.audio.prefetch_stats.return_value = {"running": 1, "pending": 4}
+        mock_bot.audio.telemetry_stats.return_value = {"ffmpeg_processes": 3}
+        assert _build_music_stats(mock_bot) == {
+            "worker_pool": {"size": 2, "busy": 1},
+            "prefetch": {"running": 1, "pending": 4},
+            "telemetry": {"ffmpeg_processes": 3},
+        }
+
+    def test_voice_details_include_guild_music_stats(self, mock_bot, mock_voice_client):
+        """Each voice connection carries the guild's queue depth and last playback timings."""
+        from utils.valkey import _build_voice_details
+
+        mock_bot.voice_clients = [mock_voice_client]
+        mock_bot.audio.guild_stats.return_value = {"queue_length": 2, "time_to_first_audio_ms": 850.0}
+
+        _, details = _build_voice_details(mock_bot)
+
+        mock_bot.audio.guild_stats.assert_called_once_with(12345)
+        assert details[0]["music"] == {"queue_length": 2, "time_to_first_audio_ms": 850.0}
+
+    def test_voice_details_without_music_module(self, mock_voice_client):
+        """Bots without the music module report no per-guild music stats."""
+        from utils.valkey import _build_voice_details
+
+        bot = MagicMock(spec=["voice_clients"])
+        bot.voice_clients = [mock_voice_client]
+
+        _, details = _build_voice_details(bot)
+
+        assert details[0]["music"] is None
+
+    async def test_metrics_command_returns_registry_snapshot(self, mock_bot):
+        from utils.metrics import METRICS
+
+        METRICS.reset()
+        METRICS.observe("command", "reminder create", 0.25)
+        METRICS.incr("loop_items", "reminder", 4)
+        try:
+            result = await handle_valkey_command(mock_bot, "metrics", {})
+        finally:
+            METRICS.reset()
+
+        assert result["histograms"]["command"]["reminder create"]["count"] == 1
+        assert result["counters"] == {"loop_items": {"reminder": 4}}
+
+    async def test_sync_commands_skips_unchanged_tree(self, mock_bot):
+        mock_bot.tree.sync = AsyncMock(return_value=[MagicMock()])
+
+        first = await handle_valkey_command(mock_bot, "sync_commands", {"mode": "global"})
+        second = await handle_valkey_command(mock_bot, "sync_commands", {"mode": "global"})
+        forced = await handle_valkey_command(mock_bot, "sync_commands", {"mode": "global", "force": True})
+
+        assert first == {"success": True, "synced_count": 1, "skipped": False}
+        assert second == {"success": True, "synced_count": 0, "skipped": True}
+        assert forced["skipped"] is False
+        assert mock_bot.tree.sync.await_count == 2
+
+    async def test_sync_commands_auto_mode(self, mock_bot):
+        mock_bot.guilds = []
+        mock_bot.tree.sync = AsyncMock(return_value=[MagicMock(), MagicMock()])
+
+        result = await handle_valkey_command(mock_bot, "sync_commands", {"mode": "auto"})
+
+        assert result == {"success": True, "synced_count": 2, "skipped": False}
+        mock_bot.tree.sync.assert_awaited_once_with(guild=None)
+
     async def test_list_modules_command(self, mock_bot):
 
         mock_bot.extensions = {"modules.server_admin": MagicMock(), "modules.music": MagicMock()}
@@ -670,7 +758,10 @@ class TestTwitchEventHandler:
 
         from utils.valkey import handle_valkey_command
 
-        with patch("models.twitch.TwitchNotifications.get_all_by_streamer", side_effect=Exception("DB down")):
+        with (
+            patch("models.twitch.TwitchNotifications.get_all_by_streamer", side_effect=Exception("DB down")),
+            patch.object(mock_bot.twitch_index, "load", side_effect=Exception("DB down")),
+        ):
             result = await handle_valkey_command(
                 mock_bot,
                 "twitch_event",
@@ -683,6 +774,7 @@ class TestTwitchEventHandler:
             )
         assert result["success"] is False
         assert result["error"] == "DB error"
+        assert result["retry"] is True  # the stream entry stays pending for redelivery
 
     @pytest.mark.asyncio
     async def test_twitch_event_fetch_channel_fallback_on_not_found(self, mock_bot, db_session):
@@ -722,3 +814,337 @@ class TestTwitchEventHandler:
         assert result["success"] is True
         assert result["notified"] == 0  # channel not found, so not notified
         mock_guild.fetch_channel.assert_awaited_once_with(222)
+
+    @pytest.mark.asyncio
+    async def test_twitch_event_served_from_index_without_db(self, mock_bot):
+        from utils.strings import get_string
+        from utils.twitch_index import TwitchTarget
+        from utils.valkey import handle_twitch_event
+
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
+        for config_id, guild_id, language in ((1, 111, "de"), (2, 112, "de"), (3, 113, "en")):
+            mock_bot.twitch_index.put("shroud", TwitchTarget(config_id, guild_id, 222, None, False, language))
+        channel = AsyncMock()
+        mock_bot.get_guild.return_value.get_channel.return_value = channel
+
+        with patch("models.twitch.TwitchNotifications.get_all_by_streamer", side_effect=AssertionError("DB hit")):
+            result = await handle_twitch_event(
+                mock_bot, {"event_type": "stream.online", "broadcaster_login": "shroud", "broadcaster_name": "shroud"}
+            )
+
+        assert result == {"success": True, "notified": 3}
+        embeds = [call.kwargs["embed"] for call in channel.send.await_args_list]
+        assert len({id(embed) for embed in embeds}) == 2  # one embed per language, shared by its targets
+        assert {embed.title for embed in embeds} == {
+            get_string("de", "twitch.live_title", streamer="shroud"),
+            get_string("en", "twitch.live_title", streamer="shroud"),
+        }
+
+    async def test_twitch_event_only_notifies_owned_guilds(self, mock_bot, db_session):
+        from models.twitch import TwitchNotifications
+        from utils.sharding import ClusterPlan
+
+        mock_bot.cluster = ClusterPlan(shard_count=2, cluster_id=1, cluster_count=2)
+        mock_bot.owns_guild = mock_bot.cluster.owns
+        for guild_id in (1 << 22, 2 << 22):  # shard 1 (ours) and shard 0
+            db_session.add(
+                TwitchNotifications(
+                    GuildId=guild_id, ChannelId=guild_id, Streamer="shroud", StreamerDisplayName="shroud"
+                )
+            )
+        db_session.commit()
+        mock_guild = MagicMock()
+        mock_guild.get_channel.return_value = AsyncMock()
+        mock_bot.get_guild.return_value = mock_guild
+
+        result = await handle_valkey_command(
+            mock_bot, "twitch_event", {"event_type": "stream.online", "broadcaster_login": "shroud"}
+        )
+
+        assert result == {"success": True, "notified": 1}
+        mock_bot.get_guild.assert_called_once_with(1 << 22)
+
+
+class TestInvalidateTwitchNotification:
+    @pytest.fixture
+    def notification(self, db_session):
+        from models.twitch import TwitchNotifications
+
+        row = TwitchNotifications(GuildId=111, ChannelId=222, Streamer="shroud", StreamerDisplayName="shroud")
+        db_session.add(row)
+        db_session.commit()
+        return row
+
+    @pytest.mark.asyncio
+    async def test_reload_puts_current_row(self, mock_bot, db_session, notification):
+        from utils.valkey import handle_valkey_command
+
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
+        notification.ChannelId = 333
+        db_session.commit()
+
+        result = await handle_valkey_command(
+            mock_bot, "invalidate_twitch_notification", {"guild_id": "111", "config_id": notification.Id}
+        )
+
+        assert result == {"ok": True}
+        assert [t.channel_id for t in mock_bot.twitch_index.get("shroud")] == [333]
+
+    @pytest.mark.asyncio
+    async def test_deleted_row_is_removed(self, mock_bot, db_session, notification):
+        from utils.valkey import handle_valkey_command
+
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
+        config_id = notification.Id
+        db_session.delete(notification)
+        db_session.commit()
+
+        result = await handle_valkey_command(
+            mock_bot, "invalidate_twitch_notification", {"guild_id": 111, "config_id": config_id}
+        )
+
+        assert result == {"ok": True}
+        assert mock_bot.twitch_index.get("shroud") == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", [{"guild_id": 111}, {"guild_id": 0, "config_id": 1}, {"config_id": True}])
+    async def test_invalid_payload(self, mock_bot, payload):
+        from utils.valkey import handle_valkey_command
+
+        result = await handle_valkey_command(mock_bot, "invalidate_twitch_notification", payload)
+        assert result == {"ok": False, "error": "invalid guild_id or config_id"}
+
+    @pytest.mark.asyncio
+    async def test_reload_failure_stops_serving_from_memory(self, mock_bot, notification):
+        from sqlalchemy.exc import SQLAlchemyError
+
+        from utils.valkey import handle_valkey_command
+
+        mock_bot.twitch_index.warm(mock_bot.SESSION)
+        with patch("models.twitch.TwitchNotifications.get_by_id", side_effect=SQLAlchemyError("DB down")):
+            result = await handle_valkey_command(
+                mock_bot, "invalidate_twitch_notification", {"guild_id": 111, "config_id": notification.Id}
+            )
+
+        assert result["ok"] is False
+        assert mock_bot.twitch_index.get("shroud") is None
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, channel, message):
+        self._calls.append(("publish", channel, message))
+
+    def lpush(self, key, value):
+        self._calls.append(("lpush", key, value))
+
+    def expire(self, key, seconds):
+        self._calls.append(("expire", key, seconds))
+
+    async def execute(self):
+        self._client.batches.append(self._calls)
+
+
+class _FakeReplyClient:
+    def __init__(self):
+        self.batches: list[list[tuple]] = []
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    @property
+    def replies(self) -> dict:
+        return {
+            json.loads(call[2])["request_id"]: json.loads(call[2])["result"]
+            for batch in self.batches
+            for call in batch
+            if call[0] == "publish"
+        }
+
+
+def _cmd(request_id, command, **payload):
+    return json.dumps({"request_id": request_id, "reply_to": "nerpybot:reply:web", "command": command, **payload})
+
+
+async def _drain(runner):
+    while runner.in_flight:
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(0.01)
+
+
+class TestCommandRunner:
+    @pytest.fixture
+    def client(self):
+        return _FakeReplyClient()
+
+    @pytest.fixture
+    async def runner(self, mock_bot, client):
+        runner = CommandRunner(mock_bot, client)
+        yield runner
+        await runner.aclose()
+
+    async def test_slow_command_does_not_block_fast_one(self, runner, client):
+        async def handler(bot, command, payload):
+            if command == "search_realms":
+                await asyncio.sleep(1)
+            return {"command": command}
+
+        with patch("utils.valkey.handle_valkey_command", side_effect=handler):
+            await runner.submit(_cmd("slow", "search_realms"))
+            await runner.submit(_cmd("fast", "health_live"))
+            await asyncio.sleep(0.1)
+
+        assert client.replies == {"fast": {"command": "health_live"}}
+        assert runner.in_flight == 1
+
+    async def test_lane_limits_concurrency_per_command(self, runner):
+        running = peak = 0
+        release = asyncio.Event()
+
+        async def handler(bot, command, payload):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return {}
+
+        with patch("utils.valkey.handle_valkey_command", side_effect=handler):
+            for i in range(5):
+                await runner.submit(_cmd(str(i), "search_realms"))
+            await asyncio.sleep(0.05)
+            assert peak == COMMAND_LIMITS["search_realms"]
+            release.set()
+            await _drain(runner)
+
+        assert peak == COMMAND_LIMITS["search_realms"]
+
+    async def test_timeout_replies_with_error(self, runner, client):
+        async def handler(bot, command, payload):
+            await asyncio.sleep(10)
+
+        with (
+            patch("utils.valkey.handle_valkey_command", side_effect=handler),
+            patch("utils.valkey.DEFAULT_COMMAND_TIMEOUT", 0.02),
+        ):
+            await runner.submit(_cmd("r1", "get_roles"))
+            await _drain(runner)
+
+        assert client.replies == {"r1": {"error": "get_roles timed out"}}
+
+    async def test_handler_exception_replies_with_error(self, runner, client):
+        with patch("utils.valkey.handle_valkey_command", side_effect=RuntimeError("boom")):
+            await runner.submit(_cmd("r1", "health"))
+            await _drain(runner)
+
+        assert client.replies == {"r1": {"error": "boom"}}
+
+    async def test_replies_are_pipelined(self, runner, client):
+        with patch("utils.valkey.handle_valkey_command", AsyncMock(return_value={"ok": True})):
+            for i in range(5):
+                await runner.submit(_cmd(str(i), "health_live"))
+            await _drain(runner)
+
+        assert len(client.batches) == 1
+        assert set(client.replies) == {"0", "1", "2", "3", "4"}
+
+    async def test_legacy_reply_without_reply_to(self, runner, client):
+        with patch("utils.valkey.handle_valkey_command", AsyncMock(return_value={"ok": 1})):
+            await runner.submit(json.dumps({"request_id": "abc", "command": "health"}))
+            await _drain(runner)
+
+        assert client.batches == [[("lpush", "nerpybot:reply:abc", '{"ok": 1}'), ("expire", "nerpybot:reply:abc", 10)]]
+
+    async def test_fire_and_forget_sends_no_reply(self, runner, client):
+        with patch("utils.valkey.handle_valkey_command", AsyncMock(return_value={"ok": 1})) as handler:
+            await runner.submit(json.dumps({"command": "invalidate_modrole", "guild_id": "1"}))
+            await _drain(runner)
+
+        handler.assert_awaited_once()
+        assert client.batches == []
+
+
+def _cluster_bot(mock_bot, cluster_id):
+    from utils.sharding import ClusterPlan
+
+    mock_bot.cluster = ClusterPlan(shard_count=2, cluster_id=cluster_id, cluster_count=2)
+    mock_bot.owns_guild = mock_bot.cluster.owns
+    return mock_bot
+
+
+OWNED_BY_SECONDARY = str(1 << 22)  # shard 1
+OWNED_BY_PRIMARY = str(2 << 22)  # shard 0
+
+
+class TestRouteCommand:
+    def test_single_process_handles_everything(self, mock_bot):
+        from utils.valkey import route_command
+
+        assert route_command(mock_bot, "get_channels", {"guild_id": OWNED_BY_SECONDARY}) == (True, True)
+        assert route_command(mock_bot, "list_guilds", {}) == (True, True)
+
+    def test_guild_commands_go_to_the_owner(self, mock_bot):
+        from utils.valkey import route_command
+
+        bot = _cluster_bot(mock_bot, 1)
+
+        assert route_command(bot, "get_channels", {"guild_id": OWNED_BY_SECONDARY}) == (True, True)
+        assert route_command(bot, "get_channels", {"guild_id": OWNED_BY_PRIMARY}) == (False, False)
+        sync = {"mode": "local", "guild_ids": [OWNED_BY_SECONDARY]}
+        assert route_command(bot, "sync_commands", sync) == (True, True)
+
+    def test_other_commands_go_to_the_primary(self, mock_bot):
+        from utils.valkey import route_command
+
+        bot = _cluster_bot(mock_bot, 1)
+
+        assert route_command(bot, "list_guilds", {}) == (False, False)
+        assert route_command(bot, "sync_commands", {"mode": "global", "guild_ids": [OWNED_BY_SECONDARY]}) == (
+            False,
+            False,
+        )
+        assert route_command(bot, "module_load", {"module": "wow"}) == (True, False)
+        assert route_command(_cluster_bot(mock_bot, 0), "module_load", {"module": "wow"}) == (True, True)
+
+
+class TestClusteredCommandRunner:
+    async def test_secondary_runs_broadcasts_silently_and_ignores_the_rest(self, mock_bot):
+        client = _FakeReplyClient()
+        runner = CommandRunner(_cluster_bot(mock_bot, 1), client)
+        try:
+            with patch("utils.valkey.handle_valkey_command", AsyncMock(return_value={"ok": True})) as handler:
+                await runner.submit(_cmd("h", "health"))
+                await runner.submit(_cmd("m", "module_load", module="wow"))
+                await runner.submit(_cmd("c", "get_channels", guild_id=OWNED_BY_SECONDARY))
+                await runner.submit(_cmd("x", "get_channels", guild_id=OWNED_BY_PRIMARY))
+                await _drain(runner)
+        finally:
+            await runner.aclose()
+
+        assert sorted(call.args[1] for call in handler.await_args_list) == ["get_channels", "module_load"]
+        assert client.replies == {"c": {"ok": True}}
+
+
+class TestShardStats:
+    def test_reports_each_shard_with_its_guilds(self, mock_bot):
+        from utils.valkey import _build_shard_stats
+
+        healthy, connecting = MagicMock(latency=0.0421), MagicMock(latency=float("inf"))
+        healthy.is_closed.return_value = False
+        connecting.is_closed.return_value = True
+        mock_bot.shards = {1: connecting, 0: healthy}
+        mock_bot.guilds = [MagicMock(shard_id=0), MagicMock(shard_id=0), MagicMock(shard_id=1)]
+
+        assert _build_shard_stats(mock_bot) == [
+            {"id": 0, "latency_ms": 42.1, "closed": False, "guild_count": 2},
+            {"id": 1, "latency_ms": None, "closed": True, "guild_count": 1},
+        ]
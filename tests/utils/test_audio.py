@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from modules.music.audio import Audio, BufferKey, QueuedSong
+from modules.music.prefetch import PrefetchScheduler
 
 
 class TestQueuedSong:
@@ -43,7 +44,9 @@ def _make_audio():
     audio.paused_at = {}
     audio.now_playing_message = {}
     audio.history = defaultdict(lambda: deque(maxlen=50))
+    audio.timings = defaultdict(dict)
     audio._on_song_start_hook = None
+    audio.prefetch = PrefetchScheduler()
     return audio
 
 
@@ -346,3 +349,39 @@ class TestAudioStopAndClear:
         _attach_vc(audio, 1, _make_vc())
         audio.stop_and_clear(1)
         assert 1 in audio.lastPlayed
+
+
+class TestAudioTimings:
+    def test_queued_song_records_enqueue_time(self):
+        song = QueuedSong(channel=MagicMock(), fetcher=MagicMock(), fetch_data="url")
+        assert isinstance(song.queued_at, float)
+
+    def test_observe_records_guild_timing(self):
+        audio = _make_audio()
+        song = QueuedSong(channel=MagicMock(), fetcher=MagicMock(), fetch_data="url")
+        song.queued_at -= 2.0
+        audio._observe(1, "queue_wait", song)
+        assert audio.timings[1]["queue_wait_ms"] >= 2000
+
+    def test_observe_ignores_songs_without_enqueue_time(self):
+        audio = _make_audio()
+        audio._observe(1, "queue_wait", MagicMock())
+        assert 1 not in audio.timings
+
+    def test_guild_stats_reports_queue_and_timings(self):
+        audio = _make_audio()
+        audio._setup_buffer(1)
+        ready = QueuedSong(channel=MagicMock(), fetcher=MagicMock(), fetch_data="a")
+        ready.stream = MagicMock()
+        audio._add_to_buffer(1, ready)
+        audio._add_to_buffer(1, QueuedSong(channel=MagicMock(), fetcher=MagicMock(), fetch_data="b"))
+        audio.timings[1]["time_to_first_audio_ms"] = 1200.0
+
+        stats = audio.guild_stats(1)
+
+        assert stats == {
+            "queue_length": 2,
+            "buffered": 1,
+            "queue_wait_ms": None,
+            "time_to_first_audio_ms": 1200.0,
+        }
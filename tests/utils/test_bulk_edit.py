@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/bulk_edit.py — the shared bulk message re-render pipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from utils import bulk_edit
+from utils.bulk_edit import BulkEditStats, MessageEdit, bulk_edit_messages, is_unchanged, progress_logger
+
+
+def _not_found():
+    return discord.NotFound(MagicMock(status=404, reason="Not Found"), "Unknown Message")
+
+
+class _Channel:
+    """Channel whose messages record their edits; tracks concurrent edits per channel."""
+
+    def __init__(self, channel_id, messages, stats):
+        self.id = channel_id
+        self._messages = messages
+        self._stats = stats
+
+    async def fetch_message(self, message_id):
+        message = self._messages.get(message_id)
+        if message is None:
+            raise _not_found()
+        return message
+
+    def make_message(self, message_id, embed=None):
+        message = MagicMock(spec=discord.Message)
+        message.id = message_id
+        message.embeds = [embed] if embed is not None else []
+        message.components = []
+
+        async def edit(**kwargs):
+            self._stats["active"][self.id] = self._stats["active"].get(self.id, 0) + 1
+            self._stats["peak_channel"] = max(self._stats["peak_channel"], self._stats["active"][self.id])
+            self._stats["peak_total"] = max(self._stats["peak_total"], sum(self._stats["active"].values()))
+            await asyncio.sleep(0.01)
+            self._stats["active"][self.id] -= 1
+            self._stats["edits"].append((self.id, message_id))
+
+        message.edit = AsyncMock(side_effect=edit)
+        self._messages[message_id] = message
+        return message
+
+
+@pytest.fixture
+def world():
+    stats = {"active": {}, "peak_channel": 0, "peak_total": 0, "edits": []}
+    channels = {}
+
+    def channel(channel_id):
+        return channels.setdefault(channel_id, _Channel(channel_id, {}, stats))
+
+    bot = MagicMock()
+    bot.get_channel = lambda cid: channels.get(cid)
+    bot.fetch_channel = AsyncMock(side_effect=_not_found())
+    return bot, channel, stats
+
+
+def _embed(title):
+    return discord.Embed(title=title, description="body", colour=discord.Colour.green())
+
+
+def _render(title):
+    return lambda _message: {"embed": _embed(title)}
+
+
+class TestBulkEditMessages:
+    async def test_channels_run_in_parallel_and_each_channel_serially(self, world):
+        bot, channel, stats = world
+        edits = []
+        for channel_id in (1, 2, 3):
+            for message_id in range(3):
+                channel(channel_id).make_message(message_id)
+                edits.append(MessageEdit(channel_id, message_id, _render("new")))
+
+        result = await bulk_edit_messages(bot, edits)
+
+        assert result.edited == 9
+        assert stats["peak_channel"] == 1
+        assert stats["peak_total"] == 3
+        # Order within a channel is preserved.
+        assert [m for c, m in stats["edits"] if c == 1] == [0, 1, 2]
+
+    async def test_channel_concurrency_is_capped(self, world, monkeypatch):
+        monkeypatch.setattr(bulk_edit, "CHANNEL_CONCURRENCY", 2)
+        bot, channel, stats = world
+        edits = []
+        for channel_id in range(6):
+            channel(channel_id).make_message(1)
+            edits.append(MessageEdit(channel_id, 1, _render("new")))
+
+        await bulk_edit_messages(bot, edits)
+
+        assert stats["peak_total"] == 2
+
+    async def test_unchanged_messages_are_skipped(self, world):
+        bot, channel, stats = world
+        channel(1).make_message(1, embed=_embed("same"))
+        channel(1).make_message(2, embed=_embed("old"))
+
+        result = await bulk_edit_messages(bot, [MessageEdit(1, 1, _render("same")), MessageEdit(1, 2, _render("new"))])
+
+        assert (result.edited, result.unchanged) == (1, 1)
+        assert stats["edits"] == [(1, 2)]
+
+    async def test_missing_channels_and_messages_are_counted(self, world):
+        bot, channel, _ = world
+        channel(1).make_message(1)
+
+        result = await bulk_edit_messages(
+            bot,
+            [
+                MessageEdit(1, 1, _render("new")),
+                MessageEdit(1, 404, _render("new")),  # deleted message
+                MessageEdit(99, 1, _render("new")),  # deleted channel
+                MessageEdit(1, 1, lambda _message: None),  # nothing left to render
+            ],
+        )
+
+        assert (result.edited, result.missing, result.failed) == (1, 3, 0)
+
+    async def test_a_broken_renderer_does_not_stop_the_refresh(self, world):
+        bot, channel, _ = world
+        channel(1).make_message(1)
+        channel(1).make_message(2)
+
+        def broken(_message):
+            raise KeyError("missing translation")
+
+        result = await bulk_edit_messages(bot, [MessageEdit(1, 1, broken), MessageEdit(1, 2, _render("new"))])
+
+        assert (result.edited, result.failed) == (1, 1)
+
+    async def test_progress_is_reported_per_message(self, world):
+        bot, channel, _ = world
+        for message_id in range(3):
+            channel(1).make_message(message_id)
+        seen = []
+
+        await bulk_edit_messages(
+            bot,
+            [MessageEdit(1, m, _render("new")) for m in range(3)],
+            on_progress=lambda stats: seen.append(stats.done),
+        )
+
+        assert seen == [1, 2, 3]
+
+
+class TestIsUnchanged:
+    def test_view_labels_are_compared(self):
+        view = discord.ui.View()
+        view.add_item(discord.ui.Button(label="Bewerben", custom_id="apply"))
+        posted = MagicMock()
+        posted.embeds = [_embed("x")]
+        button = MagicMock(spec=["custom_id", "label", "disabled"], custom_id="apply", label="Apply", disabled=False)
+        button.__class__ = discord.Button
+        posted.components = [MagicMock(children=[button])]
+
+        assert not is_unchanged(posted, {"embed": _embed("x"), "view": view})
+
+    def test_other_edit_arguments_always_edit(self):
+        posted = MagicMock(embeds=[], components=[])
+        assert not is_unchanged(posted, {"content": "hi"})
+
+
+def test_progress_logger_logs_summary(caplog):
+    log = progress_logger("test refresh", every=2)
+    with caplog.at_level("INFO", logger="nerpybot"):
+        log(BulkEditStats(total=3, edited=2))
+        log(BulkEditStats(total=3, edited=2, missing=1))
+    assert "test refresh: 2/3 messages" in caplog.text
+    assert "test refresh: 2 edited, 0 unchanged, 1 missing, 0 failed" in caplog.text
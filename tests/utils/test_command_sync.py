@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/command_sync.py — hash-guarded application command sync."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from discord import Object, app_commands
+
+from models.guild import CommandTreeSync
+from utils.command_sync import GLOBAL_SCOPE, auto_sync, sync_tree, tree_hash
+
+
+def _command(name: str, description: str = "does things") -> app_commands.Command:
+    async def callback(interaction: discord.Interaction) -> None:
+        pass
+
+    return app_commands.Command(name=name, description=description, callback=callback)
+
+
+def _tree(*commands, guild=None) -> app_commands.CommandTree:
+    tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+    for command in commands:
+        tree.add_command(command, guild=guild)
+    return tree
+
+
+@pytest.fixture
+def bot(mock_bot):
+    mock_bot.tree = _tree(_command("alpha"), _command("beta"))
+    mock_bot.tree.sync = AsyncMock(
+        side_effect=lambda guild=None: [MagicMock()] * len(mock_bot.tree.get_commands(guild=guild))
+    )
+    mock_bot.guilds = []
+    return mock_bot
+
+
+class TestTreeHash:
+    async def test_independent_of_registration_order(self):
+        assert await tree_hash(_tree(_command("alpha"), _command("beta"))) == await tree_hash(
+            _tree(_command("beta"), _command("alpha"))
+        )
+
+    async def test_changes_with_the_payload(self):
+        before = await tree_hash(_tree(_command("alpha")))
+
+        assert await tree_hash(_tree(_command("alpha", description="does other things"))) != before
+
+    async def test_scopes_hash_separately(self):
+        tree = _tree(_command("alpha"))
+        tree.add_command(_command("guild-only"), guild=Object(id=1))
+
+        assert await tree_hash(tree) != await tree_hash(tree, Object(id=1))
+
+
+class TestSyncTree:
+    async def test_first_sync_pushes_and_stores_hash(self, bot, db_session):
+        assert await sync_tree(bot) == 2
+
+        bot.tree.sync.assert_awaited_once_with(guild=None)
+        assert CommandTreeSync.get_hash(GLOBAL_SCOPE, db_session) == await tree_hash(bot.tree)
+
+    async def test_unchanged_tree_is_skipped(self, bot):
+        await sync_tree(bot)
+
+        assert await sync_tree(bot) is None
+        assert bot.tree.sync.await_count == 1
+
+    async def test_force_syncs_unchanged_tree(self, bot):
+        await sync_tree(bot)
+
+        assert await sync_tree(bot, force=True) == 2
+        assert bot.tree.sync.await_count == 2
+
+    async def test_changed_tree_is_synced(self, bot):
+        await sync_tree(bot)
+        bot.tree.add_command(_command("gamma"))
+
+        assert await sync_tree(bot) == 3
+
+    async def test_failed_sync_does_not_store_hash(self, bot, db_session):
+        bot.tree.sync = AsyncMock(side_effect=discord.HTTPException(MagicMock(status=429), "rate limited"))
+
+        with pytest.raises(discord.HTTPException):
+            await sync_tree(bot)
+
+        assert CommandTreeSync.get_hash(GLOBAL_SCOPE, db_session) is None
+
+    async def test_guild_scopes_are_tracked_separately(self, bot, db_session):
+        guild = Object(id=42)
+        bot.tree.add_command(_command("local"), guild=guild)
+
+        await sync_tree(bot)
+        assert await sync_tree(bot, guild) == 1
+        assert CommandTreeSync.get_hash("42", db_session) == await tree_hash(bot.tree, guild)
+
+
+class TestAutoSync:
+    async def test_syncs_global_and_guilds_with_own_commands(self, bot):
+        with_commands, without_commands = MagicMock(id=1), MagicMock(id=2)
+        bot.guilds = [with_commands, without_commands]
+        bot.tree.add_command(_command("local"), guild=Object(id=1))
+
+        assert await auto_sync(bot) == {GLOBAL_SCOPE: 2, "1": 1}
+        assert await auto_sync(bot) == {GLOBAL_SCOPE: None, "1": None}
+
+    async def test_failing_scope_does_not_stop_the_others(self, bot):
+        bot.guilds = [MagicMock(id=1)]
+        bot.tree.add_command(_command("local"), guild=Object(id=1))
+
+        async def _sync(guild=None):
+            if guild is None:
+                raise discord.HTTPException(MagicMock(status=500), "boom")
+            return [MagicMock()]
+
+        bot.tree.sync = AsyncMock(side_effect=_sync)
+
+        assert await auto_sync(bot) == {"1": 1}
+        bot.log.error.assert_called_once()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/database.py — the debug-mode guard against sync queries on the event loop."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from utils.database import install_sync_call_guard
+
+
+@pytest.fixture
+def guarded_engine():
+    engine = create_engine("sqlite:///:memory:")
+    log = MagicMock()
+    install_sync_call_guard(engine, log)
+    yield engine, log
+    engine.dispose()
+
+
+def _query(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+class TestSyncCallGuard:
+    def test_silent_without_running_loop(self, guarded_engine):
+        engine, log = guarded_engine
+        _query(engine)
+        log.warning.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warns_on_event_loop(self, guarded_engine):
+        engine, log = guarded_engine
+        _query(engine)
+        log.warning.assert_called_once()
+        assert "SELECT 1" in log.warning.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_reports_each_call_site_once(self, guarded_engine):
+        engine, log = guarded_engine
+        for _ in range(3):
+            _query(engine)
+        assert log.warning.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_silent_in_worker_thread(self, guarded_engine):
+        engine, log = guarded_engine
+        await asyncio.to_thread(_query, engine)
+        log.warning.assert_not_called()
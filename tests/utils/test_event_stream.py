@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/event_stream.py — consumer-group delivery of web events."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from valkey.exceptions import ResponseError
+
+from utils.event_stream import CONSUMER_NAME, EventStreamConsumer
+
+STREAM = "nerpybot:events:test"
+
+
+class _FakeStreamClient:
+    """One stream with one consumer group, enough of XREADGROUP/XACK/XAUTOCLAIM for the consumer."""
+
+    def __init__(self):
+        self.entries: list[tuple[str, dict]] = []
+        self.pending: dict[str, dict] = {}
+        self._delivered = 0
+        self.groups: dict[str, dict] = {}  # name -> group info, as XINFO GROUPS reports it
+        self.consumers: dict[str, float] = {}  # name -> last seen
+        self._seq = 0
+
+    def add(self, payload, ms: int | None = None, raw: dict | None = None) -> str:
+        self._seq += 1
+        entry_id = f"{ms if ms is not None else int(time.time() * 1000)}-{self._seq}"
+        self.entries.append((entry_id, raw if raw is not None else {"data": json.dumps(payload)}))
+        return entry_id
+
+    async def xgroup_create(self, stream, group, id="$", mkstream=False):
+        if group in self.groups:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.groups[group] = {"name": group, "last-delivered-id": id}
+
+    async def xinfo_groups(self, stream):
+        return list(self.groups.values())
+
+    def _deliver(self, entry_id, consumer):
+        info = self.pending.setdefault(entry_id, {"times": 0})
+        info.update(consumer=consumer, times=info["times"] + 1, at=time.monotonic())
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        self.consumers[consumer] = time.monotonic()
+        start = streams[STREAM]
+        if start == ">":
+            batch = self.entries[self._delivered : self._delivered + count]
+            self._delivered += len(batch)
+        else:
+            batch = [e for e in self.entries if self.pending.get(e[0], {}).get("consumer") == consumer][:count]
+        if not batch:
+            await asyncio.sleep(0.001)
+            return []
+        for entry_id, _ in batch:
+            self._deliver(entry_id, consumer)
+        return [[STREAM, batch]]
+
+    async def xack(self, stream, group, *ids):
+        return sum(self.pending.pop(i, None) is not None for i in ids)
+
+    async def xautoclaim(self, stream, group, consumer, min_idle_time, start_id="0-0", count=None, justid=False):
+        now = time.monotonic()
+        self.consumers[consumer] = now
+        claimed = [
+            e for e in self.entries if e[0] in self.pending and now - self.pending[e[0]]["at"] >= min_idle_time / 1000
+        ]
+        claimed = claimed[:count]
+        for entry_id, _ in claimed:
+            self._deliver(entry_id, consumer)
+        return ["0-0", claimed, []]
+
+    async def xpending_range(self, stream, group, min, max, count, consumername=None):
+        return [
+            {"message_id": i, "consumer": p["consumer"], "time_since_delivered": 0, "times_delivered": p["times"]}
+            for i, p in self.pending.items()
+        ][:count]
+
+    async def xinfo_consumers(self, stream, group):
+        now = time.monotonic()
+        return [
+            {
+                "name": name,
+                "pending": sum(p["consumer"] == name for p in self.pending.values()),
+                "idle": int((now - seen) * 1000),
+            }
+            for name, seen in self.consumers.items()
+        ]
+
+    async def xgroup_delconsumer(self, stream, group, consumer):
+        del self.consumers[consumer]
+
+
+def _consumer(client, handler, **kwargs):
+    kwargs.setdefault("consumer", "bot-test")
+    kwargs.setdefault("claim_idle_ms", 0)
+    return EventStreamConsumer(client, STREAM, handler, **kwargs)
+
+
+class TestEventStreamConsumer:
+    async def test_delivers_and_acks(self):
+        client = _FakeStreamClient()
+        seen = []
+
+        async def handler(payload):
+            seen.append(payload["n"])
+            return True
+
+        for n in range(3):
+            client.add({"n": n})
+        consumer = _consumer(client, handler)
+        await consumer._read(">")
+
+        assert seen == [0, 1, 2]
+        assert client.pending == {}
+        assert consumer.stats["acked"] == 3
+
+    async def test_failed_entry_stays_pending_and_is_reclaimed(self):
+        client = _FakeStreamClient()
+        attempts = []
+
+        async def handler(payload):
+            attempts.append(payload)
+            return len(attempts) > 1
+
+        entry_id = client.add({"n": 1})
+        consumer = _consumer(client, handler)
+        await consumer._read(">")
+        assert entry_id in client.pending
+
+        await consumer.claim_stale()
+
+        assert len(attempts) == 2
+        assert client.pending == {}
+
+    async def test_handler_exception_counts_as_retry(self):
+        client = _FakeStreamClient()
+
+        async def handler(payload):
+            raise RuntimeError("discord down")
+
+        entry_id = client.add({"n": 1})
+        consumer = _consumer(client, handler)
+        await consumer._read(">")
+
+        assert entry_id in client.pending
+        assert consumer.stats["retried"] == 1
+
+    async def test_poison_entry_is_dropped_after_max_deliveries(self):
+        client = _FakeStreamClient()
+
+        async def handler(payload):
+            return False
+
+        client.add({"n": 1})
+        consumer = _consumer(client, handler, max_deliveries=2)
+        await consumer._read(">")
+        for _ in range(3):
+            await consumer.claim_stale()
+
+        assert client.pending == {}
+        assert consumer.stats["dead_lettered"] == 1
+
+    async def test_restart_redelivers_own_pending_entries(self):
+        client = _FakeStreamClient()
+
+        async def crash(payload):
+            raise RuntimeError("bot stopped mid-dispatch")
+
+        entry_id = client.add({"n": 1})
+        await _consumer(client, crash)._read(">")
+        assert entry_id in client.pending
+
+        seen = []
+
+        async def handler(payload):
+            seen.append(payload["n"])
+            return True
+
+        await _consumer(client, handler, claim_idle_ms=60_000)._read("0")
+
+        assert seen == [1]
+        assert client.pending == {}
+
+    async def test_old_and_malformed_entries_are_acked_without_dispatch(self):
+        client = _FakeStreamClient()
+        seen = []
+
+        async def handler(payload):
+            seen.append(payload)
+            return True
+
+        client.add({"n": 1}, ms=int(time.time() * 1000) - 3_600_000)
+        client.add(None, raw={"other": "x"})
+        client.add(None, raw={"data": "{not json"})
+        consumer = _consumer(client, handler, max_age_seconds=60)
+        await consumer._read(">")
+
+        assert seen == []
+        assert client.pending == {}
+        assert consumer.stats["expired"] == 1
+
+    async def test_batch_is_dispatched_concurrently(self):
+        client = _FakeStreamClient()
+
+        async def handler(payload):
+            await asyncio.sleep(0.1)
+            return True
+
+        for n in range(20):
+            client.add({"n": n})
+        consumer = _consumer(client, handler)
+
+        start = time.monotonic()
+        await consumer._read(">")
+
+        assert time.monotonic() - start < 0.5
+        assert consumer.stats["acked"] == 20
+
+    async def test_run_creates_group_once_and_consumes(self):
+        client = _FakeStreamClient()
+        await client.xgroup_create(STREAM, "nerpybot", id="0", mkstream=True)  # group already exists
+        seen = asyncio.Event()
+
+        async def handler(payload):
+            seen.set()
+            return True
+
+        client.add({"n": 1})
+        task = asyncio.create_task(_consumer(client, handler, claim_idle_ms=60_000).run())
+        try:
+            await asyncio.wait_for(seen.wait(), 1)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert client.pending == {}
+
+    async def test_new_group_starts_after_what_other_groups_delivered(self):
+        """Switching to cluster mode must not re-announce entries the old group already delivered."""
+        client = _FakeStreamClient()
+        await client.xgroup_create(STREAM, "nerpybot", id="0")
+        client.groups["nerpybot"]["last-delivered-id"] = "1700000000000-3"
+        await client.xgroup_create(STREAM, "nerpybot:cluster-0", id="1690000000000-9")
+
+        await _consumer(client, None, group="nerpybot:cluster-1")._ensure_group()
+
+        assert client.groups["nerpybot:cluster-1"]["last-delivered-id"] == "1700000000000-3"
+
+    async def test_first_group_reads_from_the_start(self):
+        client = _FakeStreamClient()
+
+        await _consumer(client, None)._ensure_group()
+
+        assert client.groups["nerpybot"]["last-delivered-id"] == "0"
+
+    async def test_default_name_survives_a_new_host(self):
+        """A recreated container gets a new hostname but must still find its pending entries."""
+
+        async def handler(payload):
+            return True
+
+        assert EventStreamConsumer(_FakeStreamClient(), STREAM, handler).consumer == CONSUMER_NAME
+
+    async def test_claim_removes_gone_consumers_without_pending_entries(self):
+        client = _FakeStreamClient()
+
+        async def fail(payload):
+            return False
+
+        client.add({"n": 1})
+        await _consumer(client, fail, consumer="bot-busy")._read(">")
+        client.consumers["bot-gone"] = time.monotonic() - 3600
+        client.consumers["bot-busy"] -= 3600
+
+        async def handler(payload):
+            return False
+
+        consumer = _consumer(client, handler, claim_idle_ms=60_000)
+        await consumer._read(">")
+        await consumer.claim_stale()
+
+        assert "bot-gone" not in client.consumers
+        assert "bot-busy" in client.consumers  # its entry is not idle long enough to be claimed yet
+        assert consumer.consumer in client.consumers
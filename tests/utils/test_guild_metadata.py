@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/guild_metadata.py — bot-pushed guild channel/role snapshot."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils import guild_metadata
+from utils.guild_metadata import GuildMetadataPublisher
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self._client = client
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        if self._client.fail:
+            self._client.fail -= 1
+            raise ConnectionError("valkey down")
+        self._client.batches.append(self.calls)
+
+
+class _Client:
+    def __init__(self, fail=0):
+        self.batches = []
+        self.fail = fail
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def calls(self, name):
+        return [call for batch in self.batches for call in batch if call[0] == name]
+
+
+def _guild(guild_id=1):
+    guild = SimpleNamespace(id=guild_id)
+    guild.channels = [SimpleNamespace(id=10, name="general", type=SimpleNamespace(value=0), guild=guild)]
+    everyone = MagicMock(id=guild_id, position=0, guild=guild)
+    everyone.name = "@everyone"
+    everyone.is_default.return_value = True
+    mod = MagicMock(id=20, position=3, guild=guild)
+    mod.name = "Mod"
+    mod.is_default.return_value = False
+    guild.roles = [everyone, mod]
+    return guild
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestGuildMetadataPublisher:
+    async def test_detached_publisher_ignores_changes(self):
+        publisher = GuildMetadataPublisher(lambda gid: None)
+        publisher.put_channel(_guild().channels[0])  # must not raise
+        assert not publisher.attached
+
+    async def test_attach_publishes_full_snapshot(self):
+        client = _Client()
+        publisher = GuildMetadataPublisher(lambda gid: None)
+
+        publisher.attach(client, [_guild()])
+        await _settle()
+
+        (hset_channels, hset_roles, *_) = client.calls("hset")
+        assert hset_channels[1] == ("nerpybot:guild:1:channels",)
+        assert hset_channels[2]["mapping"] == {"10": json.dumps({"name": "general", "type": 0})}
+        assert hset_roles[2]["mapping"] == {"20": json.dumps({"name": "Mod", "position": 3})}
+        assert client.calls("hincrby") == [("hincrby", ("nerpybot:guild:1:meta", "version", 1), {})]
+        publisher.detach()
+
+    async def test_incremental_changes_keep_event_order(self):
+        client = _Client()
+        guild = _guild()
+        publisher = GuildMetadataPublisher(lambda gid: None)
+        publisher.attach(client, [])
+        channel = guild.channels[0]
+
+        publisher.put_channel(channel)
+        publisher.remove_channel(channel)
+        publisher.put_role(guild.roles[0])  # @everyone is never published
+        publisher.forget_guild(guild.id)
+        await _settle()
+
+        ops = [name for batch in client.batches for name, *_ in batch if name in ("hset", "hdel", "delete")]
+        assert ops == ["hset", "hset", "hdel", "hset", "delete"]  # (meta "updated" follows each change)
+        assert len(client.batches) == 1
+        publisher.detach()
+
+    async def test_failed_batch_is_rewritten_in_full(self, monkeypatch):
+        monkeypatch.setattr(guild_metadata, "_RETRY_DELAY", 0)
+        client = _Client(fail=1)
+        guild = _guild()
+        publisher = GuildMetadataPublisher({guild.id: guild}.get)
+        publisher.attach(client, [])
+
+        publisher.remove_channel(guild.channels[0])
+        await _settle()
+
+        assert len(client.batches) == 1
+        mappings = [call[2].get("mapping") for call in client.calls("hset")]
+        assert {"10": json.dumps({"name": "general", "type": 0})} in mappings
+        publisher.detach()
+
+    @pytest.mark.parametrize("guild_known", [True, False])
+    async def test_stale_guild_that_left_is_forgotten(self, monkeypatch, guild_known):
+        monkeypatch.setattr(guild_metadata, "_RETRY_DELAY", 0)
+        client = _Client(fail=1)
+        guild = _guild()
+        publisher = GuildMetadataPublisher(lambda gid: guild if guild_known else None)
+        publisher.attach(client, [])
+
+        publisher.put_channel(guild.channels[0])
+        await _settle()
+
+        assert bool(client.calls("delete")) is True  # full snapshot deletes first; forget deletes all keys
+        assert bool(client.calls("hincrby")) is guild_known
+        publisher.detach()
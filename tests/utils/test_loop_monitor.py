@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/loop_monitor.py — event-loop lag probe and stall watchdog."""
+
+import asyncio
+import time
+
+from utils.loop_monitor import LoopMonitor, create_loop_monitor
+
+
+def _blocking_call(seconds):
+    time.sleep(seconds)  # stands in for a sync DB session or a YAML load on the loop
+
+
+async def _run(monitor, seconds):
+    monitor.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        monitor.stop()
+
+
+class TestLoopMonitor:
+    async def test_idle_loop_records_lag_without_stalls(self):
+        monitor = LoopMonitor(interval=0.01, threshold=0.2)
+        await _run(monitor, 0.1)
+
+        snap = monitor.snapshot()
+        assert snap["lag"]["count"] >= 3
+        assert snap["stall_count"] == 0
+        assert snap["recent_stalls"] == []
+
+    async def test_stall_is_recorded_with_the_blocking_stack(self, caplog):
+        monitor = LoopMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            _blocking_call(0.3)
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+
+        assert monitor.stall_count == 1
+        stall = monitor.snapshot()["recent_stalls"][0]
+        assert stall["blocked_ms"] >= 250
+        assert any("_blocking_call" in line for line in stall["stack"])
+        assert "Event loop blocked" in caplog.text
+
+    async def test_live_snapshot_leaves_out_stalls(self):
+        monitor = LoopMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            _blocking_call(0.1)
+            await asyncio.sleep(0.03)
+        finally:
+            monitor.stop()
+
+        snap = monitor.snapshot(stalls=False)
+        assert snap["stall_count"] == 1
+        assert snap["recent_stalls"] == []
+
+    async def test_stop_ends_probe_and_watchdog(self):
+        monitor = LoopMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        watchdog = monitor._watchdog
+        monitor.stop()
+        await asyncio.sleep(0.05)
+
+        assert not monitor.running
+        assert not watchdog.is_alive()
+
+
+class TestCreateLoopMonitor:
+    def test_disabled_by_default(self):
+        assert create_loop_monitor({"bot": {}}) is None
+        assert create_loop_monitor({"bot": {"loop_monitor": {"enabled": False}}}) is None
+
+    def test_settings_are_read_in_milliseconds(self):
+        monitor = create_loop_monitor({"bot": {"loop_monitor": {"enabled": True, "threshold_ms": 100}}})
+        assert (monitor.interval, monitor.threshold) == (0.5, 0.1)
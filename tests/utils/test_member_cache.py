@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/member_cache.py — which guilds are chunked and how single members are looked up."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from discord import DiscordException, NotFound
+
+from models.moderation import AutoKicker
+from models.reactionrole import ReactionRoleMessage
+from utils.member_cache import QUERY_BATCH, MemberCache, create_member_cache, member_guild_ids
+
+
+def _member(guild_id: int, user_id: int) -> MagicMock:
+    member = MagicMock()
+    member.id = user_id
+    member.guild.id = guild_id
+    return member
+
+
+def _guild(guild_id: int = 1, chunked: bool = False, members: dict | None = None) -> MagicMock:
+    members = members or {}
+    guild = MagicMock()
+    guild.id = guild_id
+    guild.name = f"guild {guild_id}"
+    guild.chunked = chunked
+    guild.members = list(members.values())
+    guild.get_member = MagicMock(side_effect=members.get)
+    guild.chunk = AsyncMock()
+    guild.fetch_member = AsyncMock(side_effect=lambda user_id: _member(guild_id, user_id))
+    guild.query_members = AsyncMock(
+        side_effect=lambda user_ids, limit, cache: [_member(guild_id, user_id) for user_id in user_ids]
+    )
+    return guild
+
+
+class TestMemberGuildIds:
+    def test_enabled_autokickers_and_reaction_roles(self, db_session):
+        db_session.add_all(
+            [
+                AutoKicker(GuildId=1, KickAfter=3600, Enabled=True),
+                AutoKicker(GuildId=2, KickAfter=3600, Enabled=False),
+                AutoKicker(GuildId=3, KickAfter=0, Enabled=True),
+                ReactionRoleMessage(GuildId=4, ChannelId=10, MessageId=100),
+                ReactionRoleMessage(GuildId=4, ChannelId=10, MessageId=101),
+            ]
+        )
+        db_session.commit()
+
+        assert member_guild_ids(db_session) == {1, 4}
+
+
+class TestChunking:
+    @pytest.mark.asyncio
+    async def test_chunks_only_wanted_unchunked_guilds(self):
+        cache = MemberCache()
+        cache.set_wanted({1, 2})
+        wanted, done, other = _guild(1), _guild(2, chunked=True), _guild(3)
+
+        assert await cache.chunk_wanted([wanted, done, other]) == 1
+
+        wanted.chunk.assert_awaited_once()
+        done.chunk.assert_not_awaited()
+        other.chunk.assert_not_awaited()
+        assert cache.last_startup["guilds"] == 1
+        assert cache.chunk_time.snapshot()["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_skipped(self):
+        cache = MemberCache()
+        cache.set_wanted({1, 2})
+        failing, ok = _guild(1), _guild(2)
+        failing.chunk.side_effect = DiscordException("gateway closed")
+
+        assert await cache.chunk_wanted([failing, ok]) == 1
+        ok.chunk.assert_awaited_once()
+
+    def test_modes(self):
+        assert MemberCache("all").chunk_at_startup
+        assert not MemberCache().chunk_at_startup
+        lazy = MemberCache("lazy")
+        lazy.set_wanted({1})
+        assert not lazy.wants(1)
+        with pytest.raises(ValueError, match="bot.member_cache.chunking"):
+            MemberCache("some")
+
+    def test_from_config(self):
+        cache = create_member_cache({"bot": {"member_cache": {"chunking": "lazy", "lookup_cache_size": "5"}}})
+        assert (cache.chunking, cache.lookup_size) == ("lazy", 5)
+        assert create_member_cache({"bot": {}}).chunking == "selective"
+
+
+class TestLookups:
+    @pytest.mark.asyncio
+    async def test_get_member_fetches_once_then_hits_the_lru(self):
+        cache = MemberCache()
+        guild = _guild()
+
+        first = await cache.get_member(guild, 42)
+        second = await cache.get_member(guild, 42)
+
+        assert first is second
+        guild.fetch_member.assert_awaited_once_with(42)
+        assert cache.snapshot([guild])["lookup_cache"] == {"size": 1, "max_size": 1000, "hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_member_trusts_a_chunked_guild(self):
+        cache = MemberCache()
+        guild = _guild(chunked=True)
+
+        assert await cache.get_member(guild, 42) is None
+        guild.fetch_member.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_member_not_found(self):
+        cache = MemberCache()
+        guild = _guild()
+        guild.fetch_member.side_effect = NotFound(MagicMock(status=404), "Unknown Member")
+
+        assert await cache.get_member(guild, 42) is None
+        assert cache.snapshot([guild])["lookup_cache"]["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_is_bounded_and_expires(self):
+        cache = MemberCache(lookup_size=2, lookup_ttl=0)
+        guild = _guild()
+        for user_id in (1, 2, 3):
+            await cache.get_member(guild, user_id)
+
+        assert list(cache._lookups) == [(1, 2), (1, 3)]
+        await cache.get_member(guild, 3)  # expired at once with a zero TTL
+        assert guild.fetch_member.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_get_members_batches_gateway_queries(self):
+        cache = MemberCache()
+        cached = _member(1, 0)
+        guild = _guild(members={0: cached})
+        user_ids = list(range(QUERY_BATCH + 51))
+
+        found = await cache.get_members(guild, user_ids + [5])
+
+        assert sorted(found) == user_ids
+        assert found[0] is cached
+        assert [len(call.kwargs["user_ids"]) for call in guild.query_members.await_args_list] == [QUERY_BATCH, 50]
+        assert all(call.kwargs["cache"] is False for call in guild.query_members.await_args_list)
+
+        await cache.get_members(guild, [1, 2])
+        assert guild.query_members.await_count == 2  # both answered from the LRU
+
+    @pytest.mark.asyncio
+    async def test_get_members_stops_on_timeout(self):
+        cache = MemberCache()
+        guild = _guild()
+        guild.query_members.side_effect = TimeoutError
+
+        assert await cache.get_members(guild, list(range(QUERY_BATCH * 2))) == {}
+        guild.query_members.assert_awaited_once()
+
+
+class TestSnapshot:
+    def test_counts_chunked_guilds_and_members(self):
+        cache = MemberCache()
+        cache.set_wanted({1})
+        guilds = [_guild(1, chunked=True, members={1: _member(1, 1), 2: _member(1, 2)}), _guild(2)]
+
+        snapshot = cache.snapshot(guilds)
+
+        assert snapshot["chunking"] == "selective"
+        assert (snapshot["guilds"], snapshot["chunked_guilds"], snapshot["wanted_guilds"]) == (2, 1, 1)
+        assert snapshot["cached_members"] == 2
+        assert snapshot["startup"] is None
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/metrics.py — fixed-bucket latency histogram and the bot-wide registry."""
+
+import pytest
+
+from utils.metrics import METRICS, Histogram, MetricsRegistry, instrumented_loop
+
+
+class TestHistogram:
+    def test_empty_snapshot(self):
+        assert Histogram().snapshot() == {
+            "count": 0,
+            "avg_ms": None,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "max_ms": None,
+            "last_ms": None,
+        }
+
+    def test_observations_are_summarized(self):
+        h = Histogram(buckets=(0.1, 1.0, 10.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            h.observe(value)
+        snap = h.snapshot()
+        assert snap["count"] == 4
+        assert snap["avg_ms"] == pytest.approx(1400.0)
+        assert snap["p50_ms"] == 100.0
+        assert snap["p95_ms"] == 5000.0  # capped at the observed max, not the 10 s bucket bound
+        assert snap["p99_ms"] == 5000.0
+        assert snap["max_ms"] == 5000.0
+        assert snap["last_ms"] == 5000.0
+
+    def test_values_above_largest_bucket(self):
+        h = Histogram(buckets=(1.0,))
+        h.observe(42.0)
+        assert h.snapshot()["p50_ms"] == 42000.0
+
+    def test_negative_values_are_clamped(self):
+        h = Histogram()
+        h.observe(-1.0)
+        assert h.snapshot()["max_ms"] == 0.0
+
+    def test_time_context_records_even_on_error(self):
+        h = Histogram()
+        with pytest.raises(RuntimeError):
+            with h.time():
+                raise RuntimeError("boom")
+        assert h.snapshot()["count"] == 1
+
+
+class TestMetricsRegistry:
+    def test_histograms_and_counters_are_created_on_first_use(self):
+        registry = MetricsRegistry()
+        registry.observe("command", "reminder create", 0.2)
+        registry.observe("command", "reminder create", 0.4)
+        registry.incr("command_errors", "reminder create")
+
+        snap = registry.snapshot()
+        assert snap["histograms"]["command"]["reminder create"]["count"] == 2
+        assert snap["counters"] == {"command_errors": {"reminder create": 1}}
+        assert registry.histogram("command", "reminder create") is registry.histogram("command", "reminder create")
+
+    def test_empty_snapshot(self):
+        assert MetricsRegistry().snapshot() == {"histograms": {}, "counters": {}}
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.observe("loop", "reminder", 0.1)
+        registry.incr("loop_items", "reminder", 3)
+        registry.reset()
+        assert registry.counter("loop_items", "reminder") == 0
+        assert registry.snapshot() == {"histograms": {}, "counters": {}}
+
+
+class TestInstrumentedLoop:
+    @pytest.fixture(autouse=True)
+    def _clean_registry(self):
+        METRICS.reset()
+        yield
+        METRICS.reset()
+
+    async def test_records_duration_and_work_count(self):
+        @instrumented_loop("test_loop")
+        async def tick():
+            return 3
+
+        assert await tick() == 3
+        await tick()
+
+        assert METRICS.snapshot()["histograms"]["loop"]["test_loop"]["count"] == 2
+        assert METRICS.counter("loop_iterations", "test_loop") == 2
+        assert METRICS.counter("loop_items", "test_loop") == 6
+
+    async def test_iteration_without_work_count(self):
+        @instrumented_loop("test_loop")
+        async def tick():
+            pass
+
+        await tick()
+
+        assert METRICS.counter("loop_iterations", "test_loop") == 1
+        assert METRICS.snapshot()["counters"].get("loop_items") is None
+
+    async def test_failed_iteration_is_counted_and_reraised(self):
+        @instrumented_loop("test_loop")
+        async def tick():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await tick()
+
+        assert METRICS.counter("loop_errors", "test_loop") == 1
+        assert METRICS.snapshot()["histograms"]["loop"]["test_loop"]["count"] == 1
+
+    async def test_works_under_tasks_loop(self):
+        from discord.ext import tasks
+
+        class Cog:
+            @tasks.loop(seconds=60)
+            @instrumented_loop("test_loop")
+            async def _loop(self):
+                return 2
+
+        cog = Cog()
+        assert await cog._loop.coro(cog) == 2
+        assert METRICS.counter("loop_items", "test_loop") == 2
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/resource_versions.py — change tracking and the bot-side counter writer."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+
+from sqlalchemy import delete
+
+from utils import resource_versions
+from utils.resource_versions import EPOCH_KEY, ResourceVersionPublisher, pop_changed_resources, version_key
+
+
+def _reminder(guild_id=1):
+    from models.reminder import ReminderMessage
+
+    return ReminderMessage(
+        GuildId=guild_id,
+        ChannelId=10,
+        CreateDate=datetime.now(UTC),
+        Message="hi",
+        Enabled=True,
+        NextFire=datetime.now(UTC),
+        ScheduleType="interval",
+        IntervalSeconds=60,
+    )
+
+
+class TestChangeTracking:
+    def test_flush_records_guild_of_new_modified_and_deleted_rows(self, db_session):
+        reminder = _reminder(guild_id=1)
+        db_session.add_all([reminder, _reminder(guild_id=2)])
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("reminders", 1), ("reminders", 2)}
+
+        reminder.Message = "changed"
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("reminders", 1)}
+
+        db_session.delete(reminder)
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("reminders", 1)}
+        assert pop_changed_resources(db_session) == set()
+
+    def test_untracked_and_unmodified_rows_are_ignored(self, db_session):
+        from models.guild import GuildLanguageConfig
+
+        reminder = _reminder()
+        db_session.add_all([reminder, GuildLanguageConfig(GuildId=1, Language="de")])
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("reminders", 1)}
+
+        reminder.Message = reminder.Message  # no net change
+        db_session.commit()
+        assert pop_changed_resources(db_session) == set()
+
+    def test_child_rows_resolve_their_guild_through_the_parent(self, db_session):
+        from models.application import ApplicationForm, ApplicationQuestion
+
+        form = ApplicationForm(GuildId=7, Name="Apply")
+        db_session.add(form)
+        db_session.commit()
+        pop_changed_resources(db_session)
+
+        db_session.add(ApplicationQuestion(FormId=form.Id, QuestionText="Why?", SortOrder=1))
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("application_forms", 7)}
+
+    def test_child_with_parent_not_loaded_bumps_resource_wide(self, db_session):
+        from models.application import ApplicationForm, ApplicationQuestion
+
+        form = ApplicationForm(GuildId=7, Name="Apply")
+        db_session.add(form)
+        db_session.commit()
+        form_id = form.Id
+        db_session.expunge_all()
+        pop_changed_resources(db_session)
+
+        db_session.add(ApplicationQuestion(FormId=form_id, QuestionText="Why?", SortOrder=1))
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("application_forms", None)}
+
+    def test_bulk_statements_bump_resource_wide(self, db_session):
+        from models.wow import CraftingRecipeCache
+
+        db_session.execute(delete(CraftingRecipeCache))
+        db_session.commit()
+        assert pop_changed_resources(db_session) == {("recipe_cache", None)}
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value):
+        self._calls.append(("set", key, value))
+
+    def incr(self, key):
+        self._calls.append(("incr", key))
+
+    async def execute(self):
+        if self._client.fail:
+            self._client.fail -= 1
+            raise ConnectionError("valkey down")
+        self._client.calls.extend(self._calls)
+        self._client.executed.set()
+
+
+class _FakeClient:
+    def __init__(self, fail=0):
+        self.calls = []
+        self.fail = fail
+        self.executed = asyncio.Event()
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+async def _flush(client):
+    await asyncio.wait_for(client.executed.wait(), 1)
+    client.executed.clear()
+
+
+class TestResourceVersionPublisher:
+    async def test_attach_starts_epoch_then_increments(self):
+        client = _FakeClient()
+        publisher = ResourceVersionPublisher()
+        publisher.attach(client)
+        try:
+            await _flush(client)
+            assert [c[:2] for c in client.calls] == [("set", EPOCH_KEY)]
+
+            publisher.publish({("reminders", 1), ("recipe_cache", None)})
+            await _flush(client)
+            assert sorted(client.calls[1:]) == [
+                ("incr", version_key("recipe_cache")),
+                ("incr", version_key("reminders", 1)),
+            ]
+        finally:
+            publisher.detach()
+
+    async def test_publish_from_a_worker_thread(self):
+        client = _FakeClient()
+        publisher = ResourceVersionPublisher()
+        publisher.attach(client)
+        try:
+            await _flush(client)
+            thread = threading.Thread(target=publisher.publish, args=({("reminders", 3)},))
+            thread.start()
+            thread.join()
+            await _flush(client)
+            assert client.calls[-1] == ("incr", "nerpybot:version:reminders:3")
+        finally:
+            publisher.detach()
+
+    async def test_failed_write_retries_with_a_new_epoch(self, monkeypatch):
+        monkeypatch.setattr(resource_versions, "_RETRY_DELAY", 0)
+        client = _FakeClient(fail=1)
+        publisher = ResourceVersionPublisher()
+        publisher.attach(client)
+        try:
+            await _flush(client)
+            publisher.publish({("reminders", 1)})
+            await _flush(client)
+            assert client.calls[-1] == ("incr", version_key("reminders", 1))
+            assert [c[0] for c in client.calls].count("set") == 1
+        finally:
+            publisher.detach()
+
+    def test_publish_while_detached_is_dropped(self):
+        publisher = ResourceVersionPublisher()
+        publisher.publish({("reminders", 1)})
+        assert not publisher.attached
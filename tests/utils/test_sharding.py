@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/sharding.py — shard ranges, guild ownership and the SQL guild filter."""
+
+import pytest
+
+from models.guild import BotGuild
+from utils.sharding import ClusterPlan, cluster_shard_ids, plan_from_config, shard_id_for
+
+
+def _guild_on_shard(shard_id: int, shard_count: int, salt: int = 0) -> int:
+    """Return a guild ID Discord routes to *shard_id*."""
+    return ((shard_id + salt * shard_count) << 22) | 12345
+
+
+class TestShardLayout:
+    def test_shard_id_uses_the_timestamp_bits(self):
+        assert shard_id_for(_guild_on_shard(3, 8), 8) == 3
+        assert shard_id_for(_guild_on_shard(3, 8, salt=5), 8) == 3
+
+    @pytest.mark.parametrize(("shard_count", "cluster_count"), [(1, 1), (4, 2), (10, 3), (16, 16)])
+    def test_cluster_ranges_cover_every_shard_once(self, shard_count, cluster_count):
+        ranges = [cluster_shard_ids(shard_count, i, cluster_count) for i in range(cluster_count)]
+
+        assert sorted(s for shard_ids in ranges for s in shard_ids) == list(range(shard_count))
+        assert all(shard_ids == list(range(shard_ids[0], shard_ids[-1] + 1)) for shard_ids in ranges)
+        assert max(map(len, ranges)) - min(map(len, ranges)) <= 1
+
+
+class TestClusterPlan:
+    def test_single_process_owns_everything(self):
+        plan = ClusterPlan()
+
+        assert not plan.clustered
+        assert plan.primary
+        assert plan.shard_ids is None
+        assert plan.owns(_guild_on_shard(5, 8))
+        assert plan.guild_filter(BotGuild.GuildId) is None
+
+    def test_each_guild_has_exactly_one_owner(self):
+        plans = [ClusterPlan(shard_count=8, cluster_id=i, cluster_count=3) for i in range(3)]
+
+        for shard_id in range(8):
+            guild_id = _guild_on_shard(shard_id, 8, salt=shard_id)
+            assert [plan.owns(guild_id) for plan in plans].count(True) == 1
+        assert [plan.primary for plan in plans] == [True, False, False]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"cluster_count": 2},  # no fixed shard count
+            {"shard_count": 4, "cluster_id": 2, "cluster_count": 2},
+            {"shard_count": 1, "cluster_count": 2},
+            {"cluster_count": 0},
+        ],
+    )
+    def test_invalid_layouts_are_rejected(self, kwargs):
+        with pytest.raises(ValueError, match="bot.sharding"):
+            ClusterPlan(**kwargs)
+
+    def test_guild_filter_matches_owns(self, db_session):
+        guild_ids = [_guild_on_shard(s, 4, salt=n) for s in range(4) for n in range(3)]
+        BotGuild.sync(guild_ids, db_session)
+        plan = ClusterPlan(shard_count=4, cluster_id=1, cluster_count=2)
+
+        rows = db_session.query(BotGuild.GuildId).filter(plan.guild_filter(BotGuild.GuildId))
+
+        assert sorted(row[0] for row in rows) == sorted(g for g in guild_ids if plan.owns(g))
+        assert len({shard_id_for(row[0], 4) for row in rows}) == 2
+
+    def test_from_config(self):
+        assert plan_from_config({"bot": {}}) == ClusterPlan()
+        plan = plan_from_config({"bot": {"sharding": {"shard_count": "6", "cluster_id": "2", "cluster_count": "3"}}})
+        assert plan.shard_ids == [4, 5]
+        assert plan.describe() == {"id": 2, "count": 3, "shard_count": 6, "shard_ids": [4, 5]}
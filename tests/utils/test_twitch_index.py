@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Tests for utils/twitch_index.py — in-memory streamer → notification index."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils import twitch_index
+from utils.twitch_index import SendBudget, TwitchNotificationIndex, TwitchTarget
+
+
+def _target(config_id, guild_id=1, channel_id=10, language="en"):
+    return TwitchTarget(config_id, guild_id, channel_id, None, False, language)
+
+
+@pytest.fixture
+def session_factory(db_session):
+    db_session.close = MagicMock()  # the factory hands out the shared test session
+    return MagicMock(return_value=db_session)
+
+
+class TestTwitchNotificationIndex:
+    def test_unwarmed_index_cannot_answer(self):
+        index = TwitchNotificationIndex()
+        index.put("shroud", _target(1))
+        assert index.get("shroud") is None
+
+    def test_warm_loads_configs_with_guild_language(self, db_session, session_factory):
+        from models.guild import GuildLanguageConfig
+        from models.twitch import TwitchNotifications
+
+        db_session.add_all(
+            [
+                TwitchNotifications(GuildId=1, ChannelId=10, Streamer="shroud", StreamerDisplayName="shroud"),
+                TwitchNotifications(GuildId=2, ChannelId=20, Streamer="shroud", StreamerDisplayName="shroud"),
+                TwitchNotifications(GuildId=2, ChannelId=20, Streamer="ninja", StreamerDisplayName="ninja"),
+                GuildLanguageConfig(GuildId=2, Language="de"),
+            ]
+        )
+        db_session.commit()
+        index = TwitchNotificationIndex()
+
+        index.warm(session_factory)
+
+        assert sorted((t.guild_id, t.language) for t in index.get("shroud")) == [(1, "en"), (2, "de")]
+        assert len(index.get("ninja")) == 1
+        assert index.get("nobody") == []
+
+    def test_put_moves_config_between_streamers_and_remove_drops_it(self, session_factory):
+        index = TwitchNotificationIndex()
+        index.warm(session_factory)
+
+        index.put("shroud", _target(1))
+        index.put("ninja", _target(1, channel_id=11))
+        assert index.get("shroud") == []
+        assert [t.channel_id for t in index.get("ninja")] == [11]
+
+        index.remove(1)
+        index.remove(1)  # unknown ids are ignored
+        assert index.get("ninja") == [] and len(index) == 0
+
+    def test_set_language_only_touches_that_guild(self, session_factory):
+        index = TwitchNotificationIndex()
+        index.warm(session_factory)
+        index.put("shroud", _target(1, guild_id=1))
+        index.put("shroud", _target(2, guild_id=2))
+
+        index.set_language(2, "de")
+
+        assert {t.guild_id: t.language for t in index.get("shroud")} == {1: "en", 2: "de"}
+
+    async def test_rewarm_after_invalidate_is_rate_limited(self, session_factory, monkeypatch):
+        index = TwitchNotificationIndex()
+        load = MagicMock(side_effect=TwitchNotificationIndex.load)
+        monkeypatch.setattr(index, "load", load)
+        index.invalidate()
+
+        await index.try_rewarm(session_factory)
+        index.invalidate()
+        await index.try_rewarm(session_factory)  # within the cooldown
+        assert load.call_count == 1
+
+        monkeypatch.setattr(twitch_index, "_REWARM_COOLDOWN", 0)
+        await index.try_rewarm(session_factory)
+        assert load.call_count == 2 and index.warmed
+
+    async def test_changes_during_a_threaded_warm_are_kept(self, db_session, session_factory, monkeypatch):
+        """/twitch add or remove while the rows are read must not be overwritten by the older snapshot."""
+        from models.twitch import TwitchNotifications
+
+        old = TwitchNotifications(GuildId=1, ChannelId=10, Streamer="shroud", StreamerDisplayName="shroud")
+        db_session.add(old)
+        db_session.commit()
+        index = TwitchNotificationIndex()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_load(factory):
+            entries = TwitchNotificationIndex.load(factory)
+            started.set()
+            release.wait(5)
+            return entries
+
+        monkeypatch.setattr(index, "load", slow_load)
+        warm = asyncio.create_task(index.warm_async(session_factory))
+        await asyncio.to_thread(started.wait, 5)
+        index.put("ninja", _target(99, guild_id=2))
+        index.remove(old.Id)
+        index.set_language(2, "de")
+        release.set()
+        await warm
+
+        assert index.warmed
+        assert index.get("shroud") == []
+        assert [(t.config_id, t.language) for t in index.get("ninja")] == [(99, "de")]
+
+        # changes after the warm are no longer journaled
+        index.put("ninja", _target(100))
+        assert index._journals == []
+
+
+class TestSendBudget:
+    async def test_same_channel_is_serialized_and_channels_run_in_parallel(self):
+        budget = SendBudget(10)
+        active: dict[int, int] = {}
+        peak = {"per_channel": 0, "total": 0}
+
+        async def send(channel_id):
+            async with budget.slot(channel_id):
+                active[channel_id] = active.get(channel_id, 0) + 1
+                peak["per_channel"] = max(peak["per_channel"], active[channel_id])
+                peak["total"] = max(peak["total"], sum(active.values()))
+                await asyncio.sleep(0.01)
+                active[channel_id] -= 1
+
+        await asyncio.gather(*(send(channel_id) for channel_id in (1, 1, 1, 2, 3)))
+
+        assert peak == {"per_channel": 1, "total": 3}
+
+    async def test_total_concurrency_is_capped(self):
+        budget = SendBudget(2)
+        running = 0
+        peak = 0
+
+        async def send(channel_id):
+            nonlocal running, peak
+            async with budget.slot(channel_id):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(send(channel_id) for channel_id in range(6)))
+
+        assert peak == 2
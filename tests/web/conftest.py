@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "NerdyPy"))
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from db_helpers import create_test_engine
+from db_helpers import SyncBackedAsyncSession, create_test_engine
 
 
 @pytest.fixture
@@ -59,13 +59,37 @@ def web_config():
     )
 
 
+def make_async_session_override(session_factory, valkey=None):
+    """Build a ``get_async_db_session`` override that runs on the shared synchronous test engine.
+
+    With *valkey*, committed changes bump the resource versions like the app's own dependency.
+    """
+    from utils.resource_versions import pop_changed_resources
+
+    async def override_async_session():
+        session = SyncBackedAsyncSession(session_factory())
+        try:
+            yield session
+            await session.commit()
+            if valkey is not None:
+                valkey.bump_resource_versions(pop_changed_resources(session))
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    return override_async_session
+
+
 @pytest.fixture
 def client(web_db_engine, web_config, fake_valkey):
     """FastAPI TestClient with overridden dependencies."""
     from fastapi.testclient import TestClient
 
+    from utils.resource_versions import pop_changed_resources
     from web.app import create_app
-    from web.dependencies import get_db_session
+    from web.dependencies import get_async_db_session, get_db_session
 
     app = create_app(web_config, fake_valkey)
     test_session_factory = sessionmaker(bind=web_db_engine, expire_on_commit=False)
@@ -75,6 +99,7 @@ def client(web_db_engine, web_config, fake_valkey):
         try:
             yield session
             session.commit()
+            fake_valkey.bump_resource_versions(pop_changed_resources(session))
         except Exception:
             session.rollback()
             raise
@@ -82,6 +107,7 @@ def client(web_db_engine, web_config, fake_valkey):
             session.close()
 
     app.dependency_overrides[get_db_session] = override_session
+    app.dependency_overrides[get_async_db_session] = make_async_session_override(test_session_factory, fake_valkey)
 
     with TestClient(app) as tc:
         yield tc
@@ -106,10 +132,12 @@ def clear_web_caches():
     from web.dependencies import invalidate_premium_cache
     from web.routes.auth import _bot_guild_ids_cache
     from web.routes.guilds import _guild_lang_cache
+    from web.routes.operator import _recipe_page_cache
 
     invalidate_premium_cache()
     _bot_guild_ids_cache.clear()
     _guild_lang_cache.clear()
+    _recipe_page_cache.clear()
     yield
 
 
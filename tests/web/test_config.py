@@ -116,6 +116,25 @@ class TestWebConfigFromEnv:
             cfg = WebConfig.from_env()
 
         assert cfg.db_connection_string == "sqlite:///db.db"
+        assert cfg.async_db_connection_string == "sqlite+aiosqlite:///db.db"
+
+    def test_async_db_connection_string_postgresql_unchanged(self):
+        """psycopg provides the async dialect too, so PostgreSQL URLs are shared."""
+        from web.config import WebConfig
+
+        env = {
+            "NERPYBOT_WEB_CLIENT_ID": "123",
+            "NERPYBOT_WEB_OPS": "1",
+            "NERPYBOT_WEB_CLIENT_SECRET": "s",
+            "NERPYBOT_WEB_JWT_SECRET": "j",
+            "NERPYBOT_DB_TYPE": "postgresql",
+            "NERPYBOT_DB_NAME": "mydb",
+            "NERPYBOT_DB_HOST": "db",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            cfg = WebConfig.from_env()
+
+        assert cfg.async_db_connection_string == cfg.db_connection_string
 
 
 class TestWebConfigFromFile:
@@ -317,6 +317,28 @@ class TestReactionRoleEndpoints:
         assert len(data[0]["entries"]) == 1
         assert data[0]["entries"][0]["emoji"] == "👍"
 
+    def test_matching_etag_answers_304(self, client, auth_header):
+        first = client.get(f"/api/guilds/{GUILD_ID}/reaction-roles", headers=auth_header)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        with patch("models.reactionrole.ReactionRoleMessage.get_by_guild") as query:
+            response = client.get(
+                f"/api/guilds/{GUILD_ID}/reaction-roles", headers={**auth_header, "If-None-Match": etag}
+            )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        query.assert_not_called()
+
+    def test_bot_side_change_invalidates_etag(self, client, auth_header, fake_valkey):
+        etag = client.get(f"/api/guilds/{GUILD_ID}/reaction-roles", headers=auth_header).headers["etag"]
+
+        fake_valkey.bump_resource_versions({("reaction_roles", GUILD_ID)})
+
+        response = client.get(f"/api/guilds/{GUILD_ID}/reaction-roles", headers={**auth_header, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
 
 class TestRoleMappingEndpoints:
     def test_get_empty(self, client, auth_header):
@@ -406,6 +428,21 @@ class TestReminderEndpoints:
         assert data[0]["schedule_type"] == "daily"
         assert data[0]["channel_name"] == "general"
 
+    def test_dashboard_write_invalidates_etag(self, client, auth_header):
+        etag = client.get(f"/api/guilds/{GUILD_ID}/reminders", headers=auth_header).headers["etag"]
+        headers = {**auth_header, "If-None-Match": etag}
+        assert client.get(f"/api/guilds/{GUILD_ID}/reminders", headers=headers).status_code == 304
+
+        client.post(
+            f"/api/guilds/{GUILD_ID}/reminders",
+            json={"channel_id": "111", "message": "Test", "schedule_type": "interval", "interval_seconds": 3600},
+            headers=auth_header,
+        )
+
+        response = client.get(f"/api/guilds/{GUILD_ID}/reminders", headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
     def test_get_null_channel_name_returned_as_null(self, client, auth_header, web_db_session):
         """GET serialises NULL ChannelName as null, not '' or a missing key."""
         _make_reminder(web_db_session)
@@ -563,6 +600,140 @@ class TestApplicationFormEndpoints:
         assert data[0]["name"] == "Apply"
         assert len(data[0]["questions"]) == 1
 
+    def test_question_change_invalidates_form_etag(self, client, auth_header, fake_valkey, web_db_session):
+        from models.application import ApplicationForm, ApplicationQuestion
+        from utils.resource_versions import pop_changed_resources
+
+        form = ApplicationForm(GuildId=GUILD_ID, Name="Apply")
+        web_db_session.add(form)
+        web_db_session.commit()
+        pop_changed_resources(web_db_session)
+        etag = client.get(f"/api/guilds/{GUILD_ID}/application-forms", headers=auth_header).headers["etag"]
+
+        web_db_session.add(ApplicationQuestion(FormId=form.Id, QuestionText="Why?", SortOrder=1))
+        web_db_session.commit()
+        fake_valkey.bump_resource_versions(pop_changed_resources(web_db_session))
+
+        response = client.get(
+            f"/api/guilds/{GUILD_ID}/application-forms", headers={**auth_header, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert len(response.json()[0]["questions"]) == 1
+
+
+def _seed_submissions(session, count, form_name="Apply", status=None):
+    from datetime import UTC, datetime
+
+    from models.application import (
+        ApplicationAnswer,
+        ApplicationForm,
+        ApplicationQuestion,
+        ApplicationSubmission,
+        ApplicationVote,
+        SubmissionStatus,
+        VoteType,
+    )
+
+    form = ApplicationForm(GuildId=GUILD_ID, Name=form_name)
+    session.add(form)
+    session.flush()
+    question = ApplicationQuestion(FormId=form.Id, QuestionText="Why?", SortOrder=1)
+    session.add(question)
+    session.flush()
+    submissions = []
+    for n in range(count):
+        sub = ApplicationSubmission(
+            FormId=form.Id,
+            GuildId=GUILD_ID,
+            UserId=1000 + n,
+            UserName=f"user{n}",
+            Status=status or SubmissionStatus.PENDING,
+            SubmittedAt=datetime.now(UTC),
+        )
+        session.add(sub)
+        session.flush()
+        session.add(ApplicationAnswer(SubmissionId=sub.Id, QuestionId=question.Id, AnswerText=f"answer {n}"))
+        session.add(ApplicationVote(SubmissionId=sub.Id, UserId=1, VoterName="mod", Vote=VoteType.APPROVE))
+        submissions.append(sub)
+    session.commit()
+    return form, submissions
+
+
+class TestApplicationSubmissionEndpoints:
+    URL = f"/api/guilds/{GUILD_ID}/application-submissions"
+
+    def test_pages_follow_the_cursor(self, client, auth_header, web_db_session):
+        _, subs = _seed_submissions(web_db_session, 5)
+        expected = [s.Id for s in reversed(subs)]
+
+        seen = []
+        cursor = None
+        while True:
+            url = f"{self.URL}?limit=2" + (f"&before={cursor}" if cursor else "")
+            data = client.get(url, headers=auth_header).json()
+            seen += [row["id"] for row in data["submissions"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    def test_summary_rows_carry_no_answers(self, client, auth_header, web_db_session):
+        form, _ = _seed_submissions(web_db_session, 1)
+
+        row = client.get(self.URL, headers=auth_header).json()["submissions"][0]
+
+        assert row["form_id"] == form.Id and row["form_name"] == "Apply"
+        assert row["user_name"] == "user0" and row["status"] == "pending"
+        assert "answers" not in row and "votes" not in row
+        assert (row["approve_count"], row["deny_count"]) == (1, 0)
+
+    def test_form_and_status_filters(self, client, auth_header, web_db_session):
+        from models.application import SubmissionStatus
+
+        form, _ = _seed_submissions(web_db_session, 2, form_name="Raid")
+        _seed_submissions(web_db_session, 3, form_name="Staff", status=SubmissionStatus.APPROVED)
+
+        by_form = client.get(f"{self.URL}?form_id={form.Id}", headers=auth_header).json()["submissions"]
+        approved = client.get(f"{self.URL}?status=approved", headers=auth_header).json()["submissions"]
+
+        assert [r["form_name"] for r in by_form] == ["Raid", "Raid"]
+        assert [r["form_name"] for r in approved] == ["Staff"] * 3
+        assert client.get(f"{self.URL}?status=maybe", headers=auth_header).status_code == 422
+
+    def test_detail_includes_answers_and_votes(self, client, auth_header, web_db_session):
+        _, subs = _seed_submissions(web_db_session, 1)
+
+        data = client.get(f"{self.URL}/{subs[0].Id}", headers=auth_header).json()
+
+        assert data["answers"] == [
+            {"question_id": data["answers"][0]["question_id"], "question_text": "Why?", "answer_text": "answer 0"}
+        ]
+        assert data["votes"][0]["vote"] == "approve"
+
+    def test_detail_of_another_guild_is_404(self, client, auth_header, web_db_session):
+        _, subs = _seed_submissions(web_db_session, 1)
+        subs[0].GuildId = 1
+        web_db_session.commit()
+
+        assert client.get(f"{self.URL}/{subs[0].Id}", headers=auth_header).status_code == 404
+
+    def test_export_streams_ndjson(self, client, auth_header, web_db_session, monkeypatch):
+        import json
+
+        from web.routes import guilds
+
+        monkeypatch.setattr(guilds, "_SUBMISSION_EXPORT_BATCH", 2)
+        _, subs = _seed_submissions(web_db_session, 5)
+
+        response = client.get(f"{self.URL}/export", headers=auth_header)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [s.Id for s in reversed(subs)]
+        assert all(line["answers"] and line["votes"] for line in lines)
+
 
 class TestWowEndpoints:
     def test_get_empty(self, client, auth_header):
@@ -876,6 +1047,14 @@ class TestSupportModeRedactionAndWriteBlocking:
         assert response.status_code == 200
         assert response.headers.get("x-support-mode") == "true"
 
+    def test_redacted_reminders_have_their_own_etag(self, client, support_header, auth_header):
+        """A cached unredacted list must not revalidate for a support-mode viewer (and vice versa)."""
+        etag = client.get(f"/api/guilds/{GUILD_ID}/reminders", headers=auth_header).headers["etag"]
+
+        response = client.get(f"/api/guilds/{GUILD_ID}/reminders", headers={**support_header, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
     def test_get_language_in_support_mode_sets_header(self, client, support_header):
         """GET language in support mode → X-Support-Mode: true response header."""
         response = client.get(f"/api/guilds/{GUILD_ID}/language", headers=support_header)
@@ -1008,3 +1187,71 @@ class TestPremiumCacheBehavior:
 
         response = client.get(f"/api/guilds/{GUILD_ID}/language", headers=new_header)
         assert response.status_code == 200
+
+
+class TestDiscordEntityEndpoints:
+    def test_channels_served_from_snapshot_without_rpc(self, client, fake_valkey, auth_header):
+        fake_valkey._client.hset(f"nerpybot:guild:{GUILD_ID}:meta", "version", 1)
+        fake_valkey._client.hset(f"nerpybot:guild:{GUILD_ID}:channels", "5", '{"name": "general", "type": 0}')
+
+        with patch.object(fake_valkey, "send_bot_command") as rpc:
+            response = client.get(f"/api/guilds/{GUILD_ID}/discord/channels", headers=auth_header)
+
+        assert response.status_code == 200
+        assert response.json() == {"channels": [{"id": "5", "name": "general", "type": 0}]}
+        rpc.assert_not_called()
+
+    def test_roles_fall_back_to_rpc_on_miss(self, client, fake_valkey, auth_header):
+        async def reply(command, payload):
+            return {"roles": [{"id": "7", "name": "Mod"}]}
+
+        with patch.object(fake_valkey, "send_bot_command", side_effect=reply) as rpc:
+            response = client.get(f"/api/guilds/{GUILD_ID}/discord/roles", headers=auth_header)
+
+        assert response.json() == {"roles": [{"id": "7", "name": "Mod"}]}
+        rpc.assert_called_once_with("get_roles", {"guild_id": GUILD_ID})
+
+
+class TestTwitchNotificationEndpoints:
+    @pytest.fixture
+    def notification_id(self, web_db_session):
+        from models.twitch import TwitchNotifications
+
+        row = TwitchNotifications(GuildId=GUILD_ID, ChannelId=111, Streamer="shroud", StreamerDisplayName="shroud")
+        web_db_session.add(row)
+        web_db_session.commit()
+        return row.Id
+
+    @staticmethod
+    def _invalidations(published):
+        import json
+
+        bot_cmds = [json.loads(msg) for ch, msg in published if ch == "nerpybot:cmd"]
+        return [c for c in bot_cmds if c.get("command") == "invalidate_twitch_notification"]
+
+    def test_update_notifies_bot_to_reload_config(self, client, fake_valkey, auth_header, notification_id):
+        published = []
+        with patch.object(fake_valkey._client, "publish", side_effect=lambda ch, msg: published.append((ch, msg))):
+            response = client.patch(
+                f"/api/guilds/{GUILD_ID}/twitch-notifications/{notification_id}",
+                json={"message": "live!"},
+                headers=auth_header,
+            )
+
+        assert response.status_code == 200
+        assert self._invalidations(published) == [
+            {"command": "invalidate_twitch_notification", "guild_id": GUILD_ID, "config_id": notification_id}
+        ]
+
+    def test_delete_notifies_bot_to_drop_config(self, client, fake_valkey, auth_header, notification_id):
+        published = []
+        with (
+            patch.object(fake_valkey._client, "publish", side_effect=lambda ch, msg: published.append((ch, msg))),
+            patch("web.twitch_reconciler.reconcile_once"),
+        ):
+            response = client.delete(
+                f"/api/guilds/{GUILD_ID}/twitch-notifications/{notification_id}", headers=auth_header
+            )
+
+        assert response.status_code == 204
+        assert len(self._invalidations(published)) == 1
@@ -0,0 +1,109 @@
+"""Tests for web/metrics.py and the Prometheus endpoint."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    from web.metrics import WEB_METRICS
+
+    WEB_METRICS.reset()
+    yield
+    WEB_METRICS.reset()
+
+
+def _sample(text: str, prefix: str) -> float:
+    """Return the value of the first exposition line starting with *prefix*."""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {prefix!r} in:\n{text}")
+
+
+class TestMetricsEndpoint:
+    def test_requires_operator(self, client, auth_header):
+        assert client.get("/api/metrics", headers=auth_header).status_code == 403
+
+    def test_requests_are_recorded_by_route_template(self, client, operator_header):
+        client.get("/api/branding")
+        client.get("/api/branding")
+        client.get("/api/does-not-exist")
+
+        response = client.get("/api/metrics", headers=operator_header)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert "# TYPE nerpybot_web_request_duration_seconds histogram" in text
+        count = 'nerpybot_web_request_duration_seconds_count{method="GET",route="/api/branding",status="200"}'
+        assert _sample(text, count) == 2
+        assert _sample(text, 'nerpybot_web_request_duration_seconds_count{method="GET",route="unmatched"') == 1
+
+    def test_path_parameters_share_one_series(self, client, operator_header):
+        client.get("/api/guilds/1/reminders", headers=operator_header)
+        client.get("/api/guilds/2/reminders", headers=operator_header)
+
+        text = client.get("/api/metrics", headers=operator_header).text
+
+        assert 'route="/api/guilds/{guild_id}/reminders"' in text
+        assert 'route="/api/guilds/1/reminders"' not in text
+
+    def test_pool_and_sse_gauges(self, client, operator_header):
+        text = client.get("/api/metrics", headers=operator_header).text
+
+        assert _sample(text, "nerpybot_web_sse_connections ") == 0
+        assert "# TYPE nerpybot_web_db_pool_checked_out gauge" in text
+
+
+class TestBotCommandMetrics:
+    async def test_round_trip_and_timeouts_are_recorded(self):
+        from web.cache import ValkeyClient, _FakeValkeyClient
+        from web.metrics import WEB_METRICS
+
+        rpc = AsyncMock()
+        rpc.call = AsyncMock(side_effect=[{"ok": True}, None])
+        vk = ValkeyClient(_FakeValkeyClient(), rpc)
+
+        assert await vk.send_bot_command("health", {}) == {"ok": True}
+        assert await vk.send_bot_command("health", {}) is None
+
+        assert WEB_METRICS.bot_commands.labels("health").snapshot()["count"] == 2
+        assert WEB_METRICS.bot_command_timeouts.value("health") == 1
+
+
+class TestTimedValkey:
+    def test_operations_and_pipelines_are_timed(self):
+        from web.cache import _FakeValkeyClient
+        from web.metrics import WEB_METRICS, TimedValkey
+
+        client = TimedValkey(_FakeValkeyClient())
+        client.set("k", "v")
+        assert client.get("k") == "v"
+        pipe = client.pipeline(transaction=False)
+        pipe.incr("n")
+        assert pipe.execute() == [1]
+
+        for operation in ("set", "get", "pipeline"):
+            assert WEB_METRICS.valkey.labels(operation).snapshot()["count"] == 1
+
+
+class TestPoolInstrumentation:
+    def test_checkouts_are_timed_and_pool_size_reported(self, tmp_path):
+        from sqlalchemy import create_engine, text
+
+        from web.metrics import WEB_METRICS, instrument_pool
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+        instrument_pool(engine.pool, "sync")
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                rendered = WEB_METRICS.render()
+        finally:
+            engine.dispose()
+
+        assert WEB_METRICS.pool_checkout.labels("sync").snapshot()["count"] == 1
+        assert _sample(rendered, 'nerpybot_web_db_pool_checked_out{engine="sync"}') == 1
+        assert _sample(rendered, 'nerpybot_web_db_pool_size{engine="sync"}') == 5
@@ -14,6 +14,80 @@ class TestHealthEndpoint:
         assert data["active_reminders"] is None
         assert data["voice_details"] == []
 
+    def test_health_passes_event_loop_stats_through(self, client, operator_header, monkeypatch):
+        event_loop = {
+            "interval_ms": 500,
+            "threshold_ms": 250,
+            "lag": {
+                "count": 10,
+                "avg_ms": 0.5,
+                "p50_ms": 1.0,
+                "p95_ms": 1.0,
+                "p99_ms": 300.0,
+                "max_ms": 300.0,
+                "last_ms": 0.2,
+            },
+            "stall_count": 1,
+            "recent_stalls": [{"at": "2026-01-01T00:00:00+00:00", "blocked_ms": 300.0, "stack": ["  File ...\n"]}],
+        }
+
+        async def mock_send_bot_command(self, command, payload):
+            return {"event_loop": event_loop}
+
+        from web.cache import ValkeyClient
+
+        monkeypatch.setattr(ValkeyClient, "send_bot_command", mock_send_bot_command)
+
+        data = client.get("/api/operator/health", headers=operator_header).json()
+        assert data["event_loop"] == event_loop
+
+    def test_health_without_loop_monitor(self, client, operator_header, monkeypatch):
+        async def mock_send_bot_command(self, command, payload):
+            return {"event_loop": None}
+
+        from web.cache import ValkeyClient
+
+        monkeypatch.setattr(ValkeyClient, "send_bot_command", mock_send_bot_command)
+
+        assert client.get("/api/operator/health", headers=operator_header).json()["event_loop"] is None
+
+
+class TestMetricsEndpoint:
+    def test_metrics_requires_operator(self, client, auth_header):
+        assert client.get("/api/operator/metrics", headers=auth_header).status_code == 403
+
+    def test_metrics_returns_unreachable_when_no_bot(self, client, operator_header):
+        data = client.get("/api/operator/metrics", headers=operator_header).json()
+        assert data == {"status": "unreachable", "histograms": {}, "counters": {}}
+
+    def test_metrics_passes_snapshot_through(self, client, operator_header, monkeypatch):
+        timing = {
+            "count": 3,
+            "avg_ms": 120.0,
+            "p50_ms": 100.0,
+            "p95_ms": 250.0,
+            "p99_ms": 250.0,
+            "max_ms": 210.0,
+            "last_ms": 90.0,
+        }
+        snapshot = {
+            "histograms": {"command": {"reminder create": timing}, "loop": {"reminder": timing}},
+            "counters": {"command_errors": {"reminder create": 1}, "loop_items": {"reminder": 7}},
+        }
+        commands = []
+
+        async def mock_send_bot_command(self, command, payload):
+            commands.append(command)
+            return snapshot
+
+        from web.cache import ValkeyClient
+
+        monkeypatch.setattr(ValkeyClient, "send_bot_command", mock_send_bot_command)
+
+        data = client.get("/api/operator/metrics", headers=operator_header).json()
+        assert commands == ["metrics"]
+        assert data == {"status": "online", **snapshot}
+
 
 class TestModuleEndpoints:
     def test_list_modules_requires_operator(self, client, auth_header):
@@ -167,3 +241,41 @@ class TestRecipeCacheBrowse:
         data = response.json()
         assert data["total"] == 1
         assert data["recipes"][0]["item_name"] == "Fancy Chair"
+
+    def test_pages_are_cached_per_version(self, client, operator_header, fake_valkey, web_db_session):
+        from datetime import UTC, datetime
+        from unittest.mock import patch
+
+        from models.wow import CraftingRecipeCache
+
+        def add_recipe(recipe_id):
+            web_db_session.add(
+                CraftingRecipeCache(
+                    RecipeId=recipe_id,
+                    ProfessionId=171,
+                    ProfessionName="Alchemy",
+                    ItemId=recipe_id,
+                    ItemName=f"Flask {recipe_id}",
+                    RecipeType="crafted",
+                    LastSynced=datetime.now(UTC),
+                )
+            )
+            web_db_session.commit()
+
+        add_recipe(1)
+        first = client.get("/api/operator/recipe-cache", headers=operator_header)
+        assert first.json()["total"] == 1
+
+        add_recipe(2)  # a recipe sync on the bot, which has not bumped the version yet
+        with patch("sqlalchemy.select") as select:
+            assert client.get("/api/operator/recipe-cache", headers=operator_header).json()["total"] == 1
+        select.assert_not_called()
+        assert (
+            client.get(
+                "/api/operator/recipe-cache", headers={**operator_header, "If-None-Match": first.headers["etag"]}
+            ).status_code
+            == 304
+        )
+
+        fake_valkey.bump_resource_versions({("recipe_cache", None)})
+        assert client.get("/api/operator/recipe-cache", headers=operator_header).json()["total"] == 2
@@ -0,0 +1,173 @@
+"""Tests for web/rpc.py — multiplexed bot command channel."""
+
+import asyncio
+import json
+import threading
+
+from web.cache import ValkeyClient
+from web.rpc import CMD_CHANNEL, BotRpcClient
+
+
+class _FakePubSub:
+    def __init__(self, bus):
+        self._bus = bus
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self._bus.subscribers.setdefault(channel, []).append(self._queue)
+        self._queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def get_message(self, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def aclose(self):
+        pass
+
+
+class _FakeAsyncValkey:
+    """In-memory pub/sub bus; *responder* plays the bot and returns the reply for a command."""
+
+    def __init__(self, responder=None):
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.responder = responder
+        self.commands: list[dict] = []
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def publish(self, channel, message):
+        if channel == CMD_CHANNEL:
+            if self.responder is None:
+                return 0
+            data = json.loads(message)
+            self.commands.append(data)
+            asyncio.get_running_loop().create_task(self._reply(data))
+            return 1
+        queues = self.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(queues)
+
+    async def _reply(self, data):
+        result = await self.responder(data)
+        if result is not None:
+            await self.publish(data["reply_to"], json.dumps({"request_id": data["request_id"], "result": result}))
+
+
+async def _echo(data):
+    return {"echo": data["command"], "n": data.get("n")}
+
+
+class TestBotRpcClient:
+    async def test_roundtrip(self):
+        bus = _FakeAsyncValkey(_echo)
+        rpc = BotRpcClient(client=bus)
+
+        assert await rpc.call("health", {"n": 1}) == {"echo": "health", "n": 1}
+        assert bus.commands[0]["reply_to"] == rpc.reply_channel
+        assert rpc.in_flight == 0
+        await rpc.aclose()
+
+    async def test_concurrent_calls_share_one_subscription_and_no_threads(self):
+        async def slow_echo(data):
+            await asyncio.sleep(0.05)
+            return {"n": data["n"]}
+
+        bus = _FakeAsyncValkey(slow_echo)
+        rpc = BotRpcClient(client=bus)
+        threads_before = threading.active_count()
+
+        results = await asyncio.gather(*(rpc.call("health", {"n": i}) for i in range(100)))
+
+        assert [r["n"] for r in results] == list(range(100))
+        assert list(bus.subscribers) == [rpc.reply_channel]
+        assert len(bus.subscribers[rpc.reply_channel]) == 1
+        assert threading.active_count() == threads_before
+        await rpc.aclose()
+
+    async def test_timeout_returns_none_and_drops_pending(self):
+        async def never(data):
+            await asyncio.sleep(10)
+
+        rpc = BotRpcClient(client=_FakeAsyncValkey(never))
+
+        assert await rpc.call("health", {}, timeout=0.05) is None
+        assert rpc.in_flight == 0
+        await rpc.aclose()
+
+    async def test_late_reply_is_discarded(self):
+        async def late(data):
+            await asyncio.sleep(0.1)
+            return {"late": True}
+
+        rpc = BotRpcClient(client=_FakeAsyncValkey(late))
+
+        assert await rpc.call("health", {}, timeout=0.02) is None
+        await asyncio.sleep(0.15)  # the reply arrives with nobody waiting
+        assert await rpc.call("health", {}, timeout=1.0) == {"late": True}
+        await rpc.aclose()
+
+    async def test_cancelled_caller_drops_pending(self):
+        async def never(data):
+            await asyncio.sleep(10)
+
+        rpc = BotRpcClient(client=_FakeAsyncValkey(never))
+        task = asyncio.create_task(rpc.call("health", {}, timeout=5.0))
+        await asyncio.sleep(0.01)
+        assert rpc.in_flight == 1
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert rpc.in_flight == 0
+        await rpc.aclose()
+
+    async def test_no_bot_subscribed_returns_immediately(self):
+        rpc = BotRpcClient(client=_FakeAsyncValkey(responder=None))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await rpc.call("health", {}, timeout=5.0) is None
+        assert loop.time() - start < 1.0
+        await rpc.aclose()
+
+    async def test_malformed_reply_is_ignored(self):
+        bus = _FakeAsyncValkey(_echo)
+        rpc = BotRpcClient(client=bus)
+        await rpc.call("health", {})
+
+        await bus.publish(rpc.reply_channel, "not json")
+
+        assert await rpc.call("health", {"n": 2}) == {"echo": "health", "n": 2}
+        await rpc.aclose()
+
+    async def test_aclose_releases_waiting_callers(self):
+        async def never(data):
+            await asyncio.sleep(10)
+
+        rpc = BotRpcClient(client=_FakeAsyncValkey(never))
+        task = asyncio.create_task(rpc.call("health", {}, timeout=5.0))
+        await asyncio.sleep(0.01)
+
+        await rpc.aclose()
+
+        assert await task is None
+
+
+class TestValkeyClientBotCommands:
+    async def test_fake_client_without_rpc_returns_none(self):
+        assert await ValkeyClient.create_fake().send_bot_command("health", {}) is None
+
+    async def test_delegates_to_rpc(self):
+        rpc = BotRpcClient(client=_FakeAsyncValkey(_echo))
+        vk = ValkeyClient(ValkeyClient.create_fake()._client, rpc)
+
+        assert await vk.send_bot_command("get_roles", {"n": 7}) == {"echo": "get_roles", "n": 7}
+        await vk.aclose()
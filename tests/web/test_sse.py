@@ -0,0 +1,112 @@
+"""Tests for web/routes/sse.py — shared health feed and its SSE relay."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from web.routes import sse
+from web.routes.sse import HealthFeed
+
+
+def _vk(result=None):
+    vk = MagicMock()
+    vk.send_bot_command = AsyncMock(return_value=result if result is not None else {"guild_count": 3})
+    return vk
+
+
+class TestHealthFeed:
+    async def test_one_poll_serves_every_subscriber(self):
+        vk = _vk()
+        feed = HealthFeed(vk, interval=60)
+        queues = [feed.subscribe() for _ in range(10)]
+
+        frames = await asyncio.gather(*(asyncio.wait_for(q.get(), 1) for q in queues))
+
+        assert vk.send_bot_command.await_count == 1
+        assert {json.loads(f)["guild_count"] for f in frames} == {3}
+        await feed.aclose()
+
+    async def test_poller_stops_with_last_subscriber(self):
+        feed = HealthFeed(_vk(), interval=60)
+        first, second = feed.subscribe(), feed.subscribe()
+        task = feed._task
+
+        feed.unsubscribe(first)
+        assert not task.cancelled() and feed._task is task
+        feed.unsubscribe(second)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert feed.subscriber_count == 0
+
+    async def test_slow_client_drops_oldest_frames(self):
+        feed = HealthFeed(_vk(), interval=60)
+        slow, fast = feed.subscribe(), feed.subscribe()
+        feed._task.cancel()
+
+        for i in range(5):
+            feed._publish(str(i))
+            fast.get_nowait()
+
+        assert [slow.get_nowait() for _ in range(slow.qsize())] == ["3", "4"]
+        assert feed.dropped == 3
+        await feed.aclose()
+
+    async def test_new_subscriber_gets_latest_snapshot(self):
+        feed = HealthFeed(_vk(), interval=60)
+        first = feed.subscribe()
+        await asyncio.wait_for(first.get(), 1)
+
+        late = feed.subscribe()
+
+        assert json.loads(late.get_nowait()) == {"guild_count": 3}
+        await feed.aclose()
+
+    async def test_error_replies_are_not_published(self):
+        vk = _vk({"error": "boom"})
+        feed = HealthFeed(vk, interval=60)
+        queue = feed.subscribe()
+        await asyncio.sleep(0.01)
+
+        assert vk.send_bot_command.await_count == 1
+        assert queue.empty()
+        await feed.aclose()
+
+
+class TestHealthEventGenerator:
+    @pytest.fixture(autouse=True)
+    def _reset_connections(self):
+        sse._active_connections.clear()
+        yield
+        sse._active_connections.clear()
+
+    async def test_relays_feed_and_cleans_up(self):
+        feed = HealthFeed(_vk(), interval=60)
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+        sse._active_connections["42"] = 1
+
+        gen = sse._health_event_generator("42", feed, request)
+        event = await asyncio.wait_for(anext(gen), 1)
+        await gen.aclose()
+
+        assert event["event"] == "health"
+        assert json.loads(event["data"]) == {"guild_count": 3}
+        assert feed.subscriber_count == 0
+        assert "42" not in sse._active_connections
+        await feed.aclose()
+
+    async def test_heartbeat_without_data(self, monkeypatch):
+        monkeypatch.setattr(sse, "_HEARTBEAT_INTERVAL", 0.01)
+        feed = HealthFeed(_vk({"error": "bot down"}), interval=60)
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+
+        gen = sse._health_event_generator("42", feed, request)
+        event = await asyncio.wait_for(anext(gen), 1)
+        await gen.aclose()
+
+        assert event == {"comment": "heartbeat"}
+        await feed.aclose()
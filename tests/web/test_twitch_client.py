@@ -78,3 +78,50 @@ class TestTwitchClientDeleteIdempotency:
         with patch("httpx.AsyncClient.delete", new_callable=AsyncMock, return_value=mock_response):
             # Should not raise
             await client.delete_eventsub_subscription("sub-uuid-123")
+
+
+class TestTwitchClientRateLimit:
+    @staticmethod
+    def _client():
+        from web.twitch import TwitchClient
+        import time
+
+        client = TwitchClient("client_id", "client_secret")
+        client._token = "tok"
+        client._token_expires_at = time.monotonic() + 7200
+        return client
+
+    @staticmethod
+    def _response(status_code=204, remaining="799", reset="0"):
+        resp = MagicMock()
+        resp.status_code = status_code
+        resp.headers = {"Ratelimit-Remaining": remaining, "Ratelimit-Reset": reset}
+        return resp
+
+    async def test_waits_for_refill_when_bucket_is_nearly_empty(self):
+        import time
+
+        client = self._client()
+        reset = str(time.time() + 5)
+        responses = [self._response(remaining="3", reset=reset), self._response()]
+        with (
+            patch("httpx.AsyncClient.delete", new_callable=AsyncMock, side_effect=responses),
+            patch("web.twitch.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            await client.delete_eventsub_subscription("a")
+            sleep.assert_not_called()
+            await client.delete_eventsub_subscription("b")
+
+        sleep.assert_awaited_once()
+        assert 4 < sleep.await_args.args[0] <= 5
+
+    async def test_429_is_retried_after_refill(self):
+        client = self._client()
+        responses = [self._response(status_code=429, remaining="0"), self._response()]
+        with (
+            patch("httpx.AsyncClient.delete", new_callable=AsyncMock, side_effect=responses) as delete,
+            patch("web.twitch.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            await client.delete_eventsub_subscription("a")
+
+        assert delete.await_count == 2
@@ -1,5 +1,7 @@
 """Unit tests for the Twitch EventSub reconciler."""
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
@@ -24,6 +26,28 @@ def reconciler_db():
     return sessionmaker(bind=engine, expire_on_commit=False)
 
 
+CALLBACK = "https://example.com/webhooks/twitch"
+
+
+def _remote(sub_id, user_id, event_type="stream.online", status="enabled", callback=CALLBACK):
+    return {
+        "id": sub_id,
+        "type": event_type,
+        "status": status,
+        "condition": {"broadcaster_user_id": user_id},
+        "transport": {"method": "webhook", "callback": callback},
+    }
+
+
+def _state(session_factory, twitch):
+    state = MagicMock()
+    state.session_factory = session_factory
+    state.twitch_client = twitch
+    state.config.twitch_webhook_url = CALLBACK
+    state.config.twitch_webhook_secret = "secret"
+    return state
+
+
 class TestReconcileOnce:
     async def test_creates_missing_subscription(self, reconciler_db):
         session = reconciler_db()
@@ -72,6 +96,7 @@ class TestReconcileOnce:
         session.close()
 
         mock_twitch = AsyncMock()
+        mock_twitch.list_eventsub_subscriptions.return_value = [_remote("sub-orphan", "99")]
         mock_state = MagicMock()
         mock_state.session_factory = reconciler_db
         mock_state.twitch_client = mock_twitch
@@ -83,6 +108,9 @@ class TestReconcileOnce:
         await reconcile_once(mock_state)
 
         mock_twitch.delete_eventsub_subscription.assert_called_once_with("sub-orphan")
+        session = reconciler_db()
+        assert session.query(TwitchEventSubSubscription).count() == 0
+        session.close()
 
     async def test_creates_offline_subscription_when_notify_offline(self, reconciler_db):
         """When any config has NotifyOffline=True, stream.offline sub is also created."""
@@ -128,3 +156,124 @@ class TestReconcileOnce:
         from web.twitch_reconciler import reconcile_once
 
         await reconcile_once(mock_state)  # should not raise
+
+
+class TestReconcileDiff:
+    @staticmethod
+    def _seed(session_factory, *rows):
+        session = session_factory()
+        session.add_all(rows)
+        session.commit()
+        session.close()
+
+    @staticmethod
+    def _local(session_factory):
+        from models.twitch import TwitchEventSubSubscription
+
+        session = session_factory()
+        rows = {
+            (r.StreamerLogin, r.EventType): (r.TwitchSubscriptionId, r.Status)
+            for r in session.query(TwitchEventSubSubscription).all()
+        }
+        session.close()
+        return rows
+
+    async def test_adopts_live_twitch_subscription_missing_from_db(self, reconciler_db):
+        from models.twitch import TwitchNotifications
+
+        self._seed(
+            reconciler_db, TwitchNotifications(GuildId=1, ChannelId=2, Streamer="shroud", StreamerDisplayName="s")
+        )
+        twitch = AsyncMock()
+        twitch.list_eventsub_subscriptions.return_value = [_remote("sub-live", "12345")]
+        twitch.get_users.return_value = [{"id": "12345", "login": "shroud"}]
+
+        from web.twitch_reconciler import reconcile_once
+
+        stats = await reconcile_once(_state(reconciler_db, twitch))
+
+        twitch.create_eventsub_subscription.assert_not_called()
+        assert self._local(reconciler_db) == {("shroud", "stream.online"): ("sub-live", "enabled")}
+        assert stats["kept"] == 1 and stats["created"] == 0
+
+    async def test_recreates_subscription_missing_on_twitch_and_drops_dead_ones(self, reconciler_db):
+        from models.twitch import TwitchEventSubSubscription, TwitchNotifications
+
+        self._seed(
+            reconciler_db,
+            TwitchNotifications(GuildId=1, ChannelId=2, Streamer="shroud", StreamerDisplayName="s"),
+            TwitchEventSubSubscription(
+                TwitchSubscriptionId="sub-gone",
+                StreamerLogin="shroud",
+                StreamerUserId="12345",
+                EventType="stream.online",
+                Status="enabled",
+                CreatedAt=datetime.now(UTC),
+            ),
+        )
+        twitch = AsyncMock()
+        twitch.list_eventsub_subscriptions.return_value = [
+            _remote("sub-failed", "12345", status="webhook_callback_verification_failed"),
+            _remote("sub-other-app", "12345", callback="https://elsewhere.example/hook"),
+        ]
+        twitch.create_eventsub_subscription.return_value = {"id": "sub-new", "status": "enabled"}
+
+        from web.twitch_reconciler import reconcile_once
+
+        stats = await reconcile_once(_state(reconciler_db, twitch))
+
+        twitch.get_users.assert_not_called()  # broadcaster id known from the DB row
+        twitch.delete_eventsub_subscription.assert_called_once_with("sub-failed")
+        assert self._local(reconciler_db) == {("shroud", "stream.online"): ("sub-new", "enabled")}
+        assert (stats["created"], stats["deleted"], stats["remote"]) == (1, 1, 1)
+
+    async def test_calls_run_concurrently_and_commit_once(self, reconciler_db, monkeypatch):
+        from models.twitch import TwitchNotifications
+
+        self._seed(
+            reconciler_db,
+            *(
+                TwitchNotifications(GuildId=1, ChannelId=2, Streamer=f"s{i}", StreamerDisplayName=f"s{i}")
+                for i in range(40)
+            ),
+        )
+        twitch = AsyncMock()
+        twitch.list_eventsub_subscriptions.return_value = [_remote(f"old-{i}", f"orphan-{i}") for i in range(40)]
+        twitch.get_users.return_value = [{"id": str(i), "login": f"s{i}"} for i in range(40)]
+
+        async def slow_create(event_type, broadcaster_id, callback, secret):
+            await asyncio.sleep(0.02)
+            return {"id": f"sub-{broadcaster_id}"}
+
+        async def slow_delete(sub_id):
+            await asyncio.sleep(0.02)
+
+        twitch.create_eventsub_subscription.side_effect = slow_create
+        twitch.delete_eventsub_subscription.side_effect = slow_delete
+        commits = []
+        original_commit = reconciler_db.class_.commit
+
+        def counting_commit(session):
+            commits.append(session)
+            original_commit(session)
+
+        monkeypatch.setattr(reconciler_db.class_, "commit", counting_commit)
+
+        from web.twitch_reconciler import reconcile_once
+
+        started = time.monotonic()
+        stats = await reconcile_once(_state(reconciler_db, twitch))
+
+        assert time.monotonic() - started < 0.5  # 80 calls of 20 ms, serially 1.6 s
+        assert (stats["created"], stats["deleted"], stats["failed"]) == (40, 40, 0)
+        assert len(commits) == 1
+        assert len(self._local(reconciler_db)) == 40
+
+    async def test_list_failure_skips_cycle(self, reconciler_db):
+        twitch = AsyncMock()
+        twitch.list_eventsub_subscriptions.side_effect = RuntimeError("helix down")
+
+        from web.twitch_reconciler import reconcile_once
+
+        assert await reconcile_once(_state(reconciler_db, twitch)) is None
+        twitch.delete_eventsub_subscription.assert_not_called()
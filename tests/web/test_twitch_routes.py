@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from tests.web.conftest import make_auth_header
+from tests.web.conftest import make_async_session_override, make_auth_header
 
 GUILD_ID = 987654321
 
@@ -28,7 +28,7 @@ def twitch_client(web_db_engine, fake_valkey):
     from sqlalchemy.orm import sessionmaker
     from web.app import create_app
     from web.config import WebConfig
-    from web.dependencies import get_db_session
+    from web.dependencies import get_async_db_session, get_db_session
 
     cfg = WebConfig(
         client_id="x",
@@ -59,6 +59,7 @@ def twitch_client(web_db_engine, fake_valkey):
             s.close()
 
     app.dependency_overrides[get_db_session] = override
+    app.dependency_overrides[get_async_db_session] = make_async_session_override(sf)
     with TestClient(app) as tc:
         yield tc
 
@@ -103,27 +103,42 @@ class TestWebhookNotification:
                 "started_at": "2024-01-01T00:00:00Z",
             },
         }
-        from unittest.mock import patch
-
-        published = []
-        with patch.object(fake_valkey._client, "publish", side_effect=lambda ch, msg: published.append(msg)):
-            resp = _post_webhook(twitch_client, "notification", body)
+        resp = _post_webhook(twitch_client, "notification", body)
         assert resp.status_code == 204
-        assert any("twitch_event" in m for m in published)
+        entries = fake_valkey._client._streams["nerpybot:events:twitch"]
+        assert [json.loads(fields["data"]) for _, fields in entries] == [
+            {
+                "event_type": "stream.online",
+                "broadcaster_login": "shroud",
+                "broadcaster_name": "shroud",
+                "started_at": "2024-01-01T00:00:00Z",
+            }
+        ]
 
-    def test_duplicate_notification_returns_204_without_publish(self, twitch_client, fake_valkey):
+    def test_duplicate_notification_returns_204_without_queueing(self, twitch_client, fake_valkey):
         body = {
             "subscription": {"type": "stream.online"},
             "event": {"broadcaster_user_login": "shroud", "broadcaster_user_name": "shroud", "started_at": "x"},
         }
+        _post_webhook(twitch_client, "notification", body, msg_id="dup-id")
+        resp = _post_webhook(twitch_client, "notification", body, msg_id="dup-id")
+        assert resp.status_code == 204
+        assert len(fake_valkey._client._streams["nerpybot:events:twitch"]) == 1  # only first was queued
+
+    def test_queue_failure_releases_claim_and_returns_503(self, twitch_client, fake_valkey):
         from unittest.mock import patch
 
-        published = []
-        with patch.object(fake_valkey._client, "publish", side_effect=lambda ch, msg: published.append(msg)):
-            _post_webhook(twitch_client, "notification", body, msg_id="dup-id")
-            resp = _post_webhook(twitch_client, "notification", body, msg_id="dup-id")
+        body = {
+            "subscription": {"type": "stream.online"},
+            "event": {"broadcaster_user_login": "shroud", "broadcaster_user_name": "shroud", "started_at": "x"},
+        }
+        with patch.object(fake_valkey._client, "xadd", side_effect=ConnectionError("valkey down")):
+            resp = _post_webhook(twitch_client, "notification", body, msg_id="retry-me")
+        assert resp.status_code == 503
+        # Twitch's redelivery of the same message must be accepted and queued.
+        resp = _post_webhook(twitch_client, "notification", body, msg_id="retry-me")
         assert resp.status_code == 204
-        assert len(published) == 1  # only first was published
+        assert len(fake_valkey._client._streams["nerpybot:events:twitch"]) == 1
 
     def test_stale_timestamp_returns_403(self, twitch_client):
         old_ts = "2020-01-01T00:00:00Z"
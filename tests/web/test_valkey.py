@@ -67,3 +67,115 @@ class TestTwitchDedup:
         second = vk.claim_twitch_event("msg-abc", ttl=300)
         assert first is True
         assert second is False
+
+
+class TestGuildSnapshot:
+    """The web reads the hashes the bot writes through utils.guild_metadata."""
+
+    @staticmethod
+    def _publish(vk, guild_id, *ops):
+        from utils.guild_metadata import _apply
+
+        pipe = vk._client.pipeline()
+        for op in ops:
+            _apply(pipe, guild_id, op)
+        pipe.execute()
+
+    def test_miss_returns_none(self):
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        assert vk.get_guild_channels(1) is None
+        assert vk.get_guild_roles(1) is None
+
+    def test_snapshot_roundtrip_is_sorted(self):
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        channels = {"2": '{"name": "general", "type": 0}', "3": '{"name": "announcements", "type": 5}'}
+        roles = {"10": '{"name": "Member", "position": 1}', "11": '{"name": "Admin", "position": 5}'}
+        self._publish(vk, 1, ("guild", channels, roles))
+
+        assert vk.get_guild_channels(1) == [
+            {"id": "3", "name": "announcements", "type": 5},
+            {"id": "2", "name": "general", "type": 0},
+        ]
+        assert vk.get_guild_roles(1) == [{"id": "11", "name": "Admin"}, {"id": "10", "name": "Member"}]
+
+    def test_empty_guild_is_a_hit(self):
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        self._publish(vk, 1, ("guild", {}, {}))
+
+        assert vk.get_guild_channels(1) == []
+        assert vk.get_guild_roles(1) == []
+
+    def test_incremental_updates_and_forget(self):
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        self._publish(
+            vk,
+            1,
+            ("guild", {"2": '{"name": "general", "type": 0}'}, {}),
+            ("hset", 0, "4", '{"name": "memes", "type": 0}'),
+            ("hdel", 0, "2"),
+        )
+        assert vk.get_guild_channels(1) == [{"id": "4", "name": "memes", "type": 0}]
+        assert vk._client.hgetall("nerpybot:guild:1:meta")["version"] == "3"
+
+        self._publish(vk, 1, ("forget",))
+        assert vk.get_guild_channels(1) is None
+
+
+class TestResourceEtag:
+    """ETags follow the version counters the bot and the web bump (utils.resource_versions)."""
+
+    def test_etag_is_stable_until_a_bump(self):
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        etag = vk.resource_etag("reminders", 1)
+        assert etag.startswith('"') and etag == vk.resource_etag("reminders", 1)
+        assert vk.resource_etag("reminders", 2) != etag
+        assert vk.resource_etag("reminders", 1, variant="support") != etag
+
+        vk.bump_resource_versions({("reminders", 2)})
+        assert vk.resource_etag("reminders", 1) == etag
+
+        vk.bump_resource_versions({("reminders", 1)})
+        bumped = vk.resource_etag("reminders", 1)
+        assert bumped != etag
+
+        vk.bump_resource_versions({("reminders", None)})  # resource-wide bump
+        assert vk.resource_etag("reminders", 1) != bumped
+
+    def test_new_epoch_retires_every_etag(self):
+        from utils.resource_versions import EPOCH_KEY
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        etag = vk.resource_etag("recipe_cache")
+        vk._client.set(EPOCH_KEY, "restarted")
+        assert vk.resource_etag("recipe_cache") != etag
+
+    def test_unavailable_valkey_disables_etags(self):
+        from unittest.mock import patch
+
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        with patch.object(vk._client, "mget", side_effect=ConnectionError("down")):
+            assert vk.resource_etag("reminders", 1) is None
+
+    def test_failed_bump_starts_a_new_epoch(self):
+        from unittest.mock import patch
+
+        from web.cache import ValkeyClient
+
+        vk = ValkeyClient.create_fake()
+        etag = vk.resource_etag("reminders", 1)
+        with patch.object(vk._client, "pipeline", side_effect=ConnectionError("down")):
+            vk.bump_resource_versions({("reminders", 1)})
+        assert vk.resource_etag("reminders", 1) != etag
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 if TYPE_CHECKING:
@@ -30,10 +31,13 @@ def create_app(
     1. Explicit ``config`` parameter (used by tests)
     2. Load from ``config_path`` (or ``./config.yaml`` if None) + env var overlay
     """
+    from utils.resource_versions import pop_changed_resources
     from web.cache import ValkeyClient
     from web.config import WebConfig
-    from web.dependencies import _TEST_MODE, get_config, get_db_session, get_valkey
-    from web.routes import auth, guilds, health, legal, operator, sse, support, wow
+    from web.dependencies import _TEST_MODE, get_async_db_session, get_config, get_db_session, get_valkey
+    from web.metrics import WEB_METRICS, MetricsMiddleware, instrument_pool
+    from web.routes import auth, guilds, health, legal, metrics, operator, sse, support, wow
+    from web.routes.sse import HealthFeed
     from web.webhooks import twitch as webhooks_twitch
 
     if config is None:
@@ -54,6 +58,12 @@ def create_app(
         engine_kwargs["connect_args"] = {"check_same_thread": False}
     engine = create_engine(config.db_connection_string, **engine_kwargs)
     session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    # Dashboard routes use the async engine so a slow query never stalls the event loop. The sync
+    # engine still backs the Twitch webhook and reconciler.
+    async_engine = create_async_engine(config.async_db_connection_string, pool_pre_ping=True)
+    async_session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    instrument_pool(engine.pool, "sync")
+    instrument_pool(async_engine.sync_engine.pool, "async")
 
     if valkey_client is None:
         if _TEST_MODE:
@@ -66,8 +76,12 @@ def create_app(
         """Initialize app state on startup and clean up on shutdown."""
         app.state.engine = engine
         app.state.session_factory = session_factory
+        app.state.async_engine = async_engine
+        app.state.async_session_factory = async_session_factory
         app.state.config = config
         app.state.valkey = valkey_client
+        app.state.health_feed = HealthFeed(valkey_client)
+        WEB_METRICS.sse_connections.set_function(lambda: app.state.health_feed.subscriber_count)
 
         # Initialize Twitch client and reconciler if configured
         reconciler_task = None
@@ -90,8 +104,10 @@ def create_app(
                 pass  # expected during shutdown — cancellation is intentional
         if app.state.twitch_client is not None:
             await app.state.twitch_client.aclose()
-        valkey_client.close()
+        await app.state.health_feed.aclose()
+        await valkey_client.aclose()
         engine.dispose()
+        await async_engine.dispose()
 
     app = FastAPI(
         title=f"{config.bot_name} Dashboard API",
@@ -109,6 +125,8 @@ def create_app(
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Added last so it wraps everything else, CORS preflights included.
+    app.add_middleware(MetricsMiddleware)
 
     # Wire up dependency defaults
     app.dependency_overrides[get_config] = lambda: config
@@ -120,6 +138,7 @@ def create_app(
         try:
             yield session
             session.commit()
+            valkey_client.bump_resource_versions(pop_changed_resources(session))
         except Exception:
             session.rollback()
             raise
@@ -128,12 +147,26 @@ def create_app(
 
     app.dependency_overrides[get_db_session] = _get_db_session
 
+    async def _get_async_db_session():
+        """Yield an async SQLAlchemy session, committing on success and rolling back on error."""
+        async with async_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+                valkey_client.bump_resource_versions(pop_changed_resources(session))
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_async_db_session] = _get_async_db_session
+
     # Register routers
     app.include_router(webhooks_twitch.router)
     app.include_router(auth.router, prefix="/api")
     app.include_router(guilds.router, prefix="/api")
     app.include_router(health.router, prefix="/api")
     app.include_router(operator.router, prefix="/api")
+    app.include_router(metrics.router, prefix="/api")
     app.include_router(wow.router, prefix="/api")
     app.include_router(legal.router, prefix="/api")
     app.include_router(support.router, prefix="/api")
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
 from typing import Any
 
 import valkey
 
+from utils.resource_versions import EPOCH_KEY, new_epoch, version_key
+from web.metrics import WEB_METRICS, TimedValkey
+from web.rpc import BotRpcClient
+
 _log = logging.getLogger(__name__)
 
+# Twitch EventSub notifications for the bot (consumed by NerdyPy/utils/event_stream.py). Trimmed
+# approximately, which keeps XADD O(1) while bounding memory to the most recent events.
+TWITCH_EVENT_STREAM_MAXLEN = 10_000
+
 # Permissions cache TTL (independent of JWT expiry) — short enough that guild
 # removals/role changes are reflected within this window without requiring re-login.
 PERM_CACHE_TTL = 15 * 60  # 15 minutes
@@ -20,31 +30,24 @@ class ValkeyClient:
 
     PREFIX = "nerpybot"
 
-    def __init__(self, client: Any, blocking_client: Any | None = None):
+    def __init__(self, client: Any, rpc: BotRpcClient | None = None):
         """Initialize with a Valkey (or fake) client instance.
 
-        blocking_client, if provided, is used exclusively for blpop.  It must
-        have socket_timeout=None so the TCP read does not expire before the
-        server-side blpop timeout fires.
+        rpc, if provided, carries bot commands (``send_bot_command``). Without it — the fake used
+        in tests — every bot command times out immediately.
         """
         self._client = client
-        self._blocking_client = blocking_client if blocking_client is not None else client
+        self._rpc = rpc
 
     @classmethod
     def create(cls, url: str) -> ValkeyClient:
         """Connect to a real Valkey instance."""
-        client = valkey.from_url(url, decode_responses=True)
-        # Blocking commands (blpop) need socket_timeout=None: the server holds
-        # the connection open for up to `timeout` seconds, and a shorter client-
-        # side socket timeout fires first, raising "Timeout reading from socket".
-        blocking_client = valkey.from_url(url, decode_responses=True, socket_timeout=None)
-        return cls(client, blocking_client)
+        return cls(TimedValkey(valkey.from_url(url, decode_responses=True)), BotRpcClient(url))
 
     @classmethod
     def create_fake(cls) -> ValkeyClient:
         """Create a dict-backed fake for testing."""
-        fake = _FakeValkeyClient()
-        return cls(fake, fake)
+        return cls(_FakeValkeyClient())
 
     def _key(self, *parts: str) -> str:
         """Build a namespaced Valkey key from the given parts."""
@@ -110,35 +113,97 @@ class ValkeyClient:
         key = self._key("twitch", "dedup", message_id)
         self._client.delete(key)
 
-    # ── Pub/Sub for bot commands ──
+    def add_twitch_event(self, event: dict) -> str:
+        """Append an event to the durable Twitch event stream. Raises if Valkey rejects the write."""
+        return self._client.xadd(
+            self._key("events", "twitch"),
+            {"data": json.dumps(event)},
+            maxlen=TWITCH_EVENT_STREAM_MAXLEN,
+            approximate=True,
+        )
 
-    async def send_bot_command(self, command: str, payload: dict, timeout: float = 3.0) -> dict | None:
-        """Publish a command and wait for a reply. Returns None on timeout."""
-        import asyncio
-        import uuid
+    # ── Guild metadata snapshot (written by the bot, see NerdyPy/utils/guild_metadata.py) ──
+
+    def _guild_snapshot(self, guild_id: int, kind: str) -> dict[str, str] | None:
+        """Return the raw *kind* hash of a guild, or None if the bot has not published the guild."""
+        base = self._key("guild", str(guild_id))
+        pipe = self._client.pipeline(transaction=True)
+        pipe.exists(f"{base}:meta")
+        pipe.hgetall(f"{base}:{kind}")
+        exists, fields = pipe.execute()
+        return fields if exists else None
+
+    def get_guild_channels(self, guild_id: int) -> list[dict] | None:
+        """Return the guild's channels sorted by name, or None on a snapshot miss."""
+        fields = self._guild_snapshot(guild_id, "channels")
+        if fields is None:
+            return None
+        channels = [{"id": cid, **json.loads(raw)} for cid, raw in fields.items()]
+        channels.sort(key=lambda c: c["name"])
+        return channels
+
+    def get_guild_roles(self, guild_id: int) -> list[dict] | None:
+        """Return the guild's roles from highest to lowest, or None on a snapshot miss."""
+        fields = self._guild_snapshot(guild_id, "roles")
+        if fields is None:
+            return None
+        roles = [(json.loads(raw), rid) for rid, raw in fields.items()]
+        roles.sort(key=lambda r: -r[0]["position"])
+        return [{"id": rid, "name": role["name"]} for role, rid in roles]
 
-        request_id = str(uuid.uuid4())
-        reply_channel = self._key("reply", request_id)
-        cmd_channel = self._key("cmd")
+    # ── Resource versions (ETags of read-mostly views, see NerdyPy/utils/resource_versions.py) ──
 
-        message = json.dumps({"request_id": request_id, "command": command, **payload})
-        self._client.publish(cmd_channel, message)
+    def resource_etag(self, resource: str, guild_id: int | None = None, variant: str = "") -> str | None:
+        """Return a strong ETag for the current version of *resource*, or None if Valkey is unavailable.
 
-        # Use the dedicated blocking client so socket_timeout=None does not
-        # interfere with the regular client's fast KV operations.
+        *variant* distinguishes representations of the same data (e.g. a redacted view).
+        """
+        keys = [EPOCH_KEY, version_key(resource)]
+        if guild_id is not None:
+            keys.append(version_key(resource, guild_id))
         try:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(self._blocking_client.blpop, reply_channel, timeout=max(1, int(timeout))),
-                timeout=timeout + 1,
-            )
-            if result:
-                _, data = result
-                return json.loads(data)
-        except asyncio.TimeoutError:
-            pass  # expected — no reply within timeout window
-        except Exception as exc:
-            _log.warning("Unexpected error waiting for bot command reply: %s", exc)
-        return None
+            values = self._client.mget(keys)
+            if values[0] is None:
+                # First reader after a Valkey restart: pick an epoch (or adopt a concurrent one).
+                self._client.set(EPOCH_KEY, new_epoch(), nx=True)
+                values = self._client.mget(keys)
+        except Exception as e:
+            _log.warning("Resource version lookup failed for %s: %s", resource, e)
+            return None
+        if values[0] is None:
+            return None
+        raw = ":".join([resource, str(guild_id), variant, *(v or "0" for v in values)])
+        return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+    def bump_resource_versions(self, changes) -> None:
+        """Increment the counters of *changes* (``(resource, guild_id)`` pairs). Errors are logged."""
+        if not changes:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for resource, guild_id in changes:
+                pipe.incr(version_key(resource, guild_id))
+            pipe.execute()
+        except Exception as e:
+            # Without the bump, ETags handed out for these resources would stay valid: retire them all.
+            _log.warning("Resource version bump failed, starting a new epoch: %s", e)
+            try:
+                self._client.set(EPOCH_KEY, new_epoch())
+            except Exception:
+                _log.exception("Failed to reset the resource version epoch")
+
+    # ── Pub/Sub for bot commands ──
+
+    async def send_bot_command(self, command: str, payload: dict, timeout: float = 3.0) -> dict | None:
+        """Publish a command and wait for a reply. Returns None on timeout."""
+        if self._rpc is None:
+            return None
+        start = time.monotonic()
+        result = await self._rpc.call(command, payload, timeout=timeout)
+        WEB_METRICS.bot_commands.observe(time.monotonic() - start, command)
+        if result is None:
+            WEB_METRICS.bot_command_timeouts.inc(command)
+        return result
 
     def notify_bot(self, command: str, payload: dict) -> None:
         """Publish a fire-and-forget command to the bot (no reply expected).
@@ -151,18 +216,16 @@ class ValkeyClient:
         except Exception as exc:
             _log.error("notify_bot: failed to publish %r: %s", command, exc, exc_info=True)
 
-    def push_reply(self, request_id: str, data: dict) -> None:
-        """Push a reply to a waiting command (used by bot side)."""
-        key = self._key("reply", request_id)
-        self._client.lpush(key, json.dumps(data))
-        self._client.expire(key, 10)
+    async def aclose(self) -> None:
+        """Close the bot command channel and the underlying Valkey connection."""
+        if self._rpc is not None:
+            await self._rpc.aclose()
+        self.close()
 
     def close(self) -> None:
-        """Close the underlying Valkey connections if supported."""
+        """Close the underlying Valkey connection if supported."""
         if hasattr(self._client, "close"):
             self._client.close()
-        if self._blocking_client is not self._client and hasattr(self._blocking_client, "close"):
-            self._blocking_client.close()
 
 
 class _FakeValkeyClient:
@@ -171,6 +234,8 @@ class _FakeValkeyClient:
     def __init__(self):
         """Initialize the fake client with an empty in-memory store."""
         self._store: dict[str, str] = {}
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._streams: dict[str, list[tuple[str, dict]]] = {}
 
     def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool | None:
         """Store a value (TTL ignored in fake).
@@ -186,35 +251,97 @@ class _FakeValkeyClient:
         """Return a stored value or None if absent."""
         return self._store.get(key)
 
+    def mget(self, keys: list[str]) -> list[str | None]:
+        """Return the stored values of *keys* (None where absent)."""
+        return [self._store.get(key) for key in keys]
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """Increment an integer value (starting from 0)."""
+        self._store[key] = str(int(self._store.get(key, 0)) + amount)
+        return int(self._store[key])
+
     def delete(self, *keys: str) -> None:
         """Remove one or more keys from the store."""
         for key in keys:
             self._store.pop(key, None)
+            self._hashes.pop(key, None)
 
     def publish(self, channel: str, message: str) -> None:
         """No-op — pub/sub is not simulated in the fake."""
         pass  # no-op in fake
 
-    def lpush(self, key: str, value: str) -> None:
-        """Push a value to a list key (fake stores only the last value)."""
-        self._store[key] = value
+    def delete_twitch_event_claim(self, message_id: str) -> None:
+        """Delete the dedup key so retries can succeed."""
+        key = f"{ValkeyClient.PREFIX}:twitch:dedup:{message_id}"
+        self._store.pop(key, None)
 
-    def blpop(self, key: str, timeout: int = 0) -> tuple[str, str] | None:
-        """Pop and return a list item, or None if the key is absent."""
-        val = self._store.pop(key, None)
-        if val is not None:
-            return (key, val)
-        return None
+    def exists(self, *keys: str) -> int:
+        """Return how many of the given keys are present."""
+        return sum(key in self._store or key in self._hashes for key in keys)
+
+    def hset(self, key: str, field: str | None = None, value: str | None = None, mapping: dict | None = None) -> int:
+        """Set one field and/or a mapping of fields on a hash."""
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        self._hashes.setdefault(key, {}).update({k: str(v) for k, v in fields.items()})
+        return len(fields)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        """Return every field of a hash (empty if absent)."""
+        return dict(self._hashes.get(key, {}))
+
+    def hdel(self, key: str, *fields: str) -> int:
+        """Remove fields from a hash; the hash disappears with its last field."""
+        hash_ = self._hashes.get(key, {})
+        removed = sum(hash_.pop(f, None) is not None for f in fields)
+        if key in self._hashes and not hash_:
+            del self._hashes[key]
+        return removed
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        """Increment an integer hash field."""
+        hash_ = self._hashes.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+        return int(hash_[field])
 
     def expire(self, key: str, seconds: int) -> None:
         """No-op — expiry is not simulated in the fake."""
         pass  # no-op in fake
 
-    def delete_twitch_event_claim(self, message_id: str) -> None:
-        """Delete the dedup key so retries can succeed."""
-        key = f"{ValkeyClient.PREFIX}:twitch:dedup:{message_id}"
-        self._store.pop(key, None)
+    def xadd(self, name: str, fields: dict, maxlen: int | None = None, approximate: bool = True) -> str:
+        """Append an entry to a stream (trimmed exactly to *maxlen* in the fake)."""
+        entries = self._streams.setdefault(name, [])
+        entry_id = f"{len(entries) + 1}-0"
+        entries.append((entry_id, dict(fields)))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return entry_id
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        """Return a pipeline that replays queued calls against this fake on execute()."""
+        return _FakePipeline(self)
 
     def getdel(self, key: str) -> str | None:
         """Atomically get and delete a key. Returns the value or None if absent."""
         return self._store.pop(key, None)
+
+
+class _FakePipeline:
+    """Queues calls on a _FakeValkeyClient and replays them in order on execute()."""
+
+    def __init__(self, client: _FakeValkeyClient):
+        self._client = client
+        self._calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        """Run the queued calls and return their results."""
+        calls, self._calls = self._calls, []
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in calls]
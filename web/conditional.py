@@ -0,0 +1,35 @@
+"""Conditional GETs for read-mostly dashboard views.
+
+The ETag comes from the Valkey version counters (``ValkeyClient.resource_etag``), so a matching
+``If-None-Match`` is answered with 304 before the route touches the database.
+"""
+
+from __future__ import annotations
+
+from fastapi import Request, Response, status
+
+# Browsers and proxies must revalidate every time; the 304 path is what makes that cheap.
+CACHE_CONTROL = "private, no-cache"
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 prescribes for If-None-Match."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, response: Response, etag: str | None) -> Response | None:
+    """Tag *response* with *etag* and return a 304 response if the client already has it.
+
+    With no ETag (Valkey unavailable) the response is left untouched and always rendered in full.
+    """
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -65,6 +65,13 @@ class WebConfig:
     twitch_webhook_url: str = ""
     twitch_webhook_secret: str = ""
 
+    @property
+    def async_db_connection_string(self) -> str:
+        """The connection string for the async engine: SQLite goes through aiosqlite, psycopg serves both."""
+        if self.db_connection_string.startswith("sqlite:"):
+            return "sqlite+aiosqlite:" + self.db_connection_string.removeprefix("sqlite:")
+        return self.db_connection_string
+
     @classmethod
     def load(cls, config_path: Path | str | None = None) -> WebConfig:
         """Load config from file + env vars.  Env vars take priority."""
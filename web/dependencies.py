@@ -11,6 +11,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import PyJWTError as JWTError
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
@@ -64,6 +65,11 @@ def get_db_session() -> Session:
     raise NotImplementedError
 
 
+def get_async_db_session() -> AsyncSession:
+    """Placeholder — overridden at app startup."""
+    raise NotImplementedError
+
+
 def get_config() -> WebConfig:
     """Placeholder — overridden at app startup."""
     raise NotImplementedError
@@ -108,10 +114,10 @@ def require_operator(
     return user
 
 
-def require_premium(
+async def require_premium(
     user: dict = Depends(get_current_user),
     config: WebConfig = Depends(get_config),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> dict:
     """Require the current user to have premium access. Operators bypass."""
     if _is_test_user(user):
@@ -119,7 +125,7 @@ def require_premium(
     user_id = int(user["sub"])
     if user_id in config.ops:
         return user
-    if user_id not in _get_premium_ids(session):
+    if user_id not in await session.run_sync(_get_premium_ids):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Premium access required")
     return user
 
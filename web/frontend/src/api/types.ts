@@ -220,6 +220,23 @@ export interface ApplicationSubmissionSchema {
   votes: ApplicationVoteSchema[];
 }
 
+export interface ApplicationSubmissionSummarySchema {
+  id: number;
+  form_id: number;
+  form_name: string | null;
+  user_id: string;
+  user_name: string | null;
+  status: string;
+  submitted_at: string;
+  approve_count: number;
+  deny_count: number;
+}
+
+export interface ApplicationSubmissionListResponse {
+  submissions: ApplicationSubmissionSummarySchema[];
+  next_cursor: number | null;
+}
+
 export interface ApplicationTemplateQuestionSchema {
   id: number;
   question_text: string;
@@ -375,21 +392,96 @@ export interface DebugToggleResponse {
 }
 
 export interface SyncCommandsRequest {
-  mode: "global" | "local" | "copy" | "clear";
+  mode: "global" | "local" | "copy" | "clear" | "auto";
   guild_ids?: string[];
+  force?: boolean;
 }
 
 export interface SyncCommandsResponse {
   success: boolean;
   synced_count?: number | null;
+  skipped?: boolean;
   error?: string | null;
 }
 
+export interface VoiceMusicDetail {
+  queue_length: number;
+  buffered: number;
+  queue_wait_ms: number | null;
+  time_to_first_audio_ms: number | null;
+}
+
 export interface VoiceConnectionDetail {
   guild_id: string;
   guild_name: string;
   channel_id: string;
   channel_name: string;
+  music?: VoiceMusicDetail | null;
+}
+
+export interface MusicWorkerPoolStats {
+  size: number;
+  running: boolean;
+  busy: number;
+  queued: number;
+  utilization: number;
+  completed: number;
+  failed: number;
+  timeouts: number;
+  restarts: number;
+}
+
+export interface MusicPrefetchStats {
+  max_concurrent: number;
+  per_guild: number;
+  running: number;
+  pending: number;
+  guilds: number;
+  completed: number;
+  failed: number;
+  cancelled: number;
+}
+
+export interface TimingSummary {
+  count: number;
+  avg_ms: number | null;
+  p50_ms: number | null;
+  p95_ms: number | null;
+  p99_ms: number | null;
+  max_ms: number | null;
+  last_ms: number | null;
+}
+
+export interface MusicTelemetry {
+  extract: TimingSummary | null;
+  download: TimingSummary | null;
+  fetch: TimingSummary | null;
+  queue_wait: TimingSummary | null;
+  time_to_first_audio: TimingSummary | null;
+  file_cache_hit_rate: number | null;
+  metadata_cache_hit_rate: number | null;
+  ffmpeg_processes: number;
+  counters: Record<string, number>;
+}
+
+export interface MusicHealth {
+  worker_pool: MusicWorkerPoolStats | null;
+  prefetch: MusicPrefetchStats | null;
+  telemetry: MusicTelemetry | null;
+}
+
+export interface EventLoopStall {
+  at: string;
+  blocked_ms: number;
+  stack: string[];
+}
+
+export interface EventLoopHealth {
+  interval_ms: number;
+  threshold_ms: number;
+  lag: TimingSummary | null;
+  stall_count: number;
+  recent_stalls: EventLoopStall[];
 }
 
 export interface HealthResponse {
@@ -406,6 +498,14 @@ export interface HealthResponse {
   discord_py_version: string | null;
   bot_version: string | null;
   voice_details: VoiceConnectionDetail[];
+  music: MusicHealth | null;
+  event_loop: EventLoopHealth | null;
+}
+
+export interface MetricsResponse {
+  status: string;
+  histograms: Record<string, Record<string, TimingSummary>>;
+  counters: Record<string, Record<string, number>>;
 }
 
 export interface HealthLiveStatus {
@@ -415,6 +515,8 @@ export interface HealthLiveStatus {
   memory_mb: number;
   cpu_percent: number;
   voice_details: VoiceConnectionDetail[];
+  music?: MusicHealth | null;
+  event_loop?: EventLoopHealth | null;
   ts: number;
 }
 
@@ -22,6 +22,7 @@ import type {
   HealthResponse,
   LanguageConfig,
   LeaveMessageConfig,
+  MetricsResponse,
   ModeratorRole,
   ModuleListResponse,
   PremiumUserSchema,
@@ -30,6 +31,7 @@ import type {
   RecipeSyncStatusResponse,
   ReminderSchema,
   RoleMappingSchema,
+  TimingSummary,
   TwitchNotificationSchema,
   WowGuildNewsSchema,
 } from "@/api/types";
@@ -598,6 +600,52 @@ export const operatorHealth: HealthResponse = {
       channel_name: "Voice General",
     },
   ],
+  event_loop: {
+    interval_ms: 500,
+    threshold_ms: 250,
+    lag: { count: 345600, avg_ms: 0.4, p50_ms: 1, p95_ms: 5, p99_ms: 10, max_ms: 812.3, last_ms: 0.2 },
+    stall_count: 1,
+    recent_stalls: [
+      {
+        at: "2026-03-13T11:02:41+00:00",
+        blocked_ms: 812.3,
+        stack: [
+          '  File "/app/NerdyPy/modules/wow/guild_news.py", line 412, in _poll_guild\n',
+          '  File "/app/NerdyPy/modules/wow/api.py", line 877, in build_account_groups\n',
+        ],
+      },
+    ],
+  },
+};
+
+function timing(count: number, avg: number, [p50, p95, p99]: number[], max: number): TimingSummary {
+  return { count, avg_ms: avg, p50_ms: p50, p95_ms: p95, p99_ms: p99, max_ms: max, last_ms: avg };
+}
+
+export const operatorMetrics: MetricsResponse = {
+  status: "online",
+  histograms: {
+    command: {
+      "music play": timing(214, 1840.2, [1000, 5000, 7420.9], 7420.9),
+      "reminder create": timing(37, 212.7, [250, 500, 500], 488.4),
+      "wow armory": timing(58, 1210.5, [1000, 2500, 2500], 2391.8),
+    },
+    interaction: {
+      receive: timing(309, 61.3, [50, 100, 250], 212.4),
+      immediate: timing(41, 230.8, [250, 500, 500], 498.1),
+      deferred: timing(268, 1562.4, [1000, 5000, 7420.9], 7420.9),
+    },
+    loop: {
+      reminder: timing(2880, 4.1, [5, 10, 25], 140.2),
+      guild_news: timing(192, 8120.4, [5000, 21877.5, 21877.5], 21877.5),
+      music_progress: timing(86400, 12.6, [1, 100, 250], 611.2),
+    },
+  },
+  counters: {
+    command_errors: { "wow armory": 2 },
+    loop_iterations: { reminder: 2880, guild_news: 192, music_progress: 86400 },
+    loop_items: { reminder: 95, guild_news: 576, music_progress: 10422 },
+  },
 };
 
 export const operatorModules: ModuleListResponse = {
@@ -59,6 +59,7 @@ import {
   operatorBotPermissions,
   operatorErrorStatus,
   operatorHealth,
+  operatorMetrics,
   operatorModules,
   operatorPremiumUsers,
   operatorRecipeCache,
@@ -454,8 +455,26 @@ const routes: Route[] = [
 
   // ── Application submissions ───────────────────────────────────────────────
   {
+    // The mock serves every submission as one page (no query-string handling here).
     pattern: /^\/guilds\/(\d+)\/application-submissions$/,
-    handler: (_m, [, guildId]) => ok(guildStore(guildId, "applicationSubmissions")),
+    handler: (_m, [, guildId]) => {
+      const subs = guildStore(guildId, "applicationSubmissions") as { answers?: unknown; votes?: { vote: string }[] }[];
+      return ok({
+        submissions: subs.map(({ answers: _a, votes = [], ...summary }) => ({
+          ...summary,
+          approve_count: votes.filter((v) => v.vote === "approve").length,
+          deny_count: votes.filter((v) => v.vote === "deny").length,
+        })),
+        next_cursor: null,
+      });
+    },
+  },
+  {
+    pattern: /^\/guilds\/(\d+)\/application-submissions\/(\d+)$/,
+    handler: (_m, [, guildId, subId]) => {
+      const subs = guildStore(guildId, "applicationSubmissions") as { id: number }[];
+      return ok(subs.find((s) => s.id === Number(subId)) ?? null);
+    },
   },
   {
     pattern: /^\/guilds\/(\d+)\/application-submissions\/(\d+)\/decide$/,
@@ -604,6 +623,10 @@ const routes: Route[] = [
     pattern: /^\/operator\/health$/,
     handler: () => ok(operatorHealth),
   },
+  {
+    pattern: /^\/operator\/metrics$/,
+    handler: () => ok(operatorMetrics),
+  },
   {
     pattern: /^\/operator\/modules$/,
     handler: () => ok(operatorModules),
@@ -709,8 +732,10 @@ const routes: Route[] = [
   {
     pattern: /^\/operator\/sync-commands$/,
     handler: (_m, _g, body) => {
-      const mode = (body as { mode?: string })?.mode ?? "global";
-      return ok({ success: true, synced_count: mode === "clear" ? 0 : 42 });
+      const { mode = "global", force = false } = (body as { mode?: string; force?: boolean }) ?? {};
+      // Mimic the hash check: an unforced global sync finds the tree unchanged.
+      if (mode === "global" && !force) return ok({ success: true, synced_count: 0, skipped: true });
+      return ok({ success: true, synced_count: mode === "clear" ? 0 : 42, skipped: false });
     },
   },
 
@@ -742,32 +767,43 @@ function ni(v: string | null | undefined): string | null | undefined {
  * Apply the same PII redaction the backend applies for support-mode requests.
  * Only the fields that _redact() covers in guilds.py are touched.
  */
+type SubmissionRow = {
+  user_id: string;
+  user_name: string;
+  decision_reason?: string | null;
+  answers?: { answer_text: string | null }[];
+  votes?: { voter_id: string; voter_name: string }[];
+};
+
+function redactSubmission<T extends SubmissionRow>(s: T): T {
+  return {
+    ...s,
+    user_id: ni(s.user_id),
+    user_name: ni(s.user_name),
+    ...(s.decision_reason !== undefined && { decision_reason: ni(s.decision_reason) }),
+    ...(s.answers && { answers: s.answers.map((a) => ({ ...a, answer_text: ni(a.answer_text) })) }),
+    ...(s.votes && {
+      votes: s.votes.map((v) => ({ ...v, voter_id: ni(v.voter_id), voter_name: ni(v.voter_name) })),
+    }),
+  };
+}
+
 function applyRedaction(data: unknown, pathOnly: string): unknown {
+  if (/\/application-submissions$/.test(pathOnly)) {
+    const page = data as { submissions: SubmissionRow[]; next_cursor: number | null };
+    return { ...page, submissions: page.submissions.map(redactSubmission) };
+  }
+
+  if (/\/application-submissions\/\d+$/.test(pathOnly)) {
+    return data ? redactSubmission(data as SubmissionRow) : data;
+  }
+
   if (!Array.isArray(data)) return data;
 
   if (/\/reminders$/.test(pathOnly)) {
     return (data as { author: string | null }[]).map((r) => ({ ...r, author: ni(r.author) }));
   }
 
-  if (/\/application-submissions$/.test(pathOnly)) {
-    return (
-      data as {
-        user_id: string;
-        user_name: string;
-        decision_reason: string | null;
-        answers: { answer_text: string | null }[];
-        votes: { voter_id: string; voter_name: string }[];
-      }[]
-    ).map((s) => ({
-      ...s,
-      user_id: ni(s.user_id),
-      user_name: ni(s.user_name),
-      decision_reason: ni(s.decision_reason),
-      answers: s.answers.map((a) => ({ ...a, answer_text: ni(a.answer_text) })),
-      votes: s.votes.map((v) => ({ ...v, voter_id: ni(v.voter_id), voter_name: ni(v.voter_name) })),
-    }));
-  }
-
   if (/\/wow\/crafting-orders$/.test(pathOnly)) {
     return (
       data as {
@@ -378,6 +378,7 @@ export const de: typeof en = {
       sync_desc:
         "Synchronisiert Slash-Befehle mit der Discord-API. Globaler Sync nach dem Hinzufügen oder Entfernen von Modulen. Server-spezifische Modi eignen sich zum Testen vor dem globalen Ausrollen.",
       sync_mode_label: "Modus",
+      sync_mode_auto: "Automatisch — jeden Bereich synchronisieren, dessen Befehle sich seit dem letzten Sync geändert haben",
       sync_mode_global: "Global — alle Befehle weltweit synchronisieren",
       sync_mode_local: "Zum Server — Befehle auf einen Server übertragen",
       sync_mode_copy: "Kopieren — globale Befehle auf einen Server kopieren",
@@ -388,6 +389,8 @@ export const de: typeof en = {
       sync_syncing: "Synchronisieren…",
       sync_success: "{count} Befehle synchronisiert",
       sync_cleared: "Befehle vom Server gelöscht",
+      sync_force: "Erzwingen — auch synchronisieren, wenn sich seit dem letzten Sync nichts geändert hat",
+      sync_unchanged: "Befehle seit dem letzten Sync unverändert — nichts zu tun",
     },
 
     operator_recipe_sync: {
@@ -435,6 +438,7 @@ export const de: typeof en = {
       title: "Bot-Status",
       desc: "Live-Metriken, Bot-Berechtigungen und Fehlersteuerung.",
       tab_health: "Status",
+      tab_metrics: "Metriken",
       tab_permissions: "Bot-Berechtigungen",
       tab_error_control: "Fehlersteuerung",
       live: "Live",
@@ -456,6 +460,23 @@ export const de: typeof en = {
       bot_version: "Bot-Version",
       python: "Python",
       discord_py: "discord.py",
+      event_loop: "Event-Loop",
+      loop_lag: "Verzögerung (p50 / p95 / max)",
+      loop_stalls: "Blockaden über {threshold} ms",
+      loop_recent_stalls: "Letzte Blockaden",
+      loop_blocked: "{ms} ms blockiert",
+      metrics_desc:
+        "Latenz-Perzentile seit dem Botstart: Slash-Befehle, Interaktionen und Durchläufe der Hintergrundschleifen.",
+      metrics_loading: "Metriken werden geladen…",
+      metrics_empty: "Noch nichts erfasst.",
+      metrics_family_command: "Befehle",
+      metrics_family_interaction: "Interaktionen (Empfang / direkt beantwortet / zurückgestellt)",
+      metrics_family_loop: "Hintergrundschleifen",
+      metrics_col_name: "Name",
+      metrics_col_count: "Anzahl",
+      metrics_col_errors: "Fehler",
+      metrics_col_items: "Elemente",
+      metrics_col_percentiles: "p50 / p95 / p99",
       active_voice_sessions: "Aktive Sprachsitzungen",
       col_guild: "Server",
       col_channel: "Kanal",
@@ -565,6 +586,7 @@ export const de: typeof en = {
       all_forms: "Alle Formulare",
       empty: "Keine Einsendungen.",
       select_hint: "Wähle eine Einsendung, um Details anzuzeigen.",
+      load_more: "Mehr laden",
       status: {
         all: "Alle",
         pending: "Ausstehend",
@@ -374,6 +374,7 @@ export const en = {
       sync_desc:
         "Sync slash commands with Discord's API. Use global sync after adding or removing modules. Guild-specific modes are useful for testing before pushing globally.",
       sync_mode_label: "Mode",
+      sync_mode_auto: "Auto — sync every scope whose commands changed since the last sync",
       sync_mode_global: "Global — sync all commands worldwide",
       sync_mode_local: "Sync to guild — push commands to one guild",
       sync_mode_copy: "Copy to guild — copy global commands to one guild",
@@ -384,6 +385,8 @@ export const en = {
       sync_syncing: "Syncing…",
       sync_success: "{count} commands synced",
       sync_cleared: "Commands cleared from guild",
+      sync_force: "Force — sync even if nothing changed since the last sync",
+      sync_unchanged: "Commands unchanged since the last sync — nothing to do",
     },
 
     operator_user_management: {
@@ -431,6 +434,7 @@ export const en = {
       title: "Bot Health",
       desc: "Live metrics, bot permissions, and error control.",
       tab_health: "Health",
+      tab_metrics: "Metrics",
       tab_permissions: "Bot Permissions",
       tab_error_control: "Error Control",
       live: "Live",
@@ -452,6 +456,23 @@ export const en = {
       bot_version: "Bot version",
       python: "Python",
       discord_py: "discord.py",
+      event_loop: "Event Loop",
+      loop_lag: "Scheduling delay (p50 / p95 / max)",
+      loop_stalls: "Stalls over {threshold} ms",
+      loop_recent_stalls: "Recent stalls",
+      loop_blocked: "blocked {ms} ms",
+      metrics_desc:
+        "Latency percentiles since the bot started: slash commands, interaction round trips and background loop iterations.",
+      metrics_loading: "Loading metrics…",
+      metrics_empty: "Nothing recorded yet.",
+      metrics_family_command: "Commands",
+      metrics_family_interaction: "Interactions (receive / answered directly / deferred)",
+      metrics_family_loop: "Background loops",
+      metrics_col_name: "Name",
+      metrics_col_count: "Count",
+      metrics_col_errors: "Errors",
+      metrics_col_items: "Items",
+      metrics_col_percentiles: "p50 / p95 / p99",
       active_voice_sessions: "Active Voice Sessions",
       col_guild: "Guild",
       col_channel: "Channel",
@@ -560,6 +581,7 @@ export const en = {
       all_forms: "All forms",
       empty: "No submissions.",
       select_hint: "Select a submission to view details.",
+      load_more: "Load more",
       status: {
         all: "All",
         pending: "Pending",
@@ -0,0 +1,277 @@
+"""Request, bot RPC, Valkey and database pool metrics for the dashboard API.
+
+Everything is kept in process and rendered in the Prometheus text format by ``GET /api/metrics``
+(operators only):
+
+- ``MetricsMiddleware`` times every HTTP request by method, route template and status
+- ``ValkeyClient.send_bot_command`` times bot commands and counts the ones that got no reply
+- ``TimedValkey`` wraps the Valkey connection and times each operation
+- ``instrument_pool`` times connection checkouts; pool size and SSE subscribers are read at scrape time
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import Any
+
+from utils.metrics import LATENCY_BUCKETS, Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class LabeledHistogram:
+    """One ``Histogram`` per label combination."""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._children: dict[tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._children[values] = Histogram(self.buckets)
+            return child
+
+    def observe(self, seconds: float, *values: str) -> None:
+        self.labels(*values).observe(seconds)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            children = sorted(self._children.items())
+        for values, histogram in children:
+            pairs, count, total = histogram.cumulative()
+            for bound, seen in [*pairs, ("+Inf", count)]:
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, values, le)} {seen}")
+            labels = _labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class LabeledCounter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *values: str, amount: int = 1) -> None:
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def value(self, *values: str) -> int:
+        with self._lock:
+            return self._values.get(values, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labelnames, labels)} {n}" for labels, n in values)
+        return lines
+
+
+class LabeledGauge:
+    """Gauge read from a callback per label combination when scraped."""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._readers: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, read: Callable[[], float], *values: str) -> None:
+        self._readers[values] = read
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for values, read in sorted(self._readers.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, values)} {_number(read())}")
+        return lines
+
+
+class WebMetrics:
+    """The web process's metrics; gauges are read from callbacks at render time."""
+
+    def __init__(self):
+        self.requests = LabeledHistogram(
+            "nerpybot_web_request_duration_seconds",
+            "HTTP request latency by method, route template and status.",
+            ("method", "route", "status"),
+        )
+        self.bot_commands = LabeledHistogram(
+            "nerpybot_web_bot_command_duration_seconds",
+            "Round trip of bot commands sent over Valkey, including timeouts.",
+            ("command",),
+        )
+        self.bot_command_timeouts = LabeledCounter(
+            "nerpybot_web_bot_command_timeouts_total",
+            "Bot commands that got no reply before their deadline.",
+            ("command",),
+        )
+        self.valkey = LabeledHistogram(
+            "nerpybot_web_valkey_operation_duration_seconds",
+            "Latency of Valkey operations issued by the dashboard.",
+            ("operation",),
+        )
+        self.pool_checkout = LabeledHistogram(
+            "nerpybot_web_db_pool_checkout_seconds",
+            "Time spent waiting for a database connection from the pool.",
+            ("engine",),
+        )
+        self.pool_size = LabeledGauge(
+            "nerpybot_web_db_pool_size", "Configured size of the database connection pool.", ("engine",)
+        )
+        self.pool_checked_out = LabeledGauge(
+            "nerpybot_web_db_pool_checked_out", "Database connections currently checked out.", ("engine",)
+        )
+        self.pool_overflow = LabeledGauge(
+            "nerpybot_web_db_pool_overflow", "Connections opened beyond the pool size.", ("engine",)
+        )
+        self.sse_connections = LabeledGauge("nerpybot_web_sse_connections", "Open SSE health streams.")
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def render(self) -> str:
+        lines = []
+        for metric in vars(self).values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+WEB_METRICS = WebMetrics()
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request under its route template (``/api/guilds/{guild_id}``).
+
+    Requests that match no route are grouped as ``unmatched`` so random paths cannot grow the label set.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.monotonic()
+        status = 500
+
+        async def _send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            WEB_METRICS.requests.observe(time.monotonic() - start, scope["method"], _route_template(scope), str(status))
+
+
+def _route_template(scope) -> str:
+    """Return the full template of the route that handled *scope*, or ``unmatched``.
+
+    A route mounted with ``include_router(prefix=...)`` may only know its path below that prefix;
+    path parameters match exactly one segment, so the prefix is the request path's leading segments.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if not template:
+        return "unmatched"
+    segments = scope["path"].rstrip("/").split("/")
+    missing = len(segments) - len(template.rstrip("/").split("/"))
+    return "/".join(segments[: missing + 1]) + template if missing > 0 else template
+
+
+class TimedValkey:
+    """Proxy around a Valkey client that times every call; pipelines are timed on ``execute``."""
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name == "pipeline":
+            return lambda *args, **kwargs: _TimedPipeline(attr(*args, **kwargs))
+        if not callable(attr):
+            return attr
+
+        def _timed(*args, **kwargs):
+            with _timed_op(name):
+                return attr(*args, **kwargs)
+
+        return _timed
+
+
+class _TimedPipeline:
+    def __init__(self, pipe: Any):
+        self._pipe = pipe
+
+    def __getattr__(self, name: str):
+        return getattr(self._pipe, name)
+
+    def execute(self, *args, **kwargs):
+        with _timed_op("pipeline"):
+            return self._pipe.execute(*args, **kwargs)
+
+
+@contextmanager
+def _timed_op(operation: str):
+    with WEB_METRICS.valkey.labels(operation).time():
+        yield
+
+
+def instrument_pool(pool, engine: str) -> None:
+    """Time connection checkouts from *pool* and report its size as gauges under ``engine``.
+
+    Wraps ``Pool._do_get``, where a checkout waits for a free or new connection; SQLAlchemy has no
+    event for the start of a checkout.
+    """
+    do_get = pool._do_get
+    histogram = WEB_METRICS.pool_checkout.labels(engine)
+
+    def _timed_do_get():
+        start = time.monotonic()
+        try:
+            return do_get()
+        finally:
+            histogram.observe(time.monotonic() - start)
+
+    pool._do_get = _timed_do_get
+    # QueuePool only; other pools (SQLite in-memory, NullPool) have no size to report.
+    for gauge, method in (
+        (WEB_METRICS.pool_size, "size"),
+        (WEB_METRICS.pool_checked_out, "checkedout"),
+        (WEB_METRICS.pool_overflow, "overflow"),
+    ):
+        read = getattr(pool, method, None)
+        if callable(read):
+            gauge.set_function(read, engine)
@@ -10,6 +10,7 @@ from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.guild import BotGuild
 from web.auth.jwt import create_access_token
@@ -23,7 +24,7 @@ from web.dependencies import (
     _get_premium_ids,
     get_config,
     get_current_user,
-    get_db_session,
+    get_async_db_session,
     get_valkey,
 )
 from web.schemas import GuildSummary, UserInfo
@@ -120,7 +121,7 @@ async def callback(
     state: str = Query(...),
     config: WebConfig = Depends(get_config),
     vk: ValkeyClient = Depends(get_valkey),
-    session=Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Handle Discord OAuth2 callback."""
     if not vk.pop_oauth_state(state):
@@ -173,7 +174,7 @@ async def me(
     user: dict = Depends(get_current_user),
     config: WebConfig = Depends(get_config),
     vk: ValkeyClient = Depends(get_valkey),
-    session=Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return the current user's profile and accessible guilds."""
     user_id = user["sub"]
@@ -210,7 +211,7 @@ async def me(
         perms = resolve_guild_permissions(guilds)
         vk.set_permissions(user_id, perms, ttl=PERM_CACHE_TTL)
         _log.debug("/me: rehydrated permissions for %d guilds after cache miss", len(perms))
-    bot_guilds = _get_bot_guild_ids(session)
+    bot_guilds = await session.run_sync(_get_bot_guild_ids)
     _log.debug("/me: bot_guilds (cached) has %d entries", len(bot_guilds))
 
     invite_base = (
@@ -234,7 +235,7 @@ async def me(
             )
 
     is_operator = int(user_id) in config.ops
-    is_premium = is_operator or int(user_id) in _get_premium_ids(session)
+    is_premium = is_operator or int(user_id) in await session.run_sync(_get_premium_ids)
 
     return UserInfo(
         id=user_id,
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import logging
+from typing import Literal
 
 from cachetools import TTLCache
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from web.cache import ValkeyClient
-from web.dependencies import get_db_session, get_valkey, require_guild_access, require_premium
+from web.conditional import not_modified
+from web.dependencies import get_async_db_session, get_valkey, require_guild_access, require_premium
 from web.twitch import TwitchClient
 from web.schemas import (
     ApplicationAnswerSchema,
@@ -22,7 +27,9 @@ from web.schemas import (
     ApplicationQuestionCreate,
     ApplicationQuestionSchema,
     ApplicationQuestionUpdate,
+    ApplicationSubmissionListResponse,
     ApplicationSubmissionSchema,
+    ApplicationSubmissionSummarySchema,
     ApplicationTemplateCreate,
     ApplicationTemplateQuestionCreate,
     ApplicationTemplateQuestionSchema,
@@ -118,12 +125,14 @@ def _set_support_mode_header(user: dict, response: Response | None) -> None:
 async def get_language(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     response: Response = None,
 ):
     """Return the configured language for a guild (defaults to 'en')."""
     _set_support_mode_header(user, response)
-    return LanguageConfig(guild_id=str(guild_id), language=_get_guild_language_cached(guild_id, session))
+    return LanguageConfig(
+        guild_id=str(guild_id), language=await session.run_sync(lambda s: _get_guild_language_cached(guild_id, s))
+    )
 
 
 @router.put("/{guild_id}/language", response_model=LanguageConfig)
@@ -131,21 +140,21 @@ async def set_language(
     guild_id: int,
     body: LanguageUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Set or update the bot language for a guild."""
     _deny_support_write(user)
     from models.guild import GuildLanguageConfig
 
-    cfg = GuildLanguageConfig.get(guild_id, session)
+    cfg = await session.run_sync(lambda s: GuildLanguageConfig.get(guild_id, s))
     if cfg is None:
         cfg = GuildLanguageConfig(GuildId=guild_id, Language=body.language)
         session.add(cfg)
     else:
         cfg.Language = body.language
     lang = cfg.Language
-    session.commit()
+    await session.commit()
     _guild_lang_cache[guild_id] = lang
     vk.notify_bot("set_guild_language", {"guild_id": guild_id, "language": lang})
     return LanguageConfig(guild_id=str(guild_id), language=lang)
@@ -158,12 +167,12 @@ async def set_language(
 async def list_moderator_roles(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List the configured moderator role(s) for a guild."""
     from models.permissions import BotModeratorRole
 
-    role = BotModeratorRole.get(guild_id, session)
+    role = await session.run_sync(lambda s: BotModeratorRole.get(guild_id, s))
     if role is None:
         return []
     return [ModeratorRole(guild_id=str(guild_id), role_id=str(role.RoleId))]
@@ -174,7 +183,7 @@ async def add_moderator_role(
     guild_id: int,
     body: ModeratorRoleCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Set or replace the moderator role for a guild."""
@@ -182,12 +191,12 @@ async def add_moderator_role(
     from models.permissions import BotModeratorRole
 
     new_role_id = int(body.role_id)
-    existing = BotModeratorRole.get(guild_id, session)
+    existing = await session.run_sync(lambda s: BotModeratorRole.get(guild_id, s))
     if existing:
         existing.RoleId = new_role_id
     else:
         session.add(BotModeratorRole(GuildId=guild_id, RoleId=new_role_id))
-    session.commit()
+    await session.commit()
     vk.notify_bot("invalidate_modrole", {"guild_id": guild_id})
     return {"status": "created"}
 
@@ -197,18 +206,18 @@ async def delete_moderator_role(
     guild_id: int,
     role_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Remove the moderator role for a guild. Returns 404 if the role is not configured."""
     _deny_support_write(user)
     from models.permissions import BotModeratorRole
 
-    existing = BotModeratorRole.get(guild_id, session)
+    existing = await session.run_sync(lambda s: BotModeratorRole.get(guild_id, s))
     if existing is None or existing.RoleId != role_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
-    BotModeratorRole.delete(guild_id, session)
-    session.commit()
+    await session.run_sync(lambda s: BotModeratorRole.delete(guild_id, s))
+    await session.commit()
     vk.notify_bot("invalidate_modrole", {"guild_id": guild_id})
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -220,12 +229,12 @@ async def delete_moderator_role(
 async def get_leave_message(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return the leave message configuration for a guild."""
     from models.leavemsg import LeaveMessage
 
-    cfg = LeaveMessage.get(guild_id, session)
+    cfg = await session.run_sync(lambda s: LeaveMessage.get(guild_id, s))
     if cfg is None:
         return LeaveMessageConfig(guild_id=str(guild_id), channel_id=None, message=None, enabled=False)
     return LeaveMessageConfig(
@@ -241,7 +250,7 @@ async def set_leave_message(
     guild_id: int,
     body: LeaveMessageUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Create or update the leave message configuration for a guild."""
@@ -258,7 +267,7 @@ async def set_leave_message(
         )
     from models.leavemsg import LeaveMessage
 
-    cfg = LeaveMessage.get(guild_id, session)
+    cfg = await session.run_sync(lambda s: LeaveMessage.get(guild_id, s))
     if cfg is None:
         cfg = LeaveMessage(GuildId=guild_id)
         session.add(cfg)
@@ -273,7 +282,7 @@ async def set_leave_message(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail="channel_id is required when leave messages are enabled",
         )
-    session.commit()  # commit before notifying bot so it re-reads the updated row
+    await session.commit()  # commit before notifying bot so it re-reads the updated row
     vk.notify_bot("invalidate_leave_config", {"guild_id": guild_id})
     return LeaveMessageConfig(
         guild_id=str(guild_id),
@@ -290,12 +299,12 @@ async def set_leave_message(
 async def list_auto_delete(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List all auto-delete channel rules for a guild."""
     from models.moderation import AutoDelete
 
-    rules = AutoDelete.get_by_guild(guild_id, session)
+    rules = await session.run_sync(lambda s: AutoDelete.get_by_guild(guild_id, s))
     return [
         AutoDeleteRule(
             id=r.Id,
@@ -315,7 +324,7 @@ async def create_auto_delete(
     guild_id: int,
     body: AutoDeleteCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create a new auto-delete rule for a channel. Returns 409 if a rule already exists for that channel."""
     _deny_support_write(user)
@@ -331,9 +340,9 @@ async def create_auto_delete(
     )
     session.add(rule)
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Auto-delete rule already exists for this channel"
         )
@@ -354,13 +363,15 @@ async def update_auto_delete(
     rule_id: int,
     body: AutoDeleteUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Update an existing auto-delete rule. Returns 404 if the rule does not belong to this guild."""
     _deny_support_write(user)
     from models.moderation import AutoDelete
 
-    rule = session.query(AutoDelete).filter(AutoDelete.Id == rule_id, AutoDelete.GuildId == guild_id).first()
+    rule = await session.run_sync(
+        lambda s: s.query(AutoDelete).filter(AutoDelete.Id == rule_id, AutoDelete.GuildId == guild_id).first()
+    )
     if rule is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Auto-delete rule not found")
     if body.keep_messages is not None:
@@ -387,16 +398,18 @@ async def delete_auto_delete(
     guild_id: int,
     rule_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete an auto-delete rule. Returns 404 if not found for this guild."""
     _deny_support_write(user)
     from models.moderation import AutoDelete
 
-    rule = session.query(AutoDelete).filter(AutoDelete.Id == rule_id, AutoDelete.GuildId == guild_id).first()
+    rule = await session.run_sync(
+        lambda s: s.query(AutoDelete).filter(AutoDelete.Id == rule_id, AutoDelete.GuildId == guild_id).first()
+    )
     if rule is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Auto-delete rule not found")
-    session.delete(rule)
+    await session.delete(rule)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -407,12 +420,12 @@ async def delete_auto_delete(
 async def get_auto_kicker(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return the auto-kicker configuration for a guild."""
     from models.moderation import AutoKicker
 
-    cfg = AutoKicker.get_by_guild(guild_id, session)
+    cfg = await session.run_sync(lambda s: AutoKicker.get_by_guild(guild_id, s))
     if cfg is None:
         return AutoKickerConfig(guild_id=str(guild_id), kick_after=0, enabled=False, reminder_message=None)
     return AutoKickerConfig(
@@ -428,13 +441,13 @@ async def set_auto_kicker(
     guild_id: int,
     body: AutoKickerUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create or update the auto-kicker configuration for a guild."""
     _deny_support_write(user)
     from models.moderation import AutoKicker
 
-    cfg = AutoKicker.get_by_guild(guild_id, session)
+    cfg = await session.run_sync(lambda s: AutoKicker.get_by_guild(guild_id, s))
     if cfg is None:
         cfg = AutoKicker(GuildId=guild_id)
         session.add(cfg)
@@ -458,13 +471,18 @@ async def set_auto_kicker(
 @router.get("/{guild_id}/reaction-roles", response_model=list[ReactionRoleMessageSchema])
 async def list_reaction_roles(
     guild_id: int,
+    request: Request,
+    response: Response,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """List all reaction role messages configured for a guild (read-only)."""
     from models.reactionrole import ReactionRoleMessage
 
-    messages = ReactionRoleMessage.get_by_guild(guild_id, session)
+    if (cached := not_modified(request, response, vk.resource_etag("reaction_roles", guild_id))) is not None:
+        return cached
+    messages = await session.run_sync(lambda s: ReactionRoleMessage.get_by_guild(guild_id, s))
     return [
         ReactionRoleMessageSchema(
             id=m.Id,
@@ -483,12 +501,12 @@ async def list_reaction_roles(
 async def list_role_mappings(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List all delegated role mappings for a guild."""
     from models.rolemanage import RoleMapping
 
-    mappings = RoleMapping.get_by_guild(guild_id, session)
+    mappings = await session.run_sync(lambda s: RoleMapping.get_by_guild(guild_id, s))
     return [
         RoleMappingSchema(
             id=m.Id,
@@ -505,7 +523,7 @@ async def create_role_mapping(
     guild_id: int,
     body: RoleMappingCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create a new role mapping. Returns 409 if the mapping already exists."""
     _deny_support_write(user)
@@ -518,9 +536,9 @@ async def create_role_mapping(
     )
     session.add(mapping)
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Role mapping already exists")
     return RoleMappingSchema(
         id=mapping.Id,
@@ -535,16 +553,18 @@ async def delete_role_mapping(
     guild_id: int,
     mapping_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a role mapping. Returns 404 if not found for this guild."""
     _deny_support_write(user)
     from models.rolemanage import RoleMapping
 
-    mapping = session.query(RoleMapping).filter(RoleMapping.Id == mapping_id, RoleMapping.GuildId == guild_id).first()
+    mapping = await session.run_sync(
+        lambda s: s.query(RoleMapping).filter(RoleMapping.Id == mapping_id, RoleMapping.GuildId == guild_id).first()
+    )
     if mapping is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role mapping not found")
-    session.delete(mapping)
+    await session.delete(mapping)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -573,15 +593,25 @@ def _reminder_to_schema(r, user: dict) -> ReminderSchema:
 @router.get("/{guild_id}/reminders", response_model=list[ReminderSchema])
 async def list_reminders(
     guild_id: int,
+    request: Request,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
     response: Response = None,
 ):
     """List all reminder schedules for a guild."""
     from models.reminder import ReminderMessage
 
+    # Support mode redacts authors, so it gets its own representation.
+    etag = vk.resource_etag("reminders", guild_id, variant="support" if user.get("support_mode") else "")
+    if (cached := not_modified(request, response, etag)) is not None:
+        _set_support_mode_header(user, cached)
+        return cached
     _set_support_mode_header(user, response)
-    return [_reminder_to_schema(r, user) for r in ReminderMessage.get_all_by_guild(guild_id, session)]
+    return [
+        _reminder_to_schema(r, user)
+        for r in await session.run_sync(lambda s: ReminderMessage.get_all_by_guild(guild_id, s))
+    ]
 
 
 @router.post("/{guild_id}/reminders", response_model=ReminderSchema, status_code=status.HTTP_201_CREATED)
@@ -589,7 +619,7 @@ async def create_reminder(
     guild_id: int,
     body: ReminderCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create a new channel reminder schedule."""
     _deny_support_write(user)
@@ -654,7 +684,7 @@ async def create_reminder(
         NextFire=next_fire,
     )
     session.add(reminder)
-    session.flush()
+    await session.flush()
     return _reminder_to_schema(reminder, user)
 
 
@@ -664,13 +694,13 @@ async def update_reminder(
     reminder_id: int,
     body: ReminderUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Update a reminder's message, channel, or enabled state."""
     _deny_support_write(user)
     from models.reminder import ReminderMessage
 
-    r = ReminderMessage.get_by_id(reminder_id, guild_id, session)
+    r = await session.run_sync(lambda s: ReminderMessage.get_by_id(reminder_id, guild_id, s))
     if r is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
 
@@ -691,16 +721,16 @@ async def delete_reminder(
     guild_id: int,
     reminder_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a reminder schedule."""
     _deny_support_write(user)
     from models.reminder import ReminderMessage
 
-    r = ReminderMessage.get_by_id(reminder_id, guild_id, session)
+    r = await session.run_sync(lambda s: ReminderMessage.get_by_id(reminder_id, guild_id, s))
     if r is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
-    session.delete(r)
+    await session.delete(r)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -760,13 +790,18 @@ def _form_to_schema(f) -> ApplicationFormSchema:
 @router.get("/{guild_id}/application-forms", response_model=list[ApplicationFormSchema])
 async def list_application_forms(
     guild_id: int,
+    request: Request,
+    response: Response,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """List all application forms with their questions for a guild."""
     from models.application import ApplicationForm
 
-    return [_form_to_schema(f) for f in ApplicationForm.get_all_by_guild(guild_id, session)]
+    if (cached := not_modified(request, response, vk.resource_etag("application_forms", guild_id))) is not None:
+        return cached
+    return [_form_to_schema(f) for f in await session.run_sync(lambda s: ApplicationForm.get_all_by_guild(guild_id, s))]
 
 
 @router.post("/{guild_id}/application-forms", status_code=status.HTTP_201_CREATED, response_model=ApplicationFormSchema)
@@ -775,14 +810,14 @@ async def create_application_form(
     body: ApplicationFormCreate,
     background_tasks: BackgroundTasks,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Create a new application form for a guild. Returns 409 if a form with that name already exists."""
     _deny_support_write(user)
     from models.application import ApplicationForm
 
-    if ApplicationForm.get(body.name, guild_id, session):
+    if await session.run_sync(lambda s: ApplicationForm.get(body.name, guild_id, s)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Form with this name already exists")
     form = ApplicationForm(
         GuildId=guild_id,
@@ -797,14 +832,17 @@ async def create_application_form(
     )
     session.add(form)
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Form with this name already exists")
+    await session.refresh(form, ["questions"])
     schema = _form_to_schema(form)
     if form.ApplyChannelId:
-        session.commit()
-        background_tasks.add_task(vk.send_bot_command, "post_apply_button", {"form_id": form.Id}, 1.0)
+        await session.commit()
+        background_tasks.add_task(
+            vk.send_bot_command, "post_apply_button", {"form_id": form.Id, "guild_id": guild_id}, 1.0
+        )
     return schema
 
 
@@ -815,17 +853,17 @@ async def update_application_form(
     body: ApplicationFormUpdate,
     background_tasks: BackgroundTasks,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Update an existing application form. Returns 404 if not found for this guild."""
     _deny_support_write(user)
     from models.application import ApplicationForm
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
@@ -858,8 +896,10 @@ async def update_application_form(
         # Commit before scheduling so the bot reads the updated row, not the pre-commit version.
         # FastAPI background tasks run after the response is sent but before yield-dependency cleanup,
         # so without this explicit commit the session.commit() in _get_db_session would fire too late.
-        session.commit()
-        background_tasks.add_task(vk.send_bot_command, "post_apply_button", {"form_id": form.Id}, 1.0)
+        await session.commit()
+        background_tasks.add_task(
+            vk.send_bot_command, "post_apply_button", {"form_id": form.Id, "guild_id": guild_id}, 1.0
+        )
     return schema
 
 
@@ -868,20 +908,20 @@ async def delete_application_form(
     guild_id: int,
     form_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete an application form and all its questions and submissions."""
     _deny_support_write(user)
     from models.application import ApplicationForm
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
-    session.delete(form)
+    await session.delete(form)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -895,16 +935,16 @@ async def add_form_question(
     form_id: int,
     body: ApplicationQuestionCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Add a question to a form. Auto-assigns sort_order as max+1 if not provided."""
     _deny_support_write(user)
     from models.application import ApplicationForm, ApplicationQuestion
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
@@ -915,7 +955,7 @@ async def add_form_question(
         sort_order = body.sort_order
     question = ApplicationQuestion(FormId=form_id, QuestionText=body.question_text, SortOrder=sort_order)
     session.add(question)
-    session.flush()
+    await session.flush()
     return ApplicationQuestionSchema(id=question.Id, question_text=question.QuestionText, sort_order=question.SortOrder)
 
 
@@ -929,23 +969,25 @@ async def update_form_question(
     question_id: int,
     body: ApplicationQuestionUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Update a question's text or sort order."""
     _deny_support_write(user)
     from models.application import ApplicationForm, ApplicationQuestion
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
-    question = (
-        session.query(ApplicationQuestion)
-        .filter(ApplicationQuestion.Id == question_id, ApplicationQuestion.FormId == form_id)
-        .first()
+    question = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationQuestion)
+            .filter(ApplicationQuestion.Id == question_id, ApplicationQuestion.FormId == form_id)
+            .first()
+        )
     )
     if question is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found")
@@ -964,27 +1006,29 @@ async def delete_form_question(
     form_id: int,
     question_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a question from a form."""
     _deny_support_write(user)
     from models.application import ApplicationForm, ApplicationQuestion
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
-    question = (
-        session.query(ApplicationQuestion)
-        .filter(ApplicationQuestion.Id == question_id, ApplicationQuestion.FormId == form_id)
-        .first()
+    question = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationQuestion)
+            .filter(ApplicationQuestion.Id == question_id, ApplicationQuestion.FormId == form_id)
+            .first()
+        )
     )
     if question is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found")
-    session.delete(question)
+    await session.delete(question)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -993,27 +1037,29 @@ async def list_form_submissions(
     guild_id: int,
     form_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     response: Response = None,
 ):
     """List all submissions for a specific form."""
     _set_support_mode_header(user, response)
     from models.application import ApplicationForm, ApplicationSubmission
 
-    form = (
-        session.query(ApplicationForm)
-        .filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id)
-        .first()
+    form = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationForm).filter(ApplicationForm.Id == form_id, ApplicationForm.GuildId == guild_id).first()
+        )
     )
     if form is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
-    submissions = (
-        session.query(ApplicationSubmission)
-        .filter(ApplicationSubmission.FormId == form_id)
-        .options(joinedload(ApplicationSubmission.answers))
-        .options(selectinload(ApplicationSubmission.votes))
-        .order_by(ApplicationSubmission.Id.desc())
-        .all()
+    submissions = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationSubmission)
+            .filter(ApplicationSubmission.FormId == form_id)
+            .options(joinedload(ApplicationSubmission.answers))
+            .options(selectinload(ApplicationSubmission.votes))
+            .order_by(ApplicationSubmission.Id.desc())
+            .all()
+        )
     )
     question_texts = {q.Id: q.QuestionText for q in form.questions}
     return [_submission_to_schema(s, user, question_texts) for s in submissions]
@@ -1021,29 +1067,150 @@ async def list_form_submissions(
 
 # ── All Submissions (cross-form) ──
 
+_SUBMISSION_PAGE_MAX = 200
+_SubmissionStatusFilter = Literal["pending", "approved", "denied"]
+_SUBMISSION_EXPORT_BATCH = 200
+
+
+def _submission_filters(guild_id: int, form_id: int | None, status_filter: str | None) -> list:
+    from models.application import ApplicationSubmission, SubmissionStatus
+
+    filters = [ApplicationSubmission.GuildId == guild_id]
+    if form_id is not None:
+        filters.append(ApplicationSubmission.FormId == form_id)
+    if status_filter is not None:
+        filters.append(ApplicationSubmission.Status == SubmissionStatus(status_filter))
+    return filters
 
-@router.get("/{guild_id}/application-submissions", response_model=list[ApplicationSubmissionSchema])
+
+@router.get("/{guild_id}/application-submissions", response_model=ApplicationSubmissionListResponse)
 async def list_all_submissions(
     guild_id: int,
     form_id: int | None = None,
+    status_filter: _SubmissionStatusFilter | None = Query(None, alias="status"),
+    before: int | None = None,
+    limit: int = Query(50, ge=1, le=_SUBMISSION_PAGE_MAX),
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     response: Response = None,
 ):
-    """List all submissions for a guild, optionally filtered by form."""
+    """List a guild's submissions, newest first, one page at a time.
+
+    Pages are keyed on the submission id: pass the returned ``next_cursor`` as ``before``. Rows
+    carry vote tallies but no answers or individual votes; fetch a single submission for those.
+    """
     _set_support_mode_header(user, response)
-    from models.application import ApplicationAnswer, ApplicationSubmission
+    from models.application import ApplicationForm, ApplicationSubmission
+
+    filters = _submission_filters(guild_id, form_id, status_filter)
+    if before is not None:
+        filters.append(ApplicationSubmission.Id < before)
+    rows = (
+        await session.execute(
+            select(
+                ApplicationSubmission.Id,
+                ApplicationSubmission.FormId,
+                ApplicationForm.Name,
+                ApplicationSubmission.UserId,
+                ApplicationSubmission.UserName,
+                ApplicationSubmission.Status,
+                ApplicationSubmission.SubmittedAt,
+                *ApplicationSubmission.vote_count_columns(),
+            )
+            .join(ApplicationForm, ApplicationForm.Id == ApplicationSubmission.FormId)
+            .where(*filters)
+            .order_by(ApplicationSubmission.Id.desc())
+            .limit(limit + 1)  # one extra row tells whether another page follows
+        )
+    ).all()
+    page = rows[:limit]
+    return ApplicationSubmissionListResponse(
+        submissions=[
+            ApplicationSubmissionSummarySchema(
+                id=r.Id,
+                form_id=r.FormId,
+                form_name=r.Name,
+                user_id=_redact(str(r.UserId), user),
+                user_name=_redact(r.UserName, user),
+                status=r.Status.value,
+                submitted_at=str(r.SubmittedAt),
+                approve_count=r.ApproveCount,
+                deny_count=r.DenyCount,
+            )
+            for r in page
+        ],
+        next_cursor=page[-1].Id if len(rows) > limit else None,
+    )
 
-    q = (
-        session.query(ApplicationSubmission)
-        .filter(ApplicationSubmission.GuildId == guild_id)
-        .options(joinedload(ApplicationSubmission.answers).joinedload(ApplicationAnswer.question))
+
+def _full_submissions_query(*filters):
+    from models.application import ApplicationAnswer, ApplicationForm, ApplicationSubmission
+
+    return (
+        select(ApplicationSubmission)
+        .where(*filters)
+        .options(selectinload(ApplicationSubmission.answers).joinedload(ApplicationAnswer.question))
         .options(selectinload(ApplicationSubmission.votes))
+        .options(selectinload(ApplicationSubmission.form).lazyload(ApplicationForm.questions))
     )
-    if form_id is not None:
-        q = q.filter(ApplicationSubmission.FormId == form_id)
-    submissions = q.order_by(ApplicationSubmission.Id.desc()).all()
-    return [_submission_to_schema(s, user) for s in submissions]
+
+
+@router.get("/{guild_id}/application-submissions/export")
+async def export_submissions(
+    guild_id: int,
+    form_id: int | None = None,
+    status_filter: _SubmissionStatusFilter | None = Query(None, alias="status"),
+    user: dict = Depends(require_guild_access),
+    session: AsyncSession = Depends(get_async_db_session),
+):
+    """Stream every matching submission, with answers and votes, as NDJSON (newest first).
+
+    Rows are read in keyset batches and written as they arrive, so the export's size does not
+    bound the worker's memory.
+    """
+    from models.application import ApplicationSubmission
+
+    filters = _submission_filters(guild_id, form_id, status_filter)
+
+    async def lines():
+        before = None
+        while True:
+            stmt = _full_submissions_query(*filters)
+            if before is not None:
+                stmt = stmt.where(ApplicationSubmission.Id < before)
+            batch = (
+                await session.scalars(stmt.order_by(ApplicationSubmission.Id.desc()).limit(_SUBMISSION_EXPORT_BATCH))
+            ).all()
+            if not batch:
+                return
+            yield "".join(_submission_to_schema(s, user).model_dump_json() + "\n" for s in batch)
+            before = batch[-1].Id
+            session.expunge_all()  # the identity map would otherwise hold the whole export
+
+    headers = {"Content-Disposition": f'attachment; filename="submissions-{guild_id}.ndjson"'}
+    if user.get("support_mode"):
+        headers["X-Support-Mode"] = "true"
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/{guild_id}/application-submissions/{submission_id}", response_model=ApplicationSubmissionSchema)
+async def get_submission(
+    guild_id: int,
+    submission_id: int,
+    user: dict = Depends(require_guild_access),
+    session: AsyncSession = Depends(get_async_db_session),
+    response: Response = None,
+):
+    """Return one submission with its answers and votes."""
+    _set_support_mode_header(user, response)
+    from models.application import ApplicationSubmission
+
+    submission = await session.scalar(
+        _full_submissions_query(ApplicationSubmission.Id == submission_id, ApplicationSubmission.GuildId == guild_id)
+    )
+    if submission is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Submission not found")
+    return _submission_to_schema(submission, user)
 
 
 # ── Application Templates ──
@@ -1067,12 +1234,14 @@ def _template_to_schema(t) -> ApplicationTemplateSchema:
 async def list_application_templates(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List built-in and guild-specific application templates."""
     from models.application import ApplicationTemplate
 
-    return [_template_to_schema(t) for t in ApplicationTemplate.get_available(guild_id, session)]
+    return [
+        _template_to_schema(t) for t in await session.run_sync(lambda s: ApplicationTemplate.get_available(guild_id, s))
+    ]
 
 
 @router.post(
@@ -1082,7 +1251,7 @@ async def create_application_template(
     guild_id: int,
     body: ApplicationTemplateCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create a guild-specific application template."""
     _deny_support_write(user)
@@ -1097,14 +1266,14 @@ async def create_application_template(
     )
     session.add(template)
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Template with this name already exists")
     for i, text in enumerate(body.question_texts, start=1):
         session.add(ApplicationTemplateQuestion(TemplateId=template.Id, QuestionText=text, SortOrder=i))
-    session.flush()
-    session.refresh(template)
+    await session.flush()
+    await session.refresh(template)
     return _template_to_schema(template)
 
 
@@ -1114,16 +1283,18 @@ async def update_application_template(
     template_id: int,
     body: ApplicationTemplateUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Update a guild-specific template. Returns 403 for built-in templates."""
     _deny_support_write(user)
     from models.application import ApplicationTemplate
 
-    template = (
-        session.query(ApplicationTemplate)
-        .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
-        .first()
+    template = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationTemplate)
+            .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
+            .first()
+        )
     )
     if template is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
@@ -1143,22 +1314,24 @@ async def delete_application_template(
     guild_id: int,
     template_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a guild-specific template. Returns 403 for built-in templates."""
     _deny_support_write(user)
     from models.application import ApplicationTemplate
 
-    template = (
-        session.query(ApplicationTemplate)
-        .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
-        .first()
+    template = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationTemplate)
+            .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
+            .first()
+        )
     )
     if template is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
     if template.IsBuiltIn:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Built-in templates cannot be deleted")
-    session.delete(template)
+    await session.delete(template)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1172,16 +1345,18 @@ async def add_template_question(
     template_id: int,
     body: ApplicationTemplateQuestionCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Add a question to a guild template."""
     _deny_support_write(user)
     from models.application import ApplicationTemplate, ApplicationTemplateQuestion
 
-    template = (
-        session.query(ApplicationTemplate)
-        .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
-        .first()
+    template = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationTemplate)
+            .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
+            .first()
+        )
     )
     if template is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
@@ -1192,7 +1367,7 @@ async def add_template_question(
         TemplateId=template_id, QuestionText=body.question_text, SortOrder=max_order + 1
     )
     session.add(question)
-    session.flush()
+    await session.flush()
     return ApplicationTemplateQuestionSchema(
         id=question.Id, question_text=question.QuestionText, sort_order=question.SortOrder
     )
@@ -1207,29 +1382,35 @@ async def delete_template_question(
     template_id: int,
     question_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a question from a guild template."""
     _deny_support_write(user)
     from models.application import ApplicationTemplate, ApplicationTemplateQuestion
 
-    template = (
-        session.query(ApplicationTemplate)
-        .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
-        .first()
+    template = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationTemplate)
+            .filter(ApplicationTemplate.Id == template_id, ApplicationTemplate.GuildId == guild_id)
+            .first()
+        )
     )
     if template is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
     if template.IsBuiltIn:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Built-in templates cannot be modified")
-    question = (
-        session.query(ApplicationTemplateQuestion)
-        .filter(ApplicationTemplateQuestion.Id == question_id, ApplicationTemplateQuestion.TemplateId == template_id)
-        .first()
+    question = await session.run_sync(
+        lambda s: (
+            s.query(ApplicationTemplateQuestion)
+            .filter(
+                ApplicationTemplateQuestion.Id == question_id, ApplicationTemplateQuestion.TemplateId == template_id
+            )
+            .first()
+        )
     )
     if question is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found")
-    session.delete(question)
+    await session.delete(question)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1255,25 +1436,27 @@ def _wow_news_to_schema(cfg, tracked_characters: int = 0) -> "WowGuildNewsSchema
 async def get_wow_config(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return WoW guild news configs and crafting board config for a guild."""
     from sqlalchemy import func
 
     from models.wow import CraftingBoardConfig, WowCharacterMounts, WowGuildNewsConfig
 
-    news_configs = WowGuildNewsConfig.get_all_by_guild(guild_id, session)
-    crafting = CraftingBoardConfig.get_by_guild(guild_id, session)
+    news_configs = await session.run_sync(lambda s: WowGuildNewsConfig.get_all_by_guild(guild_id, s))
+    crafting = await session.run_sync(lambda s: CraftingBoardConfig.get_by_guild(guild_id, s))
 
     # Batch-load character counts to avoid N+1
     config_ids = [n.Id for n in news_configs]
     counts: dict[int, int] = {}
     if config_ids:
-        rows = (
-            session.query(WowCharacterMounts.ConfigId, func.count(WowCharacterMounts.Id))
-            .filter(WowCharacterMounts.ConfigId.in_(config_ids))
-            .group_by(WowCharacterMounts.ConfigId)
-            .all()
+        rows = await session.run_sync(
+            lambda s: (
+                s.query(WowCharacterMounts.ConfigId, func.count(WowCharacterMounts.Id))
+                .filter(WowCharacterMounts.ConfigId.in_(config_ids))
+                .group_by(WowCharacterMounts.ConfigId)
+                .all()
+            )
         )
         counts = dict(rows)
 
@@ -1294,7 +1477,7 @@ async def create_wow_news_config(
     guild_id: int,
     body: WowGuildNewsCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Create a WoW guild news tracker for a Discord guild. Returns 409 if already tracked."""
     _deny_support_write(user)
@@ -1303,10 +1486,12 @@ async def create_wow_news_config(
 
     normalized_name = " ".join(body.wow_guild_name.split())
     name_slug = normalized_name.lower().replace(" ", "-")
-    if WowGuildNewsConfig.get_existing(guild_id, name_slug, body.wow_realm_slug, body.region, session):
+    if await session.run_sync(
+        lambda s: WowGuildNewsConfig.get_existing(guild_id, name_slug, body.wow_realm_slug, body.region, s)
+    ):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Already tracking this WoW guild")
 
-    lang_cfg = GuildLanguageConfig.get(guild_id, session)
+    lang_cfg = await session.run_sync(lambda s: GuildLanguageConfig.get(guild_id, s))
     lang = lang_cfg.Language if lang_cfg is not None else "en"
     cfg = WowGuildNewsConfig(
         GuildId=guild_id,
@@ -1321,7 +1506,7 @@ async def create_wow_news_config(
         Enabled=True,
     )
     session.add(cfg)
-    session.flush()
+    await session.flush()
     return _wow_news_to_schema(cfg)
 
 
@@ -1331,7 +1516,7 @@ async def update_wow_news_config(
     config_id: int,
     body: WowGuildNewsUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Partial update for a WoW guild news tracker (channel, active_days, min_level, enabled)."""
     _deny_support_write(user)
@@ -1339,7 +1524,7 @@ async def update_wow_news_config(
 
     from models.wow import WowCharacterMounts, WowGuildNewsConfig
 
-    cfg = WowGuildNewsConfig.get_by_id(config_id, guild_id, session)
+    cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config_id, guild_id, s))
     if cfg is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Config not found")
 
@@ -1353,7 +1538,11 @@ async def update_wow_news_config(
         cfg.Enabled = body.enabled
 
     count = (
-        session.query(func.count(WowCharacterMounts.Id)).filter(WowCharacterMounts.ConfigId == config_id).scalar()
+        await session.run_sync(
+            lambda s: (
+                s.query(func.count(WowCharacterMounts.Id)).filter(WowCharacterMounts.ConfigId == config_id).scalar()
+            )
+        )
     ) or 0
 
     return _wow_news_to_schema(cfg, count)
@@ -1364,16 +1553,16 @@ async def delete_wow_news_config(
     guild_id: int,
     config_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Delete a WoW guild news tracker and all associated character mount data."""
     _deny_support_write(user)
     from models.wow import WowGuildNewsConfig
 
-    cfg = WowGuildNewsConfig.get_by_id(config_id, guild_id, session)
+    cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config_id, guild_id, s))
     if cfg is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Config not found")
-    WowGuildNewsConfig.delete(config_id, guild_id, session)
+    await session.run_sync(lambda s: WowGuildNewsConfig.delete(config_id, guild_id, s))
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1382,18 +1571,18 @@ async def get_wow_news_roster(
     guild_id: int,
     config_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return the character mount roster for a WoW guild news tracker, sorted by mount count desc."""
     from models.wow import WowCharacterMounts, WowGuildNewsConfig
 
-    cfg = WowGuildNewsConfig.get_by_id(config_id, guild_id, session)
+    cfg = await session.run_sync(lambda s: WowGuildNewsConfig.get_by_id(config_id, guild_id, s))
     if cfg is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Config not found")
 
     from modules.wow.api import parse_known_mounts
 
-    entries = WowCharacterMounts.get_all_by_config(config_id, session)
+    entries = await session.run_sync(lambda s: WowCharacterMounts.get_all_by_config(config_id, s))
 
     result = []
     for e in entries:
@@ -1421,7 +1610,7 @@ async def list_crafting_orders(
     guild_id: int,
     order_status: str | None = None,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     vk: ValkeyClient = Depends(get_valkey),
     response: Response = None,
 ):
@@ -1429,10 +1618,10 @@ async def list_crafting_orders(
     _set_support_mode_header(user, response)
     from models.wow import CraftingOrder
 
-    query = session.query(CraftingOrder).filter(CraftingOrder.GuildId == guild_id)
+    stmt = select(CraftingOrder).where(CraftingOrder.GuildId == guild_id)
     if order_status:
-        query = query.filter(CraftingOrder.Status == order_status)
-    orders = query.order_by(CraftingOrder.Id.desc()).all()
+        stmt = stmt.where(CraftingOrder.Status == order_status)
+    orders = (await session.scalars(stmt.order_by(CraftingOrder.Id.desc()))).all()
 
     # Lazy backfill: resolve display names for orders created before name persistence was added.
     # On the first request that includes unnamed orders, we ask the bot for names and write them
@@ -1493,13 +1682,13 @@ _PROFESSION_NAME_BY_ID: dict = _get_profession_name_by_id()
 async def list_crafting_role_mappings(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List all crafting role mappings for a guild."""
     from models.wow import CraftingRoleMapping
 
     profession_name_by_id = _PROFESSION_NAME_BY_ID
-    mappings = CraftingRoleMapping.get_by_guild(guild_id, session)
+    mappings = await session.run_sync(lambda s: CraftingRoleMapping.get_by_guild(guild_id, s))
     return [
         CraftingRoleMappingSchema(
             id=m.Id,
@@ -1516,7 +1705,7 @@ async def create_crafting_role_mapping(
     guild_id: int,
     body: CraftingRoleMappingCreate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Add a role → profession mapping for a guild."""
     _deny_support_write(user)
@@ -1528,9 +1717,9 @@ async def create_crafting_role_mapping(
     mapping = CraftingRoleMapping(GuildId=guild_id, RoleId=int(body.role_id), ProfessionId=body.profession_id)
     session.add(mapping)
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Role mapping already exists")
     return CraftingRoleMappingSchema(
         id=mapping.Id,
@@ -1546,7 +1735,7 @@ async def update_crafting_role_mapping(
     mapping_id: int,
     body: CraftingRoleMappingUpdate,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Update the profession for a role mapping."""
     _deny_support_write(user)
@@ -1554,15 +1743,17 @@ async def update_crafting_role_mapping(
 
     if body.profession_id not in _PROFESSION_NAME_BY_ID:
         raise HTTPException(status_code=400, detail="Unknown profession")
-    mapping = (
-        session.query(CraftingRoleMapping)
-        .filter(CraftingRoleMapping.Id == mapping_id, CraftingRoleMapping.GuildId == guild_id)
-        .first()
+    mapping = await session.run_sync(
+        lambda s: (
+            s.query(CraftingRoleMapping)
+            .filter(CraftingRoleMapping.Id == mapping_id, CraftingRoleMapping.GuildId == guild_id)
+            .first()
+        )
     )
     if mapping is None:
         raise HTTPException(status_code=404, detail="Mapping not found")
     mapping.ProfessionId = body.profession_id
-    session.flush()
+    await session.flush()
     return CraftingRoleMappingSchema(
         id=mapping.Id,
         role_id=str(mapping.RoleId),
@@ -1576,20 +1767,22 @@ async def delete_crafting_role_mapping(
     guild_id: int,
     mapping_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Remove a role → profession mapping."""
     _deny_support_write(user)
     from models.wow import CraftingRoleMapping
 
-    mapping = (
-        session.query(CraftingRoleMapping)
-        .filter(CraftingRoleMapping.Id == mapping_id, CraftingRoleMapping.GuildId == guild_id)
-        .first()
+    mapping = await session.run_sync(
+        lambda s: (
+            s.query(CraftingRoleMapping)
+            .filter(CraftingRoleMapping.Id == mapping_id, CraftingRoleMapping.GuildId == guild_id)
+            .first()
+        )
     )
     if mapping is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mapping not found")
-    session.delete(mapping)
+    await session.delete(mapping)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1602,7 +1795,10 @@ async def list_discord_channels(
     user: dict = Depends(require_guild_access),
     vk: ValkeyClient = Depends(get_valkey),
 ):
-    """Fetch the channel list for a guild from the bot via Valkey bridge."""
+    """Return the guild's channels from the bot-pushed snapshot, asking the bot only on a miss."""
+    channels = vk.get_guild_channels(guild_id)
+    if channels is not None:
+        return {"channels": channels}
     result = await vk.send_bot_command("get_channels", {"guild_id": guild_id})
     return result or {"channels": []}
 
@@ -1613,7 +1809,10 @@ async def list_discord_roles(
     user: dict = Depends(require_guild_access),
     vk: ValkeyClient = Depends(get_valkey),
 ):
-    """Fetch the role list for a guild from the bot via Valkey bridge."""
+    """Return the guild's roles from the bot-pushed snapshot, asking the bot only on a miss."""
+    roles = vk.get_guild_roles(guild_id)
+    if roles is not None:
+        return {"roles": roles}
     result = await vk.send_bot_command("get_roles", {"guild_id": guild_id})
     return result or {"roles": []}
 
@@ -1639,14 +1838,14 @@ def _twitch_notification_to_schema(n) -> TwitchNotificationSchema:
 async def list_twitch_notifications(
     guild_id: int,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
     response: Response = None,
 ):
     """List all Twitch notification configs for a guild."""
     _set_support_mode_header(user, response)
     from models.twitch import TwitchNotifications
 
-    rows = TwitchNotifications.get_all_by_guild(guild_id, session)
+    rows = await session.run_sync(lambda s: TwitchNotifications.get_all_by_guild(guild_id, s))
     return [_twitch_notification_to_schema(r) for r in rows]
 
 
@@ -1661,7 +1860,8 @@ async def create_twitch_notification(
     background_tasks: BackgroundTasks,
     request: Request,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """Add a Twitch notification config. Validates the Twitch username against the Helix API."""
     _deny_support_write(user)
@@ -1676,7 +1876,9 @@ async def create_twitch_notification(
     streamer_lower = body.streamer.strip().lower()
     channel_id = body.channel_id
 
-    existing = TwitchNotifications.get_by_channel_and_streamer(guild_id, channel_id, streamer_lower, session)
+    existing = await session.run_sync(
+        lambda s: TwitchNotifications.get_by_channel_and_streamer(guild_id, channel_id, streamer_lower, s)
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -1707,11 +1909,12 @@ async def create_twitch_notification(
     )
     session.add(row)
     try:
-        session.commit()
+        await session.commit()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=_TWITCH_NOTIFICATION_EXISTS)
 
+    vk.notify_bot("invalidate_twitch_notification", {"guild_id": guild_id, "config_id": row.Id})
     background_tasks.add_task(reconcile_once, request.app.state)
 
     return _twitch_notification_to_schema(row)
@@ -1725,13 +1928,14 @@ async def update_twitch_notification(
     background_tasks: BackgroundTasks,
     request: Request,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """Update a Twitch notification config (message, channel, offline flag)."""
     _deny_support_write(user)
     from models.twitch import TwitchNotifications
 
-    row = TwitchNotifications.get_by_id(config_id, guild_id, session)
+    row = await session.run_sync(lambda s: TwitchNotifications.get_by_id(config_id, guild_id, s))
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification config not found")
 
@@ -1753,15 +1957,16 @@ async def update_twitch_notification(
         row.NotifyOffline = body.notify_offline
 
     try:
-        session.flush()
+        await session.flush()
     except IntegrityError:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=_TWITCH_NOTIFICATION_EXISTS)
 
+    await session.commit()  # commit before notifying bot so it re-reads the updated row
+    vk.notify_bot("invalidate_twitch_notification", {"guild_id": guild_id, "config_id": config_id})
     if "notify_offline" in body.model_fields_set:
         from web.twitch_reconciler import reconcile_once
 
-        session.commit()
         background_tasks.add_task(reconcile_once, request.app.state)
 
     return _twitch_notification_to_schema(row)
@@ -1774,19 +1979,21 @@ async def delete_twitch_notification(
     background_tasks: BackgroundTasks,
     request: Request,
     user: dict = Depends(require_guild_access),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """Remove a Twitch notification config. Triggers reconciliation to clean up orphaned subscriptions."""
     _deny_support_write(user)
     from models.twitch import TwitchNotifications
     from web.twitch_reconciler import reconcile_once
 
-    row = TwitchNotifications.get_by_id(config_id, guild_id, session)
+    row = await session.run_sync(lambda s: TwitchNotifications.get_by_id(config_id, guild_id, s))
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification config not found")
 
-    session.delete(row)
-    session.commit()
+    await session.delete(row)
+    await session.commit()
 
+    vk.notify_bot("invalidate_twitch_notification", {"guild_id": guild_id, "config_id": config_id})
     background_tasks.add_task(reconcile_once, request.app.state)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
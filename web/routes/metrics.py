@@ -0,0 +1,14 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter, Depends, Response
+
+from web.dependencies import require_operator
+from web.metrics import CONTENT_TYPE, WEB_METRICS
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(user: dict = Depends(require_operator)) -> Response:
+    """Web process metrics in the Prometheus text format."""
+    return Response(WEB_METRICS.render(), media_type=CONTENT_TYPE)
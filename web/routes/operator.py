@@ -4,14 +4,15 @@ from __future__ import annotations
 
 import logging
 
+from cachetools import TTLCache
 from pydantic import ValidationError
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from fastapi import HTTPException, status as http_status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from web.dependencies import get_db_session, get_valkey, invalidate_premium_cache, require_operator
+from web.dependencies import get_async_db_session, get_valkey, invalidate_premium_cache, require_operator
 from web.schemas import (
     BotGuildInfo,
     BotGuildListResponse,
@@ -23,9 +24,12 @@ from web.schemas import (
     ErrorStatusBucket,
     ErrorStatusResponse,
     ErrorSuppressRequest,
+    EventLoopHealth,
     HealthResponse,
+    MetricsResponse,
     ModuleActionResponse,
     ModuleListResponse,
+    MusicHealth,
     PremiumUserGrant,
     PremiumUserSchema,
     RecipeCacheBrowseResponse,
@@ -38,9 +42,14 @@ from web.schemas import (
     VoiceConnectionDetail,
 )
 from web.cache import ValkeyClient
+from web.conditional import not_modified
 
 log = logging.getLogger("nerpybot")
 
+# Rendered recipe browser pages keyed by (ETag, query). The ETag changes with every recipe sync,
+# which retires the old pages; the TTL only bounds how long they linger afterwards.
+_recipe_page_cache: TTLCache = TTLCache(maxsize=256, ttl=600)
+
 
 def _parse_voice_details(raw: list) -> list[VoiceConnectionDetail]:
     result = []
@@ -55,6 +64,26 @@ def _parse_voice_details(raw: list) -> list[VoiceConnectionDetail]:
     return result
 
 
+def _parse_music_health(raw) -> MusicHealth | None:
+    if not isinstance(raw, dict):
+        return None
+    try:
+        return MusicHealth(**raw)
+    except (ValidationError, TypeError) as exc:
+        log.warning("health: malformed music stats %r: %s", raw, exc)
+        return None
+
+
+def _parse_event_loop_health(raw) -> EventLoopHealth | None:
+    if not isinstance(raw, dict):
+        return None
+    try:
+        return EventLoopHealth(**raw)
+    except (ValidationError, TypeError) as exc:
+        log.warning("health: malformed event loop stats %r: %s", raw, exc)
+        return None
+
+
 router = APIRouter(prefix="/operator", tags=["operator"])
 
 
@@ -72,19 +101,19 @@ def _premium_to_schema(p) -> PremiumUserSchema:
 @router.get("/premium-users", response_model=list[PremiumUserSchema])
 async def list_premium_users(
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """List all users who have been granted premium dashboard access."""
     from models.premium import PremiumUser
 
-    return [_premium_to_schema(p) for p in PremiumUser.get_all(session)]
+    return [_premium_to_schema(p) for p in await session.run_sync(PremiumUser.get_all)]
 
 
 @router.post("/premium-users", response_model=PremiumUserSchema, status_code=http_status.HTTP_201_CREATED)
 async def grant_premium(
     body: PremiumUserGrant,
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Grant premium dashboard access to a user."""
     from models.premium import PremiumUser
@@ -95,8 +124,8 @@ async def grant_premium(
         raise HTTPException(
             status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail="user_id must be a valid integer"
         )
-    entry = PremiumUser.grant(target_user_id, int(user["sub"]), session)
-    session.commit()  # commit before cache eviction so refills see the new row
+    entry = await session.run_sync(lambda s: PremiumUser.grant(target_user_id, int(user["sub"]), s))
+    await session.commit()  # commit before cache eviction so refills see the new row
     invalidate_premium_cache()
     return _premium_to_schema(entry)
 
@@ -105,14 +134,14 @@ async def grant_premium(
 async def revoke_premium(
     user_id: int,
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Revoke premium dashboard access from a user."""
     from models.premium import PremiumUser
 
-    if not PremiumUser.revoke(user_id, session):
+    if not await session.run_sync(lambda s: PremiumUser.revoke(user_id, s)):
         raise HTTPException(status_code=http_status.HTTP_404_NOT_FOUND, detail="User not found in premium list")
-    session.commit()  # commit before cache eviction so refills see the updated rows
+    await session.commit()  # commit before cache eviction so refills see the updated rows
     invalidate_premium_cache()
 
 
@@ -142,9 +171,27 @@ async def health(
         discord_py_version=result.get("discord_py_version"),
         bot_version=result.get("bot_version"),
         voice_details=_parse_voice_details(result.get("voice_details", [])),
+        music=_parse_music_health(result.get("music")),
+        event_loop=_parse_event_loop_health(result.get("event_loop")),
     )
 
 
+@router.get("/metrics", response_model=MetricsResponse)
+async def metrics(
+    user: dict = Depends(require_operator),
+    vk: ValkeyClient = Depends(get_valkey),
+):
+    """Request command, interaction and background-loop timings from the bot."""
+    result = await vk.send_bot_command("metrics", {})
+    if result is None:
+        return MetricsResponse(status="unreachable")
+    try:
+        return MetricsResponse(status="online", **result)
+    except (ValidationError, TypeError) as exc:
+        log.warning("metrics: malformed snapshot: %s", exc)
+        return MetricsResponse(status="online")
+
+
 @router.get("/modules", response_model=ModuleListResponse)
 async def list_modules(
     user: dict = Depends(require_operator),
@@ -241,28 +288,46 @@ async def get_recipe_sync_status(
 
 @router.get("/recipe-cache", response_model=RecipeCacheBrowseResponse)
 async def browse_recipe_cache(
+    request: Request,
+    response: Response,
     recipe_type: str | None = None,
     profession_id: int | None = None,
     expansion: str | None = None,
     offset: int = 0,
     limit: int = 50,
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
+    vk: ValkeyClient = Depends(get_valkey),
 ):
     """Browse cached recipes with optional filters. Returns up to `limit` rows."""
     from models.wow import CraftingRecipeCache
-    from sqlalchemy import asc, func
+    from sqlalchemy import asc, func, select
+
+    etag = vk.resource_etag("recipe_cache")
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
+    cache_key = (etag, recipe_type, profession_id, expansion, offset, limit)
+    if etag is not None and cache_key in _recipe_page_cache:
+        return _recipe_page_cache[cache_key]
 
-    q = session.query(CraftingRecipeCache)
+    filters = []
     if recipe_type:
-        q = q.filter(CraftingRecipeCache.RecipeType == recipe_type)
+        filters.append(CraftingRecipeCache.RecipeType == recipe_type)
     if profession_id is not None:
-        q = q.filter(CraftingRecipeCache.ProfessionId == profession_id)
+        filters.append(CraftingRecipeCache.ProfessionId == profession_id)
     if expansion:
-        q = q.filter(CraftingRecipeCache.ExpansionName == expansion)
-
-    total = q.with_entities(func.count(CraftingRecipeCache.RecipeId)).scalar() or 0
-    rows = q.order_by(asc(CraftingRecipeCache.ItemName)).offset(offset).limit(limit).all()
+        filters.append(CraftingRecipeCache.ExpansionName == expansion)
+
+    total = await session.scalar(select(func.count(CraftingRecipeCache.RecipeId)).where(*filters)) or 0
+    rows = (
+        await session.scalars(
+            select(CraftingRecipeCache)
+            .where(*filters)
+            .order_by(asc(CraftingRecipeCache.ItemName))
+            .offset(offset)
+            .limit(limit)
+        )
+    ).all()
 
     # Dropdown option lists are only needed on the first page (filter change / initial load).
     # On subsequent pages the frontend keeps the cached values from the first response.
@@ -270,25 +335,29 @@ async def browse_recipe_cache(
     expansions: list[str] = []
     if offset == 0:
         type_filter = CraftingRecipeCache.RecipeType == recipe_type if recipe_type else True
-        prof_rows = (
-            session.query(CraftingRecipeCache.ProfessionId, CraftingRecipeCache.ProfessionName)
-            .filter(type_filter)
-            .distinct()
-            .order_by(asc(CraftingRecipeCache.ProfessionName))
-            .all()
+        prof_rows = await session.run_sync(
+            lambda s: (
+                s.query(CraftingRecipeCache.ProfessionId, CraftingRecipeCache.ProfessionName)
+                .filter(type_filter)
+                .distinct()
+                .order_by(asc(CraftingRecipeCache.ProfessionName))
+                .all()
+            )
         )
-        exp_rows = (
-            session.query(CraftingRecipeCache.ExpansionName)
-            .filter(type_filter)
-            .filter(CraftingRecipeCache.ExpansionName.isnot(None))
-            .distinct()
-            .order_by(asc(CraftingRecipeCache.ExpansionName))
-            .all()
+        exp_rows = await session.run_sync(
+            lambda s: (
+                s.query(CraftingRecipeCache.ExpansionName)
+                .filter(type_filter)
+                .filter(CraftingRecipeCache.ExpansionName.isnot(None))
+                .distinct()
+                .order_by(asc(CraftingRecipeCache.ExpansionName))
+                .all()
+            )
         )
         professions = [RecipeCacheProfession(id=p[0], name=p[1]) for p in prof_rows]
         expansions = [e[0] for e in exp_rows]
 
-    return RecipeCacheBrowseResponse(
+    page = RecipeCacheBrowseResponse(
         recipes=[
             RecipeCacheEntry(
                 recipe_id=r.RecipeId,
@@ -308,6 +377,9 @@ async def browse_recipe_cache(
         expansions=expansions,
         total=total,
     )
+    if etag is not None:
+        _recipe_page_cache[cache_key] = page
+    return page
 
 
 # ── Bot permissions ──
@@ -328,13 +400,15 @@ async def get_bot_permissions(
 @router.get("/bot-permissions/subscriptions", response_model=list[BotPermissionSubscription])
 async def list_permission_subscriptions(
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Return which guilds the current operator is subscribed to for missing-permission DMs."""
     from models.permissions import PermissionSubscriber
 
     user_id = int(user["sub"])
-    rows = session.query(PermissionSubscriber).filter(PermissionSubscriber.UserId == user_id).all()
+    rows = await session.run_sync(
+        lambda s: s.query(PermissionSubscriber).filter(PermissionSubscriber.UserId == user_id).all()
+    )
     return [BotPermissionSubscription(guild_id=str(r.GuildId), subscribed=True) for r in rows]
 
 
@@ -342,7 +416,7 @@ async def list_permission_subscriptions(
 async def subscribe_bot_permissions(
     guild_id: str,
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Subscribe to missing-permission DMs for a guild."""
     from models.permissions import PermissionSubscriber
@@ -352,7 +426,7 @@ async def subscribe_bot_permissions(
         gid = int(guild_id)
     except ValueError:
         raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid guild_id")
-    existing = PermissionSubscriber.get(gid, user_id, session)
+    existing = await session.run_sync(lambda s: PermissionSubscriber.get(gid, user_id, s))
     if existing is None:
         session.add(PermissionSubscriber(GuildId=gid, UserId=user_id))
     return BotPermissionSubscription(guild_id=guild_id, subscribed=True)
@@ -362,7 +436,7 @@ async def subscribe_bot_permissions(
 async def unsubscribe_bot_permissions(
     guild_id: str,
     user: dict = Depends(require_operator),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """Unsubscribe from missing-permission DMs for a guild."""
     from models.permissions import PermissionSubscriber
@@ -372,7 +446,7 @@ async def unsubscribe_bot_permissions(
         gid = int(guild_id)
     except ValueError:
         raise HTTPException(status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid guild_id")
-    PermissionSubscriber.delete(gid, user_id, session)
+    await session.run_sync(lambda s: PermissionSubscriber.delete(gid, user_id, s))
 
 
 # ── Error control ──
@@ -446,7 +520,9 @@ async def sync_commands(
     vk: ValkeyClient = Depends(get_valkey),
 ):
     """Sync Discord slash commands via the bot."""
-    result = await vk.send_bot_command("sync_commands", {"mode": body.mode, "guild_ids": body.guild_ids})
+    result = await vk.send_bot_command(
+        "sync_commands", {"mode": body.mode, "guild_ids": body.guild_ids, "force": body.force}
+    )
     if result is None:
         return SyncCommandsResponse(success=False, error="Bot unreachable")
     return SyncCommandsResponse(**result)
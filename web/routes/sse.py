@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sse_starlette.sse import EventSourceResponse
 
 from web.cache import ValkeyClient
-from web.dependencies import get_valkey, require_operator
+from web.dependencies import require_operator
 
 _log = logging.getLogger(__name__)
 
@@ -22,13 +22,82 @@ _active_connections: dict[str, int] = {}
 _MAX_SSE_PER_USER = 3
 _HEALTH_POLL_INTERVAL = 10  # seconds
 _HEARTBEAT_INTERVAL = 30  # seconds
+_SUBSCRIBER_QUEUE_SIZE = 2  # frames buffered per client before the oldest is dropped
+
+
+class HealthFeed:
+    """One ``health_live`` poller per web process, fanned out to every SSE subscriber.
+
+    The poller only runs while at least one client is subscribed. Each snapshot is serialized once
+    and offered to every subscriber's bounded queue; a client that has not drained its queue loses
+    its oldest frame, so a slow tab always catches up to the latest snapshot instead of a backlog.
+    """
+
+    def __init__(self, vk: ValkeyClient, interval: float = _HEALTH_POLL_INTERVAL):
+        self._vk = vk
+        self._interval = interval
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._latest: tuple[float, str] | None = None
+        self._task: asyncio.Task | None = None
+        self.polls = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        """Register a client; it gets the last snapshot right away if it is still current."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        if self._latest is not None and time.monotonic() - self._latest[0] < self._interval:
+            queue.put_nowait(self._latest[1])
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll(), name="sse-health-poller")
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        """Drop a client; the poller stops with the last one."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _poll(self) -> None:
+        while self._subscribers:
+            try:
+                result = await self._vk.send_bot_command("health_live", {}, timeout=5.0)
+                self.polls += 1
+                if result and "error" not in result:
+                    self._publish(json.dumps(result))
+            except Exception:
+                _log.debug("SSE health poll failed", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    def _publish(self, data: str) -> None:
+        self._latest = (time.monotonic(), data)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(data)
+
+    async def aclose(self) -> None:
+        """Stop the poller (app shutdown)."""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass  # expected — cancellation is intentional
+            self._task = None
 
 
 @router.get("/health/live")
 async def health_live(
     request: Request,
     user: dict = Depends(require_operator),
-    vk: ValkeyClient = Depends(get_valkey),
 ) -> EventSourceResponse:
     """SSE stream of live health metrics from the bot."""
     user_id = user["sub"]
@@ -42,17 +111,18 @@ async def health_live(
     # from the same user see the updated count immediately (no TOCTOU gap).
     _active_connections[user_id] = count + 1
     return EventSourceResponse(
-        _health_event_generator(user_id, vk, request),
+        _health_event_generator(user_id, request.app.state.health_feed, request),
         media_type="text/event-stream",
     )
 
 
 async def _health_event_generator(
     user_id: str,
-    vk: ValkeyClient,
+    feed: HealthFeed,
     request: Request,
 ) -> AsyncGenerator[dict, None]:
-    """Poll the bot for health metrics and yield as SSE events."""
+    """Relay the shared health feed to one client as SSE events."""
+    queue = feed.subscribe()
     last_heartbeat = time.monotonic()
 
     try:
@@ -60,20 +130,16 @@ async def _health_event_generator(
             if await request.is_disconnected():
                 break
 
-            result = await vk.send_bot_command("health_live", {}, timeout=5.0)
-            # Re-check after the potentially slow Valkey call — skip yield if already gone.
-            if await request.is_disconnected():
-                break
-            if result and "error" not in result:
-                yield {"event": "health", "data": json.dumps(result)}
-
             # Heartbeat fires every _HEARTBEAT_INTERVAL regardless of data events
             # so proxies and browsers can detect a dead connection.
-            if time.monotonic() - last_heartbeat >= _HEARTBEAT_INTERVAL:
+            wait = max(0.0, last_heartbeat + _HEARTBEAT_INTERVAL - time.monotonic())
+            try:
+                data = await asyncio.wait_for(queue.get(), timeout=wait)
+            except TimeoutError:
                 yield {"comment": "heartbeat"}
                 last_heartbeat = time.monotonic()
-
-            await asyncio.sleep(_HEALTH_POLL_INTERVAL)
+                continue
+            yield {"event": "health", "data": data}
 
     except asyncio.CancelledError:
         # Expected on client disconnect or server shutdown; cleanup handled in finally.
@@ -81,6 +147,7 @@ async def _health_event_generator(
     except Exception:
         _log.debug("SSE health generator error for user %r", user_id, exc_info=True)
     finally:
+        feed.unsubscribe(queue)
         remaining = _active_connections.get(user_id, 0) - 1
         if remaining <= 0:
             _active_connections.pop(user_id, None)
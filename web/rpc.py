@@ -0,0 +1,133 @@
+"""Async request/reply channel from the dashboard to the bot over Valkey pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any
+
+import valkey.asyncio as valkey_async
+
+_log = logging.getLogger(__name__)
+
+CMD_CHANNEL = "nerpybot:cmd"
+REPLY_PREFIX = "nerpybot:reply"
+
+
+class BotRpcClient:
+    """Multiplexes bot commands over one reply subscription per web process.
+
+    Every call publishes ``{"request_id", "reply_to", "command", ...payload}`` on ``nerpybot:cmd``
+    and parks a future in ``_pending``. The bot publishes ``{"request_id", "result"}`` on the
+    ``reply_to`` channel, and a single reader task resolves the matching future. Waiting costs a
+    future, not a thread, so in-flight commands are bounded by the deadline, not the executor size.
+    """
+
+    def __init__(self, url: str | None = None, client: Any | None = None):
+        """Connect lazily to *url*, or use an already-built async *client* (tests)."""
+        self._url = url
+        self._client = client
+        self.reply_channel = f"{REPLY_PREFIX}:{uuid.uuid4().hex}"
+        self._pubsub = None
+        self._reader: asyncio.Task | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._start_lock: asyncio.Lock | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently waiting for a reply."""
+        return len(self._pending)
+
+    async def _ensure_started(self) -> None:
+        """Subscribe to the reply channel and start the reader, once per event loop."""
+        if self._reader is not None and not self._reader.done():
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._reader is not None and not self._reader.done():
+                return
+            if self._client is None:
+                # Built here, not in __init__, so the connection pool binds to the serving loop.
+                self._client = valkey_async.from_url(self._url, decode_responses=True)
+            if self._pubsub is not None:
+                await self._pubsub.aclose()  # left over from a start that timed out
+            self._pubsub = self._client.pubsub()
+            await self._pubsub.subscribe(self.reply_channel)
+            # Wait for the confirmation so a reply can never be published before we listen.
+            while await self._pubsub.get_message(timeout=1.0) is None:
+                pass
+            self._reader = asyncio.create_task(self._read_loop(), name="bot-rpc-reader")
+
+    async def _read_loop(self) -> None:
+        """Resolve pending futures from replies; reconnect with backoff on connection errors."""
+        delay = 1.0
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        self._dispatch(message["data"])
+                        delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # The pub/sub object resubscribes on reconnect; calls waiting meanwhile hit their deadline.
+                _log.warning("Bot RPC reply listener error: %s (retrying in %.0fs)", exc, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    def _dispatch(self, raw: str) -> None:
+        try:
+            envelope = json.loads(raw)
+        except (TypeError, ValueError):
+            _log.warning("Bot RPC: discarding malformed reply %r", raw)
+            return
+        future = self._pending.pop(envelope.get("request_id"), None)
+        if future is not None and not future.done():
+            future.set_result(envelope.get("result"))
+
+    async def call(self, command: str, payload: dict, timeout: float = 3.0) -> dict | None:
+        """Send *command* to the bot and return its reply, or None on timeout or Valkey errors.
+
+        Cancelling the caller drops the pending entry, so a late reply is simply discarded.
+        """
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            async with asyncio.timeout(timeout):
+                await self._ensure_started()
+                message = {"request_id": request_id, "reply_to": self.reply_channel, "command": command, **payload}
+                if not await self._client.publish(CMD_CHANNEL, json.dumps(message)):
+                    _log.debug("Bot RPC: no bot subscribed to %s, %r not delivered", CMD_CHANNEL, command)
+                    return None
+                return await future
+        except TimeoutError:
+            return None  # expected — no reply within the deadline
+        except Exception as exc:
+            _log.warning("Unexpected error waiting for bot command reply: %s", exc)
+            return None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def aclose(self) -> None:
+        """Stop the reader, release waiting callers with None and close the connections."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass  # expected — cancellation is intentional
+            self._reader = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(None)
+        self._pending.clear()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._client is not None and self._url is not None:
+            await self._client.aclose()
+            self._client = None
@@ -272,6 +272,23 @@ class ApplicationSubmissionSchema(BaseModel):
     votes: list[ApplicationVoteSchema] = []
 
 
+class ApplicationSubmissionSummarySchema(BaseModel):
+    id: int
+    form_id: int
+    form_name: str | None = None
+    user_id: str
+    user_name: str | None
+    status: str
+    submitted_at: str
+    approve_count: int = 0
+    deny_count: int = 0
+
+
+class ApplicationSubmissionListResponse(BaseModel):
+    submissions: list[ApplicationSubmissionSummarySchema]
+    next_cursor: int | None = None  # pass as ``before`` to fetch the next (older) page
+
+
 class ApplicationTemplateQuestionSchema(BaseModel):
     id: int
     question_text: str
@@ -408,11 +425,84 @@ class PremiumUserGrant(BaseModel):
 # ── Operator ──
 
 
+class VoiceMusicDetail(BaseModel):
+    queue_length: int = 0
+    buffered: int = 0
+    queue_wait_ms: float | None = None
+    time_to_first_audio_ms: float | None = None
+
+
 class VoiceConnectionDetail(BaseModel):
     guild_id: str
     guild_name: str
     channel_id: str
     channel_name: str
+    music: VoiceMusicDetail | None = None
+
+
+class MusicWorkerPoolStats(BaseModel):
+    size: int
+    running: bool = False
+    busy: int = 0
+    queued: int = 0
+    utilization: float = 0.0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    restarts: int = 0
+
+
+class MusicPrefetchStats(BaseModel):
+    max_concurrent: int
+    per_guild: int
+    running: int = 0
+    pending: int = 0
+    guilds: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+
+class TimingSummary(BaseModel):
+    count: int = 0
+    avg_ms: float | None = None
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    max_ms: float | None = None
+    last_ms: float | None = None
+
+
+class MusicTelemetry(BaseModel):
+    extract: TimingSummary | None = None
+    download: TimingSummary | None = None
+    fetch: TimingSummary | None = None
+    queue_wait: TimingSummary | None = None
+    time_to_first_audio: TimingSummary | None = None
+    file_cache_hit_rate: float | None = None
+    metadata_cache_hit_rate: float | None = None
+    ffmpeg_processes: int = 0
+    counters: dict[str, int] = {}
+
+
+class MusicHealth(BaseModel):
+    worker_pool: MusicWorkerPoolStats | None = None
+    prefetch: MusicPrefetchStats | None = None
+    telemetry: MusicTelemetry | None = None
+
+
+class EventLoopStall(BaseModel):
+    at: str
+    blocked_ms: float
+    stack: list[str] = []
+
+
+class EventLoopHealth(BaseModel):
+    interval_ms: int
+    threshold_ms: int
+    lag: TimingSummary | None = None
+    stall_count: int = 0
+    recent_stalls: list[EventLoopStall] = []
 
 
 class HealthResponse(BaseModel):
@@ -429,6 +519,14 @@ class HealthResponse(BaseModel):
     discord_py_version: str | None = None
     bot_version: str | None = None
     voice_details: list[VoiceConnectionDetail] = []
+    music: MusicHealth | None = None
+    event_loop: EventLoopHealth | None = None  # None unless the bot's loop monitor is enabled
+
+
+class MetricsResponse(BaseModel):
+    status: str  # "online" or "unreachable"
+    histograms: dict[str, dict[str, TimingSummary]] = {}  # family -> name -> timings
+    counters: dict[str, dict[str, int]] = {}
 
 
 class ModuleInfo(BaseModel):
@@ -547,13 +645,16 @@ class DebugToggleResponse(BaseModel):
 
 
 class SyncCommandsRequest(BaseModel):
-    mode: Literal["global", "local", "copy", "clear"]
+    mode: Literal["global", "local", "copy", "clear", "auto"]
     guild_ids: list[str] = []
+    # Sync even when the command tree is unchanged since the last sync (ignored by ``auto``).
+    force: bool = False
 
 
 class SyncCommandsResponse(BaseModel):
     success: bool
     synced_count: int | None = None
+    skipped: bool = False  # nothing changed since the last sync, Discord was not called
     error: str | None = None
 
 
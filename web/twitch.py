@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
@@ -15,6 +16,12 @@ _log = logging.getLogger(__name__)
 
 _TWITCH_AUTH_URL = "https://id.twitch.tv/oauth2/token"
 _TWITCH_API_BASE = "https://api.twitch.tv/helix"
+# Helix answers every request with the app's remaining points (Ratelimit-Remaining) and the epoch
+# second the bucket refills (Ratelimit-Reset). Requests wait for the refill once only this many are
+# left, which leaves room for the callers already in flight.
+_RATE_LIMIT_RESERVE = 10
+_MAX_RATE_LIMIT_WAIT = 60.0
+_MAX_ATTEMPTS = 3
 
 
 class TwitchClient:
@@ -26,6 +33,8 @@ class TwitchClient:
         self._token: str | None = None
         self._token_expires_at: float = 0.0
         self._http = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+        self._rate_remaining: int | None = None
+        self._rate_reset: float = 0.0
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client."""
@@ -55,17 +64,45 @@ class TwitchClient:
         token = await self.get_app_access_token()
         return {"Client-Id": self._client_id, "Authorization": f"Bearer {token}"}
 
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a Helix request, pacing it by the rate-limit headers and retrying a 429."""
+        for attempt in range(_MAX_ATTEMPTS):
+            await self._wait_for_rate_limit()
+            if self._rate_remaining is not None:
+                self._rate_remaining -= 1  # concurrent callers see the spend before the reply arrives
+            resp = await getattr(self._http, method)(url, headers=await self._headers(), **kwargs)
+            self._note_rate_limit(resp)
+            if resp.status_code != 429 or attempt == _MAX_ATTEMPTS - 1:
+                return resp
+            self._rate_remaining = 0
+            _log.warning("Twitch API rate limited on %s %s — waiting for the bucket to refill", method.upper(), url)
+        return resp
+
+    async def _wait_for_rate_limit(self) -> None:
+        if self._rate_remaining is None or self._rate_remaining > _RATE_LIMIT_RESERVE:
+            return
+        delay = self._rate_reset - time.time()
+        if delay > 0:
+            await asyncio.sleep(min(delay, _MAX_RATE_LIMIT_WAIT))
+        self._rate_remaining = None  # unknown until the next reply reports it
+
+    def _note_rate_limit(self, resp: httpx.Response) -> None:
+        try:
+            self._rate_remaining = int(resp.headers["Ratelimit-Remaining"])
+            self._rate_reset = float(resp.headers["Ratelimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            pass
+
     async def get_users(self, logins: list[str]) -> list[dict[str, Any]]:
         """Resolve Twitch login names to user objects with id and display_name."""
         if not logins:
             return []
-        headers = await self._headers()
         results = []
         for i in range(0, len(logins), 100):
             chunk = logins[i : i + 100]
-            resp = await self._http.get(
+            resp = await self._request(
+                "get",
                 f"{_TWITCH_API_BASE}/users",
-                headers=headers,
                 params=[("login", login) for login in chunk],
             )
             resp.raise_for_status()
@@ -90,38 +127,28 @@ class TwitchClient:
                 "secret": secret,
             },
         }
-        resp = await self._http.post(
-            f"{_TWITCH_API_BASE}/eventsub/subscriptions",
-            json=payload,
-            headers=await self._headers(),
-        )
+        resp = await self._request("post", f"{_TWITCH_API_BASE}/eventsub/subscriptions", json=payload)
         resp.raise_for_status()
         data = resp.json().get("data", [])
         return data[0] if data else {}
 
     async def delete_eventsub_subscription(self, subscription_id: str) -> None:
         """Delete an EventSub subscription by Twitch's UUID."""
-        resp = await self._http.delete(
-            f"{_TWITCH_API_BASE}/eventsub/subscriptions",
-            params={"id": subscription_id},
-            headers=await self._headers(),
+        resp = await self._request(
+            "delete", f"{_TWITCH_API_BASE}/eventsub/subscriptions", params={"id": subscription_id}
         )
         if resp.status_code not in (204, 404):
             resp.raise_for_status()
 
     async def list_eventsub_subscriptions(self) -> list[dict[str, Any]]:
-        """List all active EventSub subscriptions for this app."""
+        """List every EventSub subscription of this app, following the pagination cursor."""
         results = []
         cursor = None
         while True:
             params: dict[str, Any] = {"first": 100}
             if cursor:
                 params["after"] = cursor
-            resp = await self._http.get(
-                f"{_TWITCH_API_BASE}/eventsub/subscriptions",
-                params=params,
-                headers=await self._headers(),
-            )
+            resp = await self._request("get", f"{_TWITCH_API_BASE}/eventsub/subscriptions", params=params)
             resp.raise_for_status()
             body = resp.json()
             results.extend(body.get("data", []))
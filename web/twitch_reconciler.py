@@ -1,9 +1,23 @@
-"""Twitch EventSub reconciliation -- keeps DB config in sync with Twitch-side subscriptions."""
+"""Twitch EventSub reconciliation -- keeps DB config in sync with Twitch-side subscriptions.
+
+Each cycle diffs three views of the same thing:
+
+- desired: one ``stream.online`` subscription per configured streamer, plus ``stream.offline``
+  where any config asks for offline notifications (``TwitchNotifications``)
+- remote: what Twitch actually has for our callback URL (``list_eventsub_subscriptions``, one
+  paginated pass)
+- local: the ``TwitchEventSubSubscription`` rows the webhook uses to track verification/revocation
+
+Missing subscriptions are created, unwanted or broken ones deleted, and the local rows are rewritten
+to match what Twitch reports. Helix calls run concurrently (``TwitchClient`` paces them by the
+rate-limit headers) and all DB changes land in one commit at the end of the cycle.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 
 from models.twitch import STREAM_OFFLINE, STREAM_ONLINE, SUB_STATUS_ENABLED, SUB_STATUS_PENDING
@@ -11,14 +25,26 @@ from models.twitch import STREAM_OFFLINE, STREAM_ONLINE, SUB_STATUS_ENABLED, SUB
 _log = logging.getLogger(__name__)
 
 _RECONCILE_INTERVAL = 5 * 60  # 5 minutes
+_CONCURRENCY = 8  # Helix calls in flight per cycle
 _reconcile_lock = asyncio.Lock()
 
+# Twitch-side statuses of a subscription that is (or is about to be) delivering events. Anything
+# else (verification failed, notification failures exceeded, revoked, ...) is dead and replaced.
+_LIVE_REMOTE_STATUSES = {
+    "enabled": SUB_STATUS_ENABLED,
+    "webhook_callback_verification_pending": SUB_STATUS_PENDING,
+}
 
-async def reconcile_once(app_state) -> None:
-    """Run one reconciliation cycle. Called directly or from the background loop."""
+
+async def reconcile_once(app_state) -> dict | None:
+    """Run one reconciliation cycle. Called directly or from the background loop.
+
+    Returns the cycle's stats (also kept on ``app_state.twitch_reconcile_stats``), or None when
+    Twitch is not configured or the cycle failed.
+    """
     twitch_client = getattr(app_state, "twitch_client", None)
     if twitch_client is None:
-        return
+        return None
 
     session_factory = app_state.session_factory
     config = app_state.config
@@ -26,120 +52,152 @@ async def reconcile_once(app_state) -> None:
     async with _reconcile_lock:
         session = session_factory()
         try:
-            await _run_cycle(session, twitch_client, config)
+            stats = await _run_cycle(session, twitch_client, config)
         except Exception:
             _log.exception("twitch reconciler: unhandled error in reconcile_once")
+            return None
         finally:
             session.close()
+    app_state.twitch_reconcile_stats = stats
+    return stats
+
 
+def _desired_keys(session) -> set[tuple[str, str]]:
+    from models.twitch import TwitchNotifications
 
-def _needs_heal(streamer: str, existing_by_key: dict, offline_needed: set[str]) -> bool:
-    """Return True if this streamer needs any EventSub subscription created or healed."""
-    # Always check stream.online
-    if (streamer, STREAM_ONLINE) not in existing_by_key:
-        return True
-    if existing_by_key[(streamer, STREAM_ONLINE)].Status not in (SUB_STATUS_ENABLED, SUB_STATUS_PENDING):
-        return True
-    # Check stream.offline if any config needs it
-    if streamer in offline_needed:
-        key = (streamer, STREAM_OFFLINE)
-        if key not in existing_by_key or existing_by_key[key].Status not in (SUB_STATUS_ENABLED, SUB_STATUS_PENDING):
-            return True
-    return False
+    streamers = set(TwitchNotifications.get_all_distinct_streamers(session))
+    offline_needed = set(TwitchNotifications.get_streamers_needing_offline(session))
+    return {(s, STREAM_ONLINE) for s in streamers} | {(s, STREAM_OFFLINE) for s in offline_needed & streamers}
 
 
-async def _run_cycle(session, twitch_client, config) -> None:
-    from models.twitch import TwitchEventSubSubscription, TwitchNotifications
+async def _run_cycle(session, twitch_client, config) -> dict:
+    from models.twitch import TwitchEventSubSubscription
 
-    # Desired: distinct streamers in notification config
-    desired_streamers = set(TwitchNotifications.get_all_distinct_streamers(session))
-    offline_needed = set(TwitchNotifications.get_streamers_needing_offline(session))
+    started = time.monotonic()
+    stats = {"desired": 0, "remote": 0, "kept": 0, "created": 0, "deleted": 0, "failed": 0, "unresolved": 0}
 
-    # Actual: all EventSub subscriptions in DB
-    existing_subs = TwitchEventSubSubscription.get_all(session)
-    existing_by_key: dict[tuple[str, str], TwitchEventSubSubscription] = {
-        (s.StreamerLogin, s.EventType): s for s in existing_subs
+    desired = _desired_keys(session)
+    stats["desired"] = len(desired)
+    local_by_key: dict[tuple[str, str], TwitchEventSubSubscription] = {
+        (row.StreamerLogin, row.EventType): row for row in TwitchEventSubSubscription.get_all(session)
     }
 
-    # Resolve user IDs for missing/broken streamers
-    missing_streamers = {s for s in desired_streamers if _needs_heal(s, existing_by_key, offline_needed)}
-    user_map: dict[str, dict] = {}
-    if missing_streamers:
+    # Without Twitch's list the diff would trust the DB again; skip the cycle instead.
+    remote_subs = [
+        sub
+        for sub in await twitch_client.list_eventsub_subscriptions()
+        if sub.get("type") in (STREAM_ONLINE, STREAM_OFFLINE)
+        and sub.get("transport", {}).get("callback") == config.twitch_webhook_url
+    ]
+    stats["remote"] = len(remote_subs)
+
+    # Broadcaster ids: known ones from our rows, the rest resolved in batches of 100.
+    user_ids = {row.StreamerLogin: row.StreamerUserId for row in local_by_key.values()}
+    unknown = sorted({login for login, _ in desired if login not in user_ids})
+    if unknown:
         try:
-            users = await twitch_client.get_users(list(missing_streamers))
-            user_map = {u["login"].lower(): u for u in users}
+            users = await twitch_client.get_users(unknown)
+            user_ids.update({u["login"].lower(): u["id"] for u in users})
         except Exception:
             _log.exception("twitch reconciler: failed to resolve user IDs")
-
-    # Create missing subscriptions
-    for streamer in missing_streamers:
-        user_info = user_map.get(streamer)
-        if not user_info:
-            _log.warning("twitch reconciler: Twitch user not found for '%s' -- skipping", streamer)
-            continue
-        broadcaster_id = user_info["id"]
-
-        needs_offline = streamer in offline_needed
-        event_types = [STREAM_ONLINE]
-        if needs_offline:
-            event_types.append(STREAM_OFFLINE)
-
-        for event_type in event_types:
-            key = (streamer, event_type)
-            existing = existing_by_key.get(key)
-            if existing and existing.Status in (SUB_STATUS_ENABLED, SUB_STATUS_PENDING):
-                continue
+    login_of = {user_id: login for login, user_id in user_ids.items()}
+
+    # Live remote subscriptions by (login, type); the first one found for a key is kept.
+    live: dict[tuple[str, str], dict] = {}
+    to_delete: list[dict] = []
+    for sub in remote_subs:
+        login = login_of.get(sub.get("condition", {}).get("broadcaster_user_id"))
+        key = (login, sub["type"])
+        if login is None or key not in desired or sub.get("status") not in _LIVE_REMOTE_STATUSES or key in live:
+            to_delete.append(sub)
+        else:
+            live[key] = sub
+
+    to_create = []
+    for key in sorted(desired - live.keys()):
+        if key[0] in user_ids:
+            to_create.append(key)
+        else:
+            _log.warning("twitch reconciler: Twitch user not found for '%s' -- skipping", key[0])
+            stats["unresolved"] += 1
+
+    semaphore = asyncio.Semaphore(_CONCURRENCY)
+
+    async def _create(key):
+        login, event_type = key
+        async with semaphore:
             try:
                 sub = await twitch_client.create_eventsub_subscription(
-                    event_type,
-                    broadcaster_id,
-                    config.twitch_webhook_url,
-                    config.twitch_webhook_secret,
-                )
-                sub_id = sub.get("id", "")
-                if not sub_id:
-                    _log.warning(
-                        "twitch reconciler: create_eventsub_subscription returned no id for %s '%s' "
-                        "— subscription may be orphaned on Twitch",
-                        event_type,
-                        streamer,
-                    )
-                    continue
-                if existing:
-                    existing.TwitchSubscriptionId = sub_id
-                    existing.Status = SUB_STATUS_PENDING
-                else:
-                    row = TwitchEventSubSubscription(
-                        TwitchSubscriptionId=sub_id,
-                        StreamerLogin=streamer,
-                        StreamerUserId=broadcaster_id,
-                        EventType=event_type,
-                        Status=SUB_STATUS_PENDING,
-                        CreatedAt=datetime.now(UTC),
-                    )
-                    session.add(row)
-                session.commit()
-                _log.info(
-                    "twitch reconciler: created %s subscription for '%s' (sub_id=%s)",
-                    event_type,
-                    streamer,
-                    sub_id,
+                    event_type, user_ids[login], config.twitch_webhook_url, config.twitch_webhook_secret
                 )
             except Exception:
-                _log.exception("twitch reconciler: failed to create %s for '%s'", event_type, streamer)
-
-    # Delete orphaned subscriptions (streamer no longer in desired set, or unneeded offline sub)
-    for (streamer, event_type), sub in existing_by_key.items():
-        is_orphan = streamer not in desired_streamers
-        is_unneeded_offline = event_type == STREAM_OFFLINE and streamer not in offline_needed
-        if is_orphan or is_unneeded_offline:
+                _log.exception("twitch reconciler: failed to create %s for '%s'", event_type, login)
+                return key, None
+        if not sub.get("id"):
+            _log.warning(
+                "twitch reconciler: create_eventsub_subscription returned no id for %s '%s' "
+                "— subscription may be orphaned on Twitch",
+                event_type,
+                login,
+            )
+            return key, None
+        return key, sub
+
+    async def _delete(sub) -> bool:
+        async with semaphore:
             try:
-                await twitch_client.delete_eventsub_subscription(sub.TwitchSubscriptionId)
-                session.delete(sub)
-                session.commit()
-                _log.info("twitch reconciler: deleted orphaned %s for '%s'", event_type, streamer)
+                await twitch_client.delete_eventsub_subscription(sub["id"])
+                return True
             except Exception:
-                _log.exception("twitch reconciler: failed to delete orphaned sub for '%s'", streamer)
+                _log.exception("twitch reconciler: failed to delete subscription %s", sub.get("id"))
+                return False
+
+    created, deleted = await asyncio.gather(
+        asyncio.gather(*(_create(key) for key in to_create)),
+        asyncio.gather(*(_delete(sub) for sub in to_delete)),
+    )
+    stats["deleted"] = sum(deleted)
+    stats["failed"] = len(deleted) - stats["deleted"]
+
+    # Rewrite the local rows to match Twitch, then commit once.
+    current = dict(live)
+    stats["kept"] = len(current)
+    for key, sub in created:
+        if sub is None:
+            stats["failed"] += 1
+        else:
+            current[key] = {**sub, "status": sub.get("status", "webhook_callback_verification_pending")}
+            stats["created"] += 1
+            _log.info("twitch reconciler: created %s subscription for '%s' (sub_id=%s)", key[1], key[0], sub["id"])
+
+    for key, row in local_by_key.items():
+        if key not in current:
+            session.delete(row)
+    session.flush()  # free unique subscription ids before rows are repointed
+    for key, sub in current.items():
+        status = _LIVE_REMOTE_STATUSES.get(sub.get("status"), SUB_STATUS_PENDING)
+        row = local_by_key.get(key)
+        if row is None:
+            session.add(
+                TwitchEventSubSubscription(
+                    TwitchSubscriptionId=sub["id"],
+                    StreamerLogin=key[0],
+                    StreamerUserId=user_ids[key[0]],
+                    EventType=key[1],
+                    Status=status,
+                    CreatedAt=datetime.now(UTC),
+                )
+            )
+        elif row.TwitchSubscriptionId != sub["id"] or row.Status != status:
+            row.TwitchSubscriptionId = sub["id"]
+            row.StreamerUserId = user_ids[key[0]]
+            row.Status = status
+    session.commit()
+
+    stats["duration_ms"] = round((time.monotonic() - started) * 1000)
+    level = logging.WARNING if stats["failed"] else logging.INFO
+    _log.log(level, "twitch reconciler: cycle finished %s", stats)
+    return stats
 
 
 async def reconciler_loop(app_state) -> None:
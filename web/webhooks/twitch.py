@@ -76,15 +76,20 @@ async def twitch_webhook(
         sub = payload.get("subscription", {})
         event = payload.get("event", {})
         event_type = sub.get("type", "")
-        vk.notify_bot(
-            "twitch_event",
-            {
-                "event_type": event_type,
-                "broadcaster_login": event.get("broadcaster_user_login", ""),
-                "broadcaster_name": event.get("broadcaster_user_name", ""),
-                "started_at": event.get("started_at", ""),
-            },
-        )
+        try:
+            vk.add_twitch_event(
+                {
+                    "event_type": event_type,
+                    "broadcaster_login": event.get("broadcaster_user_login", ""),
+                    "broadcaster_name": event.get("broadcaster_user_name", ""),
+                    "started_at": event.get("started_at", ""),
+                }
+            )
+        except Exception as exc:
+            # Release the claim and fail the request so Twitch redelivers the notification.
+            _log.error("twitch_webhook: could not queue msg_id=%s: %s", msg_id, exc)
+            vk.delete_twitch_event_claim(msg_id)
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Event queue unavailable")
         return Response(status_code=204)
 
     if msg_type == "revocation":